@@ -26,7 +26,18 @@ from adapters.base_adapter import (
     Position,
     Balance,
     Order,
+    OrderBatch,
+    OrderRequest,
+    AmendRequest,
 )
+from adapters.batch_executor import (
+    BatchExecutor,
+    OrderResult,
+)
+from adapters.instruments import Instrument, InstrumentCache
+from adapters.order_cache import OrderStateCache
+from adapters.orderbook import LocalOrderBook, OrderBookService, OrderBookSnapshot
+from adapters.signing_pool import SigningPool
 from adapters.factory import (
     create_adapter,
     register_adapter,
@@ -42,6 +53,20 @@ __all__ = [
     "Position",
     "Balance",
     "Order",
+    "OrderBatch",
+    "OrderRequest",
+    "AmendRequest",
+    "OrderResult",
+    "Instrument",
+    
+    # 批量执行、签名池、订单缓存、本地订单簿与精度缓存
+    "BatchExecutor",
+    "SigningPool",
+    "OrderStateCache",
+    "OrderBookService",
+    "LocalOrderBook",
+    "OrderBookSnapshot",
+    "InstrumentCache",
     
     # 枚举
     "OrderSide",
@@ -6,10 +6,21 @@ perpetual futures exchanges. All exchange-specific adapters should inherit
 from BasePerpAdapter and implement the required methods.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from decimal import Decimal
+from array import array
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from decimal import Decimal, ROUND_HALF_EVEN
 from enum import Enum
 
+from adapters.batch_executor import (
+    BatchExecutor,
+    DEFAULT_MAX_CONCURRENCY,
+    FALLBACK_MAX_CONCURRENCY,
+    OrderResult,
+)
+from adapters.instruments import DEFAULT_REFRESH_INTERVAL, Instrument, InstrumentCache
+from adapters.orderbook import DEFAULT_PUBLISH_DEPTH, OrderBookService
+from adapters.signing_pool import DEFAULT_MIN_BATCH_SIZE, SigningPool
+
 
 class OrderSide(Enum):
     """订单方向"""
@@ -42,8 +53,20 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
+# 视为仍在挂单中的订单状态
+ACTIVE_STATUSES = ("pending", "open", "partially_filled")
+
+# OrderBatch 定点数默认精度：价格/数量都以 10^-8 为最小单位存为 int64
+DEFAULT_FIXED_DECIMALS = 8
+
+
 class Position:
     """持仓信息"""
+    __slots__ = (
+        "symbol", "size", "side", "entry_price", "mark_price",
+        "unrealized_pnl", "leverage", "margin_mode",
+    )
+
     def __init__(
         self,
         symbol: str,
@@ -80,6 +103,11 @@ class Position:
 
 class Balance:
     """账户余额信息"""
+    __slots__ = (
+        "total_balance", "available_balance", "equity", "unrealized_pnl",
+        "margin_used", "margin_available",
+    )
+
     def __init__(
         self,
         total_balance: Decimal,
@@ -110,6 +138,12 @@ class Balance:
 
 class Order:
     """订单信息"""
+    __slots__ = (
+        "order_id", "symbol", "side", "order_type", "quantity", "price",
+        "filled_quantity", "status", "time_in_force", "reduce_only",
+        "client_order_id", "created_at", "updated_at",
+    )
+
     def __init__(
         self,
         order_id: str,
@@ -159,6 +193,288 @@ class Order:
         }
 
 
+# 小于该值的定点结果可以由 float 相乘后取整精确得到（误差远小于 0.5 个单位）
+_FLOAT_EXACT_LIMIT = 2 ** 50
+
+
+def to_fixed(value: Any, decimals: int = DEFAULT_FIXED_DECIMALS) -> int:
+    """
+    将价格/数量转换为定点整数（以 10^-decimals 为单位）
+
+    常规量级的价格/数量直接 float 相乘取整，不经过 Decimal；超出 float 精确范围的
+    输入改用 Decimal 换算，小数位超过 decimals 时四舍六入五成双。
+
+    Args:
+        value: 字符串、整数、float 或 Decimal
+        decimals: 小数位数
+
+    Returns:
+        int: 定点整数
+    """
+    if isinstance(value, int):
+        return value * 10 ** decimals
+    units = round(float(value) * 10 ** decimals)
+    if -_FLOAT_EXACT_LIMIT < units < _FLOAT_EXACT_LIMIT:
+        return units
+    return int(Decimal(str(value)).scaleb(decimals).to_integral_value(ROUND_HALF_EVEN))
+
+
+def from_fixed(units: int, decimals: int = DEFAULT_FIXED_DECIMALS) -> Decimal:
+    """将定点整数还原为 Decimal（去掉多余的尾随 0）"""
+    scale = 10 ** decimals
+    if units % scale == 0:
+        return Decimal(units // scale)
+    return Decimal(units).scaleb(-decimals).normalize()
+
+
+def tick_units(tick_size: Optional[Any], decimals: int = DEFAULT_FIXED_DECIMALS) -> int:
+    """将 tick_size 换算为定点单位数（tick_size 为 None 时按 1 处理）"""
+    units = to_fixed(tick_size if tick_size is not None else 1, decimals)
+    if units <= 0:
+        raise ValueError(f"tick_size {tick_size} 超出定点精度 10^-{decimals}")
+    return units
+
+
+class OrderBatch:
+    """
+    列式订单集合（批量查询结果）
+
+    价格、数量以定点整数存放在 array("q") 中（单位 10^-decimals），字符串字段存放在列表中，
+    每个订单只在适配器边界做一次转换，不创建 Order 对象和 Decimal。
+    需要逐单访问时再通过 order(i) / to_orders() 物化为 Order。
+    """
+    __slots__ = (
+        "price_decimals", "size_decimals", "order_ids", "client_order_ids",
+        "symbols", "is_buy", "order_types", "price_ticks", "quantity_lots",
+        "filled_lots", "statuses", "time_in_force", "reduce_only",
+        "created_at", "updated_at",
+    )
+
+    # 无价格（市价单）时 price_ticks 中的占位值
+    NO_PRICE = -1
+
+    def __init__(
+        self,
+        price_decimals: int = DEFAULT_FIXED_DECIMALS,
+        size_decimals: int = DEFAULT_FIXED_DECIMALS,
+    ):
+        """
+        初始化空的订单集合
+
+        Args:
+            price_decimals: 价格定点小数位数
+            size_decimals: 数量定点小数位数
+        """
+        self.price_decimals = price_decimals
+        self.size_decimals = size_decimals
+        self.order_ids: List[str] = []
+        self.client_order_ids: List[Optional[str]] = []
+        self.symbols: List[str] = []
+        self.is_buy = bytearray()
+        self.order_types: List[str] = []
+        self.price_ticks = array("q")
+        self.quantity_lots = array("q")
+        self.filled_lots = array("q")
+        self.statuses: List[str] = []
+        self.time_in_force: List[Optional[str]] = []
+        self.reduce_only = bytearray()
+        self.created_at = array("q")  # 毫秒时间戳，0 表示未知
+        self.updated_at = array("q")
+
+    def append(
+        self,
+        order_id: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Any,
+        price: Any = None,
+        filled_quantity: Any = "0",
+        status: str = "pending",
+        time_in_force: Optional[str] = None,
+        reduce_only: bool = False,
+        client_order_id: Optional[str] = None,
+        created_at: Optional[int] = None,
+        updated_at: Optional[int] = None,
+    ) -> None:
+        """追加一个订单，价格/数量可以是交易所返回的原始字符串"""
+        self.order_ids.append(order_id)
+        self.client_order_ids.append(client_order_id)
+        self.symbols.append(symbol)
+        self.is_buy.append(1 if side in ("buy", "long") else 0)
+        self.order_types.append(order_type)
+        self.price_ticks.append(
+            to_fixed(price, self.price_decimals) if price is not None else self.NO_PRICE
+        )
+        self.quantity_lots.append(to_fixed(quantity, self.size_decimals))
+        self.filled_lots.append(to_fixed(filled_quantity, self.size_decimals))
+        self.statuses.append(status)
+        self.time_in_force.append(time_in_force)
+        self.reduce_only.append(1 if reduce_only else 0)
+        self.created_at.append(created_at or 0)
+        self.updated_at.append(updated_at or 0)
+
+    @classmethod
+    def from_orders(
+        cls,
+        orders: List["Order"],
+        price_decimals: int = DEFAULT_FIXED_DECIMALS,
+        size_decimals: int = DEFAULT_FIXED_DECIMALS,
+    ) -> "OrderBatch":
+        """由 Order 列表构建"""
+        batch = cls(price_decimals, size_decimals)
+        for order in orders:
+            batch.append(
+                order_id=order.order_id,
+                symbol=order.symbol,
+                side=order.side,
+                order_type=order.order_type,
+                quantity=order.quantity,
+                price=order.price,
+                filled_quantity=order.filled_quantity,
+                status=order.status,
+                time_in_force=order.time_in_force,
+                reduce_only=order.reduce_only,
+                client_order_id=order.client_order_id,
+                created_at=order.created_at,
+                updated_at=order.updated_at,
+            )
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def order(self, i: int) -> "Order":
+        """物化第 i 个订单"""
+        ticks = self.price_ticks[i]
+        return Order(
+            order_id=self.order_ids[i],
+            symbol=self.symbols[i],
+            side="buy" if self.is_buy[i] else "sell",
+            order_type=self.order_types[i],
+            quantity=from_fixed(self.quantity_lots[i], self.size_decimals),
+            price=from_fixed(ticks, self.price_decimals) if ticks != self.NO_PRICE else None,
+            filled_quantity=from_fixed(self.filled_lots[i], self.size_decimals),
+            status=self.statuses[i],
+            time_in_force=self.time_in_force[i],
+            reduce_only=bool(self.reduce_only[i]),
+            client_order_id=self.client_order_ids[i],
+            created_at=self.created_at[i] or None,
+            updated_at=self.updated_at[i] or None,
+        )
+
+    def to_orders(self) -> List["Order"]:
+        """物化全部订单"""
+        return [self.order(i) for i in range(len(self.order_ids))]
+
+    def pending_arrays(
+        self,
+        tick_size: Optional[Any] = None,
+    ) -> Tuple[List[int], List[int], Dict[int, List[int]], Dict[int, List[int]]]:
+        """
+        按价位汇总活跃订单，返回格式与 get_pending_orders_arrays 相同
+
+        价位为价格除以 tick_size 向下取整后的 tick 数，直接由定点整数整除得到。
+
+        Args:
+            tick_size: 价格最小变动单位，默认为 1（价位即价格的整数部分）
+
+        Returns:
+            (long_prices, short_prices, long_price_to_ids, short_price_to_ids)
+        """
+        scale = tick_units(tick_size, self.price_decimals)
+        long_price_to_ids: Dict[int, List[int]] = {}
+        short_price_to_ids: Dict[int, List[int]] = {}
+        is_buy = self.is_buy
+        statuses = self.statuses
+        order_ids = self.order_ids
+        for i, ticks in enumerate(self.price_ticks):
+            if ticks == self.NO_PRICE or statuses[i] not in ACTIVE_STATUSES:
+                continue
+            price_to_ids = long_price_to_ids if is_buy[i] else short_price_to_ids
+            ids = price_to_ids.setdefault(ticks // scale, [])
+            try:
+                ids.append(int(order_ids[i]))
+            except (ValueError, TypeError):
+                continue  # 跳过无效的订单ID
+        return (
+            sorted(long_price_to_ids),
+            sorted(short_price_to_ids),
+            long_price_to_ids,
+            short_price_to_ids,
+        )
+
+
+class OrderRequest:
+    """下单请求（批量下单使用，字段与 place_order 参数一致）"""
+    __slots__ = (
+        "symbol", "side", "order_type", "quantity", "price", "time_in_force",
+        "reduce_only", "client_order_id", "extra",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Decimal,
+        price: Optional[Decimal] = None,
+        time_in_force: str = "gtc",
+        reduce_only: bool = False,
+        client_order_id: Optional[str] = None,
+        **kwargs
+    ):
+        self.symbol = symbol
+        self.side = side
+        self.order_type = order_type
+        self.quantity = quantity
+        self.price = price
+        self.time_in_force = time_in_force
+        self.reduce_only = reduce_only
+        self.client_order_id = client_order_id
+        self.extra = kwargs
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            "symbol": self.symbol,
+            "side": self.side,
+            "order_type": self.order_type,
+            "quantity": str(self.quantity),
+            "price": str(self.price) if self.price else None,
+            "time_in_force": self.time_in_force,
+            "reduce_only": self.reduce_only,
+            "client_order_id": self.client_order_id,
+        }
+    
+    def __repr__(self) -> str:
+        return f"<OrderRequest({self.side} {self.quantity} {self.symbol} @ {self.price})>"
+
+
+class AmendRequest:
+    """改单请求（修改已有挂单的价格/数量）"""
+    __slots__ = ("order_id", "symbol", "price", "quantity", "side", "client_order_id")
+
+    def __init__(
+        self,
+        order_id: str,
+        symbol: str,
+        price: Decimal,
+        quantity: Optional[Decimal] = None,
+        side: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ):
+        self.order_id = order_id
+        self.symbol = symbol
+        self.price = price
+        self.quantity = quantity
+        self.side = side
+        self.client_order_id = client_order_id
+    
+    def __repr__(self) -> str:
+        return f"<AmendRequest({self.order_id} -> {self.price})>"
+
+
 class BasePerpAdapter(ABC):
     """
     永续合约交易所适配器基类
@@ -167,15 +483,49 @@ class BasePerpAdapter(ABC):
     这样可以确保不同交易所的接口统一，方便策略编写。
     """
     
+    # 交易所是否支持原地改单（保留订单，只修改价格/数量）；支持的子类覆盖为 True 并实现 amend_order
+    supports_amend = False
+    
+    # 签名池模式：签名持有 GIL 的交易所用 "process"，签名库释放 GIL 的用 "thread"
+    signing_pool_mode = "process"
+    
     def __init__(self, config: Dict[str, Any]):
         """
         初始化适配器
         
         Args:
-            config: 交易所配置字典，包含 API key、secret、base_url 等
+            config: 交易所配置字典，包含 API key、secret、base_url 等，
+                可选 max_concurrency 指定批量操作的并发上限，
+                可选 signing_workers / signing_min_batch 启用批量签名池，
+                可选 orderbook_depth 指定本地订单簿发布的档位数，
+                可选 instrument_refresh_interval 指定交易对精度信息的刷新间隔（秒）
         """
         self.config = config
         self.exchange_name = config.get("exchange_name", "unknown")
+        
+        # 批量下单/撤单的并发执行器，并发上限可通过 max_concurrency 配置
+        max_concurrency = config.get("max_concurrency") or DEFAULT_MAX_CONCURRENCY.get(
+            str(self.exchange_name).lower(), FALLBACK_MAX_CONCURRENCY
+        )
+        self.batch_executor = BatchExecutor(max_workers=int(max_concurrency))
+        
+        # 批量签名池，默认关闭（signing_workers=0），仅覆盖了 place_orders 的适配器使用
+        self.signing_pool = SigningPool(
+            max_workers=int(config.get("signing_workers", 0)),
+            mode=self.signing_pool_mode,
+            min_batch_size=int(config.get("signing_min_batch", DEFAULT_MIN_BATCH_SIZE)),
+        )
+        
+        # 本地订单簿，由 subscribe_orderbook 的深度推送维护，get_orderbook 优先从这里读取
+        self.orderbooks = OrderBookService(
+            publish_depth=int(config.get("orderbook_depth", DEFAULT_PUBLISH_DEPTH)),
+        )
+        
+        # 交易对精度信息（tick / lot），首次使用时从交易所加载，之后惰性刷新
+        self.instruments = InstrumentCache(
+            self.load_instruments,
+            refresh_interval=float(config.get("instrument_refresh_interval", DEFAULT_REFRESH_INTERVAL)),
+        )
     
     @abstractmethod
     def connect(self) -> bool:
@@ -360,18 +710,193 @@ class BasePerpAdapter(ABC):
         """
         获取订单簿
         
+        已调用 subscribe_orderbook 的交易对应直接从本地订单簿（self.orderbooks）读取。
+        
         Args:
             symbol: 交易对符号
             depth: 深度，默认 20
             
         Returns:
-            Dict[str, Any]: 包含 bids 和 asks 的订单簿数据
+            Dict[str, Any]: 包含 symbol、bids、asks（[[price, size], ...]，买盘从高到低、
+                卖盘从低到高）、sequence、timestamp 的订单簿数据
             
         Raises:
             Exception: 查询失败时抛出异常
         """
         pass
     
+    async def subscribe_ticker(self, symbol: str, callback) -> None:
+        """
+        订阅实时价格推送（可选实现）
+
+        回调参数与 get_ticker 返回的字典格式一致，供事件驱动策略使用。
+
+        Args:
+            symbol: 交易对符号
+            callback: 回调函数，参数为 ticker 字典
+
+        Raises:
+            NotImplementedError: 交易所未实现价格推送
+        """
+        raise NotImplementedError(f"{self.exchange_name} 未实现价格推送订阅")
+
+    async def subscribe_orders(self, symbol: str, callback) -> Optional[Callable[[], None]]:
+        """
+        订阅自身订单状态推送（可选实现）
+
+        回调参数为 Order 对象，订单新增、成交、撤销时触发。
+
+        Args:
+            symbol: 交易对符号
+            callback: 回调函数，参数为 Order 对象
+
+        Returns:
+            Optional[Callable[[], None]]: 取消该回调的函数；交易所不支持取消时为 None
+
+        Raises:
+            NotImplementedError: 交易所未实现订单推送
+        """
+        raise NotImplementedError(f"{self.exchange_name} 未实现订单推送订阅")
+
+    async def subscribe_orderbook(self, symbol: str) -> None:
+        """
+        订阅深度推送并维护本地订单簿（可选实现）
+
+        订阅后 get_orderbook 从本地订单簿读取，不再访问 REST；
+        丢包或断线重新同步期间，get_orderbook 按各交易所实现回退到 REST 或抛出异常。
+
+        Args:
+            symbol: 交易对符号
+
+        Raises:
+            NotImplementedError: 交易所未实现深度推送
+        """
+        raise NotImplementedError(f"{self.exchange_name} 未实现深度推送订阅")
+
+    def place_orders(self, order_requests: List[OrderRequest]) -> List[OrderResult]:
+        """
+        批量下单
+        
+        默认实现通过 batch_executor 并发调用 place_order；交易所有原生批量
+        下单接口时，子类应覆盖此方法，用一次请求提交整批订单。
+        
+        Args:
+            order_requests: 下单请求列表
+            
+        Returns:
+            List[OrderResult]: 与 order_requests 一一对应的结果，成功时 result 为 Order
+        """
+        def place_one(request: OrderRequest) -> Order:
+            return self.place_order(
+                symbol=request.symbol,
+                side=request.side,
+                order_type=request.order_type,
+                quantity=request.quantity,
+                price=request.price,
+                time_in_force=request.time_in_force,
+                reduce_only=request.reduce_only,
+                client_order_id=request.client_order_id,
+                **request.extra
+            )
+        
+        return self.batch_executor.map(place_one, order_requests)
+    
+    def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+    ) -> List[OrderResult]:
+        """
+        批量撤单
+        
+        默认实现通过 batch_executor 并发调用 cancel_order；交易所有原生批量
+        撤单接口时，子类应覆盖此方法。
+        
+        Args:
+            order_ids: 订单ID列表
+            symbol: 交易对符号（某些交易所需要）
+            
+        Returns:
+            List[OrderResult]: 与 order_ids 一一对应的结果，成功时 result 为 True
+        """
+        return self.batch_executor.map(
+            lambda order_id: self.cancel_order(order_id=str(order_id), symbol=symbol),
+            order_ids,
+        )
+    
+    def amend_order(
+        self,
+        order_id: str,
+        symbol: str,
+        price: Decimal,
+        quantity: Optional[Decimal] = None,
+        **kwargs
+    ) -> Order:
+        """
+        改单（可选实现，supports_amend 为 True 的交易所必须实现）
+        
+        Args:
+            order_id: 订单ID
+            symbol: 交易对符号
+            price: 新价格
+            quantity: 新数量，为 None 时保持原数量
+            **kwargs: 其他交易所特定参数
+            
+        Returns:
+            Order: 改单后的订单信息
+            
+        Raises:
+            NotImplementedError: 交易所不支持改单
+        """
+        raise NotImplementedError(f"{self.exchange_name} 不支持改单")
+    
+    def amend_orders(self, amend_requests: List[AmendRequest]) -> List[OrderResult]:
+        """
+        批量改单
+        
+        默认实现通过 batch_executor 并发调用 amend_order；交易所有原生批量改单接口时，
+        子类应覆盖此方法。
+        
+        Args:
+            amend_requests: 改单请求列表
+            
+        Returns:
+            List[OrderResult]: 与 amend_requests 一一对应的结果，成功时 result 为 Order
+        """
+        return self.batch_executor.map(
+            lambda request: self.amend_order(
+                order_id=request.order_id,
+                symbol=request.symbol,
+                price=request.price,
+                quantity=request.quantity,
+            ),
+            amend_requests,
+        )
+    
+    def replace_orders(
+        self,
+        cancel_ids: List[str],
+        new_orders: List[OrderRequest],
+        symbol: Optional[str] = None,
+    ) -> Tuple[List[OrderResult], List[OrderResult]]:
+        """
+        撤单并下新单（网格重新挂单）
+        
+        默认实现先批量撤单再批量下单，先撤后下可以避免新单因保证金不足被拒；
+        交易所支持原子撤单+下单时，子类应覆盖此方法用一次请求完成。
+        
+        Args:
+            cancel_ids: 需要撤销的订单ID列表
+            new_orders: 需要新下的订单请求列表
+            symbol: 交易对符号（某些交易所撤单需要）
+            
+        Returns:
+            Tuple[List[OrderResult], List[OrderResult]]: (撤单结果, 下单结果)
+        """
+        cancel_results = self.cancel_orders(cancel_ids, symbol=symbol) if cancel_ids else []
+        place_results = self.place_orders(new_orders) if new_orders else []
+        return cancel_results, place_results
+    
     def place_limit_order(
         self,
         symbol: str,
@@ -460,7 +985,46 @@ class BasePerpAdapter(ABC):
         if positions:
             return positions[0]
         return None
-    
+
+    def load_instruments(self) -> Dict[str, Instrument]:
+        """
+        从交易所加载全部交易对的精度信息（可选实现，由 instruments 缓存调用）
+
+        Returns:
+            Dict[str, Instrument]: 交易对符号 -> 精度信息
+
+        Raises:
+            NotImplementedError: 交易所未提供精度信息
+        """
+        raise NotImplementedError(f"{self.exchange_name} 未提供交易对精度信息")
+
+    def get_instrument(self, symbol: str) -> Optional[Instrument]:
+        """
+        获取交易对精度信息（带缓存）
+
+        Args:
+            symbol: 交易对符号
+
+        Returns:
+            Optional[Instrument]: 精度信息，交易所未提供或交易对不存在时返回 None
+        """
+        return self.instruments.get(symbol)
+
+    def get_open_orders_batch(self, symbol: Optional[str] = None) -> OrderBatch:
+        """
+        查询所有未成交订单，以列式 OrderBatch 返回（批量场景使用）
+
+        默认由 get_open_orders 的结果转换；子类可以直接从交易所原始响应解析，
+        省去逐单创建 Order 和 Decimal 的开销。
+
+        Args:
+            symbol: 交易对符号，如果为 None 则返回所有交易对的订单
+
+        Returns:
+            OrderBatch: 未成交订单
+        """
+        return OrderBatch.from_orders(self.get_open_orders(symbol=symbol))
+
     def close_position(
         self,
         symbol: str,
@@ -0,0 +1,107 @@
+"""
+Batch Order Executor
+
+This module fans order operations (place / cancel) out over a bounded
+thread pool, so a grid requote costs roughly one round-trip instead of N
+sequential ones. Each adapter owns one executor sized by its per-exchange
+concurrency limit.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+
+# 各交易所默认并发上限（可通过交易所配置 max_concurrency 覆盖）
+DEFAULT_MAX_CONCURRENCY = {
+    "standx": 8,
+    "grvt": 5,
+}
+FALLBACK_MAX_CONCURRENCY = 4
+
+
+class OrderResult:
+    """单笔订单操作结果"""
+    def __init__(
+        self,
+        request: Any,
+        success: bool,
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ):
+        self.request = request
+        self.success = success
+        self.result = result
+        self.error = error
+
+    def __repr__(self) -> str:
+        if self.success:
+            return f"<OrderResult(ok, request={self.request!r})>"
+        return f"<OrderResult(failed, request={self.request!r}, error={self.error})>"
+
+
+class BatchExecutor:
+    """
+    有界并发的订单操作执行器
+
+    线程池在首次使用时创建；单个请求时直接在调用线程执行，避免线程切换开销。
+    """
+
+    def __init__(self, max_workers: int = FALLBACK_MAX_CONCURRENCY):
+        """
+        初始化执行器
+
+        Args:
+            max_workers: 最大并发数（即同时在途的请求数）
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers 必须大于等于 1")
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="order-batch",
+                    )
+        return self._pool
+
+    @staticmethod
+    def _call(fn: Callable[[Any], Any], request: Any) -> OrderResult:
+        try:
+            return OrderResult(request, True, result=fn(request))
+        except Exception as e:
+            return OrderResult(request, False, error=e)
+
+    def map(self, fn: Callable[[Any], Any], requests: Iterable[Any]) -> List[OrderResult]:
+        """
+        并发执行 fn(request)，按输入顺序返回每个请求的结果
+
+        单个请求失败不会影响其他请求，异常记录在对应 OrderResult.error 中。
+
+        Args:
+            fn: 对单个请求执行的操作
+            requests: 请求列表
+
+        Returns:
+            List[OrderResult]: 与 requests 一一对应的结果列表
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+        if len(requests) == 1 or self.max_workers == 1:
+            return [self._call(fn, request) for request in requests]
+
+        pool = self._get_pool()
+        futures = [pool.submit(self._call, fn, request) for request in requests]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """关闭线程池"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
@@ -8,6 +8,11 @@ from adapters.base_adapter import BasePerpAdapter
 from adapters.standx_adapter import StandXAdapter
 from adapters.grvt_adapter import GrvtAdapter
 
+try:
+    from adapters.lighter_adapter import LighterAdapter
+except ImportError:  # Lighter SDK 的依赖（pydantic、aiohttp、websockets）未安装
+    LighterAdapter = None
+
 # 注册所有可用的适配器
 _ADAPTER_REGISTRY: Dict[str, Type[BasePerpAdapter]] = {
     "standx": StandXAdapter,
@@ -16,6 +21,9 @@ _ADAPTER_REGISTRY: Dict[str, Type[BasePerpAdapter]] = {
     # "nado": NadoAdapter,
 }
 
+if LighterAdapter is not None:
+    _ADAPTER_REGISTRY["lighter"] = LighterAdapter
+
 
 def create_adapter(config: Dict[str, Any]) -> BasePerpAdapter:
     """
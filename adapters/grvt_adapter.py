@@ -7,6 +7,7 @@ import sys
 import os
 import time
 import asyncio
+import functools
 import logging
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
@@ -15,7 +16,10 @@ from decimal import Decimal
 project_root = os.path.join(os.path.dirname(__file__), '..')
 sys.path.insert(0, project_root)
 
-from adapters.base_adapter import BasePerpAdapter, Balance, Position, Order
+from adapters.base_adapter import BasePerpAdapter, Balance, Position, Order, OrderRequest
+from adapters.batch_executor import OrderResult
+from adapters.instruments import Instrument
+from adapters.orderbook import OrderBookSnapshot, parse_levels
 
 # 导入 GRVT 相关模块
 # 注意：将 src 目录添加到 sys.path 后直接导入模块名
@@ -25,12 +29,31 @@ if grvt_sdk_path not in sys.path:
 
 from pysdk.grvt_ccxt import GrvtCcxt
 from pysdk.grvt_ccxt_env import GrvtEnv, GrvtWSEndpointType
+from pysdk.grvt_ccxt_types import GrvtOrderSide
+from pysdk.grvt_ccxt_utils import (
+    GrvtOrder,
+    get_order_signer,
+    install_worker_signer,
+    sign_grvt_order_in_worker,
+)
 from pysdk.grvt_ccxt_ws import GrvtCcxtWS
 
 
 class GrvtAdapter(BasePerpAdapter):
     """GRVT 交易所适配器实现"""
     
+    # GRVT 订单状态 -> 统一订单状态
+    _STATUS_MAP = {
+        "PENDING": "pending",
+        "OPEN": "open",
+        "FILLED": "filled",
+        "CANCELLED": "cancelled",
+        "REJECTED": "rejected",
+    }
+    
+    # REST 订单簿接口支持的深度档位
+    _BOOK_DEPTHS = (10, 50, 100, 500)
+    
     def __init__(self, config: Dict[str, Any]):
         """
         初始化 GRVT 适配器
@@ -63,29 +86,40 @@ class GrvtAdapter(BasePerpAdapter):
         # 初始化 GRVT 客户端
         self.grvt_client = GrvtCcxt(env=self.env, parameters=parameters)
         self.ws_client: Optional[GrvtCcxtWS] = None
+        self._ws_lock: Optional[asyncio.Lock] = None
     
     def connect(self) -> bool:
         """
         连接到 GRVT（获取价格不需要认证，直接返回成功）
         
+        配置了 signing_workers 时预先启动签名进程，并在每个进程中安装签名器；
+        私钥只在进程启动时传递一次，签名作业不再携带。
+        
         Returns:
             bool: 连接是否成功
         """
+        private_key = self.config.get("private_key", "")
+        if private_key and self.signing_pool.max_workers > 0:
+            self.signing_pool.start(functools.partial(install_worker_signer, private_key, self.env))
         return True
 
     async def connect_ws(self) -> GrvtCcxtWS:
-        """连接 GRVT WebSocket（市场数据无需认证）"""
-        if not self.ws_client:
-            params = {
-                "api_key": self.config.get("api_key", ""),
-                "trading_account_id": self.config.get("trading_account_id", ""),
-                "private_key": self.config.get("private_key", ""),
-                "api_ws_version": self.config.get("api_ws_version", "v1"),
-            }
-            loop = asyncio.get_running_loop()
-            logger = logging.getLogger("grvt_ws")
-            self.ws_client = GrvtCcxtWS(env=self.env, loop=loop, logger=logger, parameters=params)
-            await self.ws_client.initialize()
+        """连接 GRVT WebSocket（市场数据无需认证），多个交易对并发订阅时只初始化一次"""
+        if self._ws_lock is None:
+            self._ws_lock = asyncio.Lock()
+        async with self._ws_lock:
+            if not self.ws_client:
+                params = {
+                    "api_key": self.config.get("api_key", ""),
+                    "trading_account_id": self.config.get("trading_account_id", ""),
+                    "private_key": self.config.get("private_key", ""),
+                    "api_ws_version": self.config.get("api_ws_version", "v1"),
+                }
+                loop = asyncio.get_running_loop()
+                logger = logging.getLogger("grvt_ws")
+                ws_client = GrvtCcxtWS(env=self.env, loop=loop, logger=logger, parameters=params)
+                await ws_client.initialize()
+                self.ws_client = ws_client
         return self.ws_client
 
     async def subscribe_ws(
@@ -104,6 +138,78 @@ class GrvtAdapter(BasePerpAdapter):
             ws_end_point_type=ws_end_point_type,
         )
     
+    async def subscribe_ticker(self, symbol: str, callback) -> None:
+        """订阅价格推送（ticker.s），回调参数与 get_ticker 格式一致"""
+        def on_ticker(message: Dict[str, Any]) -> None:
+            feed = message.get("feed")
+            if isinstance(feed, dict):
+                callback(self._parse_ticker_data(feed, symbol))
+
+        await self.subscribe_ws(
+            stream="ticker.s",
+            params={"instrument": symbol},
+            callback=on_ticker,
+        )
+
+    async def subscribe_orderbook(self, symbol: str) -> None:
+        """
+        订阅增量深度推送（book.d），维护本地订单簿供 get_orderbook 读取
+        
+        订阅后的首条消息为全量快照，其后为增量（size 为 0 表示删除价位）。
+        prev_sequence_number 与上一条消息的 sequence_number 不连续时判定为丢包：
+        撤下本地快照并在后台重新订阅，重新订阅后的首条消息作为新的快照；
+        重新同步期间 get_orderbook 回退到 REST。
+        """
+        book = self.orderbooks.book(symbol)
+        params = {"instrument": symbol, "rate": self.config.get("orderbook_rate", 500)}
+        state = {"awaiting_snapshot": True, "resync_task": None}
+
+        async def resync() -> None:
+            try:
+                ws_client = await self.connect_ws()
+                # 先退订再订阅（内部等待 5 秒），期间到达的旧增量全部丢弃
+                await ws_client.re_subscribe_stream(stream="book.d", callback=on_book, params=params)
+            finally:
+                state["awaiting_snapshot"] = True
+                state["resync_task"] = None
+
+        def on_book(message: Dict[str, Any]) -> None:
+            feed = message.get("feed")
+            if not isinstance(feed, dict) or state["resync_task"] is not None:
+                return
+            sequence = int(message.get("sequence_number") or 0)
+            timestamp = int(feed.get("event_time") or 0) // 1_000_000 or None
+            bids = parse_levels(feed.get("bids"))
+            asks = parse_levels(feed.get("asks"))
+            if state["awaiting_snapshot"]:
+                # 快照的 sequence_number 为 0 时不校验下一条增量的 prev_sequence_number
+                book.apply_snapshot(bids, asks, sequence=sequence or None, timestamp=timestamp)
+                state["awaiting_snapshot"] = False
+                return
+            prev_sequence = int(message.get("prev_sequence_number") or 0)
+            if not book.apply_delta(bids, asks, sequence, prev_sequence, timestamp):
+                print(f"[GRVT] {symbol} 订单簿序列号不连续（{prev_sequence} != {book.sequence}），重新订阅")
+                state["resync_task"] = asyncio.create_task(resync())
+
+        await self.subscribe_ws(stream="book.d", params=params, callback=on_book)
+
+    async def subscribe_orders(self, symbol: str, callback) -> None:
+        """订阅自身订单推送（order），回调参数为 Order 对象"""
+        def on_order(message: Dict[str, Any]) -> None:
+            feed = message.get("feed")
+            if not isinstance(feed, dict):
+                return
+            try:
+                callback(self._grvt_order_to_order(feed, symbol))
+            except ValueError:
+                pass  # 跳过格式错误的订单
+
+        await self.subscribe_ws(
+            stream="order",
+            params={"instrument": symbol},
+            callback=on_order,
+        )
+    
     def get_balance(self) -> Balance:
         """查询账户余额"""
         raise NotImplementedError("GRVT 余额查询功能待实现")
@@ -174,6 +280,9 @@ class GrvtAdapter(BasePerpAdapter):
         
         leg = legs[0]
         metadata = grvt_order.get("metadata", {})
+        state = grvt_order.get("state") or {}
+        # 下单返回结果不带 state，视为 pending；推送与查询结果按 state.status 映射
+        status = self._STATUS_MAP.get(str(state.get("status", "")).upper(), "pending")
         
         return Order(
             order_id=str(metadata.get("client_order_id", "")),
@@ -182,25 +291,22 @@ class GrvtAdapter(BasePerpAdapter):
             order_type="market" if grvt_order.get("is_market") else "limit",
             quantity=Decimal(str(leg.get("size", 0))),
             price=Decimal(str(leg.get("limit_price", 0))) if leg.get("limit_price") else None,
-            status="pending",  # GRVT 订单状态需要进一步查询
+            status=status,
+            client_order_id=str(metadata.get("client_order_id", "")) or None,
             created_at=int(time.time() * 1000),
         )
     
-    def place_order(
+    def _build_grvt_order(
         self,
         symbol: str,
         side: str,
         order_type: str,
         quantity: Decimal,
         price: Optional[Decimal] = None,
-        time_in_force: str = "gtc",
         reduce_only: bool = False,
         client_order_id: Optional[str] = None,
-        **kwargs
-    ) -> Order:
-        """下单"""
-        from pysdk.grvt_ccxt_types import GrvtOrderSide
-        
+    ) -> GrvtOrder:
+        """构造未签名的 GRVT 订单（nonce、过期时间、client_order_id 在此确定）"""
         # 转换 side 格式
         grvt_side: GrvtOrderSide = "buy" if side.lower() in ["buy", "long"] else "sell"
         
@@ -209,21 +315,105 @@ class GrvtAdapter(BasePerpAdapter):
         if client_order_id:
             params["client_order_id"] = client_order_id
         
-        # 下单
         if order_type.lower() == "limit":
             if price is None:
                 raise ValueError("限价单必须提供价格")
-            result = self.grvt_client.create_limit_order(symbol, grvt_side, str(quantity), str(price), params)
-        elif order_type.lower() == "market":
-            result = self.grvt_client.create_order(symbol, "market", grvt_side, str(quantity), None, params)
-        else:
-            raise ValueError(f"不支持的订单类型: {order_type}")
-        
+            return self.grvt_client.build_grvt_order(symbol, "limit", grvt_side, str(quantity), str(price), params)
+        if order_type.lower() == "market":
+            return self.grvt_client.build_grvt_order(symbol, "market", grvt_side, str(quantity), None, params)
+        raise ValueError(f"不支持的订单类型: {order_type}")
+    
+    def _sign_job(self, order: GrvtOrder) -> tuple:
+        """签名作业参数：订单和该订单的合约信息，私钥由签名进程中安装的签名器持有"""
+        market = self.grvt_client.markets[order.legs[0].instrument]
+        instruments = {
+            order.legs[0].instrument: {
+                "instrument_hash": market["instrument_hash"],
+                "base_decimals": market["base_decimals"],
+            }
+        }
+        return (order, instruments)
+    
+    def _sign_inline(self, order: GrvtOrder, instruments: Dict[str, dict]) -> GrvtOrder:
+        """在调用线程用本适配器的签名器签名"""
+        return get_order_signer(self.grvt_client._private_key, self.env).sign_order(order, instruments)
+    
+    def _submit_signed_order(self, order: GrvtOrder, symbol: str) -> Order:
+        """提交已签名的订单"""
+        result = self.grvt_client.create_signed_grvt_order(order)
         if not result:
             raise Exception("下单失败：返回结果为空")
-        
         return self._grvt_order_to_order(result, symbol)
     
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Decimal,
+        price: Optional[Decimal] = None,
+        time_in_force: str = "gtc",
+        reduce_only: bool = False,
+        client_order_id: Optional[str] = None,
+        **kwargs
+    ) -> Order:
+        """下单"""
+        order = self._build_grvt_order(
+            symbol, side, order_type, quantity, price, reduce_only, client_order_id
+        )
+        self._sign_inline(*self._sign_job(order))
+        return self._submit_signed_order(order, symbol)
+    
+    def place_orders(self, order_requests: List[OrderRequest]) -> List[OrderResult]:
+        """批量下单
+        
+        批次达到 signing_min_batch 且配置了 signing_workers 时：订单在调用线程按输入顺序构造
+        （nonce 等在此确定），交给签名池并行签名，再通过 batch_executor 并发提交。
+        否则与基类相同，并发逐个下单。
+        """
+        if not self.signing_pool.should_offload(len(order_requests)):
+            return super().place_orders(order_requests)
+        
+        results: List[Optional[OrderResult]] = [None] * len(order_requests)
+        built = []
+        for i, request in enumerate(order_requests):
+            try:
+                order = self._build_grvt_order(
+                    request.symbol,
+                    request.side,
+                    request.order_type,
+                    request.quantity,
+                    request.price,
+                    request.reduce_only,
+                    request.client_order_id,
+                )
+                built.append((i, self._sign_job(order)))
+            except Exception as e:
+                results[i] = OrderResult(request, False, error=e)
+        
+        signed = self.signing_pool.map(
+            sign_grvt_order_in_worker, [job for _, job in built], inline_fn=self._sign_inline
+        )
+        to_submit = []
+        for (i, _), sign_result in zip(built, signed):
+            if sign_result.success:
+                to_submit.append((i, sign_result.result))
+            else:
+                results[i] = OrderResult(order_requests[i], False, error=sign_result.error)
+        
+        submitted = self.batch_executor.map(
+            lambda item: self._submit_signed_order(item[1], order_requests[item[0]].symbol),
+            to_submit,
+        )
+        for (i, _), submit_result in zip(to_submit, submitted):
+            results[i] = OrderResult(
+                order_requests[i],
+                submit_result.success,
+                result=submit_result.result,
+                error=submit_result.error,
+            )
+        return results
+    
     def cancel_order(
         self,
         order_id: Optional[str] = None,
@@ -243,6 +433,30 @@ class GrvtAdapter(BasePerpAdapter):
             params["client_order_id"] = str(order_id)
         return self.grvt_client.cancel_order(id=None, symbol=symbol, params=params)
     
+    def _cancel_by_any_id(self, order_id: Any, symbol: Optional[str] = None) -> bool:
+        """按交易所 order_id（0x 开头）或 client_order_id 撤单"""
+        order_id_str = str(order_id)
+        if order_id_str.startswith("0x"):
+            # 看起来是交易所 order_id
+            return self.cancel_order(order_id=order_id_str, symbol=symbol)
+        # 默认按 client_order_id 处理
+        return self.cancel_order(client_order_id=order_id_str, symbol=symbol)
+    
+    def cancel_orders(
+        self,
+        order_ids: List[Any],
+        symbol: Optional[str] = None,
+    ) -> List[OrderResult]:
+        """批量撤单（GRVT 没有批量撤单接口，并发逐个撤单）
+        
+        Args:
+            order_ids: 订单ID列表（0x 开头为交易所 order_id，其余按 client_order_id 处理）
+            symbol: 交易对符号（可选）
+        """
+        return self.batch_executor.map(
+            lambda order_id: self._cancel_by_any_id(order_id, symbol), order_ids
+        )
+    
     def cancel_orders_by_ids(
         self,
         order_id_list: List[Any],
@@ -254,20 +468,9 @@ class GrvtAdapter(BasePerpAdapter):
             order_id_list: 订单ID列表（在 GRVT 中，这些是 client_order_id）
             symbol: 交易对符号（可选）
         """
-        success_count = 0
-        for order_id in order_id_list:
-            try:
-                order_id_str = str(order_id)
-                if order_id_str.startswith("0x"):
-                    # 看起来是交易所 order_id
-                    if self.cancel_order(order_id=order_id_str, symbol=symbol):
-                        success_count += 1
-                else:
-                    # 默认按 client_order_id 处理
-                    if self.cancel_order(client_order_id=order_id_str, symbol=symbol):
-                        success_count += 1
-            except Exception:
-                continue  # 跳过失败的订单
+        # 并发撤单，失败的订单记录在结果中，不影响其他订单
+        results = self.cancel_orders(order_id_list, symbol=symbol)
+        success_count = sum(1 for r in results if r.success and r.result)
         
         return success_count > 0
     
@@ -341,6 +544,26 @@ class GrvtAdapter(BasePerpAdapter):
         
         return orders
     
+    def load_instruments(self) -> Dict[str, Instrument]:
+        """
+        通过 load_markets 加载全部永续合约的精度信息（同时刷新签名使用的市场信息）
+        
+        GRVT 没有单独的数量步长字段：数量精度由 base_decimals 决定（签名时按 10**base_decimals 取整），
+        lot_size 取 10**-base_decimals；min_size 是最小下单数量，单独作为下限。
+        """
+        instruments = {}
+        for symbol, market in self.grvt_client.load_markets().items():
+            try:
+                instruments[symbol] = Instrument(
+                    symbol,
+                    tick_size=market["tick_size"],
+                    lot_size=Decimal(1).scaleb(-int(market["base_decimals"])),
+                    min_size=market["min_size"],
+                )
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                continue  # 跳过精度字段缺失或无效的交易对
+        return instruments
+    
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         获取交易对的最新价格信息
@@ -363,32 +586,62 @@ class GrvtAdapter(BasePerpAdapter):
             if not isinstance(ticker_data, dict):
                 raise Exception(f"返回的数据格式不正确: {type(ticker_data)}")
             
-            # 转换价格（根据 GRVT API 文档，fetch_ticker 返回的价格已经是实际价格，不需要除以 PRICE_MULTIPLIER）
-            def parse_price(price_str: Optional[str]) -> Optional[float]:
-                if not price_str or price_str == "0":
-                    return None
-                try:
-                    return float(price_str)
-                except (ValueError, TypeError):
-                    return None
-            
-            return {
-                "symbol": ticker_data.get("instrument", symbol),
-                "bid_price": parse_price(ticker_data.get("best_bid_price")),
-                "ask_price": parse_price(ticker_data.get("best_ask_price")),
-                "mid_price": parse_price(ticker_data.get("mid_price")),
-                "last_price": parse_price(ticker_data.get("last_price")),
-                "mark_price": parse_price(ticker_data.get("mark_price")),
-                "index_price": parse_price(ticker_data.get("index_price")),
-                "timestamp": int(time.time() * 1000),
-            }
+            return self._parse_ticker_data(ticker_data, symbol)
         except Exception as e:
             raise Exception(f"获取价格失败: {e}")
     
+    def _parse_ticker_data(self, ticker_data: Dict[str, Any], symbol: str) -> Dict[str, Any]:
+        """将 GRVT ticker 数据（REST / ticker.s 推送）转换为统一的 ticker 字典"""
+        # 转换价格（根据 GRVT API 文档，fetch_ticker 返回的价格已经是实际价格，不需要除以 PRICE_MULTIPLIER）
+        def parse_price(price_str: Optional[str]) -> Optional[float]:
+            if not price_str or price_str == "0":
+                return None
+            try:
+                return float(price_str)
+            except (ValueError, TypeError):
+                return None
+        
+        return {
+            "symbol": ticker_data.get("instrument", symbol),
+            "bid_price": parse_price(ticker_data.get("best_bid_price")),
+            "ask_price": parse_price(ticker_data.get("best_ask_price")),
+            "mid_price": parse_price(ticker_data.get("mid_price")),
+            "last_price": parse_price(ticker_data.get("last_price")),
+            "mark_price": parse_price(ticker_data.get("mark_price")),
+            "index_price": parse_price(ticker_data.get("index_price")),
+            "timestamp": int(time.time() * 1000),
+        }
+    
     def get_orderbook(
         self,
         symbol: str,
         depth: int = 20,
     ) -> Dict[str, Any]:
-        """获取订单簿"""
-        raise NotImplementedError("GRVT 订单簿查询功能待实现")
+        """
+        获取订单簿
+        
+        已订阅深度推送（subscribe_orderbook）且已同步时直接读取本地订单簿，
+        未订阅或重新同步期间回退到 REST。
+        
+        Args:
+            symbol: 交易对符号，如 "BTC_USDT_Perp"
+            depth: 深度，默认 20
+            
+        Returns:
+            Dict[str, Any]: 包含 bids 和 asks 的订单簿数据
+        """
+        orderbook = self.orderbooks.get(symbol, depth)
+        if orderbook is not None:
+            return orderbook
+        try:
+            limit = next((d for d in self._BOOK_DEPTHS if d >= depth), self._BOOK_DEPTHS[-1])
+            data = self.grvt_client.fetch_order_book(symbol, limit=limit)
+            snapshot = OrderBookSnapshot.from_levels(
+                data.get("instrument") or data.get("symbol") or symbol,
+                parse_levels(data.get("bids")),
+                parse_levels(data.get("asks")),
+                timestamp=int(data.get("event_time") or 0) // 1_000_000 or data.get("timestamp"),
+            )
+            return snapshot.to_dict(depth)
+        except Exception as e:
+            raise Exception(f"获取订单簿失败: {e}")
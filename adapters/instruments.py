@@ -0,0 +1,183 @@
+"""
+Instrument Metadata Cache
+
+This module holds per-instrument price tick and size lot metadata and a
+per-adapter cache for it. The cache loads every instrument from the
+exchange once on first use and refreshes lazily: after refresh_interval
+seconds, or when an unknown symbol is requested (rate limited), so
+strategy code can quantize prices to integer ticks without a metadata
+request per cycle.
+"""
+import threading
+import time
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN
+from typing import Any, Callable, Dict, Optional
+
+
+# 精度信息整体刷新间隔（秒）
+DEFAULT_REFRESH_INTERVAL = 3600.0
+
+# 查询未知交易对触发重新加载的最小间隔（秒）
+UNKNOWN_SYMBOL_RELOAD_INTERVAL = 60.0
+
+# 尚无缓存时加载失败后的重试间隔（秒），避免每轮都阻塞在加载上
+LOAD_RETRY_INTERVAL = 10.0
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+class Instrument:
+    """交易对精度信息（价格最小变动单位 tick、数量最小变动单位 lot）"""
+    __slots__ = ("symbol", "tick_size", "lot_size", "min_size")
+
+    def __init__(
+        self,
+        symbol: str,
+        tick_size: Any,
+        lot_size: Any,
+        min_size: Optional[Any] = None,
+    ):
+        """
+        Args:
+            symbol: 交易对符号
+            tick_size: 价格最小变动单位
+            lot_size: 数量最小变动单位
+            min_size: 最小下单数量，默认等于 lot_size
+        """
+        self.symbol = symbol
+        self.tick_size = _to_decimal(tick_size)
+        self.lot_size = _to_decimal(lot_size)
+        self.min_size = _to_decimal(min_size) if min_size is not None else self.lot_size
+        if self.tick_size <= 0 or self.lot_size <= 0:
+            raise ValueError(f"{symbol} 的 tick_size / lot_size 必须大于 0")
+
+    @classmethod
+    def from_decimals(
+        cls,
+        symbol: str,
+        price_decimals: int,
+        size_decimals: int,
+        min_size: Optional[Any] = None,
+    ) -> "Instrument":
+        """由价格/数量小数位数构建，如 price_decimals=2 表示 tick 为 0.01"""
+        return cls(
+            symbol,
+            Decimal(1).scaleb(-int(price_decimals)),
+            Decimal(1).scaleb(-int(size_decimals)),
+            min_size,
+        )
+
+    def price_to_ticks(self, price: Any, rounding: str = ROUND_HALF_EVEN) -> int:
+        """
+        将价格换算为 tick 数
+
+        Args:
+            price: 价格（float、字符串或 Decimal）
+            rounding: 不在 tick 上的价格的取整方式（decimal 模块的 ROUND_* 常量）
+
+        Returns:
+            int: tick 数
+        """
+        return int((_to_decimal(price) / self.tick_size).to_integral_value(rounding))
+
+    def ticks_to_price(self, ticks: int) -> Decimal:
+        """将 tick 数还原为价格"""
+        return ticks * self.tick_size
+
+    def floor_ticks(self, price: Any) -> int:
+        """向下取整到 tick"""
+        return self.price_to_ticks(price, ROUND_FLOOR)
+
+    def ceil_ticks(self, price: Any) -> int:
+        """向上取整到 tick"""
+        return self.price_to_ticks(price, ROUND_CEILING)
+
+    def quantize_quantity(self, quantity: Any) -> Decimal:
+        """将数量向下取整到 lot"""
+        lots = (_to_decimal(quantity) / self.lot_size).to_integral_value(ROUND_FLOOR)
+        return lots * self.lot_size
+
+    def __repr__(self) -> str:
+        return f"<Instrument({self.symbol}, tick={self.tick_size}, lot={self.lot_size})>"
+
+
+class InstrumentCache:
+    """
+    交易对精度信息缓存
+
+    loader 一次返回交易所全部交易对，首次读取时加载；超过 refresh_interval 或查询到
+    未知交易对时重新加载。loader 抛出 NotImplementedError 表示交易所不提供精度信息，
+    此后 get 一律返回 None；其他加载错误在已有缓存时沿用旧数据，没有缓存时抛出异常，
+    LOAD_RETRY_INTERVAL 内的后续查询不再重试，直接返回 None。
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Dict[str, Instrument]],
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ):
+        """
+        Args:
+            loader: 加载全部交易对精度信息的函数（阻塞调用）
+            refresh_interval: 整体刷新间隔（秒）
+        """
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.supported = True
+        self._lock = threading.Lock()
+        self._instruments: Dict[str, Instrument] = {}
+        self._loaded_at: Optional[float] = None
+        self._failed_at: Optional[float] = None
+
+    def _load_locked(self) -> None:
+        try:
+            instruments = self.loader()
+        except NotImplementedError:
+            self.supported = False
+            return
+        except Exception as e:
+            if not self._instruments:
+                self._failed_at = time.monotonic()
+                raise Exception(f"加载交易对精度信息失败: {e}")
+            print(f"刷新交易对精度信息失败，沿用缓存: {e}")
+            instruments = self._instruments
+        self._instruments = instruments
+        self._loaded_at = time.monotonic()
+        self._failed_at = None
+
+    def get(self, symbol: str) -> Optional[Instrument]:
+        """
+        查询交易对精度信息
+
+        Args:
+            symbol: 交易对符号
+
+        Returns:
+            Optional[Instrument]: 精度信息，交易所不提供、交易对不存在或加载失败等待重试时返回 None
+        """
+        with self._lock:
+            if not self.supported:
+                return None
+            if (
+                self._failed_at is not None
+                and time.monotonic() - self._failed_at < LOAD_RETRY_INTERVAL
+            ):
+                return None
+            age = None if self._loaded_at is None else time.monotonic() - self._loaded_at
+            if (
+                age is None
+                or age >= self.refresh_interval
+                or (symbol not in self._instruments and age >= UNKNOWN_SYMBOL_RELOAD_INTERVAL)
+            ):
+                self._load_locked()
+            return self._instruments.get(symbol)
+
+    def refresh(self) -> None:
+        """立即重新加载"""
+        with self._lock:
+            self._load_locked()
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.get(symbol) is not None
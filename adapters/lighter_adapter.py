@@ -0,0 +1,1068 @@
+"""
+Lighter Exchange Adapter Implementation
+
+This module implements BasePerpAdapter for Lighter. Orders are signed
+locally with the SDK SignerClient and a whole requote (cancels and new
+orders) is submitted as one send_tx_batch over a persistent WebSocket.
+Order book, position and order state come from WsClient subscriptions
+instead of REST polling. The Lighter SDK is asyncio-based, so the adapter runs it on
+a private event-loop thread and the synchronous methods wait on that loop.
+"""
+import sys
+import os
+import time
+import asyncio
+import itertools
+import threading
+import concurrent.futures
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from typing import Callable, Dict, Any, Optional, List, Tuple
+
+# 添加项目路径
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from adapters.base_adapter import BasePerpAdapter, Balance, Position, Order, OrderRequest, AmendRequest
+from adapters.batch_executor import OrderResult
+from adapters.instruments import Instrument
+from adapters.orderbook import OrderBookSnapshot, parse_levels
+
+# 导入 Lighter SDK（exchange/exchange_lighter/lighter）
+lighter_sdk_path = os.path.join(project_root, 'exchange', 'exchange_lighter')
+if lighter_sdk_path not in sys.path:
+    sys.path.insert(0, lighter_sdk_path)
+
+import lighter
+from lighter import SignerClient, WsClient
+from lighter.fast_models import HOT_RESPONSE_TYPES
+from lighter.l2_book import L2OrderBook
+from lighter.nonce_manager import NonceManagerType, NonceUnavailableError
+
+
+# 各环境的 REST 地址（WebSocket 地址由此推导）
+BASE_URLS = {
+    "mainnet": "https://mainnet.zklighter.elliot.ai",
+    "testnet": "https://testnet.zklighter.elliot.ai",
+}
+
+# 单次 send_tx_batch 最多包含的交易数
+MAX_BATCH_SIZE = 50
+
+# 同步方法等待事件循环线程的默认超时（秒）
+DEFAULT_REQUEST_TIMEOUT = 15.0
+
+# WebSocket 断线重连的退避区间（秒）
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# 认证 token 有效期 10 分钟，提前刷新
+AUTH_TOKEN_TTL = 8 * 60
+
+# client_order_index 的取值上限（48 位）
+MAX_CLIENT_ORDER_INDEX = 2 ** 48 - 1
+
+
+def _call_signer(sign, *args):
+    """签名池作业：sign 为 SignerClient.sign_* 方法"""
+    return sign(*args)
+
+
+def _float_levels(levels) -> List[Tuple[float, float]]:
+    return [(float(price), float(size)) for price, size in levels]
+
+
+def _to_ms(value: Any) -> Optional[int]:
+    """Lighter 时间戳有秒和毫秒两种，统一为毫秒"""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    if value <= 0:
+        return None
+    return value * 1000 if value < 10 ** 11 else value
+
+
+class LighterAdapter(BasePerpAdapter):
+    """Lighter 交易所适配器实现"""
+
+    # 改单通过 sign_modify_order 原地修改价格/数量
+    supports_amend = True
+
+    # 签名在 ctypes 调用的原生库中完成，签名期间释放 GIL
+    signing_pool_mode = "thread"
+
+    # Lighter 订单状态 -> 统一订单状态（canceled-* 统一映射为 cancelled）
+    _STATUS_MAP = {
+        "in-progress": "pending",
+        "pending": "pending",
+        "open": "open",
+        "filled": "filled",
+    }
+
+    # 统一有效期 -> Lighter time_in_force
+    _TIF_MAP = {
+        "gtc": SignerClient.ORDER_TIME_IN_FORCE_GOOD_TILL_TIME,
+        "ioc": SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL,
+        "post_only": SignerClient.ORDER_TIME_IN_FORCE_POST_ONLY,
+    }
+
+    # Lighter 订单中的 time_in_force -> 统一有效期
+    _TIF_NAMES = {
+        "good-till-time": "gtc",
+        "immediate-or-cancel": "ioc",
+        "post-only": "post_only",
+    }
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        初始化 Lighter 适配器
+
+        Args:
+            config: 配置字典，包含：
+                - exchange_name: "lighter"
+                - env: "mainnet" 或 "testnet"（可选，默认 "mainnet"）
+                - base_url: REST 地址（可选，覆盖 env）
+                - account_index: 账户索引（下单需要）
+                - api_key_index / api_private_key: API Key 索引和私钥（下单需要），
+                  或 api_private_keys: {api_key_index: 私钥} 配置多个 API Key 轮换使用
+                - request_timeout: 同步调用的超时秒数（可选，默认 15）
+                - market_slippage: 市价单的最大滑点比例（可选，默认 0.01）
+                - nonce_manager: nonce 管理方式，"async"（默认，本地流水线分配、多 API Key 分片、
+                  出错时后台重新同步）、"optimistic" 或 "api"
+                - fast_deserialize: 订单簿、挂单、成交、账户等高频 REST 响应跳过 pydantic 校验，
+                  直接解码为轻量结构（可选，默认 True）
+        """
+        super().__init__(config)
+        env = str(config.get("env", "mainnet")).lower()
+        self.base_url = (config.get("base_url") or BASE_URLS.get(env, BASE_URLS["mainnet"])).rstrip("/")
+        self.account_index = int(config.get("account_index", 0))
+        self.api_private_keys = self._parse_api_keys(config)
+        self.request_timeout = float(config.get("request_timeout", DEFAULT_REQUEST_TIMEOUT))
+        self.market_slippage = Decimal(str(config.get("market_slippage", "0.01")))
+        self.nonce_manager_type = NonceManagerType[str(config.get("nonce_manager", "async")).upper()]
+        self.fast_deserialize = bool(config.get("fast_deserialize", True))
+
+        self.signer: Optional[SignerClient] = None
+        self.api_client: Optional[lighter.ApiClient] = None
+        self._order_api: Optional[lighter.OrderApi] = None
+        self._account_api: Optional[lighter.AccountApi] = None
+        self.ws_client: Optional[WsClient] = None
+
+        # SDK 的 HTTP 会话和 WebSocket 都运行在这个事件循环线程上
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._closed = False
+
+        # 同一适配器的交易批次串行签名和提交，保证同一 API Key 的 nonce 按序到达
+        self._submit_lock = threading.Lock()
+        self._client_order_ids = itertools.count(int(time.time() * 1000))
+        self._auth_token: Optional[str] = None
+        self._auth_expires_at = 0.0
+
+        # 交易对 <-> market_id，由 load_instruments 填充
+        self._market_ids: Dict[str, int] = {}
+        self._symbols: Dict[int, str] = {}
+
+        # account_all 推送维护的持仓（market_id -> Position），整体替换，读取无需加锁
+        self._positions: Dict[int, Position] = {}
+        self._account_synced = False
+
+        # market_id -> [(调用方事件循环, 回调)]
+        self._ticker_callbacks: Dict[int, List[Tuple[asyncio.AbstractEventLoop, Any]]] = {}
+        # market_id -> [(调用方事件循环, 回调)]，account_all_orders 推送按 market_index 分发
+        self._order_callbacks: Dict[int, List[Tuple[asyncio.AbstractEventLoop, Any]]] = {}
+
+    @staticmethod
+    def _parse_api_keys(config: Dict[str, Any]) -> Dict[int, str]:
+        keys = config.get("api_private_keys") or {}
+        api_keys = {int(index): str(key) for index, key in keys.items() if key}
+        if config.get("api_private_key"):
+            api_keys[int(config.get("api_key_index", 0))] = str(config["api_private_key"])
+        return api_keys
+
+    # ==================== 事件循环与连接 ====================
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """启动事件循环线程，并在其中创建 REST 客户端（aiohttp 会话需绑定到该循环）"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="lighter-loop", daemon=True).start()
+
+                async def create_api_client() -> lighter.ApiClient:
+                    return lighter.ApiClient(
+                        configuration=lighter.Configuration(host=self.base_url),
+                        fast_response_types=HOT_RESPONSE_TYPES if self.fast_deserialize else None,
+                    )
+
+                self.api_client = asyncio.run_coroutine_threadsafe(create_api_client(), loop).result()
+                self._order_api = lighter.OrderApi(self.api_client)
+                self._account_api = lighter.AccountApi(self.api_client)
+                self._loop = loop
+            return self._loop
+
+    @property
+    def order_api(self) -> lighter.OrderApi:
+        self._ensure_loop()
+        return self._order_api
+
+    @property
+    def account_api(self) -> lighter.AccountApi:
+        self._ensure_loop()
+        return self._account_api
+
+    def _run(self, coro, timeout: Optional[float] = None) -> Any:
+        """在事件循环线程中执行协程并等待结果（不能在事件循环线程内调用）"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout or self.request_timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def connect(self) -> bool:
+        """
+        创建签名客户端并启动 WebSocket（订单簿、账户推送与交易提交共用一条连接）
+
+        未配置 API 私钥时只提供行情查询。
+
+        Returns:
+            bool: 连接是否成功
+        """
+        loop = self._ensure_loop()
+        if self.api_private_keys and self.signer is None:
+            async def create_signer() -> SignerClient:
+                # 在事件循环线程上创建，SignerClient 与 self.api_client 共用同一个 HTTP 连接池；各 API Key 的初始 nonce 并发获取
+                signer = SignerClient(
+                    url=self.base_url,
+                    account_index=self.account_index,
+                    api_private_keys=dict(self.api_private_keys),
+                    nonce_management_type=self.nonce_manager_type,
+                )
+                await signer.nonce_manager.start()
+                return signer
+
+            try:
+                signer = asyncio.run_coroutine_threadsafe(create_signer(), loop).result()
+            except Exception as e:
+                raise Exception(f"Lighter 签名客户端初始化失败: {e}")
+            error = signer.check_client()
+            if error is not None:
+                raise Exception(f"Lighter API Key 校验失败: {error}")
+            self.signer = signer
+            if self.signing_pool.max_workers > 0:
+                self.signing_pool.start()
+        if self.signer is not None:
+            self._ensure_stream()
+        return True
+
+    def _ensure_stream(self, market_id: Optional[int] = None) -> WsClient:
+        """创建 WsClient 并在事件循环线程中保持连接；已签名的适配器同时订阅 account_all"""
+        loop = self._ensure_loop()
+        with self._loop_lock:
+            if self.ws_client is None:
+                self.ws_client = WsClient(
+                    host=self.base_url.replace("https://", ""),
+                    order_book_ids=[market_id] if market_id is not None else [],
+                    account_ids=[self.account_index] if self.signer is not None else [],
+                    on_order_book_update=self._on_order_book,
+                    on_account_update=self._on_account,
+                    on_order_book_gap=self._on_order_book_gap,
+                    on_account_orders_update=self._on_account_orders,
+                    auth_token_provider=self._auth,
+                )
+                asyncio.run_coroutine_threadsafe(self._supervise_stream(self.ws_client), loop)
+            return self.ws_client
+
+    async def _supervise_stream(self, ws_client: WsClient) -> None:
+        """保持 WebSocket 连接：断线后按指数退避重连，重连后 WsClient 重新订阅，收到新快照后才重新发布订单簿"""
+        delay = RECONNECT_MIN_DELAY
+        while not self._closed:
+            started = time.monotonic()
+            try:
+                await ws_client.run_async()
+                print("[Lighter] WebSocket 连接已关闭")
+            except Exception as e:
+                print(f"[Lighter] WebSocket 异常: {e}")
+
+            # 断线期间本地订单簿和持仓不再可信，回退到 REST 直到重新收到快照
+            self._account_synced = False
+            for market_id in ws_client.subscriptions["order_books"]:
+                symbol = self._symbols.get(int(market_id))
+                if symbol is not None and symbol in self.orderbooks:
+                    self.orderbooks.book(symbol).invalidate()
+            if self._closed:
+                break
+
+            if time.monotonic() - started > RECONNECT_MAX_DELAY:
+                delay = RECONNECT_MIN_DELAY
+            print(f"[Lighter] {delay:.0f} 秒后重连 WebSocket")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def close(self) -> None:
+        """关闭 WebSocket、HTTP 会话和事件循环线程"""
+        loop = self._loop
+        if loop is None:
+            return
+        self._closed = True
+
+        async def shutdown() -> None:
+            if self.ws_client is not None and self.ws_client.ws is not None:
+                await self.ws_client.ws.close()
+            if self.signer is not None:
+                await self.signer.close()
+            await self.api_client.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(self.request_timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop = None
+            self.ws_client = None
+            self.signing_pool.shutdown(wait=False)
+
+    def _require_signer(self) -> SignerClient:
+        if self.signer is None:
+            raise Exception("Lighter 未配置 API 私钥或未调用 connect()")
+        return self.signer
+
+    def _auth(self) -> str:
+        """账户私有查询使用的认证 token（缓存至过期前）"""
+        now = time.time()
+        if self._auth_token is None or now >= self._auth_expires_at:
+            token, error = self._require_signer().create_auth_token_with_expiry()
+            if error is not None:
+                raise Exception(f"生成 Lighter 认证 token 失败: {error}")
+            self._auth_token = token
+            self._auth_expires_at = now + AUTH_TOKEN_TTL
+        return self._auth_token
+
+    # ==================== 交易对信息 ====================
+
+    def load_instruments(self) -> Dict[str, Instrument]:
+        """通过 order_book_details 加载全部永续合约的价格/数量精度，同时刷新交易对与 market_id 的映射"""
+        details = self._run(self.order_api.order_book_details())
+        instruments = {}
+        market_ids = {}
+        for detail in details.order_book_details or []:
+            try:
+                instruments[detail.symbol] = Instrument.from_decimals(
+                    detail.symbol,
+                    detail.price_decimals,
+                    detail.size_decimals,
+                    detail.min_base_amount,
+                )
+            except (TypeError, ValueError, ArithmeticError):
+                continue  # 跳过精度字段缺失或无效的交易对
+            market_ids[detail.symbol] = int(detail.market_id)
+        self._market_ids = market_ids
+        self._symbols = {market_id: symbol for symbol, market_id in market_ids.items()}
+        return instruments
+
+    def _require_instrument(self, symbol: str) -> Instrument:
+        instrument = self.get_instrument(symbol)
+        if instrument is None:
+            raise ValueError(f"Lighter 不支持的交易对: {symbol}")
+        return instrument
+
+    def _market_id(self, symbol: str) -> int:
+        """交易对 -> market_id；未知交易对会触发一次（限频的）重新加载"""
+        if symbol not in self._market_ids:
+            self._require_instrument(symbol)
+        market_id = self._market_ids.get(symbol)
+        if market_id is None:
+            raise ValueError(f"Lighter 不支持的交易对: {symbol}")
+        return market_id
+
+    # ==================== WebSocket 推送 ====================
+
+    def _on_order_book(self, market_id: str, book: L2OrderBook) -> None:
+        """
+        WsClient 订单簿回调（事件循环线程）：快照整体替换本地订单簿，增量只应用变化的价位，并推送 ticker
+
+        WsClient 已按 nonce 连续性检查过增量（丢包时丢弃订单簿并重新订阅），这里只会收到连续的消息；
+        应用增量后盘口交叉时同样丢弃订单簿并重新订阅。
+        """
+        market_id = int(market_id)
+        symbol = self._symbols.get(market_id)
+        if symbol is None:
+            return
+        local = self.orderbooks.book(symbol)
+        delta = book.last_delta
+        if delta is None:
+            local.apply_snapshot(_float_levels(book.bids), _float_levels(book.asks), sequence=book.offset)
+        elif not local.apply_delta(
+            parse_levels(delta.get("bids")), parse_levels(delta.get("asks")), sequence=book.offset
+        ):
+            print(f"[Lighter] {symbol} 本地订单簿失去同步，重新订阅")
+            if self.ws_client is not None:
+                self.ws_client.resync_order_book(market_id)
+            return
+        callbacks = self._ticker_callbacks.get(market_id)
+        snapshot = local.snapshot
+        if callbacks and snapshot is not None:
+            ticker = self._ticker_from_levels(symbol, snapshot.bids[:1], snapshot.asks[:1])
+            for loop, callback in callbacks:
+                loop.call_soon_threadsafe(callback, ticker)
+
+    def _on_order_book_gap(self, market_id: str) -> None:
+        """WsClient 检测到订单簿丢包：撤下已发布的订单簿，等待重新订阅后的快照"""
+        symbol = self._symbols.get(int(market_id))
+        if symbol is not None and symbol in self.orderbooks:
+            print(f"[Lighter] {symbol} 订单簿增量不连续，重新订阅")
+            self.orderbooks.book(symbol).invalidate()
+
+    def _on_account(self, account_id: str, message: Dict[str, Any]) -> None:
+        """WsClient account_all 回调（事件循环线程）：按 market_id 合并持仓"""
+        updates = message.get("positions")
+        if isinstance(updates, dict):
+            positions = dict(self._positions)
+            for market_id, data in updates.items():
+                if not isinstance(data, dict):
+                    continue
+                market_id = int(data.get("market_id", market_id))
+                position = self._position_from_data(data, market_id)
+                if position is None:
+                    positions.pop(market_id, None)
+                else:
+                    positions[market_id] = position
+            self._positions = positions
+        self._account_synced = True
+
+    def _on_account_orders(self, account_id: str, message: Dict[str, Any]) -> None:
+        """WsClient account_all_orders 回调（事件循环线程）：转换为 Order 后在订阅方的事件循环中回调"""
+        updates = message.get("orders")
+        if not isinstance(updates, dict):
+            return
+        for market_id, items in updates.items():
+            callbacks = self._order_callbacks.get(int(market_id))
+            if not callbacks:
+                continue
+            for data in items or []:
+                if not isinstance(data, dict):
+                    continue
+                data.setdefault("market_index", market_id)
+                order = self._order_from_data(data)
+                for loop, callback in tuple(callbacks):
+                    loop.call_soon_threadsafe(self._deliver_order, callback, order)
+
+    @staticmethod
+    def _deliver_order(callback, order: Order) -> None:
+        """执行单个订单回调，异常不影响其他回调"""
+        try:
+            callback(order)
+        except Exception as e:
+            print(f"[Lighter] 订单推送回调错误: {e}")
+
+    async def subscribe_orders(self, symbol: str, callback) -> Callable[[], None]:
+        """
+        订阅自身订单推送（account_all_orders 频道，需要认证），回调参数为 Order 对象
+
+        频道推送账户下所有市场的订单变化，按 market_index 分发给各交易对的回调，回调在订阅方的事件循环中执行。
+        同一交易对重复注册同一回调只保留一个；断线重连时 WsClient 用新的认证 token 重新订阅。
+
+        Returns:
+            Callable[[], None]: 取消该回调的函数
+        """
+        self._require_signer()
+        market_id = await asyncio.to_thread(self._market_id, symbol)
+        entry = (asyncio.get_running_loop(), callback)
+        callbacks = self._order_callbacks.setdefault(market_id, [])
+        if entry not in callbacks:
+            callbacks.append(entry)
+
+        def unsubscribe() -> None:
+            registered = self._order_callbacks.get(market_id)
+            if registered and entry in registered:
+                registered.remove(entry)
+                if not registered:
+                    del self._order_callbacks[market_id]
+
+        try:
+            ws_client = await asyncio.to_thread(self._ensure_stream)
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+                ws_client.subscribe_account_orders_async(self.account_index), self._loop
+            ))
+        except Exception:
+            unsubscribe()
+            raise
+        return unsubscribe
+
+    async def subscribe_orderbook(self, symbol: str) -> None:
+        """
+        订阅 order_book/{market_id} 并维护本地订单簿供 get_orderbook 读取
+
+        WsClient 以 L2OrderBook 维护全量深度（快照 + 增量），快照和连续的增量同步写入 self.orderbooks；
+        断线或增量不连续时本地订单簿失效，get_orderbook 回退到 REST，直到收到新的快照。
+        """
+        market_id = await asyncio.to_thread(self._market_id, symbol)
+        self.orderbooks.book(symbol)
+        ws_client = await asyncio.to_thread(self._ensure_stream, market_id)
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(ws_client.subscribe_order_book_async(market_id), self._loop)
+        )
+
+    async def subscribe_ticker(self, symbol: str, callback) -> None:
+        """订阅价格推送（由订单簿推送的买一/卖一生成），回调在调用方的事件循环中执行"""
+        market_id = await asyncio.to_thread(self._market_id, symbol)
+        self._ticker_callbacks.setdefault(market_id, []).append((asyncio.get_running_loop(), callback))
+        await self.subscribe_orderbook(symbol)
+
+    # ==================== 账户查询 ====================
+
+    def _fetch_account(self):
+        try:
+            accounts = self._run(self.account_api.account(by="index", value=str(self.account_index)))
+        except Exception as e:
+            raise Exception(f"Lighter 查询账户失败: {e}")
+        if not accounts.accounts:
+            raise Exception(f"Lighter 账户 {self.account_index} 不存在")
+        return accounts.accounts[0]
+
+    def _position_from_data(self, data: Dict[str, Any], market_id: Optional[int] = None) -> Optional[Position]:
+        """将 Lighter 持仓（REST AccountPosition / account_all 推送）转换为 Position，空仓返回 None"""
+        size = Decimal(str(data.get("position") or 0))
+        if size == 0:
+            return None
+        if market_id is None:
+            market_id = int(data.get("market_id", -1))
+        value = Decimal(str(data.get("position_value") or 0))
+        margin_mode = data.get("margin_mode")
+        return Position(
+            symbol=self._symbols.get(market_id) or data.get("symbol", ""),
+            size=abs(size),
+            side="long" if int(data.get("sign") or 1) > 0 else "short",
+            entry_price=Decimal(str(data.get("avg_entry_price") or 0)),
+            mark_price=abs(value / size),
+            unrealized_pnl=Decimal(str(data.get("unrealized_pnl") or 0)),
+            margin_mode={0: "cross", 1: "isolated"}.get(margin_mode, margin_mode),
+        )
+
+    def get_balance(self) -> Balance:
+        """查询账户余额"""
+        account = self._fetch_account()
+        unrealized_pnl = sum(
+            (Decimal(str(position.unrealized_pnl or 0)) for position in account.positions or []),
+            Decimal("0"),
+        )
+        return Balance(
+            total_balance=Decimal(str(account.collateral or 0)),
+            available_balance=Decimal(str(account.available_balance or 0)),
+            equity=Decimal(str(account.total_asset_value or 0)),
+            unrealized_pnl=unrealized_pnl,
+        )
+
+    def get_positions(self, symbol: Optional[str] = None) -> List[Position]:
+        """查询持仓信息（account_all 推送已同步时直接读取推送维护的持仓）"""
+        if self._account_synced:
+            positions = list(self._positions.values())
+        else:
+            account = self._fetch_account()
+            positions = []
+            for data in account.positions or []:
+                position = self._position_from_data(data.to_dict())
+                if position is not None:
+                    positions.append(position)
+        if symbol:
+            positions = [position for position in positions if position.symbol == symbol]
+        return positions
+
+    # ==================== 订单查询 ====================
+
+    def _order_from_data(self, data: Dict[str, Any]) -> Order:
+        """将 Lighter 订单转换为 Order；order_id 取 client_order_index（撤单/改单两者均接受），为 0 时取 order_index"""
+        client_index = int(data.get("client_order_index") or 0)
+        quantity = Decimal(str(data.get("initial_base_amount") or 0))
+        filled = Decimal(str(data.get("filled_base_amount") or 0))
+        status = str(data.get("status", "")).lower()
+        if status.startswith("canceled"):
+            status = "cancelled"
+        else:
+            status = self._STATUS_MAP.get(status, "rejected")
+        if status == "open" and filled > 0:
+            status = "partially_filled"
+        market_id = int(data.get("market_index", -1))
+        return Order(
+            order_id=str(client_index or data.get("order_index", "")),
+            symbol=self._symbols.get(market_id, str(market_id)),
+            side="sell" if data.get("is_ask") else "buy",
+            order_type="market" if str(data.get("type", "")).lower() == "market" else "limit",
+            quantity=quantity,
+            price=Decimal(str(data["price"])) if data.get("price") else None,
+            filled_quantity=filled,
+            status=status,
+            time_in_force=self._TIF_NAMES.get(str(data.get("time_in_force", "")).lower()),
+            reduce_only=bool(data.get("reduce_only")),
+            client_order_id=str(client_index) if client_index else None,
+            created_at=_to_ms(data.get("created_at")),
+            updated_at=_to_ms(data.get("updated_at")),
+        )
+
+    def _fetch_active_orders(self, market_id: int) -> List[Order]:
+        orders = self._run(self.order_api.account_active_orders(
+            account_index=self.account_index,
+            market_id=market_id,
+            auth=self._auth(),
+        ))
+        return [self._order_from_data(order.to_dict()) for order in orders.orders or []]
+
+    def get_open_orders(
+        self,
+        symbol: Optional[str] = None,
+    ) -> List[Order]:
+        """查询所有未成交订单（不指定交易对时只查询账户中有挂单的市场）"""
+        try:
+            if symbol:
+                market_ids = [self._market_id(symbol)]
+            else:
+                market_ids = [
+                    position.market_id
+                    for position in self._fetch_account().positions or []
+                    if position.open_order_count or position.pending_order_count
+                ]
+            orders = []
+            for market_id in market_ids:
+                orders.extend(self._fetch_active_orders(market_id))
+            return orders
+        except Exception as e:
+            raise Exception(f"Lighter 查询挂单失败: {e}")
+
+    def get_order(
+        self,
+        order_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Optional[Order]:
+        """查询订单状态（只在未成交订单中查找，已结束的订单返回 None）"""
+        if not symbol:
+            raise ValueError("Lighter 查询订单需要提供 symbol")
+        target = str(client_order_id or order_id)
+        for order in self._fetch_active_orders(self._market_id(symbol)):
+            if target in (order.order_id, order.client_order_id):
+                return order
+        return None
+
+    # ==================== 行情 ====================
+
+    @staticmethod
+    def _ticker_from_levels(symbol: str, bids, asks, last_price: Optional[float] = None) -> Dict[str, Any]:
+        bid_price = float(bids[0][0]) if bids else None
+        ask_price = float(asks[0][0]) if asks else None
+        mid_price = (bid_price + ask_price) / 2 if bid_price and ask_price else None
+        return {
+            "symbol": symbol,
+            "bid_price": bid_price,
+            "ask_price": ask_price,
+            "mid_price": mid_price,
+            "last_price": last_price,
+            "mark_price": None,
+            "index_price": None,
+            "timestamp": int(time.time() * 1000),
+        }
+
+    def get_ticker(self, symbol: str) -> Dict[str, Any]:
+        """
+        获取交易对的最新价格信息
+
+        已订阅订单簿时由本地订单簿的买一/卖一生成，否则查询 REST（盘口 + 最新成交价）。
+        """
+        snapshot = self.orderbooks.snapshot(symbol)
+        if snapshot is not None:
+            return self._ticker_from_levels(symbol, snapshot.bids[:1], snapshot.asks[:1])
+        try:
+            market_id = self._market_id(symbol)
+            book = self._run(self.order_api.order_book_orders(market_id, 1))
+            details = self._run(self.order_api.order_book_details(market_id=market_id))
+            last_price = None
+            if details.order_book_details:
+                last_price = float(details.order_book_details[0].last_trade_price or 0) or None
+            return self._ticker_from_levels(
+                symbol,
+                [(order.price, order.remaining_base_amount) for order in book.bids or []],
+                [(order.price, order.remaining_base_amount) for order in book.asks or []],
+                last_price,
+            )
+        except Exception as e:
+            raise Exception(f"获取价格失败: {e}")
+
+    def get_orderbook(
+        self,
+        symbol: str,
+        depth: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        获取订单簿
+
+        已订阅深度推送（subscribe_orderbook）且已同步时直接读取本地订单簿，
+        未订阅或断线期间回退到 REST（按价格聚合 order_book_orders 的挂单）。
+        """
+        orderbook = self.orderbooks.get(symbol, depth)
+        if orderbook is not None:
+            return orderbook
+        try:
+            data = self._run(self.order_api.order_book_orders(self._market_id(symbol), min(max(depth, 1), 250)))
+            snapshot = OrderBookSnapshot.from_levels(
+                symbol,
+                parse_levels(L2OrderBook.aggregate_orders(data.bids or [], is_bid=True)),
+                parse_levels(L2OrderBook.aggregate_orders(data.asks or [], is_bid=False)),
+            )
+            return snapshot.to_dict(depth)
+        except Exception as e:
+            raise Exception(f"获取订单簿失败: {e}")
+
+    # ==================== 签名与批量提交 ====================
+
+    def _client_order_index(self, client_order_id: Optional[str]) -> int:
+        """数字形式且在 48 位范围内的 client_order_id 直接使用，否则生成递增的 client_order_index"""
+        if client_order_id is not None and str(client_order_id).isdigit():
+            index = int(client_order_id)
+            if 0 < index <= MAX_CLIENT_ORDER_INDEX:
+                return index
+        return next(self._client_order_ids)
+
+    def _base_amount(self, instrument: Instrument, quantity: Decimal) -> int:
+        lots = int(instrument.quantize_quantity(quantity) / instrument.lot_size)
+        if lots <= 0:
+            raise ValueError(f"数量 {quantity} 小于 {instrument.symbol} 的最小变动单位 {instrument.lot_size}")
+        return lots
+
+    def _market_price_ticks(self, symbol: str, instrument: Instrument, is_ask: bool, price: Optional[Decimal]) -> int:
+        """市价单的最差成交价：未指定价格时取对手盘一档加 market_slippage"""
+        if price is None:
+            ticker = self.get_ticker(symbol)
+            reference = ticker["bid_price"] if is_ask else ticker["ask_price"]
+            if not reference:
+                raise Exception(f"{symbol} 盘口为空，无法确定市价单价格")
+            slippage = -self.market_slippage if is_ask else self.market_slippage
+            price = Decimal(str(reference)) * (1 + slippage)
+        return instrument.price_to_ticks(price, ROUND_FLOOR if is_ask else ROUND_CEILING)
+
+    def _create_tx(self, request: OrderRequest) -> tuple:
+        """下单请求 -> (签名函数, 签名参数, 请求, 成功时返回的 Order)"""
+        signer = self._require_signer()
+        instrument = self._require_instrument(request.symbol)
+        market_id = self._market_id(request.symbol)
+        is_ask = request.side.lower() in ("sell", "short")
+        base_amount = self._base_amount(instrument, request.quantity)
+        order_type = request.order_type.lower()
+        time_in_force = (request.time_in_force or "gtc").lower()
+        if order_type == "limit":
+            if request.price is None:
+                raise ValueError("限价单必须提供价格")
+            price = instrument.price_to_ticks(request.price)
+            type_code = SignerClient.ORDER_TYPE_LIMIT
+            tif_code = self._TIF_MAP.get(time_in_force, SignerClient.ORDER_TIME_IN_FORCE_GOOD_TILL_TIME)
+        elif order_type == "market":
+            price = self._market_price_ticks(request.symbol, instrument, is_ask, request.price)
+            type_code = SignerClient.ORDER_TYPE_MARKET
+            tif_code = SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL
+            time_in_force = "ioc"
+        else:
+            raise ValueError(f"不支持的订单类型: {request.order_type}")
+        expiry = (
+            SignerClient.DEFAULT_IOC_EXPIRY
+            if tif_code == SignerClient.ORDER_TIME_IN_FORCE_IMMEDIATE_OR_CANCEL
+            else SignerClient.DEFAULT_28_DAY_ORDER_EXPIRY
+        )
+        client_index = self._client_order_index(request.client_order_id)
+        args = (
+            market_id, client_index, base_amount, price, is_ask, type_code, tif_code,
+            bool(request.reduce_only), SignerClient.NIL_TRIGGER_PRICE, expiry,
+        )
+        order = Order(
+            order_id=str(client_index),
+            symbol=request.symbol,
+            side="sell" if is_ask else "buy",
+            order_type=order_type,
+            quantity=base_amount * instrument.lot_size,
+            price=instrument.ticks_to_price(price) if order_type == "limit" else None,
+            status="pending",
+            time_in_force=time_in_force,
+            reduce_only=bool(request.reduce_only),
+            client_order_id=str(client_index),
+            created_at=int(time.time() * 1000),
+        )
+        return (signer.sign_create_order, args, request, order)
+
+    def _cancel_tx(self, order_id: Any, symbol: Optional[str]) -> tuple:
+        """撤单 -> (签名函数, 签名参数, 订单ID, True)"""
+        signer = self._require_signer()
+        if not symbol:
+            raise ValueError("Lighter 撤单需要提供 symbol")
+        return (signer.sign_cancel_order, (self._market_id(symbol), int(order_id)), order_id, True)
+
+    def _modify_tx(self, request: AmendRequest) -> tuple:
+        """改单请求 -> (签名函数, 签名参数, 请求, 成功时返回的 Order)"""
+        signer = self._require_signer()
+        if request.quantity is None:
+            raise ValueError("Lighter 改单必须提供数量")
+        instrument = self._require_instrument(request.symbol)
+        base_amount = self._base_amount(instrument, request.quantity)
+        price = instrument.price_to_ticks(request.price)
+        args = (
+            self._market_id(request.symbol), int(request.order_id), base_amount, price,
+            SignerClient.NIL_TRIGGER_PRICE,
+        )
+        order = Order(
+            order_id=str(request.order_id),
+            symbol=request.symbol,
+            side=request.side or "",
+            order_type="limit",
+            quantity=base_amount * instrument.lot_size,
+            price=instrument.ticks_to_price(price),
+            status="open",
+            client_order_id=request.client_order_id or str(request.order_id),
+            updated_at=int(time.time() * 1000),
+        )
+        return (signer.sign_modify_order, args, request, order)
+
+    def _sign_all(self, jobs: List[tuple]) -> List[OrderResult]:
+        """签名一批作业；批次达到 signing_min_batch 且配置了 signing_workers 时交给签名线程池"""
+        if self.signing_pool.should_offload(len(jobs)):
+            return self.signing_pool.map(_call_signer, jobs)
+        results = []
+        for job in jobs:
+            try:
+                results.append(OrderResult(job, True, result=_call_signer(*job)))
+            except Exception as e:
+                results.append(OrderResult(job, False, error=e))
+        return results
+
+    def _send_batch(self, tx_types: List[int], tx_infos: List[str]) -> None:
+        """通过 WebSocket 提交一批已签名交易，WebSocket 未连接时回退到 REST sendTxBatch"""
+        ws_client = self.ws_client
+        if ws_client is not None and ws_client.connected:
+            response = self._run(
+                ws_client.send_tx_batch_async(tx_types, tx_infos, timeout=self.request_timeout),
+                timeout=self.request_timeout + 1,
+            )
+            data = response.get("data") if isinstance(response.get("data"), dict) else response
+            error = response.get("error") or data.get("error")
+            code = data.get("code")
+            if error or (code is not None and int(code) != 200):
+                raise Exception(f"Lighter 批量交易被拒绝: {error or data.get('message') or code}")
+            return
+        response = self._run(self.signer.send_tx_batch(tx_types, tx_infos))
+        if response.code != 200:
+            raise Exception(f"Lighter 批量交易被拒绝: {response.message or response.code}")
+
+    def _execute(self, txs: List[tuple]) -> List[OrderResult]:
+        """
+        签名并提交交易
+
+        每 MAX_BATCH_SIZE 笔为一批：同一批使用同一个 API Key 的连续 nonce，
+        整批通过一次 send_tx_batch 提交，批内按顺序执行（撤单排在下单之前）。
+
+        Args:
+            txs: (签名函数, 签名参数（不含 nonce / api_key_index）, 请求, 成功时的结果) 列表
+
+        Returns:
+            List[OrderResult]: 与 txs 一一对应的结果
+        """
+        signer = self._require_signer()
+        results: List[OrderResult] = []
+        with self._submit_lock:
+            for start in range(0, len(txs), MAX_BATCH_SIZE):
+                results.extend(self._execute_batch(signer, txs[start:start + MAX_BATCH_SIZE]))
+        return results
+
+    def _execute_batch(self, signer: SignerClient, chunk: List[tuple]) -> List[OrderResult]:
+        """
+        签名并提交一批交易，并把每个 nonce 的结果回报给 nonce 管理器
+
+        某笔签名失败时只记该笔失败，其后的交易换用连续的 nonce 重新签名，提交的批次内 nonce 始终连续。
+        提交成功逐个确认；交易所明确拒绝整批时按倒序回退 nonce（nonce 错误时再重新同步该 API Key）；
+        超时或断线（不确定交易是否已执行）时只在后台重新同步该 API Key，其他 API Key 照常分配。
+        """
+        nonce_manager = signer.nonce_manager
+        api_key_index = None
+        results: List[Optional[OrderResult]] = [None] * len(chunk)
+        tx_types, tx_infos, sent, nonces = [], [], [], {}
+        pending = list(range(len(chunk)))
+        while pending:
+            jobs: List[tuple] = []
+            try:
+                for i in pending:
+                    sign, args, _, _ = chunk[i]
+                    api_key_index, nonce = nonce_manager.next_nonce(api_key_index)
+                    jobs.append((sign,) + args + (nonce, api_key_index))
+            except NonceUnavailableError as e:
+                for job in reversed(jobs):
+                    nonce_manager.acknowledge_failure(api_key_index, job[-2])
+                for i in pending:
+                    results[i] = OrderResult(chunk[i][2], False, error=e)
+                break
+
+            signed_all = self._sign_all(jobs)
+            failed = None
+            for k, signed in enumerate(signed_all):
+                error = signed.error if not signed.success else signed.result[3]
+                if error is not None:
+                    failed = k
+                    results[pending[k]] = OrderResult(chunk[pending[k]][2], False, error=Exception(f"签名失败: {error}"))
+                    break
+                i = pending[k]
+                tx_types.append(signed.result[0])
+                tx_infos.append(signed.result[1])
+                sent.append(i)
+                nonces[i] = jobs[k][-2]
+            if failed is None:
+                break
+            # 签名失败的 nonce 之后的交易会因 nonce 不连续被拒绝：倒序释放失败及其后的 nonce
+            # （回退到失败位置），剩余交易用连续的 nonce 重新签名
+            for job in reversed(jobs[failed:]):
+                nonce_manager.acknowledge_failure(api_key_index, job[-2])
+            pending = pending[failed + 1:]
+        if not sent:
+            return results
+
+        try:
+            self._send_batch(tx_types, tx_infos)
+        except Exception as e:
+            if isinstance(e, (TimeoutError, concurrent.futures.TimeoutError, ConnectionError)):
+                # 交易可能仍会执行：nonce 保持在途，重新同步会先等待它们结算
+                nonce_manager.hard_refresh_nonce(api_key_index)
+            else:
+                for i in reversed(sent):
+                    nonce_manager.acknowledge_failure(api_key_index, nonces[i])
+                if "nonce" in str(e).lower():
+                    nonce_manager.hard_refresh_nonce(api_key_index)
+            for i in sent:
+                results[i] = OrderResult(chunk[i][2], False, error=e)
+            return results
+
+        for i in sent:
+            nonce_manager.acknowledge_success(api_key_index, nonces[i])
+            results[i] = OrderResult(chunk[i][2], True, result=chunk[i][3])
+        return results
+
+    def _submit(self, *groups) -> List[List[OrderResult]]:
+        """
+        构造各组交易并合并为一次 _execute 提交
+
+        Args:
+            groups: (请求列表, 构造函数) 对，构造失败的请求直接记为失败
+
+        Returns:
+            List[List[OrderResult]]: 每组与请求一一对应的结果
+        """
+        txs, slots, outputs = [], [], []
+        for items, build in groups:
+            results: List[Optional[OrderResult]] = [None] * len(items)
+            for i, item in enumerate(items):
+                try:
+                    txs.append(build(item))
+                    slots.append((results, i))
+                except Exception as e:
+                    results[i] = OrderResult(item, False, error=e)
+            outputs.append(results)
+        if txs:
+            for (results, i), result in zip(slots, self._execute(txs)):
+                results[i] = result
+        return outputs
+
+    # ==================== 下单 / 撤单 / 改单 ====================
+
+    def place_orders(self, order_requests: List[OrderRequest]) -> List[OrderResult]:
+        """批量下单：本地签名后整批通过一次 send_tx_batch 提交"""
+        return self._submit((order_requests, self._create_tx))[0]
+
+    def cancel_orders(
+        self,
+        order_ids: List[Any],
+        symbol: Optional[str] = None,
+    ) -> List[OrderResult]:
+        """批量撤单（order_id 为 client_order_index 或 order_index），整批一次提交"""
+        return self._submit((order_ids, lambda order_id: self._cancel_tx(order_id, symbol)))[0]
+
+    def amend_orders(self, amend_requests: List[AmendRequest]) -> List[OrderResult]:
+        """批量改单（sign_modify_order），整批一次提交"""
+        return self._submit((amend_requests, self._modify_tx))[0]
+
+    def replace_orders(
+        self,
+        cancel_ids: List[str],
+        new_orders: List[OrderRequest],
+        symbol: Optional[str] = None,
+    ) -> Tuple[List[OrderResult], List[OrderResult]]:
+        """撤单并下新单：撤单在前、下单在后，合并为一次 send_tx_batch（超过 MAX_BATCH_SIZE 时分批）"""
+        cancel_results, place_results = self._submit(
+            (cancel_ids, lambda order_id: self._cancel_tx(order_id, symbol)),
+            (new_orders, self._create_tx),
+        )
+        return cancel_results, place_results
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Decimal,
+        price: Optional[Decimal] = None,
+        time_in_force: str = "gtc",
+        reduce_only: bool = False,
+        client_order_id: Optional[str] = None,
+        **kwargs
+    ) -> Order:
+        """下单"""
+        request = OrderRequest(
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            time_in_force=time_in_force,
+            reduce_only=reduce_only,
+            client_order_id=client_order_id,
+        )
+        result = self.place_orders([request])[0]
+        if not result.success:
+            raise Exception(f"下单失败: {result.error}")
+        return result.result
+
+    def cancel_order(
+        self,
+        order_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ) -> bool:
+        """撤单"""
+        result = self.cancel_orders([client_order_id or order_id], symbol=symbol)[0]
+        if not result.success:
+            raise Exception(f"撤单失败: {result.error}")
+        return True
+
+    def amend_order(
+        self,
+        order_id: str,
+        symbol: str,
+        price: Decimal,
+        quantity: Optional[Decimal] = None,
+        **kwargs
+    ) -> Order:
+        """改单"""
+        result = self.amend_orders([AmendRequest(order_id, symbol, price, quantity, kwargs.get("side"))])[0]
+        if not result.success:
+            raise Exception(f"改单失败: {result.error}")
+        return result.result
+
+    def cancel_all_orders(
+        self,
+        symbol: Optional[str] = None,
+    ) -> bool:
+        """撤销所有订单（指定交易对时撤销该交易对的挂单，否则撤销账户全部挂单）"""
+        if symbol:
+            orders = self.get_open_orders(symbol)
+            results = self.cancel_orders([order.order_id for order in orders], symbol=symbol)
+            return all(result.success for result in results)
+        signer = self._require_signer()
+        result = self._execute([(
+            signer.sign_cancel_all_orders,
+            (SignerClient.CANCEL_ALL_TIF_IMMEDIATE, 0),
+            None,
+            True,
+        )])[0]
+        if not result.success:
+            raise Exception(f"撤销全部订单失败: {result.error}")
+        return True
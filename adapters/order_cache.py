@@ -0,0 +1,279 @@
+"""
+Local Order State Cache
+
+This module keeps an in-memory book of our own open orders, keyed by
+order id and client order id and indexed by side and price level. It is
+seeded from a REST snapshot, kept current from the adapter's private order
+stream (subscribe_orders), and reconciled against REST periodically, so
+strategy code can read pending orders without a REST round-trip per cycle.
+"""
+import asyncio
+import threading
+import time
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from adapters.base_adapter import ACTIVE_STATUSES, Order, OrderBatch, tick_units, to_fixed
+
+
+def normalize_side(side: str) -> Optional[str]:
+    """统一订单方向：long/buy -> buy, short/sell -> sell"""
+    if side in ("buy", "long"):
+        return "buy"
+    if side in ("sell", "short"):
+        return "sell"
+    return None
+
+
+class OrderStateCache:
+    """
+    自身订单状态缓存
+
+    推送回调运行在事件循环线程，策略读取运行在挂单线程，所有读写都在锁内完成。
+    """
+
+    def __init__(self, adapter, symbol: str, reconcile_interval: float = 30.0):
+        """
+        初始化订单缓存
+
+        Args:
+            adapter: 适配器实例
+            symbol: 交易对符号
+            reconcile_interval: 与 REST 快照对账的间隔（秒）
+        """
+        self.adapter = adapter
+        self.symbol = symbol
+        self.reconcile_interval = reconcile_interval
+        self.streaming = False
+
+        self._lock = threading.Lock()
+        self._orders: Dict[str, Order] = {}  # 内部 key -> Order
+        self._by_order_id: Dict[str, str] = {}  # order_id -> 内部 key
+        self._levels: Dict[str, Dict[Decimal, Set[str]]] = {"buy": {}, "sell": {}}
+        self._listeners: List[Callable[[Order], None]] = []
+        self._last_reconcile: Optional[float] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        # REST 列式快照；只读价位汇总时直接使用，需要逐单访问时才物化为 Order
+        self._batch: Optional[OrderBatch] = None
+
+    # ------------------------------------------------------------------
+    # 写入
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _make_key(order: Order) -> str:
+        # 客户端订单ID在下单时即已知，优先作为 key，这样下单返回与后续推送能合并为同一条记录
+        return str(order.client_order_id or order.order_id)
+
+    def _materialize_locked(self) -> None:
+        batch = self._batch
+        if batch is None:
+            return
+        self._batch = None
+        for order in batch.to_orders():
+            if order.status in ACTIVE_STATUSES:
+                self._insert_locked(self._make_key(order), order)
+
+    def _resolve_key_locked(self, order: Order) -> str:
+        if order.order_id and str(order.order_id) in self._by_order_id:
+            return self._by_order_id[str(order.order_id)]
+        return self._make_key(order)
+
+    def _remove_locked(self, key: str) -> None:
+        order = self._orders.pop(key, None)
+        if order is None:
+            return
+        if order.order_id:
+            self._by_order_id.pop(str(order.order_id), None)
+        side = normalize_side(order.side)
+        if side and order.price is not None:
+            level = self._levels[side].get(order.price)
+            if level is not None:
+                level.discard(key)
+                if not level:
+                    del self._levels[side][order.price]
+
+    def _insert_locked(self, key: str, order: Order) -> None:
+        self._orders[key] = order
+        if order.order_id:
+            self._by_order_id[str(order.order_id)] = key
+        side = normalize_side(order.side)
+        if side and order.price is not None:
+            self._levels[side].setdefault(order.price, set()).add(key)
+
+    def apply(self, order: Order) -> None:
+        """应用一条订单更新（推送或下单结果），非活跃状态的订单会被移除"""
+        if self.symbol and order.symbol and order.symbol != self.symbol:
+            return
+        with self._lock:
+            self._materialize_locked()
+            key = self._resolve_key_locked(order)
+            self._remove_locked(key)
+            if order.status in ACTIVE_STATUSES:
+                self._insert_locked(key, order)
+        for listener in self._listeners:
+            listener(order)
+
+    def track_placed(self, order: Order) -> None:
+        """
+        记录刚下单成功的订单，推送确认前先占住价位，避免下一轮重复下单
+
+        如果推送已先于下单返回到达，则保留推送中的订单信息。
+        """
+        if order.status not in ACTIVE_STATUSES:
+            return
+        with self._lock:
+            self._materialize_locked()
+            key = self._make_key(order)
+            if key not in self._orders:
+                self._insert_locked(key, order)
+
+    def discard(self, order_id: str) -> None:
+        """移除已确认撤销的订单，撤单推送到达前不再占用价位"""
+        with self._lock:
+            self._materialize_locked()
+            key = self._by_order_id.get(str(order_id))
+            if key is not None:
+                self._remove_locked(key)
+
+    def _clear_locked(self) -> None:
+        self._orders.clear()
+        self._by_order_id.clear()
+        self._levels = {"buy": {}, "sell": {}}
+        self._batch = None
+
+    def replace_all(self, orders: List[Order]) -> None:
+        """用 REST 快照整体替换缓存"""
+        with self._lock:
+            self._clear_locked()
+            for order in orders:
+                if order.status in ACTIVE_STATUSES:
+                    self._insert_locked(self._make_key(order), order)
+            self._last_reconcile = time.monotonic()
+
+    def replace_batch(self, batch: OrderBatch) -> None:
+        """用列式 REST 快照整体替换缓存，Order 对象延迟到首次逐单访问时再创建"""
+        with self._lock:
+            self._clear_locked()
+            self._batch = batch
+            self._last_reconcile = time.monotonic()
+
+    def seed(self) -> None:
+        """从 REST 拉取一次未成交订单快照（阻塞调用）"""
+        self.replace_batch(self.adapter.get_open_orders_batch(symbol=self.symbol))
+
+    def reconcile_if_due(self) -> bool:
+        """距离上次对账超过 reconcile_interval 时重新拉取 REST 快照（阻塞调用）
+
+        Returns:
+            bool: 本次是否执行了对账
+        """
+        if self._last_reconcile is not None and (
+            time.monotonic() - self._last_reconcile < self.reconcile_interval
+        ):
+            return False
+        self.seed()
+        return True
+
+    def add_listener(self, listener: Callable[[Order], None]) -> None:
+        """注册订单更新监听器（每条推送都会在缓存更新后回调）"""
+        self._listeners.append(listener)
+
+    async def start(self) -> bool:
+        """
+        订阅订单推送并从 REST 播种
+
+        先订阅再拉快照，避免快照与推送之间的更新丢失。
+
+        Returns:
+            bool: 交易所是否支持订单推送；不支持时缓存只在 reconcile 时刷新
+        """
+        try:
+            self._unsubscribe = await self.adapter.subscribe_orders(self.symbol, self.apply)
+            self.streaming = True
+        except NotImplementedError:
+            self.streaming = False
+        await asyncio.to_thread(self.seed)
+        return self.streaming
+
+    def stop(self) -> None:
+        """取消订单推送回调（交易所支持时），缓存停用或引擎重启前调用"""
+        unsubscribe, self._unsubscribe = self._unsubscribe, None
+        if unsubscribe is not None:
+            unsubscribe()
+        self.streaming = False
+
+    # ------------------------------------------------------------------
+    # 读取
+    # ------------------------------------------------------------------
+
+    def get(self, order_id: str) -> Optional[Order]:
+        """按订单ID查询"""
+        with self._lock:
+            self._materialize_locked()
+            key = self._by_order_id.get(str(order_id))
+            return self._orders.get(key) if key is not None else None
+
+    def get_by_client_id(self, client_order_id: str) -> Optional[Order]:
+        """按客户端订单ID查询"""
+        with self._lock:
+            self._materialize_locked()
+            return self._orders.get(str(client_order_id))
+
+    def orders_at(self, side: str, price: Decimal) -> List[Order]:
+        """查询某一方向某一价位上的订单"""
+        side = normalize_side(side)
+        with self._lock:
+            self._materialize_locked()
+            keys = self._levels.get(side, {}).get(price, ())
+            return [self._orders[key] for key in keys]
+
+    def open_orders(self) -> List[Order]:
+        """返回所有活跃订单"""
+        with self._lock:
+            self._materialize_locked()
+            return list(self._orders.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._materialize_locked()
+            return len(self._orders)
+
+    def pending_arrays(
+        self,
+        tick_size: Optional[Decimal] = None,
+    ) -> Tuple[List[int], List[int], Dict[int, List[int]], Dict[int, List[int]]]:
+        """
+        按价位汇总活跃订单，返回格式与 get_pending_orders_arrays 相同
+
+        价位为价格除以 tick_size 向下取整后的 tick 数（tick_size 默认为 1，即价格的整数部分）。
+        尚未拿到交易所订单ID（只有客户端ID）的订单会占用价位，但不出现在ID映射中。
+
+        Args:
+            tick_size: 价格最小变动单位
+
+        Returns:
+            (long_prices, short_prices, long_price_to_ids, short_price_to_ids)
+        """
+        scale = tick_units(tick_size)
+        result = []
+        with self._lock:
+            if self._batch is not None:
+                return self._batch.pending_arrays(tick_size)
+            for side in ("buy", "sell"):
+                price_to_ids: Dict[int, List[int]] = {}
+                for price, keys in self._levels[side].items():
+                    ids = price_to_ids.setdefault(to_fixed(price) // scale, [])
+                    for key in keys:
+                        try:
+                            ids.append(int(self._orders[key].order_id))
+                        except (ValueError, TypeError):
+                            continue  # 跳过无效的订单ID
+                result.append(price_to_ids)
+        long_price_to_ids, short_price_to_ids = result
+        return (
+            sorted(long_price_to_ids),
+            sorted(short_price_to_ids),
+            long_price_to_ids,
+            short_price_to_ids,
+        )
@@ -0,0 +1,276 @@
+"""
+Local Order Book Service
+
+This module maintains per-symbol L2 order books from exchange depth
+streams, so get_orderbook is answered from memory instead of a REST
+round-trip per call. Snapshot and delta messages are applied on the
+event-loop thread; after each message the top levels are published as an
+immutable snapshot with a single reference assignment, so strategy threads
+read the latest book without taking a lock. Deltas carry sequence numbers;
+a gap, or a delta that leaves the book crossed, drops the published book
+until the exchange resends a snapshot.
+"""
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# 每次发布快照时保留的档位数（get_orderbook 的 depth 超过该值时只返回已发布的档位）
+DEFAULT_PUBLISH_DEPTH = 50
+
+# 单个价位：(价格, 数量)
+Level = Tuple[float, float]
+
+
+def parse_levels(levels: Optional[Iterable[Any]]) -> List[Level]:
+    """
+    将推送/REST 中的价位列表转换为 (price, size) 浮点元组
+
+    支持 [[price, size], ...]（StandX、ccxt 格式）和
+    [{"price": ..., "size": ...}, ...]（GRVT、Lighter 格式）两种格式。
+    """
+    result = []
+    for level in levels or ():
+        if isinstance(level, dict):
+            result.append((float(level["price"]), float(level["size"])))
+        else:
+            result.append((float(level[0]), float(level[1])))
+    return result
+
+
+class OrderBookSnapshot:
+    """
+    已发布的订单簿快照
+
+    发布后不再修改，bids 按价格从高到低、asks 按价格从低到高排列，可在任意线程读取。
+    """
+
+    __slots__ = ("symbol", "bids", "asks", "sequence", "timestamp")
+
+    def __init__(
+        self,
+        symbol: str,
+        bids: Tuple[Level, ...],
+        asks: Tuple[Level, ...],
+        sequence: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ):
+        self.symbol = symbol
+        self.bids = bids
+        self.asks = asks
+        self.sequence = sequence
+        self.timestamp = timestamp if timestamp is not None else int(time.time() * 1000)
+
+    @classmethod
+    def from_levels(
+        cls,
+        symbol: str,
+        bids: Iterable[Level],
+        asks: Iterable[Level],
+        sequence: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> "OrderBookSnapshot":
+        """由未排序的价位列表构造快照（用于 REST 回退等一次性场景），数量为 0 的价位会被忽略"""
+        return cls(
+            symbol,
+            tuple(sorted((lv for lv in bids if lv[1] > 0), key=lambda lv: -lv[0])),
+            tuple(sorted((lv for lv in asks if lv[1] > 0), key=lambda lv: lv[0])),
+            sequence,
+            timestamp,
+        )
+
+    def best_bid(self) -> Optional[Level]:
+        return self.bids[0] if self.bids else None
+
+    def best_ask(self) -> Optional[Level]:
+        return self.asks[0] if self.asks else None
+
+    def to_dict(self, depth: int = 20) -> Dict[str, Any]:
+        """转换为 get_orderbook 的返回格式"""
+        return {
+            "symbol": self.symbol,
+            "bids": [[price, size] for price, size in self.bids[:depth]],
+            "asks": [[price, size] for price, size in self.asks[:depth]],
+            "sequence": self.sequence,
+            "timestamp": self.timestamp,
+        }
+
+
+class _BookSide:
+    """单边价位表：price -> size 字典 + 升序价格列表"""
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self.sizes: Dict[float, float] = {}
+        self.prices: List[float] = []
+
+    def replace(self, levels: Iterable[Level]) -> None:
+        self.sizes = {price: size for price, size in levels if size > 0}
+        self.prices = sorted(self.sizes)
+
+    def update(self, levels: Iterable[Level]) -> None:
+        sizes, prices = self.sizes, self.prices
+        for price, size in levels:
+            if size > 0:
+                if price not in sizes:
+                    bisect.insort(prices, price)
+                sizes[price] = size
+            elif sizes.pop(price, None) is not None:
+                del prices[bisect.bisect_left(prices, price)]
+
+    def best(self) -> Optional[float]:
+        if not self.prices:
+            return None
+        return self.prices[-1] if self.is_bid else self.prices[0]
+
+    def top(self, depth: int) -> Tuple[Level, ...]:
+        prices = self.prices[:-depth - 1:-1] if self.is_bid else self.prices[:depth]
+        sizes = self.sizes
+        return tuple((price, sizes[price]) for price in prices)
+
+
+class LocalOrderBook:
+    """
+    单个交易对的本地订单簿
+
+    - apply_snapshot / apply_delta 只能在同一线程（事件循环线程）调用
+    - snapshot 属性可在任意线程无锁读取：每条消息处理完后整体替换为新的
+      OrderBookSnapshot，读取方拿到的总是某一时刻完整一致的盘口；
+      未同步（尚无快照或检测到丢包）时为 None
+    """
+
+    def __init__(self, symbol: str, publish_depth: int = DEFAULT_PUBLISH_DEPTH):
+        """
+        初始化本地订单簿
+
+        Args:
+            symbol: 交易对符号
+            publish_depth: 每次发布快照时保留的档位数
+        """
+        self.symbol = symbol
+        self.publish_depth = publish_depth
+        self.sequence: Optional[int] = None
+        self.gap_count = 0
+        self.snapshot: Optional[OrderBookSnapshot] = None
+        self._bids = _BookSide(is_bid=True)
+        self._asks = _BookSide(is_bid=False)
+        self._synced = False
+
+    @property
+    def synced(self) -> bool:
+        """是否已从快照同步且之后没有丢包"""
+        return self._synced
+
+    def _publish(self, timestamp: Optional[int]) -> None:
+        depth = self.publish_depth
+        self.snapshot = OrderBookSnapshot(
+            self.symbol,
+            self._bids.top(depth),
+            self._asks.top(depth),
+            self.sequence,
+            timestamp,
+        )
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Level],
+        asks: Iterable[Level],
+        sequence: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """用全量快照替换本地订单簿"""
+        self._bids.replace(bids)
+        self._asks.replace(asks)
+        self.sequence = sequence
+        self._synced = True
+        self._publish(timestamp)
+
+    def apply_delta(
+        self,
+        bids: Iterable[Level],
+        asks: Iterable[Level],
+        sequence: Optional[int] = None,
+        prev_sequence: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> bool:
+        """
+        应用增量更新，数量为 0 的价位表示删除
+
+        序列号校验：
+        - 给出 prev_sequence 时（GRVT），必须等于上一条消息的 sequence，否则判定为丢包
+        - 只给出 sequence 时（Lighter offset），不大于上一条的消息视为重复，直接忽略
+        - 应用后买一价不低于卖一价（盘口交叉）说明漏掉了增量，同样判定为失去同步
+
+        Returns:
+            bool: 是否仍处于同步状态；返回 False 时调用方应重新获取快照
+        """
+        if not self._synced:
+            return False
+        if sequence is not None and self.sequence is not None:
+            if prev_sequence is not None:
+                if prev_sequence != self.sequence:
+                    self.invalidate()
+                    return False
+            elif sequence <= self.sequence:
+                return True
+        self._bids.update(bids)
+        self._asks.update(asks)
+        if sequence is not None:
+            self.sequence = sequence
+        if self.crossed:
+            self.invalidate()
+            return False
+        self._publish(timestamp)
+        return True
+
+    @property
+    def crossed(self) -> bool:
+        """买一价是否不低于卖一价"""
+        best_bid, best_ask = self._bids.best(), self._asks.best()
+        return best_bid is not None and best_ask is not None and best_bid >= best_ask
+
+    def invalidate(self) -> None:
+        """标记为未同步（丢包、断线），撤下已发布的快照，等待下一条全量快照"""
+        if self._synced:
+            self.gap_count += 1
+        self._synced = False
+        self.snapshot = None
+
+
+class OrderBookService:
+    """
+    按交易对管理本地订单簿
+
+    适配器持有一个实例：subscribe_orderbook 把深度推送写入对应的 LocalOrderBook，
+    get_orderbook 通过 get() 读取已发布的快照，热路径上不访问 REST。
+    """
+
+    def __init__(self, publish_depth: int = DEFAULT_PUBLISH_DEPTH):
+        self.publish_depth = publish_depth
+        self._books: Dict[str, LocalOrderBook] = {}
+        self._lock = threading.Lock()  # 只保护订单簿的创建，读取不加锁
+
+    def book(self, symbol: str) -> LocalOrderBook:
+        """获取（不存在时创建）交易对的本地订单簿"""
+        book = self._books.get(symbol)
+        if book is None:
+            with self._lock:
+                book = self._books.get(symbol)
+                if book is None:
+                    book = LocalOrderBook(symbol, self.publish_depth)
+                    self._books[symbol] = book
+        return book
+
+    def snapshot(self, symbol: str) -> Optional[OrderBookSnapshot]:
+        """读取交易对最新发布的快照；未订阅或未同步时返回 None"""
+        book = self._books.get(symbol)
+        return book.snapshot if book is not None else None
+
+    def get(self, symbol: str, depth: int = 20) -> Optional[Dict[str, Any]]:
+        """按 get_orderbook 格式读取订单簿；未订阅或未同步时返回 None"""
+        snapshot = self.snapshot(symbol)
+        return snapshot.to_dict(depth) if snapshot is not None else None
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._books
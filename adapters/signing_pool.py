@@ -0,0 +1,175 @@
+"""
+Signing Pool
+
+This module offloads batches of order-signing jobs to a worker pool, so a
+grid requote across many levels signs in parallel instead of serially on
+the strategy thread. Pure-Python signers that hold the GIL (GRVT's
+secp256k1 EIP-712) use a process pool; native signers that release the GIL
+(e.g. ctypes libraries) can use a thread pool. Small batches are signed
+inline, where pool overhead would outweigh the work.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from adapters.batch_executor import OrderResult
+
+
+# 作业数达到该值时才分发到签名池，更小的批次直接在调用线程签名
+DEFAULT_MIN_BATCH_SIZE = 8
+
+
+def _run_chunk(fn: Callable[..., Any], jobs: List[tuple]) -> List[Tuple[bool, Any]]:
+    """在工作进程/线程中按顺序执行一组签名作业，异常按作业单独返回"""
+    outcomes = []
+    for job in jobs:
+        try:
+            outcomes.append((True, fn(*job)))
+        except Exception as e:
+            outcomes.append((False, e))
+    return outcomes
+
+
+def _noop() -> None:
+    return None
+
+
+def _run_warmup(warmup: Callable[[], Any]) -> None:
+    """执行预热函数，丢弃返回值（避免把签名器等对象传回主进程）"""
+    warmup()
+
+
+class SigningPool:
+    """
+    批量签名执行器
+
+    - max_workers 为 0 或作业数小于 min_batch_size 时，在调用线程串行签名
+    - mode="process"：进程池（spawn 启动），适用于持有 GIL 的纯 Python 签名；
+      此时 fn 必须是模块级函数，作业参数必须可 pickle
+    - mode="thread"：线程池，适用于释放 GIL 的原生签名库
+    - 结果按输入顺序返回。nonce、过期时间、client_order_id 等必须由调用方在提交前
+      按顺序生成并放入作业参数，签名函数只做纯计算，保证结果与串行签名一致
+    - 签名池异常（如工作进程崩溃）时重建池，本批次回退为串行签名
+    - start() 传入的预热函数作为池的 initializer，每个工作进程/线程（包括重建后的）各执行一次，
+      可用于在工作进程中安装签名器，使作业参数不必携带私钥
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        mode: str = "process",
+        min_batch_size: int = DEFAULT_MIN_BATCH_SIZE,
+    ):
+        """
+        初始化签名池
+
+        Args:
+            max_workers: 工作进程/线程数，0 表示不使用签名池
+            mode: "process" 或 "thread"
+            min_batch_size: 分发到签名池的最小批次大小
+        """
+        if max_workers < 0:
+            raise ValueError("max_workers 不能小于 0")
+        if mode not in ("process", "thread"):
+            raise ValueError(f"不支持的签名池模式: {mode}")
+        self.max_workers = max_workers
+        self.mode = mode
+        self.min_batch_size = max(1, min_batch_size)
+        self._warmup: Callable[[], Any] = _noop
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def should_offload(self, job_count: int) -> bool:
+        """该批次是否分发到签名池"""
+        return self.max_workers > 0 and job_count >= self.min_batch_size
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.mode == "process":
+                        # 策略进程中有 WebSocket/事件循环线程，使用 spawn 避免 fork 继承锁状态
+                        self._pool = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                            initializer=_run_warmup,
+                            initargs=(self._warmup,),
+                        )
+                    else:
+                        self._pool = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix="order-sign",
+                            initializer=_run_warmup,
+                            initargs=(self._warmup,),
+                        )
+        return self._pool
+
+    def start(self, warmup: Callable[[], Any] = _noop) -> None:
+        """
+        预先启动工作进程/线程，避免首个大批次承担进程启动和模块导入开销
+
+        Args:
+            warmup: 在每个工作进程中执行一次的模块级函数（如导入签名模块、安装签名器），
+                进程模式下必须可 pickle
+        """
+        if self.max_workers == 0:
+            return
+        self.shutdown(wait=False)
+        self._warmup = warmup
+        pool = self._get_pool()
+        futures = [pool.submit(_noop) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result()
+
+    def map(
+        self,
+        fn: Callable[..., Any],
+        jobs: Iterable[tuple],
+        inline_fn: Optional[Callable[..., Any]] = None,
+    ) -> List[OrderResult]:
+        """
+        执行 fn(*job)，按输入顺序返回每个作业的结果
+
+        作业在工作进程/线程间按连续分块分配，单个作业失败不影响其他作业。
+
+        Args:
+            fn: 签名函数
+            jobs: 签名作业参数列表
+            inline_fn: 在调用线程串行签名时使用的函数，默认为 fn；
+                fn 依赖预热函数安装的工作进程状态时需要提供
+
+        Returns:
+            List[OrderResult]: 与 jobs 一一对应的结果列表，request 为作业参数
+        """
+        jobs = [tuple(job) for job in jobs]
+        if not jobs:
+            return []
+
+        if self.should_offload(len(jobs)):
+            try:
+                pool = self._get_pool()
+                chunk_size = -(-len(jobs) // self.max_workers)
+                futures = [
+                    pool.submit(_run_chunk, fn, jobs[i:i + chunk_size])
+                    for i in range(0, len(jobs), chunk_size)
+                ]
+                outcomes = [outcome for future in futures for outcome in future.result()]
+            except Exception as e:
+                print(f"签名池执行失败，回退为串行签名: {e}")
+                self.shutdown(wait=False)
+                outcomes = _run_chunk(inline_fn or fn, jobs)
+        else:
+            outcomes = _run_chunk(inline_fn or fn, jobs)
+
+        return [
+            OrderResult(job, True, result=value) if ok else OrderResult(job, False, error=value)
+            for job, (ok, value) in zip(jobs, outcomes)
+        ]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """关闭签名池"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
@@ -3,19 +3,32 @@ StandX Exchange Adapter Implementation
 
 This module implements BasePerpAdapter for StandX exchange.
 """
+import asyncio
 import sys
 import os
 import time
+import uuid
 import base64
 import base58
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from typing import Callable, Dict, Any, Optional, List
 from decimal import Decimal
 
 # 添加项目路径
 project_root = os.path.join(os.path.dirname(__file__), '..')
 sys.path.insert(0, project_root)
 
-from adapters.base_adapter import BasePerpAdapter, Balance, Position, Order
+from adapters.base_adapter import (
+    ACTIVE_STATUSES,
+    BasePerpAdapter,
+    Balance,
+    Position,
+    Order,
+    OrderBatch,
+)
+from adapters.batch_executor import OrderResult
+from adapters.instruments import Instrument
+from adapters.orderbook import parse_levels
 
 # 导入 StandX 相关模块
 import sys
@@ -26,11 +39,36 @@ sys.path.insert(0, project_root)
 from exchange.exchange_standx.standx_protocol.perps_auth import StandXAuth
 from exchange.exchange_standx.standx_protocol.perp_http import StandXPerpHTTP
 from exchange.exchange_standx.standx_protocol.perps_wss import StandXMarketStream
+from exchange.exchange_standx.standx_protocol.transport import StandXTransport
 from eth_account.messages import encode_defunct
 from eth_account import Account
 from web3 import Web3
 
 
+# StandX 订单状态 -> 统一订单状态
+ORDER_STATUS_MAP = {
+    "new": "open",
+    "open": "open",
+    "pending": "pending",
+    "partially_filled": "partially_filled",
+    "filled": "filled",
+    "cancelled": "cancelled",
+    "canceled": "cancelled",
+    "rejected": "rejected"
+}
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[int]:
+    """将 ISO 8601 时间字符串转换为毫秒时间戳，无法解析时返回 None"""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return int(dt.timestamp() * 1000)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
 class StandXAdapter(BasePerpAdapter):
     """StandX 交易所适配器实现"""
     
@@ -47,6 +85,7 @@ class StandXAdapter(BasePerpAdapter):
                     - private_key: 钱包私钥
                     - chain: 链名称，如 "bsc" 或 "solana"
                 - base_url: API 基础 URL（可选，默认 https://perps.standx.com）
+                - http_timeouts: 按接口覆盖 HTTP 超时（可选），如 {"new_order": 3}
         """
         super().__init__(config)
         
@@ -73,19 +112,30 @@ class StandXAdapter(BasePerpAdapter):
         # chain 字段有默认值 "bsc"，所以即使不提供也可以工作
         
         base_url = config.get("base_url", "https://perps.standx.com")
-        self.http_client = StandXPerpHTTP(base_url=base_url)
+        # HTTP 客户端与认证共用一个连接池（keep-alive），连接数不低于下单并发数
+        self.transport = StandXTransport(
+            pool_maxsize=max(16, self.batch_executor.max_workers),
+            timeouts=config.get("http_timeouts"),
+        )
+        self.http_client = StandXPerpHTTP(base_url=base_url, transport=self.transport)
         self.market_stream: Optional[StandXMarketStream] = None
+        self._stream_lock: Optional[asyncio.Lock] = None
+        # 订单推送回调（按交易对）；order 频道只订阅一次
+        self._order_callbacks: Dict[Optional[str], List] = {}
+        self._order_stream_subscribed = False
         
         # 根据配置选择认证方式
+        # HTTP 签名与 WebSocket 签名共用同一个服务器时钟
+        clock = self.http_client.clock
         if self.api_key:
             # API Token 方式：使用提供的 signing_key 初始化 StandXAuth
             signing_key_bytes = self._parse_signing_key(self.signing_key)
-            self.auth = StandXAuth(private_key=signing_key_bytes)
+            self.auth = StandXAuth(private_key=signing_key_bytes, clock=clock, transport=self.transport)
             self.use_api_token = True
             self.token = self.api_key  # API Token 直接作为 token 使用
         else:
             # 钱包私钥方式：生成新的 Ed25519 密钥对用于请求签名
-            self.auth = StandXAuth()
+            self.auth = StandXAuth(clock=clock, transport=self.transport)
             self.use_api_token = False
             
             # 获取钱包地址
@@ -168,6 +218,8 @@ class StandXAdapter(BasePerpAdapter):
     
     def connect(self) -> bool:
         """连接到 StandX 并完成认证"""
+        # 后台同步服务器时间偏移，签名时不再访问 geo 接口
+        self.http_client.clock.start()
         try:
             if self.use_api_token:
                 # API Token 方式：直接使用 API Token，无需登录
@@ -190,18 +242,138 @@ class StandXAdapter(BasePerpAdapter):
             raise Exception(f"StandX 认证失败: {e}")
 
     async def connect_market_stream(self) -> StandXMarketStream:
-        """连接市场 WebSocket（公共频道无需认证）"""
-        if not self.market_stream:
-            self.market_stream = StandXMarketStream()
-        if not self.market_stream.connected:
-            await self.market_stream.connect()
+        """连接市场 WebSocket（公共频道无需认证），多个交易对并发订阅时只建立一条连接"""
+        if self._stream_lock is None:
+            self._stream_lock = asyncio.Lock()
+        async with self._stream_lock:
+            if not self.market_stream:
+                self.market_stream = StandXMarketStream()
+            if not self.market_stream.connected:
+                await self.market_stream.connect()
         return self.market_stream
 
     async def subscribe_market(self, channel: str, symbol: str, callback=None):
         """订阅市场 WebSocket 频道"""
         stream = await self.connect_market_stream()
         await stream.subscribe(channel, symbol, callback=callback)
-    
+
+    async def subscribe_ticker(self, symbol: str, callback) -> None:
+        """订阅价格推送（price 频道），回调参数与 get_ticker 格式一致"""
+        def on_price(message: Dict[str, Any]) -> None:
+            data = message.get("data") or {}
+            callback(self._parse_price_data(data, symbol))
+
+        await self.subscribe_market("price", symbol, callback=on_price)
+
+    async def subscribe_orders(self, symbol: str, callback) -> Callable[[], None]:
+        """订阅自身订单推送（order 频道，需要认证），回调参数为 Order 对象
+        
+        order 频道推送账户下所有交易对的订单，连接只认证、订阅一次，
+        按交易对分发给各自的回调（多个交易对可以共用同一个适配器）。
+        同一交易对重复注册同一回调只保留一个；单个回调异常不影响其他回调。
+        
+        Returns:
+            Callable[[], None]: 取消该回调的函数（引擎重启前调用，避免回调堆积）
+        """
+        if not self.token:
+            raise Exception("未认证，请先调用 connect()")
+
+        callbacks = self._order_callbacks.setdefault(symbol, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+
+        def unsubscribe() -> None:
+            registered = self._order_callbacks.get(symbol)
+            if registered and callback in registered:
+                registered.remove(callback)
+                if not registered:
+                    del self._order_callbacks[symbol]
+
+        if self._order_stream_subscribed:
+            return unsubscribe
+
+        def on_order(message: Dict[str, Any]) -> None:
+            data = message.get("data")
+            items = data if isinstance(data, list) else [data]
+            for order_data in items:
+                if not order_data:
+                    continue
+                order = self._parse_order_data(order_data)
+                for subscribed_symbol, order_callbacks in list(self._order_callbacks.items()):
+                    if subscribed_symbol and order.symbol and order.symbol != subscribed_symbol:
+                        continue
+                    for order_callback in tuple(order_callbacks):
+                        try:
+                            order_callback(order)
+                        except Exception as e:
+                            print(f"[StandX] 订单推送回调错误: {e}")
+
+        self._order_stream_subscribed = True
+        try:
+            stream = await self.connect_market_stream()
+            await stream.authenticate(self.token, streams=[{"channel": "order"}])
+            await stream.subscribe("order", callback=on_order)
+        except Exception:
+            self._order_stream_subscribed = False
+            unsubscribe()
+            raise
+        return unsubscribe
+
+    async def subscribe_orderbook(self, symbol: str) -> None:
+        """订阅深度推送（depth_book 频道），维护本地订单簿供 get_orderbook 读取
+
+        depth_book 每条消息都是完整盘口，没有序列号，直接整体替换本地订单簿。
+        断线期间撤下本地订单簿，重连恢复订阅后由下一条推送重新同步。
+        """
+        book = self.orderbooks.book(symbol)
+
+        def on_depth(message: Dict[str, Any]) -> None:
+            data = message.get("data")
+            if not isinstance(data, dict):
+                return
+            book.apply_snapshot(parse_levels(data.get("bids")), parse_levels(data.get("asks")))
+
+        def on_connection(connected: bool) -> None:
+            if not connected:
+                book.invalidate()
+
+        stream = await self.connect_market_stream()
+        stream.add_connection_listener(on_connection)
+        await stream.subscribe("depth_book", symbol, callback=on_depth)
+
+    def _parse_price_data(self, price_data: Dict[str, Any], symbol: str) -> Dict[str, Any]:
+        """将 StandX 价格数据（REST / price 频道）转换为统一的 ticker 字典"""
+        return {
+            "symbol": price_data.get("symbol", symbol),
+            "bid_price": float(price_data["spread_bid"]) if price_data.get("spread_bid") else None,
+            "ask_price": float(price_data["spread_ask"]) if price_data.get("spread_ask") else None,
+            "mid_price": float(price_data["mid_price"]) if price_data.get("mid_price") else None,
+            "last_price": float(price_data["last_price"]) if price_data.get("last_price") else None,
+            "mark_price": float(price_data["mark_price"]) if price_data.get("mark_price") else None,
+            "index_price": float(price_data["index_price"]) if price_data.get("index_price") else None,
+            "timestamp": int(time.time() * 1000),
+        }
+
+    def _parse_order_data(self, order_data: Dict[str, Any]) -> Order:
+        """将 StandX 订单数据（REST / order 频道）转换为 Order 对象"""
+        status = ORDER_STATUS_MAP.get(str(order_data.get("status", "")).lower(), "pending")
+
+        return Order(
+            order_id=str(order_data.get("id", "")),
+            symbol=order_data.get("symbol", ""),
+            side=order_data.get("side", "").lower(),
+            order_type=order_data.get("order_type", "").lower(),
+            quantity=Decimal(str(order_data.get("qty", "0"))),
+            price=Decimal(str(order_data.get("price", "0"))) if order_data.get("price") else None,
+            filled_quantity=Decimal(str(order_data.get("fill_qty", "0"))),
+            status=status,
+            time_in_force=order_data.get("time_in_force", "gtc").lower(),
+            reduce_only=order_data.get("reduce_only", False),
+            client_order_id=order_data.get("cl_ord_id"),
+            created_at=_parse_timestamp(order_data.get("created_at")),
+            updated_at=_parse_timestamp(order_data.get("updated_at")),
+        )
+
     def get_balance(self) -> Balance:
         """查询账户余额"""
         if not self.token:
@@ -298,6 +470,10 @@ class StandXAdapter(BasePerpAdapter):
             else:
                 side_str = side
             
+            # 未指定时生成客户端订单ID，便于与订单推送对应
+            if not client_order_id:
+                client_order_id = uuid.uuid4().hex
+            
             response = self.http_client.place_order(
                 token=self.token,
                 symbol=symbol,
@@ -462,6 +638,45 @@ class StandXAdapter(BasePerpAdapter):
         except Exception as e:
             raise Exception(f"批量撤单失败: {e}")
     
+    def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+    ) -> List[OrderResult]:
+        """
+        批量撤单：StandX 支持按订单ID列表撤单，整批只发一次请求
+        
+        Args:
+            order_ids: 订单ID列表
+            symbol: 交易对符号（可选）
+        
+        Returns:
+            List[OrderResult]: 与 order_ids 一一对应的结果
+        """
+        results: List[Optional[OrderResult]] = [None] * len(order_ids)
+        valid_ids = []
+        valid_indexes = []
+        for index, order_id in enumerate(order_ids):
+            try:
+                valid_ids.append(int(order_id))
+                valid_indexes.append(index)
+            except (ValueError, TypeError):
+                results[index] = OrderResult(
+                    order_id, False, error=ValueError(f"无效的订单ID: {order_id}")
+                )
+        
+        if valid_ids:
+            try:
+                self.cancel_orders_by_ids(order_id_list=valid_ids)
+                error = None
+            except Exception as e:
+                error = e
+            for index in valid_indexes:
+                results[index] = OrderResult(
+                    order_ids[index], error is None, result=True if error is None else None, error=error
+                )
+        return results
+    
     def get_order(
         self,
         order_id: Optional[str] = None,
@@ -501,59 +716,75 @@ class StandXAdapter(BasePerpAdapter):
             
             orders = []
             for order_data in orders_data.get("result", []):
-                # 映射订单状态
-                status_map = {
-                    "new": "open",
-                    "pending": "pending",
-                    "partially_filled": "partially_filled",
-                    "filled": "filled",
-                    "cancelled": "cancelled",
-                    "rejected": "rejected"
-                }
-                status = status_map.get(order_data.get("status", "").lower(), "pending")
-                
+                order = self._parse_order_data(order_data)
                 # 只返回未成交的订单
-                if status not in ["open", "pending", "partially_filled"]:
+                if order.status not in ["open", "pending", "partially_filled"]:
                     continue
-                
-                # 解析时间戳
-                created_at = None
-                updated_at = None
-                if order_data.get("created_at"):
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(order_data["created_at"].replace("Z", "+00:00"))
-                        created_at = int(dt.timestamp() * 1000)
-                    except:
-                        pass
-                if order_data.get("updated_at"):
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(order_data["updated_at"].replace("Z", "+00:00"))
-                        updated_at = int(dt.timestamp() * 1000)
-                    except:
-                        pass
-                
-                order = Order(
+                orders.append(order)
+            
+            return orders
+        except Exception as e:
+            raise Exception(f"查询未成交订单失败: {e}")
+
+    def get_open_orders_batch(self, symbol: Optional[str] = None) -> OrderBatch:
+        """
+        查询所有未成交订单，REST 响应中的价格/数量字符串直接解析为定点整数
+
+        Args:
+            symbol: 交易对符号，如果为 None 则返回所有交易对的订单
+
+        Returns:
+            OrderBatch: 未成交订单
+        """
+        if not self.token:
+            raise Exception("未认证，请先调用 connect()")
+
+        try:
+            orders_data = self.http_client.query_open_orders(
+                token=self.token,
+                symbol=symbol,
+                limit=1200
+            )
+
+            batch = OrderBatch()
+            for order_data in orders_data.get("result", []):
+                status = ORDER_STATUS_MAP.get(str(order_data.get("status", "")).lower(), "pending")
+                if status not in ACTIVE_STATUSES:
+                    continue
+                batch.append(
                     order_id=str(order_data.get("id", "")),
                     symbol=order_data.get("symbol", ""),
                     side=order_data.get("side", "").lower(),
                     order_type=order_data.get("order_type", "").lower(),
-                    quantity=Decimal(str(order_data.get("qty", "0"))),
-                    price=Decimal(str(order_data.get("price", "0"))) if order_data.get("price") else None,
-                    filled_quantity=Decimal(str(order_data.get("fill_qty", "0"))),
+                    quantity=order_data.get("qty") or "0",
+                    price=order_data.get("price") or None,
+                    filled_quantity=order_data.get("fill_qty") or "0",
                     status=status,
                     time_in_force=order_data.get("time_in_force", "gtc").lower(),
                     reduce_only=order_data.get("reduce_only", False),
                     client_order_id=order_data.get("cl_ord_id"),
-                    created_at=created_at,
-                    updated_at=updated_at,
+                    created_at=_parse_timestamp(order_data.get("created_at")),
+                    updated_at=_parse_timestamp(order_data.get("updated_at")),
                 )
-                orders.append(order)
-            
-            return orders
+            return batch
         except Exception as e:
             raise Exception(f"查询未成交订单失败: {e}")
+
+    def load_instruments(self) -> Dict[str, Instrument]:
+        """通过 query_symbol_info 加载全部交易对的价格/数量精度"""
+        instruments = {}
+        for info in self.http_client.query_symbol_info():
+            try:
+                symbol = info["symbol"]
+                instruments[symbol] = Instrument.from_decimals(
+                    symbol,
+                    price_decimals=info["price_tick_decimals"],
+                    size_decimals=info["qty_tick_decimals"],
+                    min_size=info.get("min_order_qty"),
+                )
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                continue  # 跳过精度字段缺失或无效的交易对
+        return instruments
     
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
@@ -567,17 +798,7 @@ class StandXAdapter(BasePerpAdapter):
         """
         try:
             price_data = self.http_client.query_symbol_price(symbol)
-            
-            return {
-                "symbol": price_data.get("symbol", symbol),
-                "bid_price": float(price_data["spread_bid"]) if price_data.get("spread_bid") else None,
-                "ask_price": float(price_data["spread_ask"]) if price_data.get("spread_ask") else None,
-                "mid_price": float(price_data["mid_price"]) if price_data.get("mid_price") else None,
-                "last_price": float(price_data["last_price"]) if price_data.get("last_price") else None,
-                "mark_price": float(price_data["mark_price"]) if price_data.get("mark_price") else None,
-                "index_price": float(price_data["index_price"]) if price_data.get("index_price") else None,
-                "timestamp": int(time.time() * 1000),
-            }
+            return self._parse_price_data(price_data, symbol)
         except Exception as e:
             raise Exception(f"获取价格失败: {e}")
     
@@ -587,9 +808,9 @@ class StandXAdapter(BasePerpAdapter):
         depth: int = 20,
     ) -> Dict[str, Any]:
         """
-        获取订单簿
+        获取订单簿（从 subscribe_orderbook 维护的本地订单簿读取）
         
-        注意: StandX API 可能没有公开的订单簿接口
+        注意: StandX 没有公开的 REST 订单簿接口，需先调用 subscribe_orderbook
         
         Args:
             symbol: 交易对符号
@@ -598,4 +819,7 @@ class StandXAdapter(BasePerpAdapter):
         Returns:
             Dict[str, Any]: 包含 bids 和 asks 的订单簿数据
         """
-        raise NotImplementedError("StandX 订单簿查询功能待实现")
+        orderbook = self.orderbooks.get(symbol, depth)
+        if orderbook is None:
+            raise Exception(f"获取订单簿失败: {symbol} 未订阅深度推送或尚未收到快照")
+        return orderbook
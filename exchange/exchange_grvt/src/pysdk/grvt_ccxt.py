@@ -5,7 +5,6 @@
 # ruff: noqa: W291
 # ruff: noqa: D400
 # ruff: noqa: E501
-import json
 import logging
 from typing import Any, Literal
 
@@ -22,12 +21,13 @@ from .grvt_ccxt_types import (
     Num,
 )
 from .grvt_ccxt_utils import (
-    EnumEncoder,
     GrvtOrder,
+    build_order_payload,
     get_cookie_with_expiration,
     get_grvt_order,
     get_order_payload,
 )
+from .grvt_codec import dumps, loads
 
 
 class GrvtCcxt(GrvtCcxtBase):
@@ -90,13 +90,13 @@ class GrvtCcxt(GrvtCcxtBase):
             raise GrvtInvalidOrder(f"{FN} Invalid path {path=} {payload=}")
         # Always see if need to referesh cookie before sending a request
         self.refresh_cookie()
-        payload_json = json.dumps(payload, cls=EnumEncoder)
+        payload_json = dumps(payload)
         self.logger.info(f"{FN} {payload=}\n{payload_json=}")
         return_value = self._session.post(path, data=payload_json, timeout=5)
         return_text: str = ""
         try:
             return_text = return_value.text
-            response = return_value.json()
+            response = loads(return_value.content)
         except Exception as err:
             self.logger.warning(f"{FN} Unable to parse {return_value=} as json. {err=}")
         if not return_value.ok:
@@ -116,13 +116,25 @@ class GrvtCcxt(GrvtCcxtBase):
         :param order: The GrvtOrder object.
         Return: dictionary representing the order response.
         """
-        FN = f"{self._clsname} _create_grvt_order cloid:{order.metadata.client_order_id}"
         order_payload = get_order_payload(
             order,
             private_key=self._private_key,
             env=self.env,
             instruments=self.markets,
         )
+        return self._post_order_payload(order, order_payload)
+
+    def create_signed_grvt_order(self, order: GrvtOrder) -> dict:
+        """
+        Send a GrvtOrder that was already signed, e.g. by sign_grvt_order in a worker process.
+        :param order: The signed GrvtOrder object.
+        Return: dictionary representing the order response.
+        """
+        self._check_account_auth()
+        return self._post_order_payload(order, build_order_payload(order))
+
+    def _post_order_payload(self, order: GrvtOrder, order_payload: dict) -> dict:
+        FN = f"{self._clsname} _create_grvt_order cloid:{order.metadata.client_order_id}"
         path = get_grvt_endpoint(self.env, "CREATE_ORDER")
         self.logger.info(f"{FN} {path=} {order_payload=}")
         response: dict = self._auth_and_post(path, payload=order_payload)
@@ -135,7 +147,7 @@ class GrvtCcxt(GrvtCcxtBase):
         )
         return response.get("result", {})
 
-    def create_order(
+    def build_grvt_order(
         self,
         symbol: str,
         order_type: GrvtOrderType,
@@ -143,15 +155,18 @@ class GrvtCcxt(GrvtCcxtBase):
         amount: Amount,
         price: Num = None,
         params={},
-    ) -> dict:
-        """Ccxt compliant signature."""
+    ) -> GrvtOrder:
+        """
+        Validate the order arguments and build an unsigned GrvtOrder.
+        The nonce and expiration are fixed here, before signing.
+        """
         self._check_account_auth()
         self._check_valid_symbol(symbol)
         # Validate order fields
         self._check_order_arguments(order_type, side, amount, price)
         # create GrvtOrder object
         order_duration_secs = params.get("order_duration_secs", 24 * 60 * 60)
-        order = get_grvt_order(
+        return get_grvt_order(
             sub_account_id=self.get_trading_account_id(),
             symbol=symbol,
             order_type=order_type,
@@ -161,6 +176,18 @@ class GrvtCcxt(GrvtCcxtBase):
             order_duration_secs=order_duration_secs,
             params=params,
         )
+
+    def create_order(
+        self,
+        symbol: str,
+        order_type: GrvtOrderType,
+        side: GrvtOrderSide,
+        amount: Amount,
+        price: Num = None,
+        params={},
+    ) -> dict:
+        """Ccxt compliant signature."""
+        order = self.build_grvt_order(symbol, order_type, side, amount, price, params)
         return self._create_grvt_order(order)
 
     def create_limit_order(
@@ -7,7 +7,6 @@
 # ruff: noqa: E501
 
 import asyncio
-import json
 import logging
 from typing import Literal
 
@@ -27,13 +26,13 @@ from .grvt_ccxt_types import (
     Num,
 )
 from .grvt_ccxt_utils import (
-    EnumEncoder,
     GrvtOrder,
     get_cookie_with_expiration,
     get_cookie_with_expiration_async,
     get_grvt_order,
     get_order_payload,
 )
+from .grvt_codec import dumps, loads
 
 
 class GrvtCcxtPro(GrvtCcxtBase):
@@ -107,7 +106,7 @@ class GrvtCcxtPro(GrvtCcxtBase):
             raise GrvtInvalidOrder(f"{FN} Invalid path {path=} {payload=}")
         # Always see if need to referesh cookie before sending a request
         await self.refresh_cookie()
-        payload_json = json.dumps(payload, cls=EnumEncoder)
+        payload_json = dumps(payload)
         self.logger.info(f"{FN} {payload=}\n{payload_json=}")
         return_text: str = ""
         async with self._session.post(
@@ -119,7 +118,7 @@ class GrvtCcxtPro(GrvtCcxtBase):
             return_text: str = ""
             try:
                 return_text = await return_value.text()
-                response = await return_value.json(content_type="application/json")
+                response = loads(return_text)
             except Exception as err:
                 self.logger.warning(
                     f"{FN} Unable to parse {return_value=} as "
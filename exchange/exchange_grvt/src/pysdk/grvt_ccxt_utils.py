@@ -6,6 +6,7 @@
 # ruff: noqa: D400
 # ruff: noqa: E501
 
+import functools
 import json
 import logging
 import random
@@ -21,6 +22,8 @@ import aiohttp
 import requests
 from eth_account import Account
 from eth_account.messages import encode_typed_data, SignableMessage
+from eth_keys import keys
+from eth_utils import keccak
 
 from .grvt_ccxt_env import CHAIN_IDS, GrvtEnv
 from .grvt_ccxt_types import (
@@ -331,21 +334,21 @@ class GrvtOrder:
 def get_signable_message(
     order: GrvtOrder, env: GrvtEnv, instruments: dict[str, dict]
 ) -> bytes | None:
-    FN = f"get_signable_message {order=}"
+    FN = "get_signable_message"
     size_multiplier = BTC_ETH_SIZE_MULTIPLIER
     PRICE_MULTIPLIER = 1_000_000_000
     legs = []
     for leg in order.legs:
         instrument = instruments.get(leg.instrument)
         if not instrument or not isinstance(instrument, dict):
-            logging.error(f"{FN}: {leg.instrument=} not found in {instruments=}")
+            logging.error(f"{FN} {order=}: {leg.instrument=} not found in instruments")
             return None
         if "base_decimals" not in instrument:
-            logging.error(f"{FN}: no 'base_decimals' in {instrument=}")
+            logging.error(f"{FN} {order=}: no 'base_decimals' in {instrument=}")
             return None
         size_multiplier = 10 ** instrument["base_decimals"]
         if "instrument_hash" not in instrument:
-            logging.error(f"{FN}: no 'instrument_hash' in {instrument=}")
+            logging.error(f"{FN} {order=}: no 'instrument_hash' in {instrument=}")
             return None
         legs.append(
             {
@@ -366,22 +369,182 @@ def get_signable_message(
         "expiration": order.signature.expiration,
     }
     domain_data: dict[str, str | int]= get_EIP712_domain_data(env)
-    logging.info(f"{FN} {domain_data=}\n{EIP712_ORDER_MESSAGE_TYPE=}\n{message_data=}")
+    # lazy %-formatting: don't format the message on every order unless debug is on
+    logging.debug(
+        "%s domain_data=%s message_data=%s", FN, domain_data, message_data
+    )
     return encode_typed_data(domain_data, EIP712_ORDER_MESSAGE_TYPE, message_data)
 
 
+def _eip712_encode_type(primary_type: str, types: dict[str, list[dict]]) -> bytes:
+    """EIP-712 encodeType: primary type followed by referenced types, sorted by name."""
+
+    def fmt(name: str) -> str:
+        fields = ",".join(f"{f['type']} {f['name']}" for f in types[name])
+        return f"{name}({fields})"
+
+    deps = sorted(
+        {
+            f["type"].rstrip("[]")
+            for f in types[primary_type]
+            if f["type"].rstrip("[]") in types and f["type"].rstrip("[]") != primary_type
+        }
+    )
+    return "".join(fmt(name) for name in [primary_type, *deps]).encode()
+
+
+_UINT256_MOD = 1 << 256
+
+
+def _word(value: int) -> bytes:
+    """ABI-encode an int/uint/bool as one 32-byte word (two's complement for negatives)."""
+    return (value % _UINT256_MOD).to_bytes(32, "big")
+
+
+class GrvtOrderSigner:
+    """
+    Precompiled EIP-712 signer for GRVT orders.
+
+    The domain separator, the Order/OrderLeg type hashes, the signer address and
+    the per-instrument asset id / size multiplier are computed once. Signing an
+    order then only hashes its struct fields and produces one secp256k1
+    signature; the result is byte-for-byte identical to
+    encode_typed_data + Account.sign_message.
+    """
+
+    PRICE_MULTIPLIER = Decimal(1_000_000_000)
+
+    ORDER_TYPE_HASH = keccak(_eip712_encode_type("Order", EIP712_ORDER_MESSAGE_TYPE))
+    ORDER_LEG_TYPE_HASH = keccak(_eip712_encode_type("OrderLeg", EIP712_ORDER_MESSAGE_TYPE))
+    DOMAIN_TYPE_HASH = keccak(b"EIP712Domain(string name,string version,uint256 chainId)")
+
+    def __init__(self, private_key: str, env: GrvtEnv):
+        account = Account.from_key(private_key)
+        self.address: str = account.address
+        self._key = keys.PrivateKey(bytes(account.key))
+        self.env = env
+
+        domain = get_EIP712_domain_data(env)
+        self.domain_separator = keccak(
+            self.DOMAIN_TYPE_HASH
+            + keccak(text=str(domain["name"]))
+            + keccak(text=str(domain["version"]))
+            + _word(int(domain["chainId"]))
+        )
+        self._digest_prefix = b"\x19\x01" + self.domain_separator
+        # instrument name -> (raw instrument dict values, encoded asset id word, size multiplier)
+        self._instruments: dict[str, tuple[Any, Any, bytes, Decimal]] = {}
+
+    def _instrument(self, name: str, instruments: dict[str, dict]) -> tuple[bytes, Decimal]:
+        instrument = instruments.get(name)
+        if not instrument or not isinstance(instrument, dict):
+            raise ValueError(f"GrvtOrderSigner: {name=} not found in instruments")
+        instrument_hash = instrument.get("instrument_hash")
+        base_decimals = instrument.get("base_decimals")
+        cached = self._instruments.get(name)
+        if cached is not None and cached[0] == instrument_hash and cached[1] == base_decimals:
+            return cached[2], cached[3]
+        if instrument_hash is None or base_decimals is None:
+            raise ValueError(
+                f"GrvtOrderSigner: instrument {name} needs 'instrument_hash' and 'base_decimals'"
+            )
+        asset_id = (
+            int(instrument_hash, 16)
+            if isinstance(instrument_hash, str)
+            else int(instrument_hash)
+        )
+        asset_word = _word(asset_id)
+        size_multiplier = Decimal(10**base_decimals)
+        self._instruments[name] = (instrument_hash, base_decimals, asset_word, size_multiplier)
+        return asset_word, size_multiplier
+
+    def hash_order(self, order: GrvtOrder, instruments: dict[str, dict]) -> bytes:
+        """EIP-712 digest of the order (the 32 bytes that get signed)."""
+        leg_hashes = b""
+        for leg in order.legs:
+            asset_word, size_multiplier = self._instrument(leg.instrument, instruments)
+            leg_hashes += keccak(
+                self.ORDER_LEG_TYPE_HASH
+                + asset_word
+                + _word(int(Decimal(leg.size) * size_multiplier))
+                + _word(int(Decimal(leg.limit_price) * self.PRICE_MULTIPLIER))
+                + _word(1 if leg.is_buying_asset else 0)
+            )
+        struct_hash = keccak(
+            self.ORDER_TYPE_HASH
+            + _word(int(order.sub_account_id))
+            + _word(1 if order.is_market else 0)
+            + _word(TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE[order.time_in_force].value)
+            + _word(1 if order.post_only else 0)
+            + _word(1 if order.reduce_only else 0)
+            + keccak(leg_hashes)
+            + _word(int(order.signature.nonce))
+            + _word(int(order.signature.expiration))
+        )
+        return keccak(self._digest_prefix + struct_hash)
+
+    def sign_order(self, order: GrvtOrder, instruments: dict[str, dict]) -> GrvtOrder:
+        """Fill order.signature (r, s, v, signer) in place and return the order."""
+        signature = self._key.sign_msg_hash(self.hash_order(order, instruments))
+        order.signature.r = "0x" + signature.r.to_bytes(32, byteorder="big").hex()
+        order.signature.s = "0x" + signature.s.to_bytes(32, byteorder="big").hex()
+        order.signature.v = signature.v + 27
+        order.signature.signer = self.address
+        return order
+
+
+@functools.lru_cache(maxsize=32)
+def get_order_signer(private_key: str, env: GrvtEnv) -> GrvtOrderSigner:
+    """Cached GrvtOrderSigner per (private key, env)."""
+    return GrvtOrderSigner(private_key, env)
+
+
+def sign_grvt_order(
+    order: GrvtOrder, private_key: str, env: GrvtEnv, instruments: dict[str, dict]
+) -> GrvtOrder:
+    """
+    Sign an order and return it.
+
+    The nonce and expiration must already be set on the order.
+    """
+    return get_order_signer(private_key, env).sign_order(order, instruments)
+
+
+# Signer installed in a signing worker process by install_worker_signer
+_worker_signer: GrvtOrderSigner | None = None
+
+
+def install_worker_signer(private_key: str, env: GrvtEnv) -> None:
+    """
+    Install the signer used by sign_grvt_order_in_worker in this process.
+
+    Meant as a worker-pool initializer: the private key crosses the process
+    boundary once per worker instead of once per order.
+    """
+    global _worker_signer
+    _worker_signer = get_order_signer(private_key, env)
+
+
+def sign_grvt_order_in_worker(order: GrvtOrder, instruments: dict[str, dict]) -> GrvtOrder:
+    """
+    Sign an order with the signer installed by install_worker_signer and return it.
+
+    Module-level and side-effect free apart from the order itself, so it can run
+    in a worker process; the nonce and expiration must already be set on the order.
+    """
+    if _worker_signer is None:
+        raise RuntimeError("sign_grvt_order_in_worker: no signer installed in this process")
+    return _worker_signer.sign_order(order, instruments)
+
+
 def get_order_payload(
     order: GrvtOrder, private_key: str, env: GrvtEnv, instruments: dict[str, dict]
 ) -> dict:
-    signable_message = get_signable_message(order, env, instruments)
-    if signable_message is None:
-        raise ValueError("Failed to create signable message")
-    signed_message = Account.sign_message(signable_message, private_key)
-    order.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    order.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    order.signature.v = signed_message.v
-    order.signature.signer = Account.from_key(private_key).address
+    return build_order_payload(sign_grvt_order(order, private_key, env, instruments))
+
 
+def build_order_payload(order: GrvtOrder) -> dict:
+    """Build the create_order payload of an already signed order."""
     return {
         "order": {
             "sub_account_id": str(order.sub_account_id),
@@ -7,7 +7,6 @@
 # ruff: noqa: E501
 
 import asyncio
-import json
 import logging
 import traceback
 from asyncio.events import AbstractEventLoop
@@ -33,6 +32,7 @@ from .grvt_ccxt_types import (
     Num,
 )
 from .grvt_ccxt_utils import get_order_rpc_payload
+from .grvt_codec import dumps, loads
 
 WS_READ_TIMEOUT = 5
 
@@ -305,7 +305,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
                     response = await asyncio.wait_for(
                         self.ws[grvt_endpoint_type].recv(), timeout=WS_READ_TIMEOUT
                     )
-                    message = json.loads(response)
+                    message = loads(response)
                     self.logger.debug(f"{FN} received {message=}")
                     self._check_susbcribed_stream(grvt_endpoint_type, message)
                     if "feed" in message:
@@ -539,7 +539,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             GrvtWSEndpointType.TRADE_DATA,
             GrvtWSEndpointType.MARKET_DATA,
         ]:  # Legacy subscription
-            subscribe_json = json.dumps(
+            subscribe_json = dumps(
                 {
                     "request_id": self._request_id,
                     "stream": versioned_stream,
@@ -551,7 +551,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             self.logger.info(f"{FN} {versioned_stream=} {subscribe_json=}")
         else:  # RPC WS format
             self._request_id += 1
-            subscribe_json = json.dumps(
+            subscribe_json = dumps(
                 {
                     "jsonrpc": "2.0",
                     "method": "subscribe",
@@ -583,7 +583,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             GrvtWSEndpointType.TRADE_DATA,
             GrvtWSEndpointType.MARKET_DATA,
         ]:  # Legacy subscription
-            subscribe_json = json.dumps(
+            subscribe_json = dumps(
                 {
                     "request_id": self._request_id,
                     "stream": versioned_stream,
@@ -595,7 +595,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             self.logger.info(f"{FN} {versioned_stream=} {subscribe_json=}")
         else:  # RPC WS format
             self._request_id += 1
-            subscribe_json = json.dumps(
+            subscribe_json = dumps(
                 {
                     "jsonrpc": "2.0",
                     "method": "unsubscribe",
@@ -629,7 +629,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
         """
         Send a message to the server.
         """
-        await self._send(end_point_type, json.dumps(message))
+        await self._send(end_point_type, dumps(message))
         self.logger.info(f"{self._clsname} send_rpc_message {end_point_type=} {message=}")
 
     async def rpc_create_order(
@@ -12,6 +12,7 @@ import aiohttp
 import requests  # type: ignore
 from eth_account import Account
 
+from .grvt_codec import dumps, loads
 from .grvt_raw_env import GrvtEnv, GrvtEnvConfig, get_env_config
 
 
@@ -147,13 +148,13 @@ class GrvtRawSyncBase(GrvtRawBase):
         if is_auth:
             self._refresh_cookie()
 
-        req_json = json.dumps(req, cls=DataclassJSONEncoder)
+        req_json = dumps(req)
         resp_json: Any = {}
 
         self.logger.debug(f"{FN} {req_json=}")
         resp: requests.Response = self._session.post(path, data=req_json, timeout=5)
         try:
-            resp_json = resp.json()
+            resp_json = loads(resp.content)
             if not resp.ok:
                 self.logger.warning(f"{FN} Error {resp_json=}")
             else:
@@ -239,7 +240,7 @@ class GrvtRawAsyncBase(GrvtRawBase):
         if is_auth:
             await self._refresh_cookie()
 
-        req_json = json.dumps(req, cls=DataclassJSONEncoder)
+        req_json = dumps(req)
         resp_json: Any = {}
 
         self.logger.debug(f"{FN} {req_json=}")
@@ -248,7 +249,7 @@ class GrvtRawAsyncBase(GrvtRawBase):
         )
         try:
             resp_text = await resp.text()
-            resp_json = json.loads(resp_text)
+            resp_json = loads(resp_text)
             if not resp.ok:
                 self.logger.warning(f"{FN} Error {resp_text=}")
             else:
@@ -0,0 +1,83 @@
+"""
+Micro-benchmark: GRVT order signing throughput.
+
+Compares the generic path (encode_typed_data over the full type schema +
+Account.sign_message + Account.from_key per order) with the cached
+GrvtOrderSigner used by get_order_payload.
+
+Usage:
+    python tests/bench_order_signing.py [n_orders]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+from eth_account import Account
+
+# 添加项目根目录到 Python 路径，使脚本可以从任何目录运行
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.pysdk.grvt_ccxt_env import GrvtEnv
+from src.pysdk.grvt_ccxt_utils import (
+    get_grvt_order,
+    get_order_signer,
+    get_signable_message,
+)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+SUB_ACCOUNT_ID = "8289849667772468"
+INSTRUMENTS = {"BTC_USDT_Perp": {"instrument_hash": "0x030501", "base_decimals": 9}}
+
+
+def make_orders(n: int) -> list:
+    rng = random.Random(0)
+    return [
+        get_grvt_order(
+            sub_account_id=SUB_ACCOUNT_ID,
+            symbol="BTC_USDT_Perp",
+            order_type="limit",
+            side=rng.choice(["buy", "sell"]),
+            amount="0.002",
+            limit_price=str(90000 + 20 * rng.randrange(-50, 50)),
+        )
+        for _ in range(n)
+    ]
+
+
+def sign_generic(order) -> None:
+    signable_message = get_signable_message(order, GrvtEnv.PROD, INSTRUMENTS)
+    signed = Account.sign_message(signable_message, PRIVATE_KEY)
+    order.signature.r = "0x" + signed.r.to_bytes(32, byteorder="big").hex()
+    order.signature.s = "0x" + signed.s.to_bytes(32, byteorder="big").hex()
+    order.signature.v = signed.v
+    order.signature.signer = Account.from_key(PRIVATE_KEY).address
+
+
+def sign_cached(order) -> None:
+    get_order_signer(PRIVATE_KEY, GrvtEnv.PROD).sign_order(order, INSTRUMENTS)
+
+
+def bench(name: str, fn, orders: list) -> float:
+    start = time.perf_counter()
+    for order in orders:
+        fn(order)
+    elapsed = time.perf_counter() - start
+    rate = len(orders) / elapsed
+    print(f"{name:<28} {len(orders):>6} orders  {elapsed * 1000:9.1f} ms  {rate:10.0f} orders/s")
+    return rate
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    sign_cached(make_orders(1)[0])  # warm the signer cache
+
+    before = bench("encode_typed_data (before)", sign_generic, make_orders(n))
+    after = bench("GrvtOrderSigner (after)", sign_cached, make_orders(n))
+    print(f"speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import dataclasses
+import math
+from decimal import Decimal
+
+import pytest
+
+from pysdk import grvt_codec
+from pysdk.grvt_raw_types import TimeInForce
+
+
+@dataclasses.dataclass
+class Leg:
+    size: Decimal
+    time_in_force: TimeInForce
+
+
+def test_dumps_is_compact():
+    assert grvt_codec.dumps({"a": [1, 2], "b": None, "c": "价格"}) == '{"a":[1,2],"b":null,"c":"价格"}'
+
+
+def test_dumps_payload_types():
+    leg = Leg(Decimal("0.10"), TimeInForce.GOOD_TILL_TIME)
+    assert grvt_codec.loads(grvt_codec.dumps({"leg": leg})) == {
+        "leg": {"size": "0.10", "time_in_force": "GOOD_TILL_TIME"}
+    }
+    assert grvt_codec.dumps(2**70) == str(2**70)
+    with pytest.raises(TypeError):
+        grvt_codec.dumps(object())
+
+
+def test_loads():
+    assert grvt_codec.loads(b'{"nonce":9007199254740993}') == {"nonce": 9007199254740993}
+    assert grvt_codec.loads('[1.5,"x"]') == [1.5, "x"]
+    assert math.isnan(grvt_codec.loads("NaN"))
+    with pytest.raises(ValueError):
+        grvt_codec.loads("{")
@@ -0,0 +1,112 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import multiprocessing
+
+import pytest
+from eth_account import Account
+
+from pysdk.grvt_ccxt_env import GrvtEnv
+from pysdk.grvt_ccxt_utils import (
+    GrvtOrderSigner,
+    get_grvt_order,
+    get_order_payload,
+    get_order_signer,
+    get_signable_message,
+    install_worker_signer,
+    sign_grvt_order_in_worker,
+)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+SUB_ACCOUNT_ID = "8289849667772468"
+
+INSTRUMENTS = {
+    "BTC_USDT_Perp": {"instrument_hash": "0x030501", "base_decimals": 9},
+    "ETH_USDT_Perp": {"instrument_hash": "0x030401", "base_decimals": 9},
+    "SOL_USDT_Perp": {"instrument_hash": "0x03e201", "base_decimals": 9},
+}
+
+
+def reference_signature(order, env: GrvtEnv) -> tuple[str, str, int]:
+    signed = Account.sign_message(
+        get_signable_message(order, env, INSTRUMENTS), PRIVATE_KEY
+    )
+    return (
+        "0x" + signed.r.to_bytes(32, byteorder="big").hex(),
+        "0x" + signed.s.to_bytes(32, byteorder="big").hex(),
+        signed.v,
+    )
+
+
+def random_order(rng: random.Random):
+    params = {
+        "time_in_force": rng.choice(
+            ["GOOD_TILL_TIME", "IMMEDIATE_OR_CANCEL", "FILL_OR_KILL", "ALL_OR_NONE"]
+        ),
+        "post_only": rng.random() < 0.5,
+        "reduce_only": rng.random() < 0.5,
+        "client_order_id": rng.randrange(2**32),
+    }
+    return get_grvt_order(
+        sub_account_id=SUB_ACCOUNT_ID,
+        symbol=rng.choice(list(INSTRUMENTS)),
+        order_type=rng.choice(["limit", "market"]),
+        side=rng.choice(["buy", "sell"]),
+        amount=f"{rng.uniform(0.001, 50):.9f}",
+        limit_price=f"{rng.uniform(1, 120000):.9f}",
+        params=params,
+    )
+
+
+def test_order_signer_matches_encode_typed_data():
+    rng = random.Random(7)
+    for env in (GrvtEnv.PROD, GrvtEnv.TESTNET):
+        signer = GrvtOrderSigner(PRIVATE_KEY, env)
+        for _ in range(50):
+            order = random_order(rng)
+            want_r, want_s, want_v = reference_signature(order, env)
+            signer.sign_order(order, INSTRUMENTS)
+            assert order.signature.r == want_r
+            assert order.signature.s == want_s
+            assert order.signature.v == want_v
+            assert order.signature.signer == Account.from_key(PRIVATE_KEY).address
+
+
+def test_order_signer_refreshes_changed_instrument():
+    signer = GrvtOrderSigner(PRIVATE_KEY, GrvtEnv.TESTNET)
+    instruments = {"BTC_USDT_Perp": {"instrument_hash": "0x030501", "base_decimals": 9}}
+    order = random_order(random.Random(1))
+    order.legs[0].instrument = "BTC_USDT_Perp"
+    first = signer.hash_order(order, instruments)
+    instruments["BTC_USDT_Perp"] = {"instrument_hash": "0x030501", "base_decimals": 6}
+    assert signer.hash_order(order, instruments) != first
+
+
+def test_get_order_payload_uses_cached_signer():
+    order = random_order(random.Random(3))
+    want_r, want_s, want_v = reference_signature(order, GrvtEnv.PROD)
+    payload = get_order_payload(order, PRIVATE_KEY, GrvtEnv.PROD, INSTRUMENTS)
+    signature = payload["order"]["signature"]
+    assert (signature["r"], signature["s"], signature["v"]) == (want_r, want_s, want_v)
+    assert get_order_signer(PRIVATE_KEY, GrvtEnv.PROD) is get_order_signer(
+        PRIVATE_KEY, GrvtEnv.PROD
+    )
+
+
+def test_sign_in_worker_without_installed_signer_fails():
+    with pytest.raises(RuntimeError):
+        sign_grvt_order_in_worker(random_order(random.Random(4)), INSTRUMENTS)
+
+
+def test_sign_in_worker_uses_signer_installed_by_initializer():
+    orders = [random_order(random.Random(seed)) for seed in range(5, 9)]
+    pool = ProcessPoolExecutor(
+        max_workers=2,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=partial(install_worker_signer, PRIVATE_KEY, GrvtEnv.PROD),
+    )
+    with pool:
+        signed = list(pool.map(sign_grvt_order_in_worker, orders, [INSTRUMENTS] * len(orders)))
+    for order, result in zip(orders, signed):
+        r, s, v = reference_signature(order, GrvtEnv.PROD)
+        assert (result.signature.r, result.signature.s, result.signature.v) == (r, s, v)
@@ -6,7 +6,8 @@ logging.basicConfig(level=logging.INFO)
 
 
 def on_order_book_update(market_id, order_book):
-    logging.info(f"Order book {market_id}:\n{json.dumps(order_book, indent=2)}")
+    bids, asks = order_book.top_n(5)
+    logging.info(f"Order book {market_id}:\nbids={bids}\nasks={asks}")
 
 
 def on_account_update(account_id, account):
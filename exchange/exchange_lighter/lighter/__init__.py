@@ -180,5 +180,6 @@ from lighter.models.validator_info import ValidatorInfo
 from lighter.models.withdraw_history import WithdrawHistory
 from lighter.models.withdraw_history_item import WithdrawHistoryItem
 from lighter.models.zk_lighter_info import ZkLighterInfo
+from lighter.l2_book import L2OrderBook
 from lighter.ws_client import WsClient
 from lighter.signer_client import SignerClient, create_api_key
\ No newline at end of file
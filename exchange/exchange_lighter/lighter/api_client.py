@@ -28,7 +28,7 @@ from pydantic import SecretStr
 from lighter.configuration import Configuration
 from lighter.api_response import ApiResponse, T as ApiResponseT
 import lighter.models
-from lighter import rest
+from lighter import codec, fast_models, rest
 from lighter.exceptions import (
     ApiValueError,
     ApiException,
@@ -55,6 +55,9 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param fast_response_types: response type names (e.g.
+        fast_models.HOT_RESPONSE_TYPES) decoded into validation-free
+        structs instead of pydantic models
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -75,7 +78,8 @@ class ApiClient:
         configuration=None,
         header_name=None,
         header_value=None,
-        cookie=None
+        cookie=None,
+        fast_response_types=None
     ) -> None:
         # use default configuration if none is provided
         if configuration is None:
@@ -90,6 +94,7 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        self.fast_response_types = frozenset(fast_response_types or ())
 
     async def __aenter__(self):
         return self
@@ -399,14 +404,14 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = codec.loads(response_text)
             except ValueError:
                 data = response_text
         elif content_type.startswith("application/json"):
             if response_text == "":
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = codec.loads(response_text)
         elif content_type.startswith("text/plain"):
             data = response_text
         else:
@@ -415,6 +420,8 @@ class ApiClient:
                 reason="Unsupported content type: {0}".format(content_type)
             )
 
+        if response_type in self.fast_response_types and isinstance(data, dict):
+            return fast_models.decoder(response_type)(data)
         return self.__deserialize(data, response_type)
 
     def __deserialize(self, data, klass):
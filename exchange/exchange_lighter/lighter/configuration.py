@@ -186,6 +186,12 @@ conf = lighter.Configuration(
         """This value is passed to the aiohttp to limit simultaneous connections.
            Default values is 100, None means no-limit.
         """
+        self.dns_cache_ttl = 300
+        """Seconds aiohttp caches resolved host addresses, None caches forever.
+        """
+        self.keepalive_timeout = 60
+        """Seconds an idle pooled connection is kept open for reuse.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
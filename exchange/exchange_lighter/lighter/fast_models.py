@@ -0,0 +1,133 @@
+"""Validation-free decoding of hot REST responses into slotted structs.
+
+ApiClient deserializes every response through pydantic ``from_dict``, which
+validates and instantiates one model per nested object; an order book or
+active-order page is hundreds to thousands of models per call. For response
+types listed in ``ApiClient.fast_response_types`` the decoded JSON is instead
+mapped onto lightweight classes derived once from the generated pydantic
+models: same attribute names, nested models and lists of models decoded
+recursively, no validation, no coercion.
+
+Differences from the pydantic models:
+
+* missing fields are ``None`` instead of raising;
+* unknown fields are dropped (no ``additional_properties``);
+* ``to_dict()`` is the only model method provided.
+"""
+
+import typing
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+import lighter.models
+
+# Response types the exchange adapters poll on hot paths
+HOT_RESPONSE_TYPES: FrozenSet[str] = frozenset({
+    "OrderBookOrders",
+    "Orders",
+    "Trades",
+    "DetailedAccounts",
+})
+
+# Field kinds
+_VALUE, _MODEL, _MODEL_LIST = 0, 1, 2
+
+
+class FastModel:
+    """Base class of the generated structs"""
+    __slots__ = ()
+    _fields: Tuple[Tuple[str, str, int, Optional[Type["FastModel"]]], ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["FastModel"]:
+        """Replaced per class by a decoder generated in fast_model()"""
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary keyed by JSON field names; None values are omitted"""
+        result = {}
+        for name, key, kind, _ in self._fields:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if kind == _MODEL:
+                value = value.to_dict()
+            elif kind == _MODEL_LIST:
+                value = [item.to_dict() for item in value]
+            result[key] = value
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name, _, _, _ in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+_classes: Dict[Type[BaseModel], Type[FastModel]] = {}
+
+
+def _model_of(annotation: Any) -> Tuple[int, Optional[Type[BaseModel]]]:
+    """Classifies a field annotation as a plain value, a nested model or a list of models"""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _model_of(args[0])
+        return _VALUE, None
+    if origin is list:
+        kind, model = _model_of(typing.get_args(annotation)[0])
+        return (_MODEL_LIST, model) if kind == _MODEL else (_VALUE, None)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _MODEL, annotation
+    return _VALUE, None
+
+
+def fast_model(model: Type[BaseModel]) -> Type[FastModel]:
+    """Returns the struct class mirroring a generated pydantic model, built on first use"""
+    cls = _classes.get(model)
+    if cls is not None:
+        return cls
+    names = tuple(name for name in model.model_fields if name != "additional_properties")
+    cls = type(model.__name__, (FastModel,), {"__slots__": names, "__module__": __name__})
+    # registered before resolving fields so self-referencing models terminate
+    _classes[model] = cls
+    fields = []
+    for name in names:
+        info = model.model_fields[name]
+        kind, sub = _model_of(info.annotation)
+        fields.append((name, info.alias or name, kind, fast_model(sub) if sub is not None else None))
+    cls._fields = tuple(fields)
+    cls.from_dict = staticmethod(_compile_decoder(cls))
+    return cls
+
+
+def _compile_decoder(cls: Type[FastModel]) -> Callable[[Any], Any]:
+    """Generates a straight-line from_dict for cls, as dataclasses does for __init__"""
+    namespace: Dict[str, Any] = {"new": object.__new__, "cls": cls}
+    lines = [
+        "def from_dict(data):",
+        "    if data is None:",
+        "        return None",
+        "    self = new(cls)",
+        "    get = data.get",
+    ]
+    for i, (name, key, kind, sub) in enumerate(cls._fields):
+        if kind == _VALUE:
+            lines.append(f"    self.{name} = get({key!r})")
+            continue
+        # nested classes are looked up at call time so self-references resolve
+        namespace[f"sub_{i}"] = sub
+        decode = f"sub_{i}.from_dict(v)" if kind == _MODEL else f"[sub_{i}.from_dict(x) for x in v]"
+        lines.append(f"    v = get({key!r})")
+        lines.append(f"    self.{name} = None if v is None else {decode}")
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)
+    return namespace["from_dict"]
+
+
+def decoder(response_type: str) -> Callable[[Any], Any]:
+    """Decoder for a response type name as used in ``response_types_map``"""
+    return fast_model(getattr(lighter.models, response_type)).from_dict
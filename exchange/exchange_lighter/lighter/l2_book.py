@@ -0,0 +1,230 @@
+from bisect import bisect_left, insort
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Level = Tuple[str, str]
+
+
+class BookSide:
+    """
+    One side of an L2 book: price -> size, kept sorted best-first.
+
+    Prices are keyed by float (negated for bids) in a sorted list, so the best level
+    is always index 0. Lookups are O(1) via the dict, the insert/delete position is
+    found with bisect in O(log n), and zero-size levels are removed. `version`
+    changes whenever a level changes.
+    """
+
+    __slots__ = ("is_bid", "version", "_keys", "_levels", "_dicts", "_dicts_version")
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self.version = 0
+        self._keys: List[float] = []
+        self._levels: Dict[float, Level] = {}
+        self._dicts: List[dict] = []
+        self._dicts_version = 0
+
+    def _key(self, price: str) -> float:
+        return -float(price) if self.is_bid else float(price)
+
+    def set(self, price: str, size: str) -> None:
+        key = self._key(price)
+        if float(size) == 0:
+            if self._levels.pop(key, None) is not None:
+                del self._keys[bisect_left(self._keys, key)]
+                self.version += 1
+            return
+        if key not in self._levels:
+            insort(self._keys, key)
+        self._levels[key] = (price, size)
+        self.version += 1
+
+    def clear(self) -> None:
+        if self._keys:
+            self._keys.clear()
+            self._levels.clear()
+            self.version += 1
+
+    def best(self) -> Optional[Level]:
+        return self._levels[self._keys[0]] if self._keys else None
+
+    def top(self, depth: Optional[int] = None) -> List[Level]:
+        levels = self._levels
+        keys = self._keys if depth is None else islice(self._keys, depth)
+        return [levels[key] for key in keys]
+
+    def as_dicts(self) -> List[dict]:
+        """
+        All levels as [{"price", "size"}], best-first.
+
+        Built once per version and shared between callers until the side changes;
+        callers must not modify it.
+        """
+        if self._dicts_version != self.version:
+            self._dicts = [{"price": p, "size": s} for p, s in self]
+            self._dicts_version = self.version
+        return self._dicts
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self):
+        levels = self._levels
+        return (levels[key] for key in self._keys)
+
+
+class L2OrderBook:
+    """
+    L2 order book of one market, maintained from `order_book/{market_id}` WS messages.
+
+    `apply_snapshot` replaces the book with a `subscribed/order_book` payload and
+    `apply_update` applies an `update/order_book` delta, where a level with size 0
+    removes that price. `continuity` checks a delta against the previous message
+    before it is applied.
+    """
+
+    IN_SEQUENCE = "in_sequence"
+    STALE = "stale"
+    GAP = "gap"
+
+    def __init__(self, market_id: Any = None):
+        self.market_id = market_id
+        self.bids = BookSide(is_bid=True)
+        self.asks = BookSide(is_bid=False)
+        self.offset: Optional[int] = None
+        self.nonce: Optional[int] = None
+        # payload of the last applied delta; None right after a snapshot
+        self.last_delta: Optional[dict] = None
+
+    @classmethod
+    def from_snapshot(cls, market_id: Any, order_book: dict) -> "L2OrderBook":
+        book = cls(market_id)
+        book.apply_snapshot(order_book)
+        return book
+
+    def apply_snapshot(self, order_book: dict) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.apply_update(order_book)
+        self.last_delta = None
+
+    def apply_update(self, order_book: dict) -> None:
+        for level in order_book.get("asks", ()):
+            self.asks.set(level["price"], level["size"])
+        for level in order_book.get("bids", ()):
+            self.bids.set(level["price"], level["size"])
+        if order_book.get("offset") is not None:
+            self.offset = order_book["offset"]
+        if order_book.get("nonce") is not None:
+            self.nonce = order_book["nonce"]
+        self.last_delta = order_book
+
+    def continuity(self, order_book: dict) -> str:
+        """
+        Classify a delta against the last applied message.
+
+        Each update's `begin_nonce` must equal the previous message's `nonce`,
+        otherwise updates were missed (GAP). Messages whose `offset` is not past
+        the current one are replays (STALE) and must be skipped.
+        """
+        offset = order_book.get("offset")
+        if offset is not None and self.offset is not None and offset <= self.offset:
+            return self.STALE
+        begin_nonce = order_book.get("begin_nonce")
+        if begin_nonce is not None and self.nonce is not None and begin_nonce != self.nonce:
+            return self.GAP
+        return self.IN_SEQUENCE
+
+    def best_bid(self) -> Optional[Level]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        return self.asks.best()
+
+    def top_n(self, depth: int) -> Tuple[List[Level], List[Level]]:
+        """Best `depth` (price, size) levels per side as (bids, asks); only those levels are read."""
+        return self.bids.top(depth), self.asks.top(depth)
+
+    def to_dict(self) -> dict:
+        """Full book in the WS payload format, sorted best-first."""
+        return {
+            "asks": [{"price": p, "size": s} for p, s in self.asks],
+            "bids": [{"price": p, "size": s} for p, s in self.bids],
+            "offset": self.offset,
+        }
+
+    def __getitem__(self, side: str) -> List[dict]:
+        # Backwards compatible with the previous dict state: book["asks"] / book["bids"].
+        # Only the requested side is converted, and only when it changed since the last read.
+        if side == "asks":
+            return self.asks.as_dicts()
+        if side == "bids":
+            return self.bids.as_dicts()
+        raise KeyError(side)
+
+    @staticmethod
+    def aggregate_orders(orders: Iterable[Any], is_bid: bool) -> List[Level]:
+        """
+        Aggregate REST `SimpleOrder`s (or dicts with price / remaining_base_amount) into
+        (price, size) levels, best-first.
+        """
+        sizes: Dict[Decimal, Decimal] = {}
+        for order in orders:
+            price = order["price"] if isinstance(order, dict) else order.price
+            size = (
+                order["remaining_base_amount"]
+                if isinstance(order, dict)
+                else order.remaining_base_amount
+            )
+            price_dec = Decimal(price)
+            sizes[price_dec] = sizes.get(price_dec, Decimal(0)) + Decimal(size)
+        return [
+            (str(price), str(size))
+            for price, size in sorted(sizes.items(), reverse=is_bid)
+            if size > 0
+        ]
+
+    def compare(
+        self, bids: List[Level], asks: List[Level], depth: Optional[int] = None
+    ) -> List[str]:
+        """
+        Compare the top levels of this book with reference levels, e.g. from a REST snapshot.
+
+        Returns:
+            List[str]: human readable mismatches; empty when the books agree.
+        """
+        mismatches = []
+        for name, side, expected in (("bids", self.bids, bids), ("asks", self.asks, asks)):
+            n = len(expected) if depth is None else min(depth, len(expected))
+            actual = side.top(n)
+            for i in range(n):
+                want_price, want_size = Decimal(expected[i][0]), Decimal(expected[i][1])
+                if i >= len(actual):
+                    mismatches.append(f"{name}[{i}]: missing level {expected[i][0]}")
+                    continue
+                got_price, got_size = Decimal(actual[i][0]), Decimal(actual[i][1])
+                if got_price != want_price or got_size != want_size:
+                    mismatches.append(
+                        f"{name}[{i}]: got {actual[i][0]}@{actual[i][1]}, "
+                        f"expected {expected[i][0]}@{expected[i][1]}"
+                    )
+        return mismatches
+
+    def compare_snapshot(self, snapshot: Any, depth: Optional[int] = None) -> List[str]:
+        """
+        Compare with an `OrderApi.order_book_orders` response (`OrderBookOrders`).
+
+        The REST snapshot lists individual orders, so it is aggregated by price first.
+        REST is limited to a number of orders per side, so only the levels it fully
+        covers are compared.
+        """
+        bids = self.aggregate_orders(snapshot.bids, is_bid=True)
+        asks = self.aggregate_orders(snapshot.asks, is_bid=False)
+        # the last aggregated level may be cut off by the REST order limit
+        if len(snapshot.bids) < snapshot.total_bids:
+            bids = bids[:-1]
+        if len(snapshot.asks) < snapshot.total_asks:
+            asks = asks[:-1]
+        return self.compare(bids, asks, depth)
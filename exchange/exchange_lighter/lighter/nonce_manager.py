@@ -1,16 +1,34 @@
 import abc
+import asyncio
 import enum
-from typing import Optional, Tuple, List
+import logging
+import threading
+from typing import Dict, Optional, Set, Tuple, List
 
 import requests
 
+from lighter.api.transaction_api import TransactionApi
 from lighter.api_client import ApiClient
 from lighter.errors import ValidationError
 
+# seconds between attempts when a background nonce resync fails
+RESYNC_RETRY_DELAY = 1.0
+
+# longest a resync waits for the key's in-flight nonces to be acknowledged before refetching
+RESYNC_SETTLE_TIMEOUT = 5.0
+
+
+class NonceUnavailableError(Exception):
+    """No API key can hand out a nonce right now (resyncing, or at max_in_flight)."""
+
+
+# keep-alive pool for the blocking nonce fetches, shared by all managers
+_http = requests.Session()
+
 
 def get_nonce_from_api(client: ApiClient, account_index: int, api_key: int) -> int:
     #  uses request to avoid async initialization
-    req = requests.get(
+    req = _http.get(
         client.configuration.host + "/api/v1/nextNonce",
         params={"account_index": account_index, "api_key_index": api_key},
     )
@@ -38,10 +56,6 @@ class NonceManager(abc.ABC):
             for i in range(len(api_keys_list))
         }
 
-    def refresh_nonce(self, api_key: int) -> int:
-        self.nonce[api_key] = get_nonce_from_api(self.api_client, self.account_index, api_key)
-        return self.nonce[api_key]
-
     def hard_refresh_nonce(self, api_key: int):
         self.nonce[api_key] = get_nonce_from_api(self.api_client, self.account_index, api_key) - 1
 
@@ -49,9 +63,22 @@ class NonceManager(abc.ABC):
     def next_nonce(self, api_key: Optional[int] = None) -> Tuple[int, int]:
         pass
 
-    def acknowledge_failure(self, api_key: int) -> None:
+    async def start(self) -> None:
+        """Fetch initial nonces; the blocking managers already did so in __init__."""
+
+    async def next_nonce_async(self, api_key: Optional[int] = None) -> Tuple[int, int]:
+        return self.next_nonce(api_key)
+
+    def acknowledge_success(self, api_key: int, nonce: Optional[int] = None) -> None:
+        pass
+
+    def acknowledge_failure(self, api_key: int, nonce: Optional[int] = None) -> None:
         pass
 
+    async def hard_refresh_nonce_async(self, api_key: int) -> None:
+        # keep the blocking HTTP call off the event loop
+        await asyncio.to_thread(self.hard_refresh_nonce, api_key)
+
 
 class OptimisticNonceManager(NonceManager):
     def __init__(
@@ -70,7 +97,7 @@ class OptimisticNonceManager(NonceManager):
         self.nonce[api_key] += 1
         return api_key, self.nonce[api_key]
 
-    def acknowledge_failure(self, api_key: int) -> None:
+    def acknowledge_failure(self, api_key: int, nonce: Optional[int] = None) -> None:
         self.nonce[api_key] -= 1
 
 
@@ -83,6 +110,10 @@ class ApiNonceManager(NonceManager):
     ) -> None:
         super().__init__(account_index, api_client, api_keys_list)
 
+    def refresh_nonce(self, api_key: int) -> int:
+        self.nonce[api_key] = get_nonce_from_api(self.api_client, self.account_index, api_key)
+        return self.nonce[api_key]
+
     def next_nonce(self, api_key: Optional[int] = None) -> Tuple[int, int]:
         """
         It is recommended to wait at least 350ms before using the same api key.
@@ -96,10 +127,247 @@ class ApiNonceManager(NonceManager):
         nonce = self.refresh_nonce(api_key)
         return api_key, nonce
 
+    async def next_nonce_async(self, api_key: Optional[int] = None) -> Tuple[int, int]:
+        return await asyncio.to_thread(self.next_nonce, api_key)
+
+
+class AsyncNonceManager(NonceManager):
+    """
+    Pipelined optimistic nonce allocator for asyncio clients.
+
+    - `start` fetches the next nonce of every API key concurrently, without blocking the event loop.
+    - `next_nonce()` shards transactions across API keys by availability: it picks the ready key with
+      the fewest nonces in flight, round-robin on ties. Many nonces can be in flight per key;
+      `max_in_flight` (0 = unlimited) caps it.
+    - Callers report each nonce with `acknowledge_success` / `acknowledge_failure`. A failed nonce that
+      was the last one handed out for its key is rolled back. A failure that leaves a gap marks only
+      that key as resyncing and refetches its nonce in the background; the other keys keep serving.
+    - A resync first waits (up to `settle_timeout`) until the key's outstanding nonces are acknowledged,
+      so the refetched nonce already counts every transaction the server is still processing.
+
+    `next_nonce` and the acknowledge methods are thread-safe and never wait on the network.
+    """
+
+    def __init__(
+            self,
+            account_index: int,
+            api_client: ApiClient,
+            api_keys_list: List[int],
+            max_in_flight: int = 0,
+            settle_timeout: float = RESYNC_SETTLE_TIMEOUT,
+    ) -> None:
+        if len(api_keys_list) == 0:
+            raise ValidationError(f"No API Key provided")
+
+        self.current = 0
+        self.account_index = account_index
+        self.api_client = api_client
+        self.api_keys_list = list(api_keys_list)
+        self.max_in_flight = max_in_flight
+        self.settle_timeout = settle_timeout
+        self.tx_api = TransactionApi(api_client)
+
+        # api key -> last nonce handed out, and the handed out nonces not acknowledged yet
+        self.nonce: Dict[int, int] = {}
+        self.in_flight: Dict[int, Set[int]] = {api_key: set() for api_key in self.api_keys_list}
+        # keys without a trusted nonce: not fetched yet, or being refetched after a gap
+        self.resyncing: Set[int] = set(self.api_keys_list)
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._available: Optional[asyncio.Event] = None
+        # api key -> set once its in-flight nonces are all acknowledged during a resync
+        self._drained: Dict[int, asyncio.Event] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Fetch the next nonce of all API keys that have none yet, concurrently."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._available = asyncio.Event()
+            self._drained = {api_key: asyncio.Event() for api_key in self.api_keys_list}
+        pending = [api_key for api_key in self.api_keys_list if api_key not in self.nonce]
+        if pending:
+            await asyncio.gather(*(self._resync(api_key, retry=False) for api_key in pending))
+
+    async def _fetch_nonce(self, api_key: int) -> int:
+        resp = await self.tx_api.next_nonce(account_index=self.account_index, api_key_index=api_key)
+        return resp.nonce
+
+    async def _settle(self, api_key: int) -> None:
+        """Wait until no nonce of the key is in flight, or settle_timeout passes."""
+        drained = self._drained[api_key]
+        deadline = self._loop.time() + self.settle_timeout
+        while True:
+            with self._lock:
+                if not self.in_flight[api_key]:
+                    return
+                drained.clear()
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                logging.warning(
+                    f"nonce resync of api key {api_key}: {len(self.in_flight[api_key])} nonces still unacknowledged"
+                )
+                return
+            try:
+                await asyncio.wait_for(drained.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _resync(self, api_key: int, retry: bool = True) -> None:
+        await self._settle(api_key)
+        while True:
+            try:
+                nonce = await self._fetch_nonce(api_key)
+                break
+            except Exception as e:
+                if not retry:
+                    raise
+                logging.warning(f"nonce resync of api key {api_key} failed: {e}")
+                await asyncio.sleep(RESYNC_RETRY_DELAY)
+
+        with self._lock:
+            self.nonce[api_key] = nonce - 1
+            self.in_flight[api_key].clear()
+            self.resyncing.discard(api_key)
+        self._notify()
+
+    def _notify(self, event: Optional[asyncio.Event] = None) -> None:
+        if self._loop is None:
+            return
+        event = event or self._available
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            event.set()
+        else:
+            self._loop.call_soon_threadsafe(event.set)
+
+    def _release_locked(self, api_key: int, nonce: int) -> bool:
+        """Drop an acknowledged nonce; returns True when a resync waiting on the key can proceed."""
+        flight = self.in_flight[api_key]
+        flight.discard(nonce)
+        return api_key in self.resyncing and not flight
+
+    def _is_available(self, api_key: int) -> bool:
+        if api_key in self.resyncing:
+            return False
+        return self.max_in_flight <= 0 or len(self.in_flight[api_key]) < self.max_in_flight
+
+    def _pick_key(self) -> int:
+        count = len(self.api_keys_list)
+        best = None
+        for step in range(1, count + 1):
+            index = (self.current + step) % count
+            api_key = self.api_keys_list[index]
+            if self._is_available(api_key) and (
+                best is None or len(self.in_flight[api_key]) < len(self.in_flight[self.api_keys_list[best]])
+            ):
+                best = index
+        if best is None:
+            raise NonceUnavailableError("no API key available, all are resyncing or at max_in_flight")
+        self.current = best
+        return self.api_keys_list[best]
+
+    def next_nonce(self, api_key: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Hand out the next nonce without waiting; pass `api_key` to stay on one key (batches).
+
+        :raises NonceUnavailableError: no usable key (the requested key is resyncing, or all keys are busy)
+        """
+        with self._lock:
+            if api_key is None:
+                api_key = self._pick_key()
+            elif not self._is_available(api_key):
+                raise NonceUnavailableError(f"api key {api_key} is resyncing or at max_in_flight")
+            self.nonce[api_key] += 1
+            nonce = self.nonce[api_key]
+            self.in_flight[api_key].add(nonce)
+        return api_key, nonce
+
+    async def next_nonce_async(self, api_key: Optional[int] = None) -> Tuple[int, int]:
+        """Like `next_nonce`, but waits for a key to become available instead of raising."""
+        await self.start()
+        while True:
+            self._available.clear()
+            try:
+                return self.next_nonce(api_key)
+            except NonceUnavailableError:
+                await self._available.wait()
+
+    def acknowledge_success(self, api_key: int, nonce: Optional[int] = None) -> None:
+        with self._lock:
+            flight = self.in_flight.get(api_key)
+            if not flight:
+                return
+            drained = self._release_locked(api_key, min(flight) if nonce is None else nonce)
+        if drained:
+            self._notify(self._drained[api_key])
+        elif self.max_in_flight > 0:
+            self._notify()
+
+    def acknowledge_failure(self, api_key: int, nonce: Optional[int] = None) -> None:
+        """
+        Report a nonce that was not consumed. `nonce` defaults to the last one handed out for the key;
+        nonces that are no longer in flight (e.g. handed out before a resync) are ignored.
+        """
+        gap = drained = False
+        with self._lock:
+            if api_key in self.resyncing:
+                # the key is refetched anyway; only tell the waiting resync that the nonce settled
+                drained = nonce in self.in_flight[api_key] and self._release_locked(api_key, nonce)
+            else:
+                last = self.nonce[api_key]
+                nonce = last if nonce is None else nonce
+                if nonce not in self.in_flight[api_key]:
+                    return
+                self.in_flight[api_key].discard(nonce)
+                if nonce == last:
+                    self.nonce[api_key] -= 1
+                else:
+                    # later nonces are already out and will be rejected: refetch this key only
+                    self.resyncing.add(api_key)
+                    gap = True
+        if drained:
+            self._notify(self._drained[api_key])
+        elif gap:
+            self._schedule_resync(api_key)
+        elif self.max_in_flight > 0:
+            self._notify()
+
+    def hard_refresh_nonce(self, api_key: int) -> None:
+        """Refetch the key's nonce in the background; the key is skipped until then."""
+        with self._lock:
+            if api_key in self.resyncing and self._loop is not None:
+                # a resync is already scheduled; a second one could hand out duplicate nonces
+                return
+            self.resyncing.add(api_key)
+        self._schedule_resync(api_key)
+
+    async def hard_refresh_nonce_async(self, api_key: int) -> None:
+        self.hard_refresh_nonce(api_key)
+
+    def _schedule_resync(self, api_key: int) -> None:
+        if self._loop is None:
+            raise NonceUnavailableError("AsyncNonceManager.start() has not been awaited")
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            task = self._loop.create_task(self._resync(api_key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(self._resync(api_key), self._loop)
+
 
 class NonceManagerType(enum.Enum):
     OPTIMISTIC = 1
     API = 2
+    ASYNC = 3
 
 
 def nonce_manager_factory(
@@ -120,4 +388,10 @@ def nonce_manager_factory(
             api_client=api_client,
             api_keys_list=api_keys_list,
         )
+    elif nonce_manager_type == NonceManagerType.ASYNC:
+        return AsyncNonceManager(
+            account_index=account_index,
+            api_client=api_client,
+            api_keys_list=api_keys_list,
+        )
     raise ValidationError("invalid nonce manager type")
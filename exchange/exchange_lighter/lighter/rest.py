@@ -12,11 +12,14 @@
 """  # noqa: E501
 
 
+import asyncio
 import io
 import json
 import re
 import ssl
-from typing import Optional, Union
+import threading
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 import aiohttp
 import aiohttp_retry
@@ -49,9 +52,17 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
-class RESTClientObject:
+class _Transport:
+    """One aiohttp session (connection pool, DNS cache, keep-alive) shared by
+    every RESTClientObject created on the same event loop with the same host
+    and TLS/proxy settings. Reference counted; the last release closes it."""
 
-    def __init__(self, configuration) -> None:
+    _lock = threading.Lock()
+    _shared: Dict[Tuple, "_Transport"] = {}
+
+    def __init__(self, configuration, key: Optional[Tuple]) -> None:
+        self.key = key
+        self.refs = 0
 
         # maxsize is number of requests to host that are allowed in parallel
         maxsize = configuration.connection_pool_maxsize
@@ -70,14 +81,13 @@ class RESTClientObject:
 
         connector = aiohttp.TCPConnector(
             limit=maxsize,
+            ttl_dns_cache=configuration.dns_cache_ttl,
+            keepalive_timeout=configuration.keepalive_timeout,
             ssl=ssl_context
         )
 
-        self.proxy = configuration.proxy
-        self.proxy_headers = configuration.proxy_headers
-
         # https pool manager
-        self.pool_manager = aiohttp.ClientSession(
+        self.session = aiohttp.ClientSession(
             connector=connector,
             trust_env=True
         )
@@ -86,7 +96,7 @@ class RESTClientObject:
         self.retry_client: Optional[aiohttp_retry.RetryClient]
         if retries is not None:
             self.retry_client = aiohttp_retry.RetryClient(
-                client_session=self.pool_manager,
+                client_session=self.session,
                 retry_options=aiohttp_retry.ExponentialRetry(
                     attempts=retries,
                     factor=0.0,
@@ -97,11 +107,63 @@ class RESTClientObject:
         else:
             self.retry_client = None
 
-    async def close(self):
-        await self.pool_manager.close()
+    @classmethod
+    def acquire(cls, configuration) -> "_Transport":
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # the session cannot be tied to a loop yet, so it is not shared
+            transport = cls(configuration, None)
+            transport.refs = 1
+            return transport
+
+        key = (
+            loop,
+            urlsplit(configuration.host).netloc,
+            configuration.ssl_ca_cert,
+            configuration.cert_file,
+            configuration.key_file,
+            configuration.verify_ssl,
+            configuration.proxy,
+            configuration.retries,
+            configuration.connection_pool_maxsize,
+        )
+        with cls._lock:
+            transport = cls._shared.get(key)
+            if transport is None or transport.session.closed:
+                transport = cls._shared[key] = cls(configuration, key)
+            transport.refs += 1
+            return transport
+
+    async def release(self) -> None:
+        with self._lock:
+            self.refs -= 1
+            if self.refs > 0:
+                return
+            if self.key is not None and self._shared.get(self.key) is self:
+                del self._shared[self.key]
+        await self.session.close()
         if self.retry_client is not None:
             await self.retry_client.close()
 
+
+class RESTClientObject:
+
+    def __init__(self, configuration) -> None:
+        self.transport = _Transport.acquire(configuration)
+        self.pool_manager = self.transport.session
+        self.retry_client = self.transport.retry_client
+        self._closed = False
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+
+    async def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        await self.transport.release()
+
     async def request(
         self,
         method,
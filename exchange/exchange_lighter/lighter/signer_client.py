@@ -174,33 +174,49 @@ def trim_exc(exception_body: str):
 
 
 def process_api_key_and_nonce(func):
+    # Resolve the signature once at class creation. Every decorated method ends
+    # with (..., nonce, api_key_index), so the per-call shim only has to pick
+    # those two out of args/kwargs instead of running inspect's bind machinery.
+    params = list(inspect.signature(func).parameters)[1:]
+    if params[-2:] != ["nonce", "api_key_index"]:
+        raise TypeError(f"{func.__qualname__} must end with (nonce, api_key_index)")
+    head = len(params) - 2
+    nonce_pos, api_key_pos = head, head + 1
+    max_args = head + 2
+
     @wraps(func)
     async def wrapper(self, *args, **kwargs):
-        # Get the signature
-        sig = inspect.signature(func)
-
-        # Bind args and kwargs to the function's signature
-        bound_args = sig.bind(self, *args, **kwargs)
-        bound_args.apply_defaults()
-        # Extract api_key_index and nonce from kwargs or use defaults
-        api_key_index = bound_args.arguments.get("api_key_index", 255)
-        nonce = bound_args.arguments.get("nonce", -1)
+        n_args = len(args)
+        if n_args > max_args:
+            raise TypeError(
+                f"{func.__qualname__}() takes {max_args} positional arguments but {n_args} were given"
+            )
+        if n_args > head:
+            nonce = args[nonce_pos]
+            api_key_index = args[api_key_pos] if n_args > api_key_pos else kwargs.pop("api_key_index", 255)
+            args = args[:head]
+        else:
+            nonce = kwargs.pop("nonce", -1)
+            api_key_index = kwargs.pop("api_key_index", 255)
         if api_key_index == 255 and nonce == -1:
-            api_key_index, nonce = self.nonce_manager.next_nonce()
+            api_key_index, nonce = await self.nonce_manager.next_nonce_async()
 
         # Call the original function with modified kwargs
         ret: TxHash
         try:
-            partial_arguments = {k: v for k, v in bound_args.arguments.items() if k not in ("self", "nonce", "api_key_index")}
-            created_tx, ret, err = await func(self, **partial_arguments, nonce=nonce, api_key_index=api_key_index)
+            created_tx, ret, err = await func(self, *args, nonce=nonce, api_key_index=api_key_index, **kwargs)
             if (ret is None and err) or (ret and ret.code != CODE_OK):
-                self.nonce_manager.acknowledge_failure(api_key_index)
+                self.nonce_manager.acknowledge_failure(api_key_index, nonce)
+            else:
+                self.nonce_manager.acknowledge_success(api_key_index, nonce)
         except lighter.exceptions.BadRequestException as e:
             if "invalid nonce" in str(e):
-                self.nonce_manager.hard_refresh_nonce(api_key_index)
+                # release the rejected nonce first so the resync does not wait for it to settle
+                self.nonce_manager.acknowledge_failure(api_key_index, nonce)
+                await self.nonce_manager.hard_refresh_nonce_async(api_key_index)
                 return None, None, trim_exc(str(e))
             else:
-                self.nonce_manager.acknowledge_failure(api_key_index)
+                self.nonce_manager.acknowledge_failure(api_key_index, nonce)
                 return None, None, trim_exc(str(e))
 
         return created_tx, ret, err
@@ -1,7 +1,11 @@
-import json
+import asyncio
+import itertools
+
 from websockets.sync.client import connect
 from websockets.client import connect as connect_async
+from lighter.codec import dumps, loads
 from lighter.configuration import Configuration
+from lighter.l2_book import L2OrderBook
 
 class WsClient:
     def __init__(
@@ -12,6 +16,9 @@ class WsClient:
         account_ids=[],
         on_order_book_update=print,
         on_account_update=print,
+        on_order_book_gap=None,
+        on_account_orders_update=None,
+        auth_token_provider=None,
     ):
         if host is None:
             host = Configuration.get_default().host.replace("https://", "")
@@ -19,8 +26,10 @@ class WsClient:
         self.base_url = f"wss://{host}{path}"
 
         self.subscriptions = {
-            "order_books": order_book_ids,
-            "accounts": account_ids,
+            "order_books": list(order_book_ids),
+            "accounts": list(account_ids),
+            # account_all_orders needs an auth token, added with subscribe_account_orders_async
+            "account_orders": [],
         }
 
         if len(order_book_ids) == 0 and len(account_ids) == 0:
@@ -31,12 +40,23 @@ class WsClient:
 
         self.on_order_book_update = on_order_book_update
         self.on_account_update = on_account_update
+        # called with the market id when a book is dropped after a missed update
+        self.on_order_book_gap = on_order_book_gap
+        self.on_account_orders_update = on_account_orders_update
+        # returns a fresh auth token; called on every (re)subscribe since tokens expire
+        self.auth_token_provider = auth_token_provider
 
         self.ws = None
+        self.connected = False
+
+        # request id -> future of the `jsonapi/sendtx*` response, in send order
+        self.pending_txs = {}
+        self._tx_ids = itertools.count(1)
+        self._background = set()
 
     def on_message(self, ws, message):
         if isinstance(message, str):
-            message = json.loads(message)
+            message = loads(message)
 
         message_type = message.get("type")
 
@@ -50,84 +70,127 @@ class WsClient:
             self.handle_subscribed_account(message)
         elif message_type == "update/account_all":
             self.handle_update_account(message)
+        elif message_type in ("subscribed/account_all_orders", "update/account_all_orders"):
+            self.handle_account_orders(message)
         elif message_type == "ping":
             # Respond to ping with pong
-            ws.send(json.dumps({"type": "pong"}))
+            ws.send(dumps({"type": "pong"}))
+        elif message_type in ("jsonapi/sendtx", "jsonapi/sendtxbatch") or (
+            self.pending_txs and self.tx_request_id(message) in self.pending_txs
+        ):
+            # error frames only answer a submission when they echo its request id
+            self.handle_tx_response(message)
         else:
             self.handle_unhandled_message(message)
 
     async def on_message_async(self, ws, message):
-        message = json.loads(message)
+        message = loads(message)
         message_type = message.get("type")
 
         if message_type == "connected":
             await self.handle_connected_async(ws)
         elif message_type == "ping":
             # Respond to ping with pong
-            await ws.send(json.dumps({"type": "pong"}))
+            await ws.send(dumps({"type": "pong"}))
         else:
             self.on_message(ws, message)
 
     def handle_connected(self, ws):
+        self.connected = True
         for market_id in self.subscriptions["order_books"]:
             ws.send(
-                json.dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
+                dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
             )
         for account_id in self.subscriptions["accounts"]:
             ws.send(
-                json.dumps(
+                dumps(
                     {"type": "subscribe", "channel": f"account_all/{account_id}"}
                 )
             )
+        for account_id in self.subscriptions["account_orders"]:
+            ws.send(self.account_orders_subscription(account_id))
 
     async def handle_connected_async(self, ws):
+        self.connected = True
         for market_id in self.subscriptions["order_books"]:
             await ws.send(
-                json.dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
+                dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
             )
         for account_id in self.subscriptions["accounts"]:
             await ws.send(
-                json.dumps(
+                dumps(
                     {"type": "subscribe", "channel": f"account_all/{account_id}"}
                 )
             )
+        for account_id in self.subscriptions["account_orders"]:
+            await ws.send(self.account_orders_subscription(account_id))
 
     def handle_subscribed_order_book(self, message):
         market_id = message["channel"].split(":")[1]
-        self.order_book_states[market_id] = message["order_book"]
+        self.order_book_states[market_id] = L2OrderBook.from_snapshot(
+            market_id, message["order_book"]
+        )
         if self.on_order_book_update:
             self.on_order_book_update(market_id, self.order_book_states[market_id])
 
     def handle_update_order_book(self, message):
         market_id = message["channel"].split(":")[1]
+        state = self.order_book_states.get(market_id)
+        if state is None:
+            # no snapshot since (re)subscribing; deltas cannot be applied yet
+            return
+        continuity = state.continuity(message["order_book"])
+        if continuity == L2OrderBook.STALE:
+            return
+        if continuity == L2OrderBook.GAP:
+            if self.on_order_book_gap:
+                self.on_order_book_gap(market_id)
+            self.resync_order_book(market_id)
+            return
         self.update_order_book_state(market_id, message["order_book"])
         if self.on_order_book_update:
-            self.on_order_book_update(market_id, self.order_book_states[market_id])
+            self.on_order_book_update(market_id, state)
 
     def update_order_book_state(self, market_id, order_book):
-        self.update_orders(
-            order_book["asks"], self.order_book_states[market_id]["asks"]
-        )
-        self.update_orders(
-            order_book["bids"], self.order_book_states[market_id]["bids"]
-        )
+        self.order_book_states[market_id].apply_update(order_book)
+
+    def resync_order_book(self, market_id):
+        """Drop the book of `market_id` and resubscribe; updates are ignored until the new snapshot."""
+        self.order_book_states.pop(str(market_id), None)
+        self.resubscribe_order_book(market_id)
 
-    def update_orders(self, new_orders, existing_orders):
-        for new_order in new_orders:
-            is_new_order = True
-            for existing_order in existing_orders:
-                if new_order["price"] == existing_order["price"]:
-                    is_new_order = False
-                    existing_order["size"] = new_order["size"]
-                    if float(new_order["size"]) == 0:
-                        existing_orders.remove(existing_order)
-                    break
-            if is_new_order:
-                existing_orders.append(new_order)
-
-        existing_orders = [
-            order for order in existing_orders if float(order["size"]) > 0
+    def resubscribe_order_book(self, market_id):
+        """Unsubscribe and subscribe again so the server sends a fresh snapshot."""
+        frames = [
+            dumps({"type": "unsubscribe", "channel": f"order_book/{market_id}"}),
+            dumps({"type": "subscribe", "channel": f"order_book/{market_id}"}),
         ]
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            for frame in frames:
+                self.ws.send(frame)
+            return
+
+        async def send_frames():
+            for frame in frames:
+                await self.ws.send(frame)
+
+        task = loop.create_task(send_frames())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def check_order_book(self, market_id, order_api, limit=100, depth=None):
+        """
+        Compare the WS-maintained book of `market_id` with a REST snapshot.
+
+        :param order_api: a lighter.OrderApi instance
+        :param limit: number of orders per side to request (1-250)
+        :param depth: number of levels to compare (default: all levels covered by the snapshot)
+        :return: list of mismatches, empty if the books agree
+        """
+        snapshot = await order_api.order_book_orders(int(market_id), limit)
+        return self.order_book_states[str(market_id)].compare_snapshot(snapshot, depth)
 
     def handle_subscribed_account(self, message):
         account_id = message["channel"].split(":")[1]
@@ -141,6 +204,104 @@ class WsClient:
         if self.on_account_update:
             self.on_account_update(account_id, self.account_states[account_id])
 
+    def handle_account_orders(self, message):
+        account_id = message["channel"].split(":")[1]
+        if self.on_account_orders_update:
+            self.on_account_orders_update(account_id, message)
+
+    def account_orders_subscription(self, account_id):
+        if self.auth_token_provider is None:
+            raise Exception("account_all_orders requires an auth_token_provider")
+        return dumps(
+            {
+                "type": "subscribe",
+                "channel": f"account_all_orders/{account_id}",
+                "auth": self.auth_token_provider(),
+            }
+        )
+
+    async def subscribe_account_orders_async(self, account_id):
+        """
+        Add an account_all_orders subscription; sent right away when connected, otherwise on connect.
+        """
+        if account_id in self.subscriptions["account_orders"]:
+            return
+        if self.auth_token_provider is None:
+            raise Exception("account_all_orders requires an auth_token_provider")
+        self.subscriptions["account_orders"].append(account_id)
+        if self.connected:
+            await self.ws.send(self.account_orders_subscription(account_id))
+
+    async def subscribe_order_book_async(self, market_id):
+        """
+        Add an order book subscription; sent right away when connected, otherwise on connect.
+        """
+        if market_id in self.subscriptions["order_books"]:
+            return
+        self.subscriptions["order_books"].append(market_id)
+        if self.connected:
+            await self.ws.send(
+                dumps({"type": "subscribe", "channel": f"order_book/{market_id}"})
+            )
+
+    async def send_tx_batch_async(self, tx_types, tx_infos, timeout=10.0):
+        """
+        Send signed txs as one `jsonapi/sendtxbatch` request over the open connection.
+
+        All txs of a batch must be signed with the same API key, with consecutive nonces.
+
+        :param tx_types: list of tx types returned by the SignerClient.sign_* methods
+        :param tx_infos: list of tx info JSON strings returned by the SignerClient.sign_* methods
+        :param timeout: seconds to wait for the response
+        :return: the response message
+        """
+        if len(tx_types) != len(tx_infos):
+            raise Exception("Tx types and tx infos must be of same length")
+        if not self.connected:
+            raise ConnectionError("WebSocket is not connected")
+
+        request_id = f"batch_{next(self._tx_ids)}"
+        future = asyncio.get_running_loop().create_future()
+        self.pending_txs[request_id] = future
+        try:
+            await self.ws.send(
+                dumps(
+                    {
+                        "type": "jsonapi/sendtxbatch",
+                        "data": {
+                            "id": request_id,
+                            "tx_types": dumps(tx_types),
+                            "tx_infos": dumps(tx_infos),
+                        },
+                    }
+                )
+            )
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending_txs.pop(request_id, None)
+
+    @staticmethod
+    def tx_request_id(message):
+        data = message.get("data")
+        if isinstance(data, dict) and "id" in data:
+            return data["id"]
+        return message.get("id")
+
+    def handle_tx_response(self, message):
+        request_id = self.tx_request_id(message)
+        future = self.pending_txs.pop(request_id, None)
+        if future is None and self.pending_txs:
+            # responses that do not echo the request id answer the oldest request
+            future = self.pending_txs.pop(next(iter(self.pending_txs)))
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def fail_pending_txs(self, error):
+        pending, self.pending_txs = self.pending_txs, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
     def handle_unhandled_message(self, message):
         raise Exception(f"Unhandled message: {message}")
 
@@ -161,5 +322,11 @@ class WsClient:
         ws = await connect_async(self.base_url)
         self.ws = ws
 
-        async for message in ws:
-            await self.on_message_async(ws, message)
+        try:
+            async for message in ws:
+                await self.on_message_async(ws, message)
+        finally:
+            self.connected = False
+            # books are rebuilt from the snapshots sent after resubscribing
+            self.order_book_states.clear()
+            self.fail_pending_txs(ConnectionError("WebSocket connection closed"))
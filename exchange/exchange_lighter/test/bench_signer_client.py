@@ -0,0 +1,122 @@
+"""
+Micro-benchmark: Lighter create_order / cancel_order signing throughput.
+
+Compares the previous process_api_key_and_nonce wrapper (inspect.signature +
+bind/apply_defaults + a filtered kwargs dict per call) with the call shim
+resolved once at class creation. The signer shared library, nonce manager and
+transaction API are replaced by in-process stubs, so the numbers measure the
+Python-side overhead per transaction only.
+
+Usage:
+    python test/bench_signer_client.py [n_orders]
+"""
+import asyncio
+import inspect
+import json
+import sys
+import time
+from functools import wraps
+from pathlib import Path
+from types import SimpleNamespace
+
+# 添加项目根目录到 Python 路径，使脚本可以从任何目录运行
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from lighter.signer_client import CODE_OK, SignerClient
+
+TX_INFO = json.dumps({"AccountIndex": 5, "OrderBookIndex": 1, "Nonce": 0, "Sig": "0x"}).encode()
+SIGNED = SimpleNamespace(err=None, txType=14, txInfo=TX_INFO, txHash=b"0x1")
+SENT = SimpleNamespace(code=CODE_OK)
+
+
+class StubSigner:
+    def SignCreateOrder(self, *args):
+        return SIGNED
+
+    def SignCancelOrder(self, *args):
+        return SIGNED
+
+
+class StubNonceManager:
+    def __init__(self):
+        self.nonce = 0
+
+    async def next_nonce_async(self, api_key=None):
+        self.nonce += 1
+        return 3, self.nonce
+
+    def acknowledge_success(self, api_key, nonce=None):
+        pass
+
+    def acknowledge_failure(self, api_key, nonce=None):
+        pass
+
+
+class StubTransactionApi:
+    async def send_tx(self, tx_type, tx_info):
+        return SENT
+
+
+def legacy_process_api_key_and_nonce(func):
+    """The wrapper as it was before the call shim, for comparison"""
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        sig = inspect.signature(func)
+        bound_args = sig.bind(self, *args, **kwargs)
+        bound_args.apply_defaults()
+        api_key_index = bound_args.arguments.get("api_key_index", 255)
+        nonce = bound_args.arguments.get("nonce", -1)
+        if api_key_index == 255 and nonce == -1:
+            api_key_index, nonce = await self.nonce_manager.next_nonce_async()
+        partial_arguments = {k: v for k, v in bound_args.arguments.items() if k not in ("self", "nonce", "api_key_index")}
+        created_tx, ret, err = await func(self, **partial_arguments, nonce=nonce, api_key_index=api_key_index)
+        if (ret is None and err) or (ret and ret.code != CODE_OK):
+            self.nonce_manager.acknowledge_failure(api_key_index, nonce)
+        else:
+            self.nonce_manager.acknowledge_success(api_key_index, nonce)
+        return created_tx, ret, err
+
+    return wrapper
+
+
+class LegacySignerClient(SignerClient):
+    create_order = legacy_process_api_key_and_nonce(SignerClient.create_order.__wrapped__)
+    cancel_order = legacy_process_api_key_and_nonce(SignerClient.cancel_order.__wrapped__)
+
+
+def make_client(cls):
+    client = cls.__new__(cls)
+    client.account_index = 5
+    client.signer = StubSigner()
+    client.nonce_manager = StubNonceManager()
+    client.tx_api = StubTransactionApi()
+    return client
+
+
+async def run_orders(client, n: int) -> None:
+    for i in range(n):
+        await client.create_order(1, i, 100, 5000, i & 1, client.ORDER_TYPE_LIMIT, client.ORDER_TIME_IN_FORCE_POST_ONLY)
+        await client.cancel_order(1, i)
+
+
+def bench(name: str, cls, n: int) -> float:
+    client = make_client(cls)
+    start = time.perf_counter()
+    asyncio.run(run_orders(client, n))
+    elapsed = time.perf_counter() - start
+    rate = 2 * n / elapsed
+    print(f"{name:<28} {2 * n:>7} txs  {elapsed * 1000:9.1f} ms  {rate:10.0f} txs/s")
+    return rate
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    before = bench("inspect.signature (before)", LegacySignerClient, n)
+    after = bench("call shim (after)", SignerClient, n)
+    print(f"speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
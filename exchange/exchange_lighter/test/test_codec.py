@@ -0,0 +1,42 @@
+import dataclasses
+import enum
+import math
+import unittest
+from decimal import Decimal
+
+from lighter import codec
+
+
+class Side(enum.Enum):
+    BUY = "buy"
+
+
+@dataclasses.dataclass
+class Leg:
+    size: Decimal
+    side: Side
+
+
+class TestCodec(unittest.TestCase):
+    """JSON codec unit tests"""
+
+    def testDumpsIsCompact(self):
+        self.assertEqual(codec.dumps({"a": [1, 2], "b": None, "c": "价格"}), '{"a":[1,2],"b":null,"c":"价格"}')
+
+    def testDumpsPayloadTypes(self):
+        leg = Leg(Decimal("0.10"), Side.BUY)
+        self.assertEqual(codec.loads(codec.dumps({"leg": leg})), {"leg": {"size": "0.10", "side": "buy"}})
+        self.assertEqual(codec.dumps(2 ** 70), str(2 ** 70))
+        with self.assertRaises(TypeError):
+            codec.dumps(object())
+
+    def testLoads(self):
+        self.assertEqual(codec.loads(b'{"nonce":9007199254740993}'), {"nonce": 9007199254740993})
+        self.assertEqual(codec.loads('[1.5,"x"]'), [1.5, "x"])
+        self.assertTrue(math.isnan(codec.loads("NaN")))
+        with self.assertRaises(ValueError):
+            codec.loads("{")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import unittest
+
+import lighter
+from lighter import fast_models
+from lighter.models import DetailedAccounts, OrderBookOrders
+
+
+def simple_order(i):
+    return {
+        "order_index": i,
+        "order_id": str(i),
+        "owner_account_index": 1,
+        "initial_base_amount": "1.00",
+        "remaining_base_amount": "0.50",
+        "price": str(100 + i),
+        "order_expiry": 0,
+    }
+
+
+ORDER_BOOK = {
+    "code": 200,
+    "total_asks": 2,
+    "asks": [simple_order(1), simple_order(2)],
+    "total_bids": 1,
+    "bids": [simple_order(0)],
+}
+
+POSITION = {
+    "market_id": 1,
+    "symbol": "BTC",
+    "initial_margin_fraction": "5.00",
+    "open_order_count": 2,
+    "pending_order_count": 0,
+    "position_tied_order_count": 0,
+    "sign": -1,
+    "position": "0.10",
+    "avg_entry_price": "100000",
+    "position_value": "10000",
+    "unrealized_pnl": "1.5",
+    "realized_pnl": "0",
+    "liquidation_price": "0",
+    "margin_mode": 0,
+    "allocated_margin": "0",
+}
+
+ACCOUNTS = {
+    "code": 200,
+    "total": 1,
+    "accounts": [{
+        "code": 0,
+        "account_type": 0,
+        "index": 7,
+        "l1_address": "0x0",
+        "cancel_all_time": 0,
+        "total_order_count": 2,
+        "pending_order_count": 0,
+        "available_balance": "900",
+        "status": 1,
+        "collateral": "1000",
+        "account_index": 7,
+        "name": "",
+        "description": "",
+        "can_invite": True,
+        "referral_points_percentage": "",
+        "positions": [POSITION],
+        "assets": [{"symbol": "USDC", "asset_id": 3, "balance": "1000", "locked_balance": "0"}],
+        "total_asset_value": "1001.5",
+        "cross_asset_value": "1001.5",
+        "shares": [],
+    }],
+}
+
+
+class TestFastModels(unittest.IsolatedAsyncioTestCase):
+    """Validation-free response decoding unit tests"""
+
+    async def asyncSetUp(self):
+        self.client = lighter.ApiClient(fast_response_types=fast_models.HOT_RESPONSE_TYPES)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    def deserialize(self, data, response_type):
+        return self.client.deserialize(json.dumps(data), response_type, "application/json")
+
+    def testOrderBookMatchesPydantic(self):
+        book = self.deserialize(ORDER_BOOK, "OrderBookOrders")
+        self.assertNotIsInstance(book, OrderBookOrders)
+        self.assertEqual(book.asks[1].price, "102")
+        self.assertEqual(book.bids[0].remaining_base_amount, "0.50")
+        self.assertEqual(book.to_dict(), OrderBookOrders.from_dict(ORDER_BOOK).to_dict())
+
+    def testNestedAccountsMatchPydantic(self):
+        accounts = self.deserialize(ACCOUNTS, "DetailedAccounts")
+        account = accounts.accounts[0]
+        self.assertEqual(account.positions[0].open_order_count, 2)
+        self.assertEqual(account.assets[0].symbol, "USDC")
+        self.assertIsNone(account.pool_info)
+        self.assertEqual(account.positions[0].to_dict(), POSITION)
+        self.assertEqual(accounts.to_dict(), DetailedAccounts.from_dict(ACCOUNTS).to_dict())
+
+    def testMissingFieldsAreNoneAndUnknownFieldsDropped(self):
+        book = self.deserialize({"code": 200, "asks": [], "extra": 1}, "OrderBookOrders")
+        self.assertIsNone(book.bids)
+        self.assertEqual(book.to_dict(), {"code": 200, "asks": []})
+
+    def testOtherTypesUsePydantic(self):
+        self.assertIsInstance(self.deserialize(ACCOUNTS, "DetailedAccounts"), fast_models.FastModel)
+        self.client.fast_response_types = frozenset()
+        self.assertIsInstance(self.deserialize(ORDER_BOOK, "OrderBookOrders"), OrderBookOrders)
+
+    def testStructClassesAreBuiltOnce(self):
+        self.assertIs(fast_models.fast_model(OrderBookOrders), fast_models.fast_model(OrderBookOrders))
+        with self.assertRaises(AttributeError):
+            fast_models.fast_model(OrderBookOrders).from_dict(ORDER_BOOK).unknown = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import random
+import unittest
+
+from lighter.l2_book import L2OrderBook
+from lighter.models.order_book_orders import OrderBookOrders
+
+
+def simple_order(index, price, size):
+    return {
+        "order_index": index,
+        "order_id": str(index),
+        "owner_account_index": 1,
+        "initial_base_amount": size,
+        "remaining_base_amount": size,
+        "price": price,
+        "order_expiry": 0,
+    }
+
+
+class TestL2OrderBook(unittest.TestCase):
+    """L2OrderBook unit tests"""
+
+    def setUp(self):
+        self.book = L2OrderBook.from_snapshot(
+            "0",
+            {
+                "asks": [
+                    {"price": "3001.00", "size": "1.0"},
+                    {"price": "3000.50", "size": "2.0"},
+                ],
+                "bids": [
+                    {"price": "2999.00", "size": "3.0"},
+                    {"price": "2999.50", "size": "0.5"},
+                ],
+                "offset": 1,
+            },
+        )
+
+    def testSnapshotSortedBestFirst(self):
+        bids, asks = self.book.top_n(10)
+        self.assertEqual(bids, [("2999.50", "0.5"), ("2999.00", "3.0")])
+        self.assertEqual(asks, [("3000.50", "2.0"), ("3001.00", "1.0")])
+        self.assertEqual(self.book.best_bid(), ("2999.50", "0.5"))
+        self.assertEqual(self.book.best_ask(), ("3000.50", "2.0"))
+        self.assertEqual(self.book.offset, 1)
+
+    def testUpdateRemovesZeroSizeLevels(self):
+        self.book.apply_update(
+            {
+                "asks": [
+                    {"price": "3000.50", "size": "0.0000"},
+                    {"price": "3002.00", "size": "4.0"},
+                ],
+                "bids": [
+                    {"price": "2999.50", "size": "0"},
+                    {"price": "2998.00", "size": "0"},
+                    {"price": "2999.00", "size": "1.5"},
+                ],
+                "offset": 2,
+            }
+        )
+        self.assertEqual(self.book.top_n(10), (
+            [("2999.00", "1.5")],
+            [("3001.00", "1.0"), ("3002.00", "4.0")],
+        ))
+        self.assertEqual(len(self.book.bids), 1)
+        self.assertEqual(self.book["asks"][0], {"price": "3001.00", "size": "1.0"})
+        self.assertEqual(self.book.offset, 2)
+
+    def testMatchesReferenceUnderRandomDeltas(self):
+        rng = random.Random(0)
+        reference = {"asks": {}, "bids": {}}
+        book = L2OrderBook("1")
+        for _ in range(2000):
+            side = rng.choice(["asks", "bids"])
+            price = f"{rng.randrange(900, 1100) / 10:.2f}"
+            size = rng.choice(["0", f"{rng.randrange(1, 50) / 10:.1f}"])
+            book.apply_update({side: [{"price": price, "size": size}]})
+            if float(size) == 0:
+                reference[side].pop(price, None)
+            else:
+                reference[side][price] = size
+        for side, reverse in (("bids", True), ("asks", False)):
+            expected = sorted(reference[side].items(), key=lambda x: float(x[0]), reverse=reverse)
+            self.assertEqual(getattr(book, side).top(), expected)
+            self.assertEqual(getattr(book, side).top(5), expected[:5])
+
+    def testGetItemCachedPerVersion(self):
+        asks = self.book["asks"]
+        self.assertIs(self.book["asks"], asks)
+        self.book.apply_update({"bids": [{"price": "2990.00", "size": "1.0"}]})
+        self.assertIs(self.book["asks"], asks)
+        self.book.apply_update({"asks": [{"price": "3000.50", "size": "0"}]})
+        self.assertIsNot(self.book["asks"], asks)
+        self.assertEqual(self.book["asks"], [{"price": "3001.00", "size": "1.0"}])
+        self.assertEqual(self.book["bids"], self.book.to_dict()["bids"])
+        with self.assertRaises(KeyError):
+            self.book["offset"]
+
+    def testContinuity(self):
+        self.book.apply_update({"offset": 2, "nonce": 10, "begin_nonce": 8})
+        self.assertIsNotNone(self.book.last_delta)
+        self.assertEqual(self.book.continuity({"offset": 3, "nonce": 12, "begin_nonce": 10}), L2OrderBook.IN_SEQUENCE)
+        self.assertEqual(self.book.continuity({"offset": 2, "nonce": 10, "begin_nonce": 8}), L2OrderBook.STALE)
+        self.assertEqual(self.book.continuity({"offset": 4, "nonce": 14, "begin_nonce": 12}), L2OrderBook.GAP)
+
+    def testSnapshotResetsLastDelta(self):
+        self.assertIsNone(self.book.last_delta)
+        self.book.apply_update({"bids": [{"price": "2999.00", "size": "0"}], "offset": 2})
+        self.book.apply_snapshot({"asks": [], "bids": [], "offset": 5, "nonce": 50})
+        self.assertIsNone(self.book.last_delta)
+        self.assertEqual((self.book.offset, self.book.nonce), (5, 50))
+        self.assertEqual(len(self.book.bids), 0)
+
+    def testCompareSnapshot(self):
+        snapshot = OrderBookOrders.from_dict(
+            {
+                "code": 200,
+                "total_asks": 3,
+                "asks": [
+                    simple_order(1, "3000.50", "1.5"),
+                    simple_order(2, "3000.50", "0.5"),
+                    simple_order(3, "3001.00", "1.0"),
+                ],
+                "total_bids": 2,
+                "bids": [
+                    simple_order(4, "2999.50", "0.5"),
+                    simple_order(5, "2999.00", "3.0"),
+                ],
+            }
+        )
+        self.assertEqual(self.book.compare_snapshot(snapshot), [])
+
+        self.book.apply_update({"bids": [{"price": "2999.50", "size": "0.4"}]})
+        mismatches = self.book.compare_snapshot(snapshot)
+        self.assertEqual(len(mismatches), 1)
+        self.assertIn("bids[0]", mismatches[0])
+
+    def testCompareSnapshotIgnoresTruncatedLevel(self):
+        snapshot = OrderBookOrders.from_dict(
+            {
+                "code": 200,
+                "total_asks": 5,
+                "asks": [
+                    simple_order(1, "3000.50", "2.0"),
+                    simple_order(2, "3001.00", "0.2"),
+                ],
+                "total_bids": 0,
+                "bids": [],
+            }
+        )
+        self.assertEqual(self.book.compare_snapshot(snapshot), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
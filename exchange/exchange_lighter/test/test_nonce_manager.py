@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from lighter.nonce_manager import AsyncNonceManager, NonceUnavailableError
+
+
+class FakeTransactionApi:
+    """next_nonce served from a dict; max_in_flight records the peak number of concurrent requests"""
+
+    def __init__(self, nonces, delay=0.01):
+        self.nonces = dict(nonces)
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail = set()
+
+    async def next_nonce(self, account_index, api_key_index):
+        self.calls.append(api_key_index)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if api_key_index in self.fail:
+                raise ConnectionError("unavailable")
+            return SimpleNamespace(code=200, nonce=self.nonces[api_key_index])
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncNonceManager(unittest.IsolatedAsyncioTestCase):
+    """AsyncNonceManager unit tests"""
+
+    async def make_manager(self, nonces=None, **kwargs):
+        manager = AsyncNonceManager(account_index=1, api_client=SimpleNamespace(), api_keys_list=[2, 3, 4], **kwargs)
+        manager.tx_api = FakeTransactionApi(nonces or {2: 10, 3: 20, 4: 30})
+        await manager.start()
+        return manager
+
+    async def testStartFetchesAllKeysConcurrently(self):
+        manager = await self.make_manager()
+        self.assertEqual(manager.tx_api.max_in_flight, 3)
+        self.assertEqual(manager.nonce, {2: 9, 3: 19, 4: 29})
+        self.assertEqual(manager.resyncing, set())
+
+    async def testShardsAcrossKeysByInFlightCount(self):
+        manager = await self.make_manager()
+        keys = [manager.next_nonce()[0] for _ in range(3)]
+        self.assertEqual(sorted(keys), [2, 3, 4])
+        # key 3 frees its slot first, so it serves the next tx
+        manager.acknowledge_success(3)
+        self.assertEqual(manager.next_nonce(), (3, 21))
+
+    async def testPipelinesNoncesOnOneKey(self):
+        manager = await self.make_manager()
+        nonces = [manager.next_nonce(2)[1] for _ in range(5)]
+        self.assertEqual(nonces, [10, 11, 12, 13, 14])
+        self.assertEqual(manager.in_flight[2], set(nonces))
+
+    async def testFailureOfLastNonceRollsBack(self):
+        manager = await self.make_manager()
+        manager.next_nonce(2)
+        manager.next_nonce(2)
+        manager.acknowledge_failure(2, 11)
+        self.assertEqual(manager.next_nonce(2), (2, 11))
+        self.assertNotIn(2, manager.resyncing)
+
+    async def testGapResyncsOnlyFailingKeyInBackground(self):
+        manager = await self.make_manager()
+        manager.tx_api.nonces[2] = 50
+        manager.next_nonce(2)
+        manager.next_nonce(2)
+        manager.acknowledge_failure(2, 10)
+        self.assertIn(2, manager.resyncing)
+        with self.assertRaises(NonceUnavailableError):
+            manager.next_nonce(2)
+        # other keys keep serving while key 2 resyncs
+        self.assertIn(manager.next_nonce()[0], (3, 4))
+        # nonce 11 came after the gap and is rejected; the resync proceeds once it is reported
+        manager.acknowledge_failure(2, 11)
+        self.assertEqual(await manager.next_nonce_async(2), (2, 50))
+        self.assertEqual(manager.in_flight[2], {50})
+
+    async def testStaleAcknowledgementIsIgnored(self):
+        manager = await self.make_manager(settle_timeout=0.01)
+        manager.next_nonce(2)
+        manager.hard_refresh_nonce(2)
+        await manager.next_nonce_async(2)
+        calls = len(manager.tx_api.calls)
+        manager.acknowledge_failure(2, 10)
+        manager.acknowledge_success(2, 10)
+        self.assertEqual(len(manager.tx_api.calls), calls)
+        self.assertNotIn(2, manager.resyncing)
+
+    async def testMaxInFlightWaitsForAcknowledgement(self):
+        manager = AsyncNonceManager(account_index=1, api_client=SimpleNamespace(), api_keys_list=[2], max_in_flight=1)
+        manager.tx_api = FakeTransactionApi({2: 10})
+        self.assertEqual(await manager.next_nonce_async(), (2, 10))
+        waiter = asyncio.ensure_future(manager.next_nonce_async())
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiter.done())
+        manager.acknowledge_success(2, 10)
+        self.assertEqual(await asyncio.wait_for(waiter, 1), (2, 11))
+
+    async def testResyncRetriesUntilFetchSucceeds(self):
+        manager = await self.make_manager()
+        manager.tx_api.fail.add(3)
+        manager.hard_refresh_nonce(3)
+        await asyncio.sleep(0.05)
+        self.assertIn(3, manager.resyncing)
+        manager.tx_api.fail.clear()
+        self.assertEqual(await asyncio.wait_for(manager.next_nonce_async(3), 5), (3, 20))
+
+    async def testResyncWaitsForInFlightNonces(self):
+        manager = await self.make_manager()
+        manager.next_nonce(2)
+        manager.next_nonce(2)
+        # the server has not processed 10 and 11 yet, so it still reports 10
+        manager.hard_refresh_nonce(2)
+        waiter = asyncio.ensure_future(manager.next_nonce_async(2))
+        await asyncio.sleep(0.05)
+        self.assertEqual(manager.tx_api.calls.count(2), 1)
+        self.assertFalse(waiter.done())
+        manager.tx_api.nonces[2] = 12
+        manager.acknowledge_success(2, 10)
+        manager.acknowledge_failure(2, 11)
+        self.assertEqual(await asyncio.wait_for(waiter, 1), (2, 12))
+
+    async def testSettleTimeoutBoundsResync(self):
+        manager = await self.make_manager(settle_timeout=0.05)
+        manager.next_nonce(3)
+        manager.tx_api.nonces[3] = 21
+        manager.hard_refresh_nonce(3)
+        self.assertEqual(await asyncio.wait_for(manager.next_nonce_async(3), 1), (3, 21))
+        self.assertEqual(manager.in_flight[3], {21})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+
+import lighter
+
+
+def make_client(host="https://mainnet.zklighter.elliot.ai"):
+    return lighter.ApiClient(configuration=lighter.Configuration(host=host))
+
+
+class TestSharedTransport(unittest.IsolatedAsyncioTestCase):
+    """Shared aiohttp transport unit tests"""
+
+    async def testClientsForSameHostShareSession(self):
+        first, second = make_client(), make_client()
+        try:
+            self.assertIs(first.rest_client.pool_manager, second.rest_client.pool_manager)
+            self.assertIs(lighter.OrderApi(first).api_client.rest_client.pool_manager, first.rest_client.pool_manager)
+        finally:
+            await first.close()
+            await second.close()
+
+    async def testDifferentHostsGetSeparateSessions(self):
+        first, second = make_client(), make_client("https://testnet.zklighter.elliot.ai")
+        try:
+            self.assertIsNot(first.rest_client.pool_manager, second.rest_client.pool_manager)
+        finally:
+            await first.close()
+            await second.close()
+
+    async def testLastCloseClosesSession(self):
+        first, second = make_client(), make_client()
+        session = first.rest_client.pool_manager
+        await first.close()
+        await first.close()
+        self.assertFalse(session.closed)
+        await second.close()
+        self.assertTrue(session.closed)
+        third = make_client()
+        try:
+            self.assertIsNot(third.rest_client.pool_manager, session)
+        finally:
+            await third.close()
+
+    async def testConnectorUsesConfiguredPoolSettings(self):
+        configuration = lighter.Configuration(host="https://example.com")
+        configuration.dns_cache_ttl = 30
+        configuration.connection_pool_maxsize = 8
+        client = lighter.ApiClient(configuration=configuration)
+        try:
+            connector = client.rest_client.pool_manager.connector
+            self.assertEqual(connector.limit, 8)
+            self.assertTrue(connector.use_dns_cache)
+        finally:
+            await client.close()
+
+    def testSessionsAreNotSharedAcrossEventLoops(self):
+        async def create():
+            return make_client()
+
+        async def close(client):
+            await client.close()
+
+        first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            first = first_loop.run_until_complete(create())
+            second = second_loop.run_until_complete(create())
+            self.assertIsNot(first.rest_client.pool_manager, second.rest_client.pool_manager)
+            first_loop.run_until_complete(close(first))
+            second_loop.run_until_complete(close(second))
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+
+import lighter
+from lighter.nonce_manager import AsyncNonceManager
+from lighter.signer_client import SignerClient, process_api_key_and_nonce
+from test.test_nonce_manager import FakeTransactionApi
+
+
+class StubSigner:
+    """Stands in for the signer shared library; echoes nonce and api key into the tx info"""
+
+    def __init__(self, err=None):
+        self.err = err
+        self.calls = []
+
+    def _sign(self, name, args):
+        self.calls.append((name, args))
+        if self.err:
+            return SimpleNamespace(err=self.err.encode(), txType=0, txInfo=None, txHash=None)
+        nonce, api_key_index = args[-3], args[-2]
+        tx_info = json.dumps({"Nonce": nonce, "ApiKeyIndex": api_key_index, "AccountIndex": args[-1]})
+        return SimpleNamespace(err=None, txType=14, txInfo=tx_info.encode(), txHash=b"0x1")
+
+    def SignCreateOrder(self, *args):
+        return self._sign("create", args)
+
+    def SignCancelOrder(self, *args):
+        return self._sign("cancel", args)
+
+
+class StubNonceManager:
+    """Hands out consecutive nonces on key 7 and records acknowledgements"""
+
+    def __init__(self):
+        self.next = 100
+        self.acks = []
+
+    async def next_nonce_async(self, api_key=None):
+        self.next += 1
+        return 7, self.next - 1
+
+    def acknowledge_success(self, api_key, nonce=None):
+        self.acks.append(("ok", api_key, nonce))
+
+    def acknowledge_failure(self, api_key, nonce=None):
+        self.acks.append(("fail", api_key, nonce))
+
+    async def hard_refresh_nonce_async(self, api_key):
+        self.acks.append(("refresh", api_key, None))
+
+
+class StubTransactionApi:
+    def __init__(self, code=200, exc=None):
+        self.code = code
+        self.exc = exc
+        self.sent = []
+
+    async def send_tx(self, tx_type, tx_info):
+        self.sent.append((tx_type, tx_info))
+        if self.exc:
+            raise self.exc
+        return SimpleNamespace(code=self.code)
+
+
+def make_client(signer=None, tx_api=None):
+    client = SignerClient.__new__(SignerClient)
+    client.account_index = 5
+    client.signer = signer or StubSigner()
+    client.nonce_manager = StubNonceManager()
+    client.tx_api = tx_api or StubTransactionApi()
+    return client
+
+
+class TestProcessApiKeyAndNonce(unittest.IsolatedAsyncioTestCase):
+    """process_api_key_and_nonce call shim unit tests"""
+
+    async def testAllocatesNonceWhenNotGiven(self):
+        client = make_client()
+        tx, _, err = await client.create_order(1, 42, 100, 5000, True, 0, 1)
+        self.assertIsNone(err)
+        self.assertEqual((tx.nonce, tx.account_index), (100, 5))
+        self.assertEqual(client.signer.calls[0][1], (1, 42, 100, 5000, 1, 0, 1, False, 0, -1, 100, 7, 5))
+        self.assertEqual(client.nonce_manager.acks, [("ok", 7, 100)])
+
+    async def testExplicitNonceByKeyword(self):
+        client = make_client()
+        await client.cancel_order(market_index=1, order_index=9, nonce=3, api_key_index=4)
+        self.assertEqual(client.signer.calls[0][1], (1, 9, 3, 4, 5))
+        self.assertEqual(client.nonce_manager.next, 100)
+
+    async def testExplicitNonceByPosition(self):
+        client = make_client()
+        await client.create_order(1, 42, 100, 5000, False, 0, 1, True, 0, -1, 8, 2)
+        self.assertEqual(client.signer.calls[0][1][-5:], (0, -1, 8, 2, 5))
+        self.assertEqual(client.nonce_manager.acks, [("ok", 2, 8)])
+
+    async def testMixedPositionalAndKeywordArguments(self):
+        client = make_client()
+        await client.cancel_order(1, 9, 3, api_key_index=4)
+        await client.create_order(1, 42, 100, 5000, False, 0, 1, order_expiry=0)
+        self.assertEqual(client.signer.calls[0][1], (1, 9, 3, 4, 5))
+        self.assertEqual(client.signer.calls[1][1][-4:], (0, 100, 7, 5))
+
+    async def testSignErrorAcknowledgesFailure(self):
+        client = make_client(signer=StubSigner(err="bad price"))
+        self.assertEqual(await client.cancel_order(1, 9), (None, None, "bad price"))
+        self.assertEqual(client.nonce_manager.acks, [("fail", 7, 100)])
+
+    async def testRejectedTxAcknowledgesFailure(self):
+        client = make_client(tx_api=StubTransactionApi(code=21120))
+        await client.cancel_order(1, 9)
+        self.assertEqual(client.nonce_manager.acks, [("fail", 7, 100)])
+
+    async def testInvalidNonceRefreshesKey(self):
+        exc = lighter.exceptions.BadRequestException(status=400, reason="invalid nonce")
+        client = make_client(tx_api=StubTransactionApi(exc=exc))
+        _, _, err = await client.cancel_order(1, 9)
+        self.assertIsNotNone(err)
+        self.assertEqual(client.nonce_manager.acks, [("fail", 7, 100), ("refresh", 7, None)])
+
+    async def testInvalidNonceDoesNotWaitForRejectedNonce(self):
+        exc = lighter.exceptions.BadRequestException(status=400, reason="invalid nonce")
+        client = make_client(tx_api=StubTransactionApi(exc=exc))
+        client.nonce_manager = AsyncNonceManager(account_index=5, api_client=SimpleNamespace(), api_keys_list=[7])
+        client.nonce_manager.tx_api = FakeTransactionApi({7: 100})
+        await client.cancel_order(1, 9)
+        client.nonce_manager.tx_api.nonces[7] = 100
+        # the rejected nonce is released, so the key is back well before RESYNC_SETTLE_TIMEOUT
+        self.assertEqual(await asyncio.wait_for(client.nonce_manager.next_nonce_async(), 1), (7, 100))
+        self.assertEqual(client.nonce_manager.tx_api.calls, [7, 7])
+
+    async def testRejectsExtraPositionalArguments(self):
+        client = make_client()
+        with self.assertRaises(TypeError):
+            await client.cancel_order(1, 9, 3, 4, "extra")
+        self.assertEqual((client.signer.calls, client.nonce_manager.next), ([], 100))
+
+    def testRejectsMethodsWithoutTrailingNonceParameters(self):
+        with self.assertRaises(TypeError):
+            @process_api_key_and_nonce
+            async def bad(self, nonce=-1, api_key_index=255, extra=None):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from lighter.codec import dumps, loads
+from lighter.ws_client import WsClient
+
+
+class FakeConnection:
+    """Records sent frames; answers sendtxbatch requests through the client"""
+
+    def __init__(self, client, echo_id=True, code=200):
+        self.client = client
+        self.echo_id = echo_id
+        self.code = code
+        self.sent = []
+
+    async def send(self, message):
+        message = loads(message)
+        self.sent.append(message)
+        if message.get("type") != "jsonapi/sendtxbatch":
+            return
+        data = {"code": self.code, "tx_hash": ["0x1"]}
+        if self.echo_id:
+            data["id"] = message["data"]["id"]
+        response = dumps({"type": "jsonapi/sendtxbatch", "data": data})
+        asyncio.get_running_loop().call_soon(self.client.on_message, self, response)
+
+
+class TestWsClientTx(unittest.IsolatedAsyncioTestCase):
+    """WsClient tx submission unit tests"""
+
+    def make_client(self, **kwargs):
+        client = WsClient(host="example.com", account_ids=[1])
+        client.ws = FakeConnection(client, **kwargs)
+        client.connected = True
+        return client
+
+    async def testSendTxBatchMatchesResponseById(self):
+        client = self.make_client()
+        response = await client.send_tx_batch_async([14, 15], ['{"a":1}', '{"b":2}'])
+        self.assertEqual(response["data"]["code"], 200)
+        request = client.ws.sent[0]
+        self.assertEqual(request["type"], "jsonapi/sendtxbatch")
+        self.assertEqual(loads(request["data"]["tx_types"]), [14, 15])
+        self.assertEqual(loads(request["data"]["tx_infos"]), ['{"a":1}', '{"b":2}'])
+        self.assertEqual(client.pending_txs, {})
+
+    async def testResponseWithoutIdAnswersOldestRequest(self):
+        client = self.make_client(echo_id=False)
+        first, second = await asyncio.gather(
+            client.send_tx_batch_async([14], ['{"a":1}']),
+            client.send_tx_batch_async([15], ['{"b":2}']),
+        )
+        self.assertEqual(first["data"]["code"], 200)
+        self.assertEqual(second["data"]["code"], 200)
+        self.assertEqual(client.pending_txs, {})
+
+    async def testSendRequiresConnection(self):
+        client = WsClient(host="example.com", account_ids=[1])
+        with self.assertRaises(ConnectionError):
+            await client.send_tx_batch_async([14], ['{"a":1}'])
+
+    async def testDisconnectFailsPendingRequests(self):
+        client = WsClient(host="example.com", account_ids=[1])
+        future = asyncio.get_running_loop().create_future()
+        client.pending_txs["batch_1"] = future
+        client.fail_pending_txs(ConnectionError("closed"))
+        with self.assertRaises(ConnectionError):
+            await future
+        self.assertEqual(client.pending_txs, {})
+
+    async def testUnrelatedErrorDoesNotAnswerPendingBatch(self):
+        client = WsClient(host="example.com", account_ids=[1])
+        future = asyncio.get_running_loop().create_future()
+        client.pending_txs["batch_1"] = future
+        with self.assertRaises(Exception):
+            client.on_message(None, {"error": {"code": 30003, "message": "rate limited"}})
+        self.assertFalse(future.done())
+        self.assertIn("batch_1", client.pending_txs)
+
+    async def testErrorWithRequestIdAnswersThatBatch(self):
+        client = WsClient(host="example.com", account_ids=[1])
+        loop = asyncio.get_running_loop()
+        first, second = loop.create_future(), loop.create_future()
+        client.pending_txs.update({"batch_1": first, "batch_2": second})
+        client.on_message(None, {"error": {"code": 21104, "message": "invalid nonce"}, "id": "batch_2"})
+        self.assertFalse(first.done())
+        self.assertEqual(second.result()["error"]["code"], 21104)
+
+    async def testSubscribeOrderBookWhileConnected(self):
+        client = self.make_client()
+        await client.subscribe_order_book_async(3)
+        await client.subscribe_order_book_async(3)
+        self.assertEqual(client.subscriptions["order_books"], [3])
+        self.assertEqual(client.ws.sent, [{"type": "subscribe", "channel": "order_book/3"}])
+
+    def testSubscriptionListsAreNotShared(self):
+        WsClient(host="example.com", account_ids=[1]).subscriptions["order_books"].append(1)
+        self.assertEqual(WsClient(host="example.com", account_ids=[1]).subscriptions["order_books"], [])
+
+
+class TestWsClientAccountOrders(unittest.IsolatedAsyncioTestCase):
+    """WsClient account_all_orders unit tests"""
+
+    def make_client(self):
+        self.tokens = iter(["token-1", "token-2"])
+        self.updates = []
+        client = WsClient(
+            host="example.com",
+            account_ids=[1],
+            on_account_orders_update=lambda account_id, message: self.updates.append((account_id, message["type"])),
+            auth_token_provider=lambda: next(self.tokens),
+        )
+        client.ws = FakeConnection(client)
+        return client
+
+    async def testSubscribeSendsAuthAndResubscribesWithFreshToken(self):
+        client = self.make_client()
+        await client.subscribe_account_orders_async(1)
+        self.assertEqual(client.ws.sent, [])
+        # every (re)connect subscribes again with a new token
+        for token in ("token-1", "token-2"):
+            await client.handle_connected_async(client.ws)
+            self.assertEqual(client.ws.sent[-1], {
+                "type": "subscribe", "channel": "account_all_orders/1", "auth": token,
+            })
+        await client.subscribe_account_orders_async(1)
+        self.assertEqual(client.subscriptions["account_orders"], [1])
+        self.assertEqual(len(client.ws.sent), 4)
+
+    async def testOrderMessagesReachCallback(self):
+        client = self.make_client()
+        for kind in ("subscribed/account_all_orders", "update/account_all_orders"):
+            client.on_message(None, {"type": kind, "channel": "account_all_orders:1", "orders": {}})
+        self.assertEqual(self.updates, [
+            ("1", "subscribed/account_all_orders"), ("1", "update/account_all_orders"),
+        ])
+
+    async def testSubscribeRequiresAuthTokenProvider(self):
+        client = WsClient(host="example.com", account_ids=[1])
+        with self.assertRaises(Exception):
+            await client.subscribe_account_orders_async(1)
+        self.assertEqual(client.subscriptions["account_orders"], [])
+
+
+def book_message(kind, offset, nonce, begin_nonce, bids=()):
+    return {
+        "type": kind,
+        "channel": "order_book:3",
+        "order_book": {
+            "asks": [],
+            "bids": [{"price": price, "size": size} for price, size in bids],
+            "offset": offset,
+            "nonce": nonce,
+            "begin_nonce": begin_nonce,
+        },
+    }
+
+
+class ClosedConnection:
+    """Connection that has already been closed by the server"""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+class TestWsClientOrderBook(unittest.IsolatedAsyncioTestCase):
+    """WsClient order book continuity unit tests"""
+
+    def make_client(self):
+        self.updates, self.gaps = [], []
+        client = WsClient(
+            host="example.com",
+            order_book_ids=[3],
+            on_order_book_update=lambda market_id, book: self.updates.append((market_id, book.offset)),
+            on_order_book_gap=self.gaps.append,
+        )
+        client.ws = FakeConnection(client)
+        client.connected = True
+        return client
+
+    async def testUpdatesBeforeSnapshotAreIgnored(self):
+        client = self.make_client()
+        client.on_message(None, book_message("update/order_book", 2, 20, 10))
+        self.assertEqual(client.order_book_states, {})
+        client.on_message(None, book_message("subscribed/order_book", 3, 30, 30, [("100", "1")]))
+        client.on_message(None, book_message("update/order_book", 4, 31, 30, [("101", "2")]))
+        client.on_message(None, book_message("update/order_book", 4, 31, 30, [("101", "2")]))
+        self.assertEqual(self.updates, [("3", 3), ("3", 4)])
+        self.assertEqual(client.order_book_states["3"].best_bid(), ("101", "2"))
+
+    async def testGapDropsBookAndResubscribes(self):
+        client = self.make_client()
+        client.on_message(None, book_message("subscribed/order_book", 3, 30, 30, [("100", "1")]))
+        client.on_message(None, book_message("update/order_book", 5, 40, 35, [("101", "2")]))
+        self.assertEqual(self.gaps, ["3"])
+        self.assertNotIn("3", client.order_book_states)
+        self.assertEqual(self.updates, [("3", 3)])
+        await asyncio.sleep(0)
+        self.assertEqual(client.ws.sent, [
+            {"type": "unsubscribe", "channel": "order_book/3"},
+            {"type": "subscribe", "channel": "order_book/3"},
+        ])
+
+    async def testDisconnectDropsBooks(self):
+        client = self.make_client()
+        client.on_message(None, book_message("subscribed/order_book", 3, 30, 30, [("100", "1")]))
+
+        async def connect(url):
+            return ClosedConnection()
+
+        with mock.patch("lighter.ws_client.connect_async", connect):
+            await client.run_async()
+        self.assertEqual(client.order_book_states, {})
+        self.assertFalse(client.connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 from nado_protocol.contracts.eip712.domain import *
+from nado_protocol.contracts.eip712.engine import *
 from nado_protocol.contracts.eip712.sign import *
 from nado_protocol.contracts.eip712.types import *
 
@@ -9,6 +10,12 @@ __all__ = [
     "build_eip712_typed_data",
     "get_eip712_typed_data_digest",
     "sign_eip712_typed_data",
+    "get_eip712_type_hash",
+    "get_eip712_domain_separator",
+    "hash_eip712_message",
+    "get_eip712_digest",
+    "sign_eip712_message",
+    "sign_eip712_messages",
     "get_nado_eip712_type",
     "EIP712Domain",
     "EIP712Types",
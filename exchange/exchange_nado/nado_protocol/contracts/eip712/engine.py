@@ -0,0 +1,255 @@
+from functools import lru_cache
+from typing import Any, Callable, Sequence
+
+from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from eth_utils import keccak
+
+from nado_protocol.contracts.eip712.domain import (
+    get_eip712_domain_type,
+    get_nado_eip712_domain,
+)
+from nado_protocol.contracts.eip712.types import get_nado_eip712_type
+from nado_protocol.contracts.types import NadoTxType
+
+FieldEncoder = Callable[[Any], bytes]
+
+
+def _encode_struct_type(primary_type: str, fields: list[dict[str, str]]) -> str:
+    return f"{primary_type}({','.join(f['type'] + ' ' + f['name'] for f in fields)})"
+
+
+def _int_encoder(bits: int, signed: bool) -> FieldEncoder:
+    low, high = (
+        (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if signed else (0, (1 << bits) - 1)
+    )
+
+    def encode(value: Any) -> bytes:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Expected int, got {type(value).__name__}: {value}")
+        if not low <= value <= high:
+            raise ValueError(f"Value {value} out of range for {bits}-bit integer")
+        return value.to_bytes(32, "big", signed=signed)
+
+    return encode
+
+
+def _bytes_encoder(size: int) -> FieldEncoder:
+    def encode(value: Any) -> bytes:
+        if isinstance(value, str):
+            value = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+        if not isinstance(value, (bytes, bytearray)) or len(value) > size:
+            raise TypeError(f"Value {value!r} is not encodable as bytes{size}")
+        return bytes(value).ljust(32, b"\x00")
+
+    return encode
+
+
+def _encode_bool(value: Any) -> bytes:
+    if not isinstance(value, bool):
+        raise TypeError(f"Expected bool, got {type(value).__name__}: {value}")
+    return int(value).to_bytes(32, "big")
+
+
+def _encode_address(value: Any) -> bytes:
+    if isinstance(value, str):
+        value = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    if len(value) != 20:
+        raise ValueError(f"Invalid address: {value!r}")
+    return bytes(value).rjust(32, b"\x00")
+
+
+def _field_encoder(field_type: str) -> FieldEncoder:
+    """
+    Returns a function that encodes a single value of `field_type` into its 32-byte EIP-712 word.
+    """
+    if field_type.endswith("[]"):
+        encode_item = _field_encoder(field_type[:-2])
+        return lambda values: keccak(b"".join(encode_item(v) for v in values))
+    if field_type == "bool":
+        return _encode_bool
+    if field_type == "address":
+        return _encode_address
+    if field_type.startswith("bytes") and field_type[5:].isdigit():
+        return _bytes_encoder(int(field_type[5:]))
+    if field_type.startswith("uint"):
+        return _int_encoder(int(field_type[4:] or 256), signed=False)
+    if field_type.startswith("int"):
+        return _int_encoder(int(field_type[3:] or 256), signed=True)
+    raise ValueError(f"Unsupported EIP-712 field type: {field_type}")
+
+
+@lru_cache(maxsize=None)
+def _get_struct_schema(
+    tx: NadoTxType,
+) -> tuple[bytes, tuple[tuple[str, FieldEncoder], ...]]:
+    eip712_tx_type = get_nado_eip712_type(tx)
+    primary_type, fields = next(iter(eip712_tx_type.items()))
+    type_hash = keccak(text=_encode_struct_type(primary_type, fields))
+    return type_hash, tuple((f["name"], _field_encoder(f["type"])) for f in fields)
+
+
+def get_eip712_type_hash(tx: NadoTxType) -> bytes:
+    """
+    Returns the EIP-712 type hash of the primary type for the given Nado tx type. Cached per tx type.
+
+    Args:
+        tx (NadoTxType): The Nado tx type.
+
+    Returns:
+        bytes: keccak256 of the encoded primary type.
+    """
+    return _get_struct_schema(tx)[0]
+
+
+@lru_cache(maxsize=1024)
+def get_eip712_domain_separator(verifying_contract: str, chain_id: int) -> bytes:
+    """
+    Returns the Nado EIP-712 domain separator. Cached per (verifying contract, chain id).
+
+    Args:
+        verifying_contract (str): The contract that will verify the signature.
+
+        chain_id (int): The chain ID of the originating network.
+
+    Returns:
+        bytes: The 32-byte domain separator.
+    """
+    domain = get_nado_eip712_domain(verifying_contract, chain_id)
+    domain_type_hash = keccak(
+        text=_encode_struct_type("EIP712Domain", get_eip712_domain_type())
+    )
+    return keccak(
+        domain_type_hash
+        + keccak(text=domain.name)
+        + keccak(text=domain.version)
+        + _int_encoder(256, signed=False)(domain.chainId)
+        + _encode_address(domain.verifyingContract)
+    )
+
+
+def hash_eip712_message(
+    tx: NadoTxType, msg: dict, verifying_contract: str, chain_id: int
+) -> bytes:
+    """
+    Computes the EIP-712 digest of a Nado execute message using the cached type hash and domain separator.
+
+    Equivalent to hashing `build_eip712_typed_data(tx, msg, verifying_contract, chain_id)`,
+    without building and re-validating the typed data.
+
+    Args:
+        tx (NadoTxType): The Nado tx type being signed.
+
+        msg (dict): The message being signed.
+
+        verifying_contract (str): The contract that will verify the signature.
+
+        chain_id (int): The chain ID of the originating network.
+
+    Returns:
+        bytes: The 32-byte digest that is signed.
+    """
+    type_hash, fields = _get_struct_schema(tx)
+    try:
+        struct_hash = keccak(
+            type_hash + b"".join(encode(msg[name]) for name, encode in fields)
+        )
+    except KeyError as e:
+        raise ValueError(f"Missing value for field {e} of {tx}")
+    return keccak(
+        b"\x19\x01"
+        + get_eip712_domain_separator(verifying_contract, chain_id)
+        + struct_hash
+    )
+
+
+def get_eip712_digest(
+    tx: NadoTxType, msg: dict, verifying_contract: str, chain_id: int
+) -> str:
+    """
+    Util to get the EIP-712 digest of a Nado execute message.
+
+    Returns:
+        str: The hexadecimal representation of the digest.
+    """
+    return f"0x{hash_eip712_message(tx, msg, verifying_contract, chain_id).hex()}"
+
+
+@lru_cache(maxsize=16)
+def _get_private_key(key: bytes) -> keys.PrivateKey:
+    return keys.PrivateKey(key)
+
+
+def _sign_digest(digest: bytes, private_key: keys.PrivateKey) -> str:
+    signature = private_key.sign_msg_hash(digest)
+    return (
+        "0x"
+        + (
+            signature.r.to_bytes(32, "big")
+            + signature.s.to_bytes(32, "big")
+            + bytes([signature.v + 27])
+        ).hex()
+    )
+
+
+def sign_eip712_message(
+    tx: NadoTxType,
+    msg: dict,
+    verifying_contract: str,
+    chain_id: int,
+    signer: LocalAccount,
+) -> tuple[str, str]:
+    """
+    Signs a Nado execute message and returns the signature together with its digest.
+
+    The digest is computed once and used for both, e.g. the digest of a signed order
+    can later be used to cancel it.
+
+    Args:
+        tx (NadoTxType): The Nado tx type being signed.
+
+        msg (dict): The message being signed.
+
+        verifying_contract (str): The contract that will verify the signature.
+
+        chain_id (int): The chain ID of the originating network.
+
+        signer (LocalAccount): The local Ethereum account to sign the data.
+
+    Returns:
+        tuple[str, str]: The hexadecimal signature and digest.
+    """
+    digest = hash_eip712_message(tx, msg, verifying_contract, chain_id)
+    return (
+        _sign_digest(digest, _get_private_key(bytes(signer.key))),
+        f"0x{digest.hex()}",
+    )
+
+
+def sign_eip712_messages(
+    tx: NadoTxType,
+    msgs: Sequence[tuple[dict, str]],
+    chain_id: int,
+    signer: LocalAccount,
+) -> list[tuple[str, str]]:
+    """
+    Signs many Nado execute messages of the same tx type in one call.
+
+    Args:
+        tx (NadoTxType): The Nado tx type being signed.
+
+        msgs (Sequence[tuple[dict, str]]): Pairs of (message, verifying contract), e.g. one per order.
+
+        chain_id (int): The chain ID of the originating network.
+
+        signer (LocalAccount): The local Ethereum account to sign the data.
+
+    Returns:
+        list[tuple[str, str]]: The (signature, digest) of each message, in input order.
+    """
+    private_key = _get_private_key(bytes(signer.key))
+    results = []
+    for msg, verifying_contract in msgs:
+        digest = hash_eip712_message(tx, msg, verifying_contract, chain_id)
+        results.append((_sign_digest(digest, private_key), f"0x{digest.hex()}"))
+    return results
@@ -20,6 +20,7 @@ from nado_protocol.engine_client.types.execute import (
     OrderParams,
     PlaceMarketOrderParams,
     PlaceOrderParams,
+    PlaceOrdersParams,
     WithdrawCollateralParams,
     to_execute_request,
 )
@@ -150,6 +151,32 @@ class EngineExecuteClient(NadoBaseExecute):
         )
         return self.execute(params)
 
+    def place_orders(self, params: PlaceOrdersParams) -> ExecuteResponse:
+        """
+        Execute a place orders operation, placing multiple orders in a single request.
+
+        Orders without a signature are signed together in one batch.
+
+        Args:
+            params (PlaceOrdersParams): Parameters required for placing the orders.
+
+        Returns:
+            ExecuteResponse: Response of the execution, including status and potential error message.
+        """
+        params = PlaceOrdersParams.parse_obj(params)
+        params.orders = [order_params.copy() for order_params in params.orders]
+        for order_params in params.orders:
+            order_params.order = self.prepare_execute_params(order_params.order, True)
+        unsigned = [
+            order_params for order_params in params.orders if not order_params.signature
+        ]
+        signed = self.sign_orders(
+            [(order_params.order, order_params.product_id) for order_params in unsigned]
+        )
+        for order_params, (signature, _) in zip(unsigned, signed):
+            order_params.signature = signature
+        return self.execute(params)
+
     def place_market_order(self, params: PlaceMarketOrderParams) -> ExecuteResponse:
         """
         Places an FOK order using top of the book price with provided slippage.
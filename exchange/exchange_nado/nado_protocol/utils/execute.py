@@ -3,10 +3,10 @@ from copy import deepcopy
 from typing import Optional, Type, Union
 from eth_account.signers.local import LocalAccount
 from pydantic import validator
-from nado_protocol.contracts.eip712.sign import (
-    build_eip712_typed_data,
-    get_eip712_typed_data_digest,
-    sign_eip712_typed_data,
+from nado_protocol.contracts.eip712.engine import (
+    get_eip712_digest,
+    sign_eip712_message,
+    sign_eip712_messages,
 )
 from nado_protocol.contracts.types import NadoExecuteType
 from nado_protocol.utils.backend import NadoClientOpts
@@ -307,9 +307,7 @@ class NadoBaseExecute:
         Returns:
             str: The digest computed from the provided parameters.
         """
-        return get_eip712_typed_data_digest(
-            build_eip712_typed_data(execute, msg, verifying_contract, chain_id)
-        )
+        return get_eip712_digest(execute, msg, verifying_contract, chain_id)
 
     def sign(
         self,
@@ -336,11 +334,10 @@ class NadoBaseExecute:
         Returns:
             str: The generated EIP-712 signature.
         """
-        typed_data = build_eip712_typed_data(execute, msg, verifying_contract, chain_id)
-        return sign_eip712_typed_data(
-            typed_data=typed_data,
-            signer=signer,
+        signature, _ = sign_eip712_message(
+            execute, msg, verifying_contract, chain_id, signer
         )
+        return signature
 
     def get_order_digest(self, order: OrderParams, product_id: int) -> str:
         """
@@ -360,3 +357,27 @@ class NadoBaseExecute:
             self.order_verifying_contract(product_id),
             self.chain_id,
         )
+
+    def sign_orders(
+        self, orders: list[tuple[OrderParams, int]]
+    ) -> list[tuple[str, str]]:
+        """
+        Signs many orders in one call, returning each order's signature and digest.
+
+        Orders must already have their sender and nonce set, e.g. via `prepare_execute_params`.
+
+        Args:
+            orders (list[tuple[OrderParams, int]]): Pairs of (order, product_id).
+
+        Returns:
+            list[tuple[str, str]]: The (signature, digest) of each order, in input order.
+        """
+        return sign_eip712_messages(
+            NadoExecuteType.PLACE_ORDER,
+            [
+                (order.dict(), self.order_verifying_contract(product_id))
+                for order, product_id in orders
+            ],
+            self.chain_id,
+            self.linked_signer,
+        )
@@ -0,0 +1,133 @@
+import random
+
+from eth_account import Account
+import pytest
+
+from nado_protocol.contracts.eip712.engine import (
+    get_eip712_digest,
+    get_eip712_domain_separator,
+    get_eip712_type_hash,
+    sign_eip712_message,
+    sign_eip712_messages,
+)
+from nado_protocol.contracts.eip712.sign import (
+    build_eip712_typed_data,
+    get_eip712_typed_data_digest,
+    sign_eip712_typed_data,
+)
+from nado_protocol.contracts.types import NadoExecuteType, NadoTxType
+from nado_protocol.utils.order import gen_order_verifying_contract
+
+
+def test_sign_eip712_message_matches_typed_data(
+    chain_id: int,
+    endpoint_addr: str,
+    order_verifying_contracts: list[str],
+    private_keys: list[str],
+    order_params: dict,
+    cancellation_params: dict,
+    cancellation_products_params: dict,
+    withdraw_collateral_params: dict,
+    liquidate_subaccount_params: dict,
+    mint_nlp_params: dict,
+    burn_nlp_params: dict,
+    link_signer_params: dict,
+    authenticate_stream_params: dict,
+    list_trigger_orders_params: dict,
+):
+    to_sign = [
+        (NadoTxType.PLACE_ORDER, order_verifying_contracts[1], order_params),
+        (NadoTxType.CANCEL_ORDERS, endpoint_addr, cancellation_params),
+        (
+            NadoTxType.CANCEL_PRODUCT_ORDERS,
+            endpoint_addr,
+            cancellation_products_params,
+        ),
+        (
+            NadoTxType.WITHDRAW_COLLATERAL,
+            endpoint_addr,
+            withdraw_collateral_params,
+        ),
+        (
+            NadoTxType.LIQUIDATE_SUBACCOUNT,
+            endpoint_addr,
+            liquidate_subaccount_params,
+        ),
+        (NadoTxType.MINT_NLP, endpoint_addr, mint_nlp_params),
+        (NadoTxType.BURN_NLP, endpoint_addr, burn_nlp_params),
+        (NadoTxType.LINK_SIGNER, endpoint_addr, link_signer_params),
+        (NadoTxType.AUTHENTICATE_STREAM, endpoint_addr, authenticate_stream_params),
+        (NadoTxType.LIST_TRIGGER_ORDERS, endpoint_addr, list_trigger_orders_params),
+    ]
+
+    signer = Account.from_key(private_keys[0])
+
+    for tx, verifying_contract, msg in to_sign:
+        typed_data = build_eip712_typed_data(tx, msg, verifying_contract, chain_id)
+        expected_signature = sign_eip712_typed_data(typed_data, signer)
+        expected_digest = get_eip712_typed_data_digest(typed_data)
+
+        signature, digest = sign_eip712_message(
+            tx, msg, verifying_contract, chain_id, signer
+        )
+        assert signature == expected_signature
+        assert digest == expected_digest
+        assert get_eip712_digest(tx, msg, verifying_contract, chain_id) == digest
+
+
+def test_sign_eip712_messages_batch(
+    chain_id: int, private_keys: list[str], order_params: dict
+):
+    rng = random.Random(42)
+    signer = Account.from_key(private_keys[1])
+    msgs = []
+    for _ in range(25):
+        msg = {
+            **order_params,
+            "priceX18": rng.randrange(1, 10**24),
+            "amount": rng.randrange(-(10**20), 10**20),
+            "nonce": rng.randrange(2**64),
+            "appendix": rng.randrange(2**128),
+        }
+        msgs.append((msg, gen_order_verifying_contract(rng.randrange(1, 64))))
+
+    results = sign_eip712_messages(NadoTxType.PLACE_ORDER, msgs, chain_id, signer)
+
+    assert len(results) == len(msgs)
+    for (msg, verifying_contract), (signature, digest) in zip(msgs, results):
+        typed_data = build_eip712_typed_data(
+            NadoTxType.PLACE_ORDER, msg, verifying_contract, chain_id
+        )
+        assert signature == sign_eip712_typed_data(typed_data, signer)
+        assert digest == get_eip712_typed_data_digest(typed_data)
+
+
+def test_eip712_caches(endpoint_addr: str, chain_id: int):
+    assert get_eip712_type_hash(NadoExecuteType.PLACE_ORDER) is get_eip712_type_hash(
+        NadoTxType.PLACE_ORDER
+    )
+    assert get_eip712_domain_separator(
+        endpoint_addr, chain_id
+    ) is get_eip712_domain_separator(endpoint_addr, chain_id)
+    assert get_eip712_domain_separator(
+        endpoint_addr, chain_id
+    ) != get_eip712_domain_separator(endpoint_addr, chain_id + 1)
+
+
+def test_hash_eip712_message_rejects_invalid_values(
+    endpoint_addr: str, chain_id: int, order_params: dict
+):
+    with pytest.raises(ValueError, match="Missing value"):
+        get_eip712_digest(
+            NadoTxType.PLACE_ORDER,
+            {k: v for k, v in order_params.items() if k != "nonce"},
+            endpoint_addr,
+            chain_id,
+        )
+    with pytest.raises(ValueError, match="out of range"):
+        get_eip712_digest(
+            NadoTxType.PLACE_ORDER,
+            {**order_params, "nonce": 2**64},
+            endpoint_addr,
+            chain_id,
+        )
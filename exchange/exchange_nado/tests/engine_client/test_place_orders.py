@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+from nado_protocol.contracts.eip712.sign import (
+    build_eip712_typed_data,
+    sign_eip712_typed_data,
+)
+from nado_protocol.contracts.types import NadoExecuteType
+from nado_protocol.engine_client import EngineClient
+from nado_protocol.engine_client.types.execute import (
+    OrderParams,
+    PlaceOrderParams,
+    PlaceOrdersParams,
+    PlaceOrdersRequest,
+)
+from nado_protocol.utils.bytes32 import hex_to_bytes32
+from nado_protocol.utils.order import gen_order_verifying_contract
+from nado_protocol.utils.subaccount import SubaccountParams
+
+
+def test_place_orders_execute_success(
+    engine_client: EngineClient, mock_post: MagicMock, senders: list[str]
+):
+    params = PlaceOrdersParams(
+        orders=[
+            PlaceOrderParams(
+                product_id=product_id,
+                order=OrderParams(
+                    sender=SubaccountParams(subaccount_name="default"),
+                    priceX18=1000 + product_id,
+                    amount=-1000 if product_id % 2 else 1000,
+                    expiration=1000,
+                    nonce=1000 + product_id,
+                    appendix=0,
+                ),
+            )
+            for product_id in (1, 2, 3)
+        ],
+        stop_on_failure=False,
+    )
+
+    expected_signatures = []
+    for order_params in params.orders:
+        order = order_params.order.copy(deep=True)
+        order.sender = hex_to_bytes32(senders[0])
+        expected_signatures.append(
+            sign_eip712_typed_data(
+                typed_data=build_eip712_typed_data(
+                    NadoExecuteType.PLACE_ORDER,
+                    order.dict(),
+                    gen_order_verifying_contract(order_params.product_id),
+                    engine_client.chain_id,
+                ),
+                signer=engine_client._opts.linked_signer,
+            )
+        )
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"status": "success"}
+    mock_post.return_value = mock_response
+
+    res = engine_client.place_orders(params)
+    place_orders_req = PlaceOrdersRequest(**res.req)
+
+    assert res.status == "success"
+    assert [
+        order_params.signature for order_params in place_orders_req.place_orders.orders
+    ] == expected_signatures
+    assert [
+        order_params.product_id for order_params in place_orders_req.place_orders.orders
+    ] == [1, 2, 3]
+    assert all(params.orders[i].signature is None for i in range(3))
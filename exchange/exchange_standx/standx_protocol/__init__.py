@@ -1,6 +1,10 @@
 # 只导出实际存在的模块
 from .perps_auth import StandXAuth, LoginResponse, SignedData
 from .perp_http import StandXPerpHTTP, RegionResponse
+from .clock import ServerClock
+from .transport import StandXTransport, AsyncStandXTransport
+from .dispatcher import MessageDispatcher
+from . import codec
 
 __all__ = [
     "StandXAuth",
@@ -8,4 +12,9 @@ __all__ = [
     "SignedData",
     "StandXPerpHTTP",
     "RegionResponse",
+    "ServerClock",
+    "StandXTransport",
+    "AsyncStandXTransport",
+    "MessageDispatcher",
+    "codec",
 ]
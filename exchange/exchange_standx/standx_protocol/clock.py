@@ -0,0 +1,130 @@
+"""
+StandX Server Clock
+
+Measures the offset between local time and StandX server time in a
+background thread and serves offset-corrected timestamps for request
+signing without any network I/O on the signing path.
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+
+class ServerClock:
+    """Server time offset cache"""
+
+    def __init__(
+        self,
+        fetch_server_time: Callable[[], Optional[float]],
+        refresh_interval: float = 60.0,
+        max_samples: int = 8,
+    ):
+        """
+        Initialize server clock.
+
+        Args:
+            fetch_server_time: Callable returning server time in seconds (or
+                milliseconds, auto-detected), or None if unavailable
+            refresh_interval: Seconds between background syncs (default: 60)
+            max_samples: Number of recent samples kept; the offset is taken from
+                the sample with the lowest RTT
+        """
+        self._fetch_server_time = fetch_server_time
+        self.refresh_interval = refresh_interval
+
+        # Anchor wall clock to the monotonic clock once, so local clock jumps
+        # (NTP steps, manual changes) don't leak into signing timestamps
+        self._anchor_wall = time.time()
+        self._anchor_mono = time.monotonic()
+
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)  # (rtt, offset)
+        self._offset = 0.0
+        self._rtt: Optional[float] = None
+        self._last_now = 0.0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _local_now(self) -> float:
+        return self._anchor_wall + (time.monotonic() - self._anchor_mono)
+
+    @property
+    def offset(self) -> float:
+        """Server time minus local time, in seconds"""
+        return self._offset
+
+    @property
+    def rtt(self) -> Optional[float]:
+        """RTT of the sample the offset was taken from, in seconds"""
+        return self._rtt
+
+    @property
+    def synced(self) -> bool:
+        """Whether at least one successful sync has happened"""
+        return self._rtt is not None
+
+    def sync_once(self) -> bool:
+        """
+        Take one offset sample (blocking network call).
+
+        Returns:
+            True if the sample succeeded
+        """
+        sent = self._local_now()
+        try:
+            server_time = self._fetch_server_time()
+        except Exception:
+            return False
+        received = self._local_now()
+        if server_time is None:
+            return False
+
+        server_time = float(server_time)
+        if server_time > 1e11:
+            # Millisecond timestamp
+            server_time /= 1000.0
+
+        rtt = received - sent
+        # Assume the server stamped the response halfway through the round-trip
+        offset = server_time - (sent + rtt / 2)
+
+        with self._lock:
+            self._samples.append((rtt, offset))
+            best_rtt, best_offset = min(self._samples)
+            self._rtt = best_rtt
+            self._offset = best_offset
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sync_once()
+            self._stop.wait(self.refresh_interval)
+
+    def start(self) -> None:
+        """Start background syncing (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="standx-clock-sync", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background syncing"""
+        self._stop.set()
+
+    def now(self) -> float:
+        """Offset-corrected server time in seconds (monotonic, no network I/O)"""
+        value = self._local_now() + self._offset
+        with self._lock:
+            # A new offset sample may be slightly smaller; never step backwards
+            if value < self._last_now:
+                value = self._last_now
+            self._last_now = value
+        return value
+
+    def timestamp(self) -> int:
+        """Offset-corrected server time in whole seconds, for request signing"""
+        return int(self.now())
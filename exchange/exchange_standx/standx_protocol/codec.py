@@ -0,0 +1,87 @@
+"""
+JSON codec shared by the exchange REST and WebSocket clients.
+
+The same file ships as standx_protocol/codec.py, pysdk/grvt_codec.py and
+lighter/codec.py so each SDK stays importable on its own; keep the three
+copies identical.
+
+Uses orjson when installed, then msgspec, then the stdlib json module; the
+encoded text is compact UTF-8 in every backend. Decimals are encoded as
+strings, Enums by value and dataclasses as objects, so request payloads need
+no JSONEncoder subclass. Values a fast backend cannot encode (e.g. integers
+beyond 64 bits) fall back to the stdlib encoder. The fast backends decode
+integers beyond 64 bits as floats; exchange ids, nonces and amounts fit in
+64 bits.
+"""
+
+import dataclasses
+import json
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, Enum):
+        return o.value
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _std_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+    _fast_loads = orjson.loads
+    _DecodeError: Any = orjson.JSONDecodeError
+
+    def _fast_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+elif msgspec is not None:
+    BACKEND = "msgspec"
+    _fast_loads = msgspec.json.decode
+    _DecodeError = msgspec.DecodeError
+    _encoder = msgspec.json.Encoder(enc_hook=_default, decimal_format="string")
+
+    def _fast_dumps(obj: Any) -> str:
+        return _encoder.encode(obj).decode()
+
+else:
+    BACKEND = "json"
+    _fast_loads = json.loads
+    _DecodeError = json.JSONDecodeError
+    _fast_dumps = _std_dumps
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Decode a JSON document from str or bytes; invalid JSON raises ValueError."""
+    try:
+        return _fast_loads(data)
+    except _DecodeError:
+        # inputs only the stdlib accepts (e.g. NaN); genuinely invalid JSON raises here
+        return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object (dicts, lists, dataclasses, Enums, Decimals) as compact JSON text."""
+    try:
+        return _fast_dumps(obj)
+    except TypeError:
+        # values the fast backend cannot encode, e.g. integers beyond 64 bits
+        return _std_dumps(obj)
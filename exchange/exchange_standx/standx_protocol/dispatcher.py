@@ -0,0 +1,132 @@
+"""
+StandX 推送消息分发器
+
+接收循环只负责解析消息并放入对应队列，每个队列由一个常驻任务按顺序处理：
+- 每个 key（如 "price:BTC-USD"）一个有界队列，同一 key 的消息按到达顺序处理
+- 快照型频道（每条消息都是完整状态，如 price、depth_book）开启合并，
+  队列只保留最新一条，处理跟不上时直接丢弃过期消息
+- 其他频道队列满时丢弃最旧的消息并计数
+- 处理函数返回 False 表示消息无人处理（如频道没有注册回调），计数并在该 key 首次出现时打印
+"""
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+
+# 非合并频道的队列容量
+DEFAULT_QUEUE_SIZE = 1000
+
+
+class _ChannelQueue:
+    """单个 key 的消息队列与计数"""
+
+    __slots__ = ("items", "wakeup", "task", "delivered", "dropped", "high_water", "unhandled", "errors")
+
+    def __init__(self, maxlen: int):
+        self.items: deque = deque(maxlen=maxlen)
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.dropped = 0
+        self.high_water = 0
+        self.unhandled = 0
+        self.errors = 0
+
+
+class MessageDispatcher:
+    """
+    按 key 分队列、按顺序处理推送消息
+
+    put() 只能在事件循环线程调用；处理函数抛出的异常会被打印并计数，不影响后续消息。
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Awaitable[Optional[bool]]],
+        conflate_channels: Iterable[str] = (),
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """
+        初始化分发器
+
+        Args:
+            handler: 消息处理协程函数，返回 False 表示消息无人处理
+            conflate_channels: 只保留最新消息的频道
+            queue_size: 非合并频道的队列容量
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size 必须大于 0")
+        self.handler = handler
+        self.conflate_channels = frozenset(conflate_channels)
+        self.queue_size = queue_size
+        self._queues: Dict[str, _ChannelQueue] = {}
+
+    def put(self, key: str, channel: Optional[str], data: Dict[str, Any]) -> None:
+        """
+        放入一条消息
+
+        Args:
+            key: 队列 key，同一 key 的消息按顺序处理
+            channel: 频道名，决定是否合并
+            data: 消息内容
+        """
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = _ChannelQueue(1 if channel in self.conflate_channels else self.queue_size)
+            queue.task = asyncio.create_task(self._consume(key, queue))
+            self._queues[key] = queue
+        items = queue.items
+        if len(items) == items.maxlen:
+            queue.dropped += 1  # deque 满时 append 会挤掉最旧的一条
+        items.append(data)
+        if len(items) > queue.high_water:
+            queue.high_water = len(items)
+        queue.wakeup.set()
+
+    async def _consume(self, key: str, queue: _ChannelQueue) -> None:
+        items = queue.items
+        while True:
+            if not items:
+                queue.wakeup.clear()
+                await queue.wakeup.wait()
+                continue
+            data = items.popleft()
+            try:
+                handled = await self.handler(data)
+            except Exception as e:
+                queue.errors += 1
+                print(f"处理消息错误（{key}）: {e}")
+            else:
+                if handled is False:
+                    queue.unhandled += 1
+                    if queue.unhandled == 1:
+                        print(f"收到无人处理的推送消息（{key}），之后只计数: {data}")
+            queue.delivered += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        各队列的统计
+
+        Returns:
+            Dict[str, Dict[str, int]]: key -> {depth: 当前积压, high_water: 最大积压,
+                delivered: 已处理, dropped: 丢弃/合并掉的消息数, unhandled: 无人处理的消息数,
+                errors: 处理函数抛出异常的消息数}
+        """
+        return {
+            key: {
+                "depth": len(queue.items),
+                "high_water": queue.high_water,
+                "delivered": queue.delivered,
+                "dropped": queue.dropped,
+                "unhandled": queue.unhandled,
+                "errors": queue.errors,
+            }
+            for key, queue in self._queues.items()
+        }
+
+    def close(self) -> None:
+        """停止所有处理任务，丢弃积压消息"""
+        for queue in self._queues.values():
+            if queue.task is not None:
+                queue.task.cancel()
+        self._queues.clear()
@@ -2,11 +2,12 @@
 StandX Perps HTTP API Client
 """
 from typing import Dict, Any, Optional, List
-import requests
-import json
-import time
 import uuid
 
+from .clock import ServerClock
+from .codec import dumps, loads
+from .transport import StandXTransport
+
 
 class RegionResponse:
     """Region and server time response"""
@@ -18,16 +19,26 @@ class RegionResponse:
 class StandXPerpHTTP:
     """StandX Perps HTTP API Client"""
     
-    def __init__(self, base_url: str = "https://perps.standx.com", geo_url: str = "https://geo.standx.com"):
+    def __init__(
+        self,
+        base_url: str = "https://perps.standx.com",
+        geo_url: str = "https://geo.standx.com",
+        clock: Optional[ServerClock] = None,
+        transport: Optional[StandXTransport] = None
+    ):
         """
         Initialize StandX Perps HTTP client.
         
         Args:
             base_url: Base URL for perps API (default: https://perps.standx.com)
             geo_url: Base URL for geo API (default: https://geo.standx.com)
+            clock: ServerClock used for signing timestamps (default: one synced from geo /v1/region)
+            transport: Shared pooled HTTP transport (default: a new StandXTransport)
         """
         self.base_url = base_url.rstrip('/')
         self.geo_url = geo_url.rstrip('/')
+        self.transport = transport or StandXTransport()
+        self.clock = clock or ServerClock(self._fetch_server_time)
     
     def health_check(self) -> str:
         """
@@ -40,7 +51,7 @@ class StandXPerpHTTP:
             ValueError: If request fails
         """
         url = f"{self.base_url}/api/health"
-        response = requests.get(url)
+        response = self.transport.get(url, "health")
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -58,31 +69,29 @@ class StandXPerpHTTP:
             ValueError: If request fails
         """
         url = f"{self.geo_url}/v1/region"
-        # 增加超时时间，防止网络问题导致长时间阻塞
-        response = requests.get(url, timeout=1.0)
+        # 短超时（见 transport 的 region 配置），防止网络问题导致长时间阻塞
+        response = self.transport.get(url, "region")
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        data = response.json()
+        data = loads(response.content)
         region = RegionResponse(data)
         return region
 
+    def _fetch_server_time(self) -> Optional[float]:
+        """Fetch server time from geo /v1/region (used by the background clock sync)"""
+        return self.get_region().system_time
+
     def _get_sign_timestamp(self) -> int:
         """
         获取用于签名的时间戳（秒）
         
-        优先使用服务器时间；如果无法获取服务器时间，则回退到本地时间。
+        使用后台同步的服务器时间偏移校正本地时间，签名路径上没有网络请求；
+        尚未完成同步时等同于本地时间。
         """
-        try:
-            region = self.get_region()
-            if region.system_time is not None:
-                return int(region.system_time)
-        except Exception:
-            pass
-        
-        # 回退：使用本地时间（秒）
-        return int(time.time())
+        self.clock.start()
+        return self.clock.timestamp()
     
     def query_balance(
         self,
@@ -116,12 +125,12 @@ class StandXPerpHTTP:
             "Authorization": f"Bearer {token}"
         }
         
-        response = requests.get(url, headers=headers)
+        response = self.transport.get(url, "query_balance", headers=headers)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        return response.json()
+        return loads(response.content)
     
     def place_order(
         self,
@@ -182,7 +191,7 @@ class StandXPerpHTTP:
         if leverage is not None:
             payload["leverage"] = leverage
         
-        payload_str = json.dumps(payload)
+        payload_str = dumps(payload)
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}"
@@ -196,18 +205,18 @@ class StandXPerpHTTP:
         if not auth:
             raise ValueError("StandXAuth instance is required for request signing")
         
-        # 使用缓存的服务器时间或本地时间进行签名，避免频繁访问 geo 接口导致阻塞
+        # 使用缓存的服务器时间偏移进行签名，避免每单访问 geo 接口导致阻塞
         request_id = str(uuid.uuid4())
         timestamp = self._get_sign_timestamp()
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
         
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.transport.post(url, "new_order", headers=headers, data=payload_str)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        return response.json()
+        return loads(response.content)
     
     def query_positions(
         self,
@@ -246,12 +255,12 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.transport.get(url, "query_positions", headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        return response.json()
+        return loads(response.content)
     
     def query_symbol_price(
         self,
@@ -282,12 +291,44 @@ class StandXPerpHTTP:
         url = f"{self.base_url}/api/query_symbol_price"
         params = {"symbol": symbol}
         
-        response = requests.get(url, params=params)
+        response = self.transport.get(url, "query_symbol_price", params=params)
+        
+        if not response.ok:
+            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+        
+        return loads(response.content)
+    
+    def query_symbol_info(
+        self,
+        symbol: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query trading pair configuration.
+        
+        Args:
+            symbol: Trading pair (optional, e.g., "BTC-USD"); all pairs if omitted
+            
+        Returns:
+            List of symbol dictionaries with fields including:
+            - symbol: Trading pair
+            - price_tick_decimals: Price precision (decimal places)
+            - qty_tick_decimals: Quantity precision (decimal places)
+            - min_order_qty: Minimum order quantity
+            
+        Raises:
+            ValueError: If request fails
+        """
+        url = f"{self.base_url}/api/query_symbol_info"
+        params = {}
+        if symbol:
+            params["symbol"] = symbol
+        
+        response = self.transport.get(url, "query_symbol_info", params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        return response.json()
+        return loads(response.content)
     
     def query_open_orders(
         self,
@@ -323,12 +364,12 @@ class StandXPerpHTTP:
         if limit:
             params["limit"] = limit
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.transport.get(url, "query_open_orders", headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        return response.json()
+        return loads(response.content)
     
     def cancel_orders(
         self,
@@ -363,7 +404,7 @@ class StandXPerpHTTP:
         if cl_ord_id_list:
             payload["cl_ord_id_list"] = cl_ord_id_list
         
-        payload_str = json.dumps(payload)
+        payload_str = dumps(payload)
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}"
@@ -373,18 +414,18 @@ class StandXPerpHTTP:
         if not auth:
             raise ValueError("StandXAuth instance is required for request signing")
         
-        # 使用缓存的服务器时间或本地时间进行签名，避免频繁访问 geo 接口导致阻塞
+        # 使用缓存的服务器时间偏移进行签名，避免每单访问 geo 接口导致阻塞
         request_id = str(uuid.uuid4())
         timestamp = self._get_sign_timestamp()
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
         
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.transport.post(url, "cancel_orders", headers=headers, data=payload_str)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        return response.json()
+        return loads(response.content)
     
     def query_positions(
         self,
@@ -423,9 +464,9 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.transport.get(url, "query_positions", headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
-        return response.json()
+        return loads(response.content)
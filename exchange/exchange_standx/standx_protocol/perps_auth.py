@@ -8,7 +8,8 @@ from typing import Literal, Optional, Dict, Any, Callable
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 import base58
-import requests
+
+from .transport import StandXTransport
 
 
 Chain = Literal["bsc", "solana"]
@@ -44,13 +45,22 @@ class LoginResponse:
 class StandXAuth:
     """StandX Authentication Client"""
     
-    def __init__(self, private_key: Optional[bytes] = None):
+    def __init__(
+        self,
+        private_key: Optional[bytes] = None,
+        clock: Optional[Any] = None,
+        transport: Optional[StandXTransport] = None
+    ):
         """
         Initialize StandXAuth instance.
         
         Args:
             private_key: Optional 32-byte private key. If None, generates a new key pair.
+            clock: Optional ServerClock; used when sign_request is called without a timestamp
+            transport: Shared pooled HTTP transport (default: a new StandXTransport)
         """
+        self.clock = clock
+        self.transport = transport or StandXTransport()
         if private_key:
             if len(private_key) != 32:
                 raise ValueError("Private key must be 32 bytes")
@@ -111,8 +121,9 @@ class StandXAuth:
             "requestId": self.request_id
         }
         
-        response = requests.post(
+        response = self.transport.post(
             url,
+            "prepare_signin",
             json=data,
             headers={"Content-Type": "application/json"}
         )
@@ -156,8 +167,9 @@ class StandXAuth:
             "expiresSeconds": expires_seconds
         }
         
-        response = requests.post(
+        response = self.transport.post(
             url,
+            "login",
             json=data,
             headers={"Content-Type": "application/json"}
         )
@@ -172,7 +184,7 @@ class StandXAuth:
         self,
         payload: str,
         request_id: str,
-        timestamp: int
+        timestamp: Optional[int] = None
     ) -> Dict[str, str]:
         """
         Sign a request with ed25519 private key.
@@ -180,11 +192,14 @@ class StandXAuth:
         Args:
             payload: Request payload as JSON string
             request_id: Request ID
-            timestamp: Timestamp in seconds
+            timestamp: Timestamp in seconds (default: offset-corrected clock time,
+                or local time if no clock is set)
             
         Returns:
             Dictionary with signature headers
         """
+        if timestamp is None:
+            timestamp = self.clock.timestamp() if self.clock else int(time.time())
         version = "v1"
         message = f"{version},{request_id},{timestamp},{payload}"
         message_bytes = message.encode('utf-8')
@@ -233,6 +248,6 @@ class StandXAuth:
         )
     
     @classmethod
-    def from_private_key(cls, private_key: bytes) -> 'StandXAuth':
+    def from_private_key(cls, private_key: bytes, clock: Optional[Any] = None) -> 'StandXAuth':
         """Create StandXAuth instance from private key bytes"""
-        return cls(private_key=private_key)
+        return cls(private_key=private_key, clock=clock)
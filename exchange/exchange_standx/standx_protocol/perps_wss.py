@@ -1,196 +1,448 @@
 import asyncio
-import json
+import random
 import uuid
 import time
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Tuple
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from .codec import dumps, loads
+from .dispatcher import DEFAULT_QUEUE_SIZE, MessageDispatcher
 
-class StandXMarketStream:
-    """Market Stream - 市场数据流"""
-    
-    def __init__(self, base_url: str = "wss://perps.standx.com/ws-stream/v1"):
+
+# 服务器在连接满 24 小时后断开，提前主动轮换连接
+MAX_CONNECTION_AGE = 23.5 * 3600
+# 断线重连退避（秒）：第 n 次重连前等待 uniform(0, min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2^n))
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+# connect() 等待守护任务重连完成的超时（秒）
+CONNECT_WAIT_TIMEOUT = 60.0
+# 请求响应超时（秒）
+DEFAULT_REQUEST_TIMEOUT = 10.0
+# 行情快照型频道：每条消息都是完整状态，分发队列只保留最新一条
+DEFAULT_CONFLATE_CHANNELS = ("price", "depth_book")
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    """取走请求 future 的异常，调用方不等待结果时避免 "exception was never retrieved" 警告"""
+    if not future.cancelled():
+        future.exception()
+
+
+class _SupervisedStream:
+    """
+    WebSocket 连接守护基类
+
+    connect() 建立连接后启动守护任务，由守护任务负责：
+    - 接收消息，按 _dispatch_key 放入分发队列，由 _handle_message 按顺序处理
+    - 断线后按带抖动的指数退避重连，重连成功后调用 _restore 重新认证、订阅
+    - 连接时长接近 24 小时上限时主动轮换：先建立新连接并恢复订阅，再关闭旧连接
+    close() 停止守护任务并关闭连接。
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_connection_age: float = MAX_CONNECTION_AGE,
+        conflate_channels: Tuple[str, ...] = (),
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
         self.base_url = base_url
+        self.max_connection_age = max_connection_age
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
-        self.callbacks: Dict[str, Callable] = {}
         self.connected = False
-        self._connect_time: Optional[float] = None  # 记录连接时间，用于 24 小时重连
-    
-    async def connect(self):
-        """建立 WebSocket 连接"""
+        self.reconnect_count = 0
+        self._connect_time: Optional[float] = None  # 记录连接时间，用于 24 小时轮换
+        self._supervisor: Optional[asyncio.Task] = None
+        self._closing = False
+        self._connected_event = asyncio.Event()
+        self._connection_listeners: List[Callable[[bool], Any]] = []
+        self._dispatcher = MessageDispatcher(self._handle_message, conflate_channels, queue_size)
+
+    async def _open(self) -> websockets.WebSocketClientProtocol:
+        """建立一条新的 WebSocket 连接"""
         try:
             # 禁用代理，避免需要 python-socks
             # 启用 websockets 库的自动 ping/pong 处理
             # 服务器每 10 秒发送 ping，客户端自动响应 pong
             # ping_interval=None 表示不主动发送 ping，只响应服务器的 ping
             # ping_timeout 设置为 5 分钟（服务器要求 5 分钟内响应）
-            self.ws = await websockets.connect(
-                self.base_url, 
+            return await websockets.connect(
+                self.base_url,
                 proxy=None,
                 ping_interval=None,      # 不主动发送 ping（服务器会发送）
                 ping_timeout=300.0       # 5 分钟超时（服务器要求）
             )
-            self.connected = True
-            self._connect_time = time.time()  # 记录连接时间
-            # 启动消息接收任务
-            asyncio.create_task(self._receive_messages())
         except Exception as e:
-            self.connected = False
             raise Exception(f"WebSocket 连接失败: {e}")
-    
-    async def _receive_messages(self):
-        """接收消息"""
-        try:
-            async for message in self.ws:
+
+    def _is_supervised(self) -> bool:
+        return self._supervisor is not None and not self._supervisor.done()
+
+    async def connect(self):
+        """建立 WebSocket 连接并启动守护任务；守护任务正在重连时等待重连完成"""
+        if self._is_supervised():
+            if not self.connected:
+                try:
+                    await asyncio.wait_for(self._connected_event.wait(), timeout=CONNECT_WAIT_TIMEOUT)
+                except asyncio.TimeoutError:
+                    raise Exception("WebSocket 连接失败: 等待重连超时")
+            return
+        self._closing = False
+        self.ws = await self._open()
+        self._set_connected(True)
+        self._supervisor = asyncio.create_task(self._supervise())
+
+    def add_connection_listener(self, listener: Callable[[bool], Any]) -> None:
+        """注册连接状态监听器，断线时以 False、重连恢复后以 True 调用（同步函数）"""
+        self._connection_listeners.append(listener)
+
+    def _set_connected(self, connected: bool) -> None:
+        if connected:
+            self._connect_time = time.time()
+            self._connected_event.set()
+        else:
+            self._connected_event.clear()
+            self._on_disconnected()
+        changed = connected != self.connected
+        self.connected = connected
+        if changed:
+            for listener in self._connection_listeners:
                 try:
-                    data = json.loads(message)
-                    # 异步处理消息，避免阻塞接收循环
-                    asyncio.create_task(self._handle_message(data))
+                    listener(connected)
                 except Exception as e:
-                    print(f"处理消息错误: {e}")
-        except ConnectionClosed:
-            self.connected = False
+                    print(f"连接状态回调错误: {e}")
+
+    async def _supervise(self):
+        """守护任务：接收消息，断线后重连，直到 close()"""
+        while not self._closing:
+            try:
+                await self._receive_messages()
+            except ConnectionClosed:
+                pass
+            except Exception as e:
+                print(f"接收消息错误: {e}")
+            if self._closing:
+                break
+            self._set_connected(False)
+            await self._reconnect()
+
+    async def _receive_messages(self):
+        """接收消息，连接时长到达上限时轮换连接；连接断开时抛出 ConnectionClosed"""
+        while True:
+            remaining = self._connect_time + self.max_connection_age - time.time()
+            if remaining <= 0:
+                await self._rotate()
+                continue
+            try:
+                message = await asyncio.wait_for(self.ws.recv(), timeout=remaining)
+            except asyncio.TimeoutError:
+                continue
+            try:
+                data = loads(message)
+                # 放入分发队列，由各队列的处理任务按顺序处理，不阻塞接收循环
+                key, channel = self._dispatch_key(data)
+                self._dispatcher.put(key, channel, data)
+            except Exception as e:
+                print(f"处理消息错误: {e}")
+
+    def dispatch_stats(self) -> Dict[str, Dict[str, int]]:
+        """分发队列统计（积压、最大积压、已处理、丢弃、无人处理、出错数），见 MessageDispatcher.stats"""
+        return self._dispatcher.stats()
+
+    async def _open_restored(self) -> websockets.WebSocketClientProtocol:
+        """建立新连接并恢复认证、订阅，失败时关闭新连接"""
+        ws = await self._open()
+        try:
+            await self._restore(ws)
+        except Exception:
+            await ws.close()
+            raise
+        return ws
+
+    async def _reconnect(self):
+        """按带抖动的指数退避重连，直到成功或 close()"""
+        attempt = 0
+        while not self._closing:
+            delay = random.uniform(0, min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** min(attempt, 16)))
+            await asyncio.sleep(delay)
+            try:
+                ws = await self._open_restored()
+            except Exception as e:
+                attempt += 1
+                print(f"WebSocket 重连失败（第 {attempt} 次）: {e}")
+                continue
+            if self._closing:
+                await ws.close()
+                return
+            self.ws = ws
+            self.reconnect_count += 1
+            self._set_connected(True)
+            return
+
+    async def _rotate(self):
+        """连接时长到达上限前轮换连接：新连接恢复订阅后再关闭旧连接，避免推送中断"""
+        old_ws = self.ws
+        try:
+            ws = await self._open_restored()
         except Exception as e:
-            print(f"接收消息错误: {e}")
-            self.connected = False
-    
-    async def _handle_message(self, data: Dict[str, Any]):
-        """处理接收到的消息"""
-        channel = data.get("channel")
-        if channel and channel in self.callbacks:
-            callback = self.callbacks[channel]
-            # 如果回调是协程函数，使用 await；否则直接调用
-            if asyncio.iscoroutinefunction(callback):
-                await callback(data)
-            else:
-                # 在事件循环中执行同步回调，避免阻塞
-                callback(data)
-    
+            # 轮换失败时继续使用当前连接，1 分钟后重试；服务器断开后由重连逻辑接管
+            print(f"WebSocket 连接轮换失败: {e}")
+            self._connect_time = time.time() - self.max_connection_age + 60
+            return
+        self.ws = ws
+        self._connect_time = time.time()
+        try:
+            await old_ws.close()
+        except Exception:
+            pass
+
+    async def _restore(self, ws: websockets.WebSocketClientProtocol):
+        """在新连接上恢复认证与订阅（子类实现）"""
+
+    def _on_disconnected(self) -> None:
+        """连接断开时的清理（子类实现）"""
+
+    def _dispatch_key(self, data: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """消息所属的分发队列 key 与频道名（子类实现），同一 key 的消息按顺序处理"""
+        return "", None
+
+    async def _handle_message(self, data: Dict[str, Any]) -> Optional[bool]:
+        """处理接收到的消息（子类实现），返回 False 表示消息无人处理"""
+
+    async def close(self):
+        """停止守护任务并关闭连接"""
+        self._closing = True
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            self._supervisor = None
+        self._dispatcher.close()
+        if self.ws:
+            await self.ws.close()
+        self._set_connected(False)
+        self._connect_time = None
+
+
+class StandXMarketStream(_SupervisedStream):
+    """Market Stream - 市场数据流（断线自动重连，重连后重新认证并恢复订阅）
+
+    消息按 "频道:交易对" 分队列顺序处理，conflate_channels 中的频道只处理最新一条。
+    """
+
+    def __init__(
+        self,
+        base_url: str = "wss://perps.standx.com/ws-stream/v1",
+        max_connection_age: float = MAX_CONNECTION_AGE,
+        conflate_channels: Tuple[str, ...] = DEFAULT_CONFLATE_CHANNELS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        super().__init__(base_url, max_connection_age, conflate_channels, queue_size)
+        self.callbacks: Dict[str, Callable] = {}
+        # 重连后需要重放的认证与订阅消息
+        self._auth_message: Optional[Dict[str, Any]] = None
+        self._subscriptions: Dict[str, Dict[str, Any]] = {}
+
+    async def _restore(self, ws: websockets.WebSocketClientProtocol):
+        """在新连接上重新认证并恢复所有订阅"""
+        if self._auth_message:
+            await ws.send(dumps(self._auth_message))
+        for subscribe_msg in list(self._subscriptions.values()):
+            await ws.send(dumps(subscribe_msg))
+
+    @staticmethod
+    def _route(data: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """消息的频道与交易对"""
+        symbol = data.get("symbol")
+        if not symbol and isinstance(data.get("data"), dict):
+            symbol = data["data"].get("symbol")
+        return data.get("channel"), symbol
+
+    def _dispatch_key(self, data: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        channel, symbol = self._route(data)
+        return (f"{channel}:{symbol}" if symbol else str(channel)), channel
+
+    async def _handle_message(self, data: Dict[str, Any]) -> bool:
+        """处理接收到的消息，没有对应回调时返回 False"""
+        channel, symbol = self._route(data)
+        if not channel:
+            return False
+        # 按交易对订阅的回调优先，其次是整个频道的回调
+        callback = self.callbacks.get(f"{channel}:{symbol}") if symbol else None
+        if callback is None:
+            callback = self.callbacks.get(channel)
+        if callback is None:
+            return False
+        # 如果回调是协程函数，使用 await；否则直接调用
+        if asyncio.iscoroutinefunction(callback):
+            await callback(data)
+        else:
+            # 在事件循环中执行同步回调，避免阻塞
+            callback(data)
+        return True
+
     async def authenticate(self, token: str, streams: Optional[List[Dict[str, str]]] = None):
-        """使用 JWT token 认证"""
-        if not self.connected or not self.ws:
+        """使用 JWT token 认证（重连后自动重新认证）"""
+        if not self._is_supervised():
             raise Exception("WebSocket 未连接")
-        
+
         auth_msg = {
             "auth": {
                 "token": token
             }
         }
-        
+
         if streams:
             auth_msg["auth"]["streams"] = streams
-        
-        await self.ws.send(json.dumps(auth_msg))
-    
+
+        self._auth_message = auth_msg
+        # 正在重连时只记录，连接恢复后统一发送
+        if self.connected:
+            await self.ws.send(dumps(auth_msg))
+
     async def subscribe(self, channel: str, symbol: Optional[str] = None, callback: Optional[Callable] = None):
-        """订阅频道"""
-        if not self.connected or not self.ws:
+        """订阅频道（重连后自动恢复）"""
+        if not self._is_supervised():
             raise Exception("WebSocket 未连接")
-        
+
         subscribe_msg = {"subscribe": {"channel": channel}}
         if symbol:
             subscribe_msg["subscribe"]["symbol"] = symbol
-        
-        await self._send_message(subscribe_msg)
-        
+
+        key = f"{channel}:{symbol}" if symbol else channel
         if callback:
-            self.callbacks[channel] = callback
-    
+            # 同一频道可以按交易对分别注册回调（多个交易对共用一条连接）
+            self.callbacks[key] = callback
+        self._subscriptions[key] = subscribe_msg
+
+        # 正在重连时只记录，连接恢复后统一发送
+        if self.connected:
+            await self._send_message(subscribe_msg)
+
     async def _send_message(self, message: Dict[str, Any]):
         """发送消息"""
         if self.ws:
-            await self.ws.send(json.dumps(message))
-    
-    async def close(self):
-        """关闭连接"""
-        if self.ws:
-            await self.ws.close()
-            self.connected = False
-            self._connect_time = None
+            await self.ws.send(dumps(message))
 
 
-class StandXOrderStream:
-    """Order Response Stream - 订单响应流"""
-    
-    def __init__(self, base_url: str = "wss://perps.standx.com/ws-api/v1"):
-        self.base_url = base_url
-        self.ws: Optional[websockets.WebSocketClientProtocol] = None
+class StandXOrderStream(_SupervisedStream):
+    """Order Response Stream - 订单响应流（断线自动重连并重新登录，请求带超时）"""
+
+    def __init__(
+        self,
+        base_url: str = "wss://perps.standx.com/ws-api/v1",
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        max_connection_age: float = MAX_CONNECTION_AGE,
+    ):
+        super().__init__(base_url, max_connection_age)
         self.session_id = str(uuid.uuid4())
-        self.callbacks: Dict[str, Callable] = {}
-        self.connected = False
+        self.request_timeout = request_timeout
         self.auth: Optional[Any] = None  # StandXAuth 实例，用于签名
-        self._connect_time: Optional[float] = None  # 记录连接时间，用于 24 小时重连
-    
-    async def connect(self):
-        """建立 WebSocket 连接"""
-        try:
-            # 禁用代理，避免需要 python-socks
-            # 启用 websockets 库的自动 ping/pong 处理
-            # 服务器每 10 秒发送 ping，客户端自动响应 pong
-            # ping_interval=None 表示不主动发送 ping，只响应服务器的 ping
-            # ping_timeout 设置为 5 分钟（服务器要求 5 分钟内响应）
-            self.ws = await websockets.connect(
-                self.base_url, 
-                proxy=None,
-                ping_interval=None,      # 不主动发送 ping（服务器会发送）
-                ping_timeout=300.0       # 5 分钟超时（服务器要求）
-            )
-            self.connected = True
-            self._connect_time = time.time()  # 记录连接时间
-            # 启动消息接收任务
-            asyncio.create_task(self._receive_messages())
-        except Exception as e:
-            self.connected = False
-            raise Exception(f"WebSocket 连接失败: {e}")
-    
-    async def _receive_messages(self):
-        """接收消息"""
-        try:
-            async for message in self.ws:
-                try:
-                    data = json.loads(message)
-                    # 异步处理消息，避免阻塞接收循环
-                    asyncio.create_task(self._handle_message(data))
-                except Exception as e:
-                    print(f"处理消息错误: {e}")
-        except ConnectionClosed:
-            self.connected = False
-        except Exception as e:
-            print(f"接收消息错误: {e}")
-            self.connected = False
-    
-    async def _handle_message(self, data: Dict[str, Any]):
-        """处理接收到的消息"""
-        request_id = data.get("request_id")
-        if request_id and request_id in self.callbacks:
-            callback = self.callbacks[request_id]
-            # 如果回调是协程函数，使用 await；否则直接调用
-            if asyncio.iscoroutinefunction(callback):
-                await callback(data)
-            else:
-                callback(data)
-            # 一次性回调，处理完后删除
-            del self.callbacks[request_id]
-    
-    async def login(self, token: str, callback: Optional[Callable] = None):
-        """使用 JWT token 登录"""
-        if not self.connected or not self.ws:
-            raise Exception("WebSocket 未连接")
-        
-        request_id = str(uuid.uuid4())
-        message = {
+        self._token: Optional[str] = None  # 重连后重新登录
+        # request_id -> (响应 future, 回调, 超时句柄)
+        self._pending: Dict[str, Tuple[asyncio.Future, Optional[Callable], asyncio.TimerHandle]] = {}
+
+    def _login_message(self, token: str) -> Dict[str, Any]:
+        return {
             "session_id": self.session_id,
-            "request_id": request_id,
+            "request_id": str(uuid.uuid4()),
             "method": "auth:login",
-            "params": json.dumps({"token": token})
+            "params": dumps({"token": token})
         }
-        
-        if callback:
-            self.callbacks[request_id] = callback
-        
-        await self.ws.send(json.dumps(message))
-    
+
+    async def _restore(self, ws: websockets.WebSocketClientProtocol):
+        """在新连接上重新登录"""
+        if self._token:
+            await ws.send(dumps(self._login_message(self._token)))
+
+    def _dispatch_key(self, data: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        # 请求响应数量有限，全部按到达顺序处理
+        return "response", None
+
+    def _on_disconnected(self) -> None:
+        """连接断开后原连接上的请求不会再有响应，立即失败"""
+        for request_id in list(self._pending):
+            self._fail_request(request_id, ConnectionError(f"请求 {request_id} 失败: WebSocket 连接断开"))
+
+    def _fail_request(self, request_id: str, error: Exception) -> None:
+        entry = self._pending.pop(request_id, None)
+        if entry is None:
+            return
+        future, _, timer = entry
+        timer.cancel()
+        if not future.done():
+            future.set_exception(error)
+
+    def _expire_request(self, request_id: str) -> None:
+        if request_id in self._pending:
+            print(f"请求 {request_id} 超时未响应")
+            self._fail_request(request_id, asyncio.TimeoutError(f"请求 {request_id} 超时"))
+
+    async def _send_request(
+        self,
+        message: Dict[str, Any],
+        callback: Optional[Callable],
+        timeout: Optional[float],
+    ) -> asyncio.Future:
+        """
+        发送请求并登记响应 future
+
+        响应到达时先调用 callback（如有），再以响应数据完成 future；
+        超时或连接断开时 future 以异常结束，不调用 callback。
+        """
+        if not self.connected or not self.ws:
+            raise Exception("WebSocket 未连接")
+
+        request_id = message["request_id"]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(_retrieve_exception)
+        timer = loop.call_later(
+            timeout if timeout is not None else self.request_timeout,
+            self._expire_request,
+            request_id,
+        )
+        self._pending[request_id] = (future, callback, timer)
+        try:
+            await self.ws.send(dumps(message))
+        except Exception as e:
+            self._fail_request(request_id, e)
+            raise
+        return future
+
+    async def _handle_message(self, data: Dict[str, Any]) -> bool:
+        """处理接收到的消息，不对应任何待响应请求（如超时后才到达的响应）时返回 False"""
+        request_id = data.get("request_id")
+        entry = self._pending.pop(request_id, None) if request_id else None
+        if entry is None:
+            return False
+        future, callback, timer = entry
+        timer.cancel()
+        try:
+            if callback:
+                # 如果回调是协程函数，使用 await；否则直接调用
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(data)
+                else:
+                    callback(data)
+        finally:
+            if not future.done():
+                future.set_result(data)
+        return True
+
+    async def login(
+        self,
+        token: str,
+        callback: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+    ) -> asyncio.Future:
+        """使用 JWT token 登录（重连后自动重新登录）
+
+        Returns:
+            asyncio.Future: 登录响应，可 await 获取；超时抛出 asyncio.TimeoutError
+        """
+        self._token = token
+        return await self._send_request(self._login_message(token), callback, timeout)
+
     async def new_order(
         self,
         symbol: str,
@@ -201,15 +453,17 @@ class StandXOrderStream:
         reduce_only: bool,
         price: Optional[str] = None,
         cl_ord_id: Optional[str] = None,
-        callback: Optional[Callable] = None
-    ):
-        """创建新订单"""
-        if not self.connected or not self.ws:
-            raise Exception("WebSocket 未连接")
-        
+        callback: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+    ) -> asyncio.Future:
+        """创建新订单
+
+        Returns:
+            asyncio.Future: 下单响应，可 await 获取；超时抛出 asyncio.TimeoutError
+        """
         if not self.auth:
             raise Exception("需要 StandXAuth 实例进行请求签名")
-        
+
         # 构建订单参数
         params = {
             "symbol": symbol,
@@ -219,19 +473,18 @@ class StandXOrderStream:
             "time_in_force": time_in_force,
             "reduce_only": reduce_only
         }
-        
+
         if price:
             params["price"] = price
         if cl_ord_id:
             params["cl_ord_id"] = cl_ord_id
-        
-        params_str = json.dumps(params)
+
+        params_str = dumps(params)
         request_id = str(uuid.uuid4())
-        timestamp = int(time.time())
-        
-        # 生成签名头
-        sign_headers = self.auth.sign_request(params_str, request_id, timestamp)
-        
+
+        # 生成签名头（时间戳取自 auth 的服务器时钟，未设置时为本地时间）
+        sign_headers = self.auth.sign_request(params_str, request_id)
+
         message = {
             "session_id": self.session_id,
             "request_id": request_id,
@@ -243,41 +496,39 @@ class StandXOrderStream:
             },
             "params": params_str
         }
-        
-        if callback:
-            self.callbacks[request_id] = callback
-        
-        await self.ws.send(json.dumps(message))
-    
+
+        return await self._send_request(message, callback, timeout)
+
     async def cancel_order(
         self,
         order_id_list: Optional[List[int]] = None,
         cl_ord_id_list: Optional[List[str]] = None,
-        callback: Optional[Callable] = None
-    ):
-        """取消订单"""
-        if not self.connected or not self.ws:
-            raise Exception("WebSocket 未连接")
-        
+        callback: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+    ) -> asyncio.Future:
+        """取消订单
+
+        Returns:
+            asyncio.Future: 撤单响应，可 await 获取；超时抛出 asyncio.TimeoutError
+        """
         if not self.auth:
             raise Exception("需要 StandXAuth 实例进行请求签名")
-        
+
         if not order_id_list and not cl_ord_id_list:
             raise ValueError("必须提供 order_id_list 或 cl_ord_id_list")
-        
+
         params = {}
         if order_id_list:
             params["order_id_list"] = order_id_list
         if cl_ord_id_list:
             params["cl_ord_id_list"] = cl_ord_id_list
-        
-        params_str = json.dumps(params)
+
+        params_str = dumps(params)
         request_id = str(uuid.uuid4())
-        timestamp = int(time.time())
-        
-        # 生成签名头
-        sign_headers = self.auth.sign_request(params_str, request_id, timestamp)
-        
+
+        # 生成签名头（时间戳取自 auth 的服务器时钟，未设置时为本地时间）
+        sign_headers = self.auth.sign_request(params_str, request_id)
+
         message = {
             "session_id": self.session_id,
             "request_id": request_id,
@@ -289,15 +540,5 @@ class StandXOrderStream:
             },
             "params": params_str
         }
-        
-        if callback:
-            self.callbacks[request_id] = callback
-        
-        await self.ws.send(json.dumps(message))
-    
-    async def close(self):
-        """关闭连接"""
-        if self.ws:
-            await self.ws.close()
-            self.connected = False
-            self._connect_time = None
\ No newline at end of file
+
+        return await self._send_request(message, callback, timeout)
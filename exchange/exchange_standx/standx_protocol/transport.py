@@ -0,0 +1,169 @@
+"""
+StandX HTTP Transport
+
+Shared HTTP transport for StandXPerpHTTP and StandXAuth: one pooled
+keep-alive session per process, with per-endpoint timeouts, so requests
+reuse TCP+TLS connections instead of opening a new one per call.
+An optional asyncio variant is provided when aiohttp is installed.
+"""
+from typing import Any, Dict, Optional, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+
+from .codec import loads
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+# (connect timeout, read timeout) in seconds, keyed by endpoint name
+DEFAULT_TIMEOUTS: Dict[str, Timeout] = {
+    "default": (3.05, 10.0),
+    "health": (3.05, 5.0),
+    "region": 1.0,
+    "query_symbol_price": (3.05, 5.0),
+    "query_symbol_info": (3.05, 10.0),
+    "query_balance": (3.05, 5.0),
+    "query_positions": (3.05, 5.0),
+    "query_open_orders": (3.05, 10.0),
+    "new_order": (3.05, 5.0),
+    "cancel_orders": (3.05, 5.0),
+    "prepare_signin": (3.05, 15.0),
+    "login": (3.05, 15.0),
+}
+
+
+class StandXTransport:
+    """Pooled keep-alive HTTP transport"""
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 16,
+        timeouts: Optional[Dict[str, Timeout]] = None,
+        max_retries: int = 0,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            pool_connections: Number of host pools to cache (perps, geo, api)
+            pool_maxsize: Max kept-alive connections per host; should be at
+                least the adapter's order concurrency
+            timeouts: Per-endpoint timeout overrides, merged over DEFAULT_TIMEOUTS
+            max_retries: Connection-level retries (never retries sent requests)
+        """
+        self.timeouts: Dict[str, Timeout] = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def timeout_for(self, endpoint: Optional[str]) -> Timeout:
+        """Timeout for an endpoint name (falls back to "default")"""
+        return self.timeouts.get(endpoint or "default", self.timeouts["default"])
+
+    def get(self, url: str, endpoint: Optional[str] = None, **kwargs: Any) -> requests.Response:
+        """GET over the pooled session"""
+        kwargs.setdefault("timeout", self.timeout_for(endpoint))
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, endpoint: Optional[str] = None, **kwargs: Any) -> requests.Response:
+        """POST over the pooled session"""
+        kwargs.setdefault("timeout", self.timeout_for(endpoint))
+        return self.session.post(url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+
+class AsyncResponse:
+    """Minimal response object returned by AsyncStandXTransport"""
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        return loads(self.text)
+
+
+class AsyncStandXTransport:
+    """Pooled keep-alive HTTP transport for asyncio (requires aiohttp)"""
+
+    def __init__(
+        self,
+        limit_per_host: int = 16,
+        timeouts: Optional[Dict[str, Timeout]] = None,
+        dns_cache_ttl: int = 300,
+    ):
+        """
+        Initialize async transport. The session is created lazily inside the
+        running event loop.
+
+        Args:
+            limit_per_host: Max concurrent connections per host
+            timeouts: Per-endpoint timeout overrides, merged over DEFAULT_TIMEOUTS
+            dns_cache_ttl: DNS cache TTL in seconds
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncStandXTransport requires aiohttp (pip install aiohttp)")
+        self.timeouts: Dict[str, Timeout] = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _client_timeout(self, endpoint: Optional[str]) -> "aiohttp.ClientTimeout":
+        timeout = self.timeouts.get(endpoint or "default", self.timeouts["default"])
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(total=connect + read, connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def request(
+        self, method: str, url: str, endpoint: Optional[str] = None, **kwargs: Any
+    ) -> AsyncResponse:
+        """Send a request over the pooled session"""
+        kwargs.setdefault("timeout", self._client_timeout(endpoint))
+        async with self._get_session().request(method, url, **kwargs) as response:
+            return AsyncResponse(response.status, await response.text())
+
+    async def get(self, url: str, endpoint: Optional[str] = None, **kwargs: Any) -> AsyncResponse:
+        return await self.request("GET", url, endpoint, **kwargs)
+
+    async def post(self, url: str, endpoint: Optional[str] = None, **kwargs: Any) -> AsyncResponse:
+        return await self.request("POST", url, endpoint, **kwargs)
+
+    async def close(self) -> None:
+        """Close the session and its connector"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,63 @@
+import dataclasses
+import enum
+import math
+import os
+import sys
+import unittest
+from decimal import Decimal
+
+# 添加项目路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../..", ".."))
+from exchange.exchange_standx.standx_protocol import codec
+
+EXCHANGE_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
+
+# 各 SDK 各自携带一份相同的 codec
+CODEC_COPIES = (
+    os.path.join(EXCHANGE_DIR, "exchange_standx", "standx_protocol", "codec.py"),
+    os.path.join(EXCHANGE_DIR, "exchange_grvt", "src", "pysdk", "grvt_codec.py"),
+    os.path.join(EXCHANGE_DIR, "exchange_lighter", "lighter", "codec.py"),
+)
+
+
+class Side(enum.Enum):
+    BUY = "buy"
+
+
+@dataclasses.dataclass
+class Leg:
+    size: Decimal
+    side: Side
+
+
+class TestCodec(unittest.TestCase):
+    """JSON codec unit tests"""
+
+    def testCopiesAreIdentical(self):
+        sources = []
+        for path in CODEC_COPIES:
+            with open(path, encoding="utf-8") as f:
+                sources.append(f.read())
+        for path, source in zip(CODEC_COPIES[1:], sources[1:]):
+            self.assertEqual(source, sources[0], f"{os.path.normpath(path)} 与 standx_protocol/codec.py 不一致")
+
+    def testDumpsIsCompact(self):
+        self.assertEqual(codec.dumps({"a": [1, 2], "b": None, "c": "价格"}), '{"a":[1,2],"b":null,"c":"价格"}')
+
+    def testDumpsPayloadTypes(self):
+        leg = Leg(Decimal("0.10"), Side.BUY)
+        self.assertEqual(codec.loads(codec.dumps({"leg": leg})), {"leg": {"size": "0.10", "side": "buy"}})
+        self.assertEqual(codec.dumps(2 ** 70), str(2 ** 70))
+        with self.assertRaises(TypeError):
+            codec.dumps(object())
+
+    def testLoads(self):
+        self.assertEqual(codec.loads(b'{"id":9007199254740993}'), {"id": 9007199254740993})
+        self.assertEqual(codec.loads('[1.5,"x"]'), [1.5, "x"])
+        self.assertTrue(math.isnan(codec.loads("NaN")))
+        with self.assertRaises(ValueError):
+            codec.loads("{")
+
+
+if __name__ == "__main__":
+    unittest.main()
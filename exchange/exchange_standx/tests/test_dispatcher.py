@@ -0,0 +1,133 @@
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+# 添加项目路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../..", ".."))
+from exchange.exchange_standx.standx_protocol.dispatcher import MessageDispatcher
+from exchange.exchange_standx.standx_protocol.perps_wss import StandXMarketStream
+
+
+async def drain():
+    """让各队列的处理任务跑完已放入的消息"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestMessageDispatcher(unittest.IsolatedAsyncioTestCase):
+    """MessageDispatcher unit tests"""
+
+    async def asyncSetUp(self):
+        self.received = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+        async def handler(data):
+            await self.release.wait()
+            if data.get("fail"):
+                raise ValueError("bad message")
+            self.received.append(data)
+            return data.get("handled", True)
+
+        self.dispatcher = MessageDispatcher(handler, conflate_channels=("price",), queue_size=2)
+
+    async def asyncTearDown(self):
+        self.dispatcher.close()
+
+    async def testMessagesOfOneKeyAreHandledInOrder(self):
+        for i in range(2):
+            self.dispatcher.put("order:BTC", "order", {"n": i})
+            self.dispatcher.put("order:ETH", "order", {"n": 10 + i})
+        await drain()
+        self.assertEqual([d["n"] for d in self.received if d["n"] < 10], [0, 1])
+        self.assertEqual([d["n"] for d in self.received if d["n"] >= 10], [10, 11])
+        self.assertEqual(self.dispatcher.stats()["order:BTC"]["delivered"], 2)
+
+    async def testConflatedChannelKeepsLatest(self):
+        self.release.clear()
+        self.dispatcher.put("price:BTC", "price", {"n": 0})
+        await drain()
+        for i in range(1, 4):
+            self.dispatcher.put("price:BTC", "price", {"n": i})
+        self.release.set()
+        await drain()
+        self.assertEqual([d["n"] for d in self.received], [0, 3])
+        self.assertEqual(self.dispatcher.stats()["price:BTC"]["dropped"], 2)
+
+    async def testFullQueueDropsOldest(self):
+        self.release.clear()
+        self.dispatcher.put("order:BTC", "order", {"n": 0})
+        await drain()
+        for i in range(1, 4):
+            self.dispatcher.put("order:BTC", "order", {"n": i})
+        self.release.set()
+        await drain()
+        self.assertEqual([d["n"] for d in self.received], [0, 2, 3])
+        stats = self.dispatcher.stats()["order:BTC"]
+        self.assertEqual((stats["dropped"], stats["high_water"], stats["depth"]), (1, 2, 0))
+
+    async def testUnhandledMessagesAreCounted(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for i in range(3):
+                self.dispatcher.put("order", "order", {"n": i, "handled": False})
+                await drain()
+        self.assertEqual(self.dispatcher.stats()["order"]["unhandled"], 3)
+        self.assertEqual(output.getvalue().count("无人处理"), 1)
+
+    async def testHandlerExceptionDoesNotStopQueue(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.dispatcher.put("order:BTC", "order", {"n": 0, "fail": True})
+            self.dispatcher.put("order:BTC", "order", {"n": 1})
+            await drain()
+        self.assertEqual([d["n"] for d in self.received], [1])
+        stats = self.dispatcher.stats()["order:BTC"]
+        self.assertEqual((stats["errors"], stats["delivered"]), (1, 2))
+        self.assertIn("bad message", output.getvalue())
+
+
+class TestMarketStreamRouting(unittest.IsolatedAsyncioTestCase):
+    """StandXMarketStream message routing unit tests"""
+
+    async def asyncSetUp(self):
+        self.stream = StandXMarketStream("wss://example.invalid")
+        self.received = []
+
+    async def asyncTearDown(self):
+        self.stream._dispatcher.close()
+
+    def deliver(self, data):
+        key, channel = self.stream._dispatch_key(data)
+        self.stream._dispatcher.put(key, channel, data)
+
+    async def testSymbolCallbackTakesPrecedence(self):
+        self.stream.callbacks["price:BTC-USD"] = lambda d: self.received.append(("btc", d))
+        self.stream.callbacks["price"] = lambda d: self.received.append(("any", d))
+        self.deliver({"channel": "price", "symbol": "BTC-USD"})
+        self.deliver({"channel": "price", "data": {"symbol": "ETH-USD"}})
+        await drain()
+        self.assertEqual([name for name, _ in self.received], ["btc", "any"])
+
+    async def testUnknownChannelIsCountedNotDropped(self):
+        async def on_order(data):
+            self.received.append(data)
+
+        self.stream.callbacks["order"] = on_order
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.deliver({"channel": "order", "data": {"symbol": "BTC-USD"}})
+            self.deliver({"channel": "position", "data": {"symbol": "BTC-USD"}})
+            self.deliver({"seq": 1})
+            await drain()
+        self.assertEqual(len(self.received), 1)
+        stats = self.stream.dispatch_stats()
+        self.assertEqual(stats["order:BTC-USD"]["unhandled"], 0)
+        self.assertEqual(stats["position:BTC-USD"]["unhandled"], 1)
+        self.assertEqual(stats["None"]["unhandled"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
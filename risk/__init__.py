@@ -2,6 +2,6 @@
 Risk Management Module
 风险控制模块
 """
-from risk.indicators import IndicatorTool
+from risk.indicators import IndicatorTool, WilderADX, IndicatorEngine, INDICATOR_COLUMNS
 
-__all__ = ["IndicatorTool"]
+__all__ = ["IndicatorTool", "WilderADX", "IndicatorEngine", "INDICATOR_COLUMNS"]
@@ -1,16 +1,244 @@
 """
 Technical Indicators Tool
 技术指标工具类
+
+ADX 使用 Wilder 平滑增量计算：每个 (交易对, 周期) 维护一个滚动 K 线缓冲区和
+平滑状态，新 K 线收盘时只做一次 O(1) 更新；计算结果缓存到当前 K 线收盘，
+收盘前重复调用不会访问网络。K 线既可以由 get_adx 按需从币安增量拉取，
+也可以通过 update_kline 由 K 线 WebSocket 推送驱动。
+
+IndicatorEngine 用 NumPy 环形缓冲区保存多个交易对/周期的 OHLCV，
+一次向量化计算得到全部交易对的 ATR、已实现波动率、布林带宽度和 RSI。
 """
+import copy
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 import requests
-import pandas as pd
-import talib
-from typing import Optional
+
+
+BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
+
+# 首次拉取的 K 线数量（与原先一次性计算使用的窗口一致）
+SEED_KLINE_LIMIT = 100
+
+# 拉取失败后的重试间隔（秒），避免在 1 秒循环里反复阻塞
+RETRY_SECONDS = 10.0
+
+_RESOLUTION_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800, "M": 2592000}
+
+
+def resolution_to_seconds(resolution: str) -> int:
+    """K 线周期转秒数，如 "5m" -> 300，"1h" -> 3600（"1M" 按 30 天计）"""
+    try:
+        return int(resolution[:-1]) * _RESOLUTION_UNITS[resolution[-1]]
+    except (KeyError, ValueError, IndexError):
+        raise ValueError(f"不支持的K线周期: {resolution}")
+
+
+def to_binance_symbol(symbol: str) -> str:
+    """转换交易对格式为币安格式: BTC-USD/BTC-USDT/BTC_USDT_Perp -> BTCUSDT"""
+    binance_symbol = symbol.upper().replace("_PERP", "").replace("-", "").replace("_", "")
+    if binance_symbol.endswith("USD") and not binance_symbol.endswith("USDT"):
+        binance_symbol = binance_symbol[:-3] + "USDT"
+    return binance_symbol
+
+
+class WilderADX:
+    """
+    增量 ADX（Wilder 平滑，与 TA-Lib ADX 的递推方式一致）
+
+    每次 update 传入一根已收盘 K 线，前 2*period-1 根之后开始输出 ADX。
+    """
+
+    def __init__(self, period: int = 14):
+        if period < 2:
+            raise ValueError("period 必须大于等于 2")
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """清空平滑状态"""
+        self._prev: Optional[Tuple[float, float, float]] = None
+        self._samples = 0
+        self._tr = 0.0
+        self._plus_dm = 0.0
+        self._minus_dm = 0.0
+        self._dx_samples = 0
+        self._dx_sum = 0.0
+        self._adx: Optional[float] = None
+
+    @property
+    def value(self) -> Optional[float]:
+        """当前 ADX，样本不足时为 None"""
+        return self._adx
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        """
+        输入一根已收盘 K 线
+
+        Returns:
+            Optional[float]: 更新后的 ADX
+        """
+        prev = self._prev
+        self._prev = (high, low, close)
+        if prev is None:
+            return self._adx
+        prev_high, prev_low, prev_close = prev
+
+        up_move = high - prev_high
+        down_move = prev_low - low
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+        period = self.period
+        self._samples += 1
+        if self._samples < period:
+            # 前 period-1 个样本直接累加作为平滑初值
+            self._tr += tr
+            self._plus_dm += plus_dm
+            self._minus_dm += minus_dm
+            return self._adx
+
+        self._tr += tr - self._tr / period
+        self._plus_dm += plus_dm - self._plus_dm / period
+        self._minus_dm += minus_dm - self._minus_dm / period
+
+        dx = 0.0
+        if self._tr != 0:
+            plus_di = 100.0 * self._plus_dm / self._tr
+            minus_di = 100.0 * self._minus_dm / self._tr
+            di_sum = plus_di + minus_di
+            if di_sum != 0:
+                dx = 100.0 * abs(plus_di - minus_di) / di_sum
+
+        if self._adx is None:
+            # 前 period 个 DX 取平均作为 ADX 初值
+            self._dx_samples += 1
+            self._dx_sum += dx
+            if self._dx_samples == period:
+                self._adx = self._dx_sum / period
+        else:
+            self._adx = (self._adx * (period - 1) + dx) / period
+        return self._adx
+
+    def peek(self, high: float, low: float, close: float) -> Optional[float]:
+        """计算加入一根未收盘 K 线后的 ADX，不修改状态"""
+        return copy.copy(self).update(high, low, close)
+
+
+class _ADXSeries:
+    """单个 (交易对, 周期, period) 的 K 线缓冲区、平滑状态和缓存"""
+
+    def __init__(self, period: int, interval_ms: int, maxlen: int):
+        self.adx = WilderADX(period)
+        self.interval_ms = interval_ms
+        # (open_time, high, low, close)，只保存已收盘 K 线
+        self.klines: Deque[Tuple[int, float, float, float]] = deque(maxlen=maxlen)
+        # 缓存有效期：当前未收盘 K 线的收盘时间（毫秒）
+        self.expires_at_ms = 0
+        self.retry_at = 0.0
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        return self.klines[-1][0] if self.klines else None
+
+    def append_closed(self, open_time: int, high: float, low: float, close: float) -> bool:
+        """追加一根已收盘 K 线；重复或过期的 K 线会被忽略"""
+        last = self.last_open_time
+        if last is not None and open_time <= last:
+            return False
+        self.klines.append((open_time, high, low, close))
+        self.adx.update(high, low, close)
+        self.expires_at_ms = open_time + 2 * self.interval_ms
+        return True
 
 
 class IndicatorTool:
-    """技术指标工具类"""
-    
+    """技术指标工具类（线程安全，建议整个进程共享一个实例）"""
+
+    def __init__(self, buffer_size: int = 500):
+        """
+        初始化指标工具
+
+        Args:
+            buffer_size: 每个交易对保留的已收盘 K 线数量
+        """
+        self.buffer_size = buffer_size
+        self._series: Dict[Tuple[str, str, int], _ADXSeries] = {}
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+
+    def _get_series(self, binance_symbol: str, resolution: str, period: int) -> _ADXSeries:
+        key = (binance_symbol, resolution, period)
+        series = self._series.get(key)
+        if series is None:
+            series = _ADXSeries(
+                period, resolution_to_seconds(resolution) * 1000, self.buffer_size
+            )
+            self._series[key] = series
+        return series
+
+    def _fetch_klines(
+        self, binance_symbol: str, resolution: str, start_time: Optional[int]
+    ) -> Optional[Sequence[Sequence[Any]]]:
+        """从币安拉取 K 线：首次拉取 SEED_KLINE_LIMIT 根，之后只拉取上次之后的 K 线"""
+        params: Dict[str, Any] = {"symbol": binance_symbol, "interval": resolution}
+        if start_time is None:
+            params["limit"] = SEED_KLINE_LIMIT
+        else:
+            params["startTime"] = start_time
+            params["limit"] = 1000
+
+        try:
+            response = self._session.get(BINANCE_KLINES_URL, params=params, timeout=5)
+        except requests.exceptions.RequestException as e:
+            print(f"ADX指标: 无法连接币安API - {type(e).__name__}")
+            return None
+
+        if not response.ok:
+            print(f"ADX指标: 币安API返回错误 - HTTP {response.status_code}")
+            return None
+
+        data = response.json()
+        if not data:
+            print(f"ADX指标: 币安API返回空数据")
+            return None
+        return data
+
+    def _sync_series(self, series: _ADXSeries, binance_symbol: str, resolution: str) -> None:
+        """把缓冲区补齐到最新一根已收盘 K 线"""
+        now_ms = int(time.time() * 1000)
+        last = series.last_open_time
+        if last is not None and now_ms - last > series.klines.maxlen * series.interval_ms:
+            # 中断太久，增量补齐的数据量超过缓冲区，重新播种
+            series.klines.clear()
+            series.adx.reset()
+            last = None
+
+        data = self._fetch_klines(
+            binance_symbol, resolution, None if last is None else last + 1
+        )
+        if data is None:
+            series.retry_at = time.monotonic() + RETRY_SECONDS
+            return
+
+        for kline in data:
+            # 币安 K 线: [open_time, open, high, low, close, volume, close_time, ...]
+            if int(kline[6]) >= now_ms:
+                continue  # 未收盘的 K 线不参与计算
+            series.append_closed(
+                int(kline[0]), float(kline[2]), float(kline[3]), float(kline[4])
+            )
+        series.expires_at_ms = max(
+            series.expires_at_ms,
+            (now_ms // series.interval_ms + 1) * series.interval_ms,
+        )
+
     def get_adx(
         self,
         symbol: str,
@@ -18,62 +246,268 @@ class IndicatorTool:
         period: int = 14
     ) -> Optional[float]:
         """
-        获取 ADX 指标（使用币安数据）
-        
+        获取 ADX 指标（使用币安数据，基于已收盘 K 线）
+
+        结果缓存到当前 K 线收盘；缓存过期后只增量拉取新收盘的 K 线。
+
         Args:
             symbol: 交易对符号 (e.g., "BTC-USD" 转换为 "BTCUSDT")
             resolution: 时间周期 (e.g., "1m", "5m", "15m", "1h", "4h", "1d", "1w", "1M")
             period: ADX 计算周期，默认 14
-            
+
         Returns:
             Optional[float]: ADX 值，如果计算失败返回 None
         """
         try:
-            # 转换交易对格式为币安格式: BTC-USD/BTC-USDT/BTC_USDT_Perp -> BTCUSDT
-            binance_symbol = symbol.upper().replace("_PERP", "").replace("-", "").replace("_", "")
-            if binance_symbol.endswith("USD") and not binance_symbol.endswith("USDT"):
-                binance_symbol = binance_symbol[:-3] + "USDT"
-            
-            # 从币安获取K线数据
-            url = f"https://api.binance.com/api/v3/klines"
-            params = {
-                "symbol": binance_symbol,
-                "interval": resolution,
-                "limit": 100
-            }
-            
-            try:
-                response = requests.get(url, params=params, timeout=5)
-            except requests.exceptions.RequestException as e:
-                print(f"ADX指标: 无法连接币安API - {type(e).__name__}")
-                return None
-            
-            if not response.ok:
-                print(f"ADX指标: 币安API返回错误 - HTTP {response.status_code}")
-                return None
-            
-            data = response.json()
-            if not data:
-                print(f"ADX指标: 币安API返回空数据")
-                return None
-            
-            # 转换为 DataFrame
-            df = pd.DataFrame(data, columns=[
-                'open_time', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            # 转换为数值类型
-            df['high'] = pd.to_numeric(df['high'])
-            df['low'] = pd.to_numeric(df['low'])
-            df['close'] = pd.to_numeric(df['close'])
-            
-            # 计算 ADX
-            adx = talib.ADX(df['high'], df['low'], df['close'], timeperiod=period)
-            
-            # 返回最新的 ADX 值
-            return float(adx.iloc[-1]) if not pd.isna(adx.iloc[-1]) else None
-            
+            binance_symbol = to_binance_symbol(symbol)
+            with self._lock:
+                series = self._get_series(binance_symbol, resolution, period)
+                now_ms = int(time.time() * 1000)
+                if now_ms >= series.expires_at_ms and time.monotonic() >= series.retry_at:
+                    self._sync_series(series, binance_symbol, resolution)
+                return series.adx.value
         except Exception:
             return None
+
+    def update_kline(
+        self,
+        symbol: str,
+        resolution: str,
+        kline: Dict[str, Any],
+        period: int = 14,
+    ) -> Optional[float]:
+        """
+        由 K 线推送更新缓冲区（如币安 <symbol>@kline_<interval> 流的 "k" 字段）
+
+        只有已收盘的 K 线（x 为 True）会进入计算，未收盘的推送被忽略。
+
+        Args:
+            symbol: 交易对符号
+            resolution: 时间周期
+            kline: K 线字典，字段 t(开盘时间) h l c x(是否收盘)
+            period: ADX 计算周期
+
+        Returns:
+            Optional[float]: 更新后的 ADX
+        """
+        binance_symbol = to_binance_symbol(symbol)
+        with self._lock:
+            series = self._get_series(binance_symbol, resolution, period)
+            if kline.get("x"):
+                if series.last_open_time is None:
+                    # 推送只有最新 K 线，历史部分仍需从 REST 播种
+                    self._sync_series(series, binance_symbol, resolution)
+                series.append_closed(
+                    int(kline["t"]), float(kline["h"]), float(kline["l"]), float(kline["c"])
+                )
+            return series.adx.value
+
+
+# IndicatorEngine 面板列
+INDICATOR_COLUMNS = ("close", "atr", "atr_pct", "realized_vol", "bb_width", "rsi")
+
+_SECONDS_PER_YEAR = 365 * 86400
+
+
+class IndicatorEngine:
+    """
+    多交易对向量化指标引擎
+
+    每个 (交易对, 周期) 占用环形缓冲区的一行，compute 对所有行做一次向量化计算，
+    结果写入预分配的面板；读取（get/row）不会分配新的数组。
+    缓冲区和面板按 max_rows 一次性分配，新增交易对不会重新分配内存，
+    已经交出去的 panel/row 视图在之后的写入和计算中始终有效。
+    Wilder 平滑（ATR、RSI）使用截断到缓冲区长度的指数权重点积实现，
+    缓冲区足够长时与逐根递推的结果一致。
+
+    非线程安全：写入和计算应在同一线程，或由调用方加锁。
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        max_rows: int = 64,
+        atr_period: int = 14,
+        rsi_period: int = 14,
+        vol_window: int = 30,
+        bb_period: int = 20,
+        bb_std: float = 2.0,
+    ):
+        """
+        初始化指标引擎
+
+        Args:
+            capacity: 每行保留的 K 线数量
+            max_rows: 最多容纳的 (交易对, 周期) 行数
+            atr_period: ATR 周期
+            rsi_period: RSI 周期
+            vol_window: 已实现波动率的收益率窗口
+            bb_period: 布林带周期
+            bb_std: 布林带标准差倍数
+        """
+        if capacity <= max(atr_period, rsi_period, vol_window, bb_period):
+            raise ValueError("capacity 必须大于所有指标周期")
+        if max_rows < 1:
+            raise ValueError("max_rows 必须大于等于 1")
+        self.capacity = capacity
+        self.max_rows = max_rows
+        self.atr_period = atr_period
+        self.rsi_period = rsi_period
+        self.vol_window = vol_window
+        self.bb_period = bb_period
+        self.bb_std = bb_std
+
+        self._rows: Dict[Tuple[str, str], int] = {}
+        self._keys: List[Tuple[str, str]] = []
+        # OHLCV 环形缓冲区 (行, 字段, 容量)，字段顺序 open high low close volume
+        self._bars = np.full((max_rows, 5, capacity), np.nan)
+        self._open_time = np.zeros((max_rows,), dtype=np.int64)
+        self._head = np.zeros((max_rows,), dtype=np.int64)  # 下一次写入的位置
+        self._annualize = np.zeros((max_rows,))
+        self._panel = np.full((max_rows, len(INDICATOR_COLUMNS)), np.nan)
+        self._panel_view = self._panel.view()
+        self._panel_view.flags.writeable = False
+
+        self._atr_weights = self._wilder_weights(atr_period, capacity - 1)
+        self._rsi_weights = self._wilder_weights(rsi_period, capacity - 1)
+
+    @staticmethod
+    def _wilder_weights(period: int, length: int) -> np.ndarray:
+        """Wilder 平滑 (alpha = 1/period) 的指数权重，最新一根在最后，权重和为 1"""
+        alpha = 1.0 / period
+        weights = alpha * (1.0 - alpha) ** np.arange(length - 1, -1, -1, dtype=float)
+        return weights / weights.sum()
+
+    def _add_row(self, symbol: str, interval: str) -> int:
+        row = len(self._keys)
+        if row >= self.max_rows:
+            raise ValueError(f"指标引擎行数已满 ({self.max_rows})，无法添加 {symbol} {interval}")
+        annualize = np.sqrt(_SECONDS_PER_YEAR / resolution_to_seconds(interval))
+        self._rows[(symbol, interval)] = row
+        self._keys.append((symbol, interval))
+        self._annualize[row] = annualize
+        return row
+
+    def update(
+        self,
+        symbol: str,
+        interval: str,
+        open_time: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0.0,
+    ) -> None:
+        """
+        写入一根 K 线；开盘时间与最新一根相同时覆盖（未收盘 K 线的更新），更早的忽略
+        """
+        row = self._rows.get((symbol, interval))
+        if row is None:
+            row = self._add_row(symbol, interval)
+
+        last_open_time = self._open_time[row]
+        if open_time < last_open_time:
+            return
+        if open_time == last_open_time:
+            slot = (self._head[row] - 1) % self.capacity
+        else:
+            slot = self._head[row]
+            self._head[row] = (slot + 1) % self.capacity
+            self._open_time[row] = open_time
+        self._bars[row, :, slot] = (open_, high, low, close, volume)
+
+    def load_klines(self, symbol: str, interval: str, klines: Sequence[Sequence[Any]]) -> None:
+        """批量写入币安格式的 K 线 [open_time, open, high, low, close, volume, ...]"""
+        for kline in klines:
+            self.update(
+                symbol, interval, int(kline[0]),
+                float(kline[1]), float(kline[2]), float(kline[3]), float(kline[4]), float(kline[5]),
+            )
+
+    def compute(self) -> np.ndarray:
+        """
+        对所有交易对做一次向量化计算，结果写入面板
+
+        数据不足的行对应指标为 NaN。
+
+        Returns:
+            np.ndarray: 只读面板 (行, INDICATOR_COLUMNS)
+        """
+        count = len(self._keys)
+        if not count:
+            return self._panel_view[:0]
+
+        # 按时间顺序排列的视图：最旧在前，最新在后
+        order = (self._head[:count, None] + np.arange(self.capacity)) % self.capacity
+        rows = np.arange(count)[:, None]
+        high = self._bars[:, 1, :][rows, order]
+        low = self._bars[:, 2, :][rows, order]
+        close = self._bars[:, 3, :][rows, order]
+        prev_close = close[:, :-1]
+        last_close = close[:, -1]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # ATR：真实波幅的 Wilder 平滑
+            true_range = np.maximum.reduce([
+                high[:, 1:] - low[:, 1:],
+                np.abs(high[:, 1:] - prev_close),
+                np.abs(low[:, 1:] - prev_close),
+            ])
+            atr = self._weighted_tail(true_range, self._atr_weights, self.atr_period)
+
+            # RSI：涨跌幅的 Wilder 平滑
+            change = close[:, 1:] - prev_close
+            avg_gain = self._weighted_tail(np.clip(change, 0, None), self._rsi_weights, self.rsi_period)
+            avg_loss = self._weighted_tail(np.clip(-change, 0, None), self._rsi_weights, self.rsi_period)
+            rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+            # 已实现波动率：对数收益率标准差，按周期年化
+            returns = np.log(close[:, -self.vol_window:] / close[:, -self.vol_window - 1:-1])
+            realized_vol = returns.std(axis=1, ddof=1) * self._annualize[:count]
+
+            # 布林带宽度：(上轨 - 下轨) / 中轨
+            window = close[:, -self.bb_period:]
+            bb_width = 2.0 * self.bb_std * window.std(axis=1) / window.mean(axis=1)
+
+            panel = self._panel[:count]
+            panel[:, 0] = last_close
+            panel[:, 1] = atr
+            panel[:, 2] = atr / last_close
+            panel[:, 3] = realized_vol
+            panel[:, 4] = bb_width
+            panel[:, 5] = rsi
+        return self._panel_view[:count]
+
+    @staticmethod
+    def _weighted_tail(values: np.ndarray, weights: np.ndarray, period: int) -> np.ndarray:
+        """指数加权点积；缺失数据（NaN）不足 period 根时结果为 NaN"""
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+        # 只有部分历史时，按有效部分的权重和归一化
+        weight_sum = valid @ weights
+        result = (filled @ weights) / weight_sum
+        result[valid.sum(axis=1) < period] = np.nan
+        return result
+
+    @property
+    def panel(self) -> np.ndarray:
+        """最近一次 compute 的只读面板 (行, INDICATOR_COLUMNS)，只包含已添加的行"""
+        return self._panel_view[:len(self._keys)]
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """面板各行对应的 (交易对, 周期)"""
+        return list(self._keys)
+
+    def row(self, symbol: str, interval: str) -> Optional[np.ndarray]:
+        """某个交易对的指标行（只读视图，不复制），列顺序见 INDICATOR_COLUMNS"""
+        row = self._rows.get((symbol, interval))
+        return None if row is None else self._panel_view[row]
+
+    def get(self, symbol: str, interval: str, name: str) -> Optional[float]:
+        """读取单个指标值，没有数据时返回 None"""
+        row = self._rows.get((symbol, interval))
+        if row is None:
+            return None
+        value = self._panel[row, INDICATOR_COLUMNS.index(name)]
+        return None if np.isnan(value) else float(value)
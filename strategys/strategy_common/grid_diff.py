@@ -0,0 +1,163 @@
+"""
+网格增量比对
+
+把目标网格与当前挂单比对，生成最小编辑脚本：保留（keep）、改价（amend）、
+撤单（cancel）、下单（place）。价格移动 k 个步长时，只有移出网格的 k 个价位
+需要处理；交易所支持改单时，这些价位直接改价到新价位，消息数减半，
+不需要移动的价位保持原订单（保留队列位置）。
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class SideDiff:
+    """单边（做多或做空）的编辑脚本"""
+    def __init__(
+        self,
+        keep: List,
+        amend: List[Tuple],
+        cancel: List,
+        place: List,
+    ):
+        self.keep = keep
+        # (订单ID, 原价格, 新价格)
+        self.amend = amend
+        # 订单ID
+        self.cancel = cancel
+        # 价格
+        self.place = place
+
+    @property
+    def message_count(self) -> int:
+        """执行本编辑脚本需要的订单操作数"""
+        return len(self.amend) + len(self.cancel) + len(self.place)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SideDiff(keep={len(self.keep)}, amend={self.amend}, "
+            f"cancel={self.cancel}, place={self.place})>"
+        )
+
+
+class GridDiff:
+    """做多、做空两边的编辑脚本"""
+    def __init__(self, long: SideDiff, short: SideDiff):
+        self.long = long
+        self.short = short
+
+    @property
+    def is_empty(self) -> bool:
+        return self.long.message_count == 0 and self.short.message_count == 0
+
+    @property
+    def message_count(self) -> int:
+        return self.long.message_count + self.short.message_count
+
+    def __repr__(self) -> str:
+        return f"<GridDiff(long={self.long}, short={self.short})>"
+
+
+def diff_side(
+    target: Sequence,
+    current: Dict[object, List],
+    allow_amend: bool = False,
+) -> SideDiff:
+    """
+    计算单边的编辑脚本
+
+    Args:
+        target: 目标价格列表
+        current: 当前价格 -> 订单ID列表（同 get_pending_orders_arrays 的映射）
+        allow_amend: 是否把移出网格的订单改价到新价位
+
+    Returns:
+        SideDiff: 编辑脚本，各列表按价格升序
+    """
+    target_set = set(target)
+    keep = []
+    cancel = []
+    # 移出网格的价位上可用于改价的订单 (价格, 订单ID)
+    movable = []
+    for price in sorted(current):
+        order_ids = current[price]
+        if price in target_set:
+            keep.append(price)
+            # 每个价位只保留一个订单，重复的撤掉
+            cancel.extend(order_ids[1:])
+        elif order_ids:
+            movable.append((price, order_ids[0]))
+            cancel.extend(order_ids[1:])
+    place = sorted(price for price in target_set if price not in current)
+
+    amend = []
+    if allow_amend:
+        # 按价格顺序一一配对：网格平移 k 步时，移出的 k 个订单改到新进入的 k 个价位
+        pairs = min(len(movable), len(place))
+        amend = [
+            (order_id, old_price, new_price)
+            for (old_price, order_id), new_price in zip(movable[:pairs], place[:pairs])
+        ]
+        movable = movable[pairs:]
+        place = place[pairs:]
+
+    cancel.extend(order_id for _, order_id in movable)
+    return SideDiff(keep=keep, amend=amend, cancel=cancel, place=place)
+
+
+class GridReconciler:
+    """
+    网格比对器
+
+    记录上一次的目标网格；目标未变且当前挂单价位正好覆盖目标时直接返回空脚本，
+    价格在同一个网格步长内波动时不需要逐价位比对。
+    """
+
+    def __init__(self):
+        self._last_target: Optional[Tuple[Tuple, Tuple]] = None
+
+    def diff(
+        self,
+        target_long: Sequence,
+        target_short: Sequence,
+        long_price_to_ids: Dict[object, List],
+        short_price_to_ids: Dict[object, List],
+        allow_amend: bool = False,
+    ) -> GridDiff:
+        """
+        计算从当前挂单到目标网格的最小编辑脚本
+
+        Args:
+            target_long: 目标做多数组
+            target_short: 目标做空数组
+            long_price_to_ids: 当前做多价格 -> 订单ID列表
+            short_price_to_ids: 当前做空价格 -> 订单ID列表
+            allow_amend: 交易所是否支持改单
+
+        Returns:
+            GridDiff: 编辑脚本
+        """
+        target = (tuple(target_long), tuple(target_short))
+        if (
+            target == self._last_target
+            and self._covers(target_long, long_price_to_ids)
+            and self._covers(target_short, short_price_to_ids)
+        ):
+            return GridDiff(
+                SideDiff(keep=sorted(target_long), amend=[], cancel=[], place=[]),
+                SideDiff(keep=sorted(target_short), amend=[], cancel=[], place=[]),
+            )
+        self._last_target = target
+        return GridDiff(
+            diff_side(target_long, long_price_to_ids, allow_amend),
+            diff_side(target_short, short_price_to_ids, allow_amend),
+        )
+
+    @staticmethod
+    def _covers(target: Sequence, price_to_ids: Dict[object, List]) -> bool:
+        """当前挂单价位与目标网格完全一致，且每个价位只有一个订单"""
+        return len(price_to_ids) == len(target) and all(
+            len(price_to_ids.get(price, ())) == 1 for price in target
+        )
+
+    def reset(self) -> None:
+        """清除记录的目标网格（例如对账后挂单状态未知时）"""
+        self._last_target = None
@@ -0,0 +1,141 @@
+"""
+事件驱动网格引擎
+
+订阅交易所的价格推送和订单推送，只有在目标网格发生变化、
+自身订单成交/撤销，或者超过 resync_interval 未同步时才触发重新挂单，
+替代 while True + time.sleep 的轮询循环。
+
+阻塞的 REST 调用（撤单、下单、持仓查询）放在线程中执行，
+执行期间到达的事件只会合并为一次后续的重新挂单，不会堆积。
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+# 触发重新挂单的订单状态：成交或撤销意味着网格上出现了空位
+REQUOTE_ORDER_STATUSES = ("partially_filled", "filled", "cancelled", "rejected")
+
+
+def extract_price(ticker: Dict[str, Any]) -> Optional[float]:
+    """从 ticker 字典中取出用于计算网格的价格"""
+    return ticker.get('last_price') or ticker.get('mid_price') or ticker.get('mark_price')
+
+
+class EventGridEngine:
+    """事件驱动网格引擎"""
+
+    def __init__(
+        self,
+        adapter,
+        symbol: str,
+        build_grid: Callable[[float], Tuple[Sequence[int], Sequence[int]]],
+        requote: Callable[[float, Sequence[int], Sequence[int]], None],
+        resync_interval: float = 30.0,
+        order_cache=None,
+    ):
+        """
+        初始化事件驱动网格引擎
+
+        Args:
+            adapter: 适配器实例
+            symbol: 交易对符号
+            build_grid: 根据价格计算 (做多价位, 做空价位)（tick 数），必须是无 I/O 的纯计算
+            requote: 根据价格和目标网格同步订单，阻塞调用，在线程中执行
+            resync_interval: 没有事件时的强制同步间隔（秒），同时作为无推送时的轮询间隔
+            order_cache: 已订阅订单推送的 OrderStateCache；提供时从缓存接收订单事件，
+                不再单独订阅（交易所每个频道只保留一个回调）
+        """
+        self.adapter = adapter
+        self.symbol = symbol
+        self.build_grid = build_grid
+        self.requote = requote
+        self.resync_interval = resync_interval
+        self.order_cache = order_cache
+
+        self.last_price: Optional[float] = None
+        self._last_tick_time: Optional[float] = None
+        self._target: Optional[Tuple[Sequence[int], Sequence[int]]] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._ticker_streaming = False
+        self._unsubscribe_orders: Optional[Callable[[], None]] = None
+
+    def on_ticker(self, ticker: Dict[str, Any]) -> None:
+        """价格推送回调：只有目标网格变化时才唤醒挂单任务"""
+        price = extract_price(ticker)
+        if price is None:
+            return
+        self.last_price = price
+        self._last_tick_time = time.monotonic()
+
+        grid = self.build_grid(price)
+        if grid != self._target:
+            self._target = grid
+            self._wakeup.set()
+
+    def on_order(self, order) -> None:
+        """订单推送回调：自身订单成交或撤销时唤醒挂单任务"""
+        if order.status in REQUOTE_ORDER_STATUSES:
+            self._wakeup.set()
+
+    async def _subscribe(self) -> None:
+        """订阅价格和订单推送，交易所未实现时退回 REST 轮询"""
+        try:
+            await self.adapter.subscribe_ticker(self.symbol, self.on_ticker)
+            self._ticker_streaming = True
+        except NotImplementedError as e:
+            print(f"{e}，价格退回 REST 轮询（间隔 {self.resync_interval} 秒）")
+
+        if self.order_cache is not None:
+            self.order_cache.add_listener(self.on_order)
+            return
+        try:
+            self._unsubscribe_orders = await self.adapter.subscribe_orders(self.symbol, self.on_order)
+        except NotImplementedError as e:
+            print(f"{e}，依赖定时同步发现成交")
+
+    def _price_is_stale(self) -> bool:
+        """推送中断或尚未收到价格时，需要通过 REST 补一次价格"""
+        if not self._ticker_streaming or self._last_tick_time is None:
+            return True
+        return time.monotonic() - self._last_tick_time > self.resync_interval
+
+    async def _requote(self) -> None:
+        """按最新价格计算网格并在线程中同步订单"""
+        if self._price_is_stale():
+            ticker = await asyncio.to_thread(self.adapter.get_ticker, self.symbol)
+            price = extract_price(ticker)
+            if price is not None:
+                self.last_price = price
+
+        if self.last_price is None:
+            return
+
+        price = self.last_price
+        long_grid, short_grid = self.build_grid(price)
+        self._target = (long_grid, short_grid)
+        await asyncio.to_thread(self.requote, price, long_grid, short_grid)
+
+    async def run(self) -> None:
+        """运行引擎，直到任务被取消"""
+        self._wakeup = asyncio.Event()
+        await self._subscribe()
+
+        # 启动时先同步一次
+        self._wakeup.set()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.resync_interval)
+                except asyncio.TimeoutError:
+                    pass
+                # 先清除再执行：执行期间到达的事件会在下一轮合并处理
+                self._wakeup.clear()
+                try:
+                    await self._requote()
+                except Exception as e:
+                    print(f"重新挂单错误: {e}")
+        finally:
+            # 取消本次注册的订单回调，引擎重启时不会重复回调
+            if self._unsubscribe_orders is not None:
+                self._unsubscribe_orders()
+                self._unsubscribe_orders = None
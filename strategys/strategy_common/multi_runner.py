@@ -0,0 +1,199 @@
+"""
+多市场网格策略运行器
+
+在一个进程中运行 config.yaml 中 markets 列出的多个 (交易所, 交易对, 网格参数)：
+- 每个交易所只创建、认证一个适配器，同一交易所的市场共用连接池、WebSocket 连接和批量执行器
+- ADX 指标由 notrade_mm.INDICATOR_TOOL 统一缓存，同一交易对只拉取一次
+- 每个市场是事件循环中的一个任务，阻塞的 REST 调用在有界线程池中执行
+- 单个市场出错只影响自身，记录错误后按间隔重试
+
+配置示例:
+    markets:
+      - exchange: standx
+        symbol: BTC-USD
+      - exchange: grvt
+        symbol: ETH-USDT
+        grid:
+          price_step: 2
+          order_quantity: 0.05
+
+每个市场的 grid / risk / cancel_stale_orders 覆盖顶层同名配置中的对应字段。
+"""
+import sys
+import os
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# 添加项目根目录到路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, '..', '..'))
+sys.path.insert(0, project_root)
+
+from adapters import create_adapter
+from strategys.strategy_common.notrade_mm import (
+    GridMarket,
+    load_config,
+    convert_symbol_format,
+    run_strategy_cycle,
+    run_event_engine,
+)
+
+
+def load_markets(config):
+    """从配置中解析市场列表
+
+    Args:
+        config: load_config 返回的配置字典
+
+    Returns:
+        (exchange_configs, markets): 交易所配置字典（已去掉 symbol），
+        以及 [(交易所名称, GridMarket, 运行模式)] 列表
+    """
+    if 'exchanges' not in config:
+        raise ValueError("配置错误: 必须提供 exchanges 配置")
+    if not config.get('markets'):
+        raise ValueError("配置错误: 必须提供 markets 配置")
+
+    base_grid = config.get('grid', {})
+    base_risk = config.get('risk', {})
+    base_cancel_stale = config.get('cancel_stale_orders', {})
+
+    exchange_configs = {}
+    markets = []
+    seen = set()
+    for entry in config['markets']:
+        exchange_key = entry.get('exchange')
+        if exchange_key not in config['exchanges']:
+            raise ValueError(f"配置错误: 交易所 '{exchange_key}' 在 exchanges 中不存在")
+
+        if exchange_key not in exchange_configs:
+            exchange_config = config['exchanges'][exchange_key].copy()
+            exchange_config.pop('symbol', None)
+            exchange_configs[exchange_key] = exchange_config
+        exchange_name = exchange_configs[exchange_key].get('exchange_name', exchange_key)
+
+        raw_symbol = entry.get('symbol')
+        if not raw_symbol:
+            raise ValueError(f"配置错误: markets 中交易所 '{exchange_key}' 的条目缺少 symbol")
+        symbol = convert_symbol_format(raw_symbol, exchange_name)
+
+        name = f"{exchange_key}:{symbol}"
+        if name in seen:
+            raise ValueError(f"配置错误: 市场 {name} 重复配置")
+        seen.add(name)
+
+        grid_config = {**base_grid, **entry.get('grid', {})}
+        market = GridMarket(
+            name,
+            symbol,
+            grid_config,
+            {**base_risk, **entry.get('risk', {})},
+            {**base_cancel_stale, **entry.get('cancel_stale_orders', {})},
+        )
+        engine_mode = entry.get('engine') or grid_config.get('engine', 'poll')
+        markets.append((exchange_key, market, engine_mode))
+
+    return exchange_configs, markets
+
+
+async def run_market_poll(adapter, market, cycle_slots):
+    """轮询模式运行单个市场，错误只影响本市场"""
+    sleep_interval = market.grid_config.get('sleep_interval', 60)
+    while True:
+        try:
+            async with cycle_slots:
+                await asyncio.to_thread(run_strategy_cycle, adapter, market)
+        except Exception as e:
+            print(f"[{market.name}] 策略循环错误: {e}")
+        await asyncio.sleep(sleep_interval)
+
+
+async def run_market_event(adapter, market):
+    """事件驱动模式运行单个市场，引擎异常退出后按 resync_interval 重启"""
+    restart_delay = market.grid_config.get('resync_interval', 30)
+    while True:
+        try:
+            await run_event_engine(adapter, market)
+        except Exception as e:
+            print(f"[{market.name}] 事件引擎错误: {e}，{restart_delay} 秒后重启")
+        await asyncio.sleep(restart_delay)
+
+
+async def run_markets(adapters, markets, max_workers):
+    """在同一个事件循环中运行所有市场
+
+    Args:
+        adapters: 交易所名称 -> 已连接的适配器
+        markets: [(交易所名称, GridMarket, 运行模式)]
+        max_workers: 同时执行的阻塞调用上限（线程池大小）
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="market-cycle")
+    )
+    # 轮询模式的策略循环共用线程池，限制同时进行的循环数
+    cycle_slots = asyncio.Semaphore(max_workers)
+
+    tasks = []
+    for exchange_key, market, engine_mode in markets:
+        adapter = adapters[exchange_key]
+        if engine_mode == 'event':
+            coro = run_market_event(adapter, market)
+        else:
+            coro = run_market_poll(adapter, market, cycle_slots)
+        tasks.append(asyncio.create_task(coro, name=market.name))
+    await asyncio.gather(*tasks)
+
+
+def connect_adapters(exchange_configs):
+    """每个交易所创建并认证一个适配器，连接失败的交易所跳过"""
+    adapters = {}
+    for exchange_key, exchange_config in exchange_configs.items():
+        try:
+            adapter = create_adapter(exchange_config)
+            adapter.connect()
+            adapters[exchange_key] = adapter
+            print(f"交易所 {exchange_key} 连接成功")
+        except Exception as e:
+            print(f"交易所 {exchange_key} 连接失败: {e}")
+    return adapters
+
+
+def main():
+    parser = argparse.ArgumentParser(description='多市场网格交易策略（单进程运行 config.yaml 中的 markets）')
+    parser.add_argument(
+        '-c', '--config',
+        type=str,
+        default='config.yaml',
+        help='指定配置文件路径（默认: config.yaml）'
+    )
+    args = parser.parse_args()
+
+    try:
+        print(f"加载配置文件: {args.config}")
+        config = load_config(args.config)
+        exchange_configs, markets = load_markets(config)
+    except Exception as e:
+        print(f"加载配置文件失败: {e}")
+        sys.exit(1)
+
+    adapters = connect_adapters(exchange_configs)
+    markets = [item for item in markets if item[0] in adapters]
+    if not markets:
+        print("没有可运行的市场")
+        sys.exit(1)
+
+    runner_config = config.get('runner', {})
+    max_workers = int(runner_config.get('max_workers', min(len(markets), 8)))
+
+    print(f"运行 {len(markets)} 个市场: {', '.join(market.name for _, market, _ in markets)}")
+    print("策略开始运行，按 Ctrl+C 停止...\n")
+    try:
+        asyncio.run(run_markets(adapters, markets, max_workers))
+    except KeyboardInterrupt:
+        print("\n\n策略已停止")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,21 @@ import sys
 import os
 import yaml
 import time
+import asyncio
 import random
 import argparse
-from decimal import Decimal
+import functools
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.insert(0, project_root)
 
-from adapters import create_adapter
+from adapters import create_adapter, OrderRequest, AmendRequest
+from adapters.order_cache import OrderStateCache
 from risk import IndicatorTool
+from strategys.strategy_common.grid_engine import EventGridEngine
+from strategys.strategy_common.grid_diff import GridReconciler
 
 # 全局配置变量
 EXCHANGE_CONFIG = None
@@ -24,6 +29,54 @@ GRID_CONFIG = None
 RISK_CONFIG = None
 CANCEL_STALE_ORDERS_CONFIG = None
 
+# 当前运行的市场（单市场模式下由 initialize_config 创建）
+MARKET = None
+
+# 共享的指标工具：ADX 缓存到当前 K 线收盘，避免每轮重新拉取和计算
+INDICATOR_TOOL = IndicatorTool()
+
+
+class GridMarket:
+    """单个网格市场（交易所 + 交易对 + 网格参数）的配置与运行状态
+    
+    策略函数通过 market 参数读取配置，多个市场可以在同一进程中并行运行。
+    """
+    def __init__(
+        self,
+        name,
+        symbol,
+        grid_config,
+        risk_config=None,
+        cancel_stale_config=None,
+    ):
+        self.name = name
+        self.symbol = symbol
+        self.grid_config = grid_config
+        self.risk_config = risk_config or {}
+        self.cancel_stale_config = cancel_stale_config or {}
+        # 记录上一次目标网格，用于增量比对
+        self.reconciler = GridReconciler()
+        # 交易对精度信息，每轮由 resolve_instrument 从适配器缓存中读取
+        self.instrument = None
+    
+    @property
+    def tick_size(self):
+        """价格最小变动单位：交易所精度信息优先，其次 grid.tick_size 配置，默认 1"""
+        if self.instrument is not None:
+            return self.instrument.tick_size
+        return Decimal(str(self.grid_config.get('tick_size', 1)))
+    
+    def to_price(self, ticks):
+        """将网格价位（tick 数）换算为价格"""
+        return ticks * self.tick_size
+    
+    def format_prices(self, ticks_list):
+        """把价位列表格式化为价格，用于打印"""
+        return "[" + ", ".join(str(self.to_price(ticks)) for ticks in ticks_list) + "]"
+    
+    def __repr__(self):
+        return f"<GridMarket({self.name}, symbol={self.symbol})>"
+
 
 def load_config(config_file="config.yaml"):
     """
@@ -55,7 +108,7 @@ def convert_symbol_format(symbol, exchange_name):
     
     Args:
         symbol: 原始交易对，如 "BTC-USDT" 或 "BTC-USD"
-        exchange_name: 交易所名称，如 "standx" 或 "grvt"
+        exchange_name: 交易所名称，如 "standx"、"grvt" 或 "lighter"
     
     Returns:
         转换后的交易对格式
@@ -67,6 +120,9 @@ def convert_symbol_format(symbol, exchange_name):
             base, quote = symbol.split("-", 1)
             return f"{base}_{quote}_Perp"
         return symbol
+    elif exchange_name.lower() == "lighter":
+        # Lighter 永续合约以 USD 计价，交易对只用基础币种，如 "BTC-USD" -> "BTC"
+        return symbol.split("-", 1)[0]
     else:
         # StandX 等其他交易所保持原格式
         return symbol
@@ -83,6 +139,7 @@ def convert_symbol_for_adx(symbol):
                - "BTC-USD" (StandX 格式)
                - "BTC-USDT" (通用格式)
                - "BTC_USDT_Perp" (GRVT 格式)
+               - "BTC" (Lighter 格式)
     
     Returns:
         转换后的交易对格式，用于 ADX 指标计算
@@ -90,6 +147,9 @@ def convert_symbol_for_adx(symbol):
     if "_" in symbol and "_Perp" in symbol:
         # GRVT 格式: BTC_USDT_Perp -> BTC-USDT
         return symbol.replace("_Perp", "").replace("_", "-")
+    elif symbol.isalnum():
+        # Lighter 格式: BTC -> BTC-USD
+        return f"{symbol}-USD"
     else:
         # StandX 等其他格式保持原样
         return symbol
@@ -106,7 +166,7 @@ def initialize_config(config_file="config.yaml", active_exchange_override=None):
         config_file: 配置文件路径
         active_exchange_override: 通过命令行参数指定的交易所名称（必需）
     """
-    global EXCHANGE_CONFIG, SYMBOL, GRID_CONFIG, RISK_CONFIG, CANCEL_STALE_ORDERS_CONFIG
+    global EXCHANGE_CONFIG, SYMBOL, GRID_CONFIG, RISK_CONFIG, CANCEL_STALE_ORDERS_CONFIG, MARKET
     
     config = load_config(config_file)
     
@@ -135,10 +195,56 @@ def initialize_config(config_file="config.yaml", active_exchange_override=None):
     GRID_CONFIG = config['grid']
     RISK_CONFIG = config.get('risk', {})
     CANCEL_STALE_ORDERS_CONFIG = config.get('cancel_stale_orders', {})
+    MARKET = GridMarket(
+        active_exchange_name, SYMBOL, GRID_CONFIG, RISK_CONFIG, CANCEL_STALE_ORDERS_CONFIG
+    )
+
+
+def resolve_instrument(adapter, market=None):
+    """从适配器缓存读取交易对精度信息，交易所未提供时使用 grid.tick_size（默认 1）
+    
+    Args:
+        adapter: 适配器实例
+        market: 网格市场，默认为当前市场
+    
+    Returns:
+        Optional[Instrument]: 精度信息，交易所未提供时为 None
+    """
+    market = market or MARKET
+    try:
+        instrument = adapter.get_instrument(market.symbol)
+    except Exception as e:
+        print(f"获取 {market.symbol} 精度信息失败: {e}")
+        return market.instrument
+    if instrument is not None:
+        market.instrument = instrument
+    return market.instrument
+
+
+@functools.lru_cache(maxsize=256)
+def _grid_ladder(bid_base, ask_base, step, long_count, short_count):
+    """按步长生成升序价位，价格在同一个步长内波动时直接复用上一次的结果"""
+    long_grid = tuple(range(bid_base - (long_count - 1) * step, bid_base + 1, step)) if long_count > 0 else ()
+    short_grid = tuple(range(ask_base, ask_base + short_count * step, step)) if short_count > 0 else ()
+    return long_grid, short_grid
 
 
-def generate_grid_arrays(current_price, price_step, grid_count, price_spread):
-    """根据当前价格和价格间距生成做多数组和做空数组，过滤超过当前价格上下1%的价格"""
+def generate_grid_arrays(current_price, price_step, grid_count, price_spread, tick_size=1):
+    """根据当前价格和价格间距生成做多数组和做空数组，过滤超过当前价格上下1%的价格
+    
+    价位以 tick 数（整数）表示，tick_size 为 1 时即整数价格。价格只在入口换算一次，
+    之后全部是整数运算，价位严格对齐到 tick 和 price_step 的整数倍。
+    
+    Args:
+        current_price: 当前价格
+        price_step: 网格价格间隔（不足一个 tick 时按一个 tick）
+        grid_count: 每个方向的网格数量
+        price_spread: 当前价格与网格中心的距离
+        tick_size: 价格最小变动单位
+    
+    Returns:
+        (long_grid, short_grid): 升序的做多/做空价位元组
+    """
     if price_step <= 0:
         raise ValueError("price_step 必须大于 0")
     if grid_count < 0:
@@ -146,44 +252,39 @@ def generate_grid_arrays(current_price, price_step, grid_count, price_spread):
     if price_spread < 0:
         raise ValueError("price_spread 必须大于等于 0")
     
+    tick = Decimal(str(tick_size))
+    price = Decimal(str(current_price))
+    spread = Decimal(str(price_spread))
+    step = max(1, int((Decimal(str(price_step)) / tick).to_integral_value(ROUND_CEILING)))
+    
     # 计算价格上下限（当前价格的上下1%）
-    price_upper_limit = current_price * 1.01  # 上限：当前价格 +1%
-    price_lower_limit = current_price * 0.99   # 下限：当前价格 -1%
-    
-    # 计算 bid 和 ask 价格
-    bid_price = current_price - price_spread
-    ask_price = current_price + price_spread
-    
-    # 将 bid 价格向下取整到最近的 price_step 倍数
-    bid_base = int(bid_price / price_step) * price_step
-    
-    # 将 ask 价格向上取整到最近的 price_step 倍数
-    ask_base = int((ask_price + price_step - 1) / price_step) * price_step
-    
-    # 做多数组：从 bid_base 向下 grid_count 个（包括 bid_base）
-    long_grid = []
-    for i in range(grid_count):
-        price = bid_base - i * price_step
-        # 过滤：做多价格不能低于当前价格的1%（即不能低于 price_lower_limit）
-        if price >= price_lower_limit:
-            long_grid.append(price)
-    long_grid = sorted(long_grid)
-    
-    # 做空数组：从 ask_base 向上 grid_count 个（包括 ask_base）
-    short_grid = []
-    for i in range(grid_count):
-        price = ask_base + i * price_step
-        # 过滤：做空价格不能超过当前价格的1%（即不能高于 price_upper_limit）
-        if price <= price_upper_limit:
-            short_grid.append(price)
-    short_grid = sorted(short_grid)
+    upper_limit = int((price * Decimal("1.01") / tick).to_integral_value(ROUND_FLOOR))
+    lower_limit = int((price * Decimal("0.99") / tick).to_integral_value(ROUND_CEILING))
     
-    return long_grid, short_grid
+    # bid 价格向下取整到最近的 price_step 倍数，ask 价格向上取整到最近的 price_step 倍数
+    bid_ticks = int(((price - spread) / tick).to_integral_value(ROUND_FLOOR))
+    ask_ticks = int(((price + spread) / tick).to_integral_value(ROUND_CEILING))
+    bid_base = bid_ticks // step * step
+    ask_base = -(-ask_ticks // step) * step
+    if ask_base <= bid_base:
+        # spread 为 0 且价格正好落在步长上时，买卖价位不能重合
+        ask_base = bid_base + step
 
+    # 做多从 bid_base 向下、做空从 ask_base 向上各 grid_count 个，超出上下限的价位不挂
+    long_count = min(grid_count, (bid_base - lower_limit) // step + 1)
+    short_count = min(grid_count, (upper_limit - ask_base) // step + 1)
+    return _grid_ladder(bid_base, ask_base, step, long_count, short_count)
 
-def get_pending_orders_arrays(adapter, symbol):
+
+def get_pending_orders_arrays(adapter, symbol, order_cache=None, tick_size=None):
     """获取当前账号未成交订单数组，按做多和做空分类，同时返回价格到订单ID的映射
     
+    Args:
+        adapter: 适配器实例
+        symbol: 交易对符号
+        order_cache: 订单缓存（OrderStateCache），为 None 时从 REST 拉取一次快照
+        tick_size: 价格最小变动单位，价位以 tick 数表示；默认为 1（整数价格）
+    
     Returns:
         (long_prices, short_prices, long_price_to_ids, short_price_to_ids):
         - long_prices: 做多价格数组
@@ -192,39 +293,10 @@ def get_pending_orders_arrays(adapter, symbol):
         - short_price_to_ids: 做空价格到订单ID列表的字典映射
     """
     try:
-        open_orders = adapter.get_open_orders(symbol=symbol)
-        
-        # 做多订单：side 为 "buy" 或 "long"
-        long_prices = []
-        long_price_to_ids = {}  # 价格 -> 订单ID列表
-        # 做空订单：side 为 "sell" 或 "short"
-        short_prices = []
-        short_price_to_ids = {}  # 价格 -> 订单ID列表
-        
-        for order in open_orders:
-            # 只处理未成交的订单（状态为 pending, open, partially_filled）
-            if order.status in ["pending", "open", "partially_filled"]:
-                if order.price is not None:
-                    price = int(float(order.price))
-                    try:
-                        order_id = int(order.order_id)
-                    except (ValueError, TypeError):
-                        continue  # 跳过无效的订单ID
-                    
-                    if order.side in ["buy", "long"]:
-                        if price not in long_prices:
-                            long_prices.append(price)
-                        if price not in long_price_to_ids:
-                            long_price_to_ids[price] = []
-                        long_price_to_ids[price].append(order_id)
-                    elif order.side in ["sell", "short"]:
-                        if price not in short_prices:
-                            short_prices.append(price)
-                        if price not in short_price_to_ids:
-                            short_price_to_ids[price] = []
-                        short_price_to_ids[price].append(order_id)
-        
-        return sorted(long_prices), sorted(short_prices), long_price_to_ids, short_price_to_ids
+        if order_cache is None:
+            order_cache = OrderStateCache(adapter, symbol)
+            order_cache.seed()
+        return order_cache.pending_arrays(tick_size)
     except NotImplementedError:
         # 如果适配器未实现，返回空数组
         return [], [], {}, {}
@@ -233,7 +305,7 @@ def get_pending_orders_arrays(adapter, symbol):
         return [], [], {}, {}
 
 
-def cancel_stale_order_ids(adapter, symbol, stale_seconds=5, cancel_probability=0.5):
+def cancel_stale_order_ids(adapter, symbol, stale_seconds=5, cancel_probability=0.5, order_cache=None):
     """随机取消未成交时间大于指定秒数的订单
     
     Args:
@@ -241,9 +313,13 @@ def cancel_stale_order_ids(adapter, symbol, stale_seconds=5, cancel_probability=
         symbol: 交易对符号
         stale_seconds: 未成交时间阈值（秒），默认5秒
         cancel_probability: 取消概率（0-1之间），默认0.5（50%）
+        order_cache: 订单缓存（OrderStateCache），为 None 时从 REST 查询
     """
     try:
-        open_orders = adapter.get_open_orders(symbol=symbol)
+        if order_cache is not None:
+            open_orders = order_cache.open_orders()
+        else:
+            open_orders = adapter.get_open_orders(symbol=symbol)
         stale_order_ids = []
         current_time = int(time.time() * 1000)  # 当前时间（毫秒）
         
@@ -262,154 +338,56 @@ def cancel_stale_order_ids(adapter, symbol, stale_seconds=5, cancel_probability=
                             except (ValueError, TypeError):
                                 pass
         
-        # 如果有需要取消的订单，执行批量撤单
+        # 如果有需要取消的订单，执行批量撤单；撤单成功的订单立即移出缓存，本轮网格比对时补挂
         if stale_order_ids:
             print(f"随机取消未成交时间>{stale_seconds}秒的订单: {stale_order_ids} (概率: {cancel_probability*100}%)")
             try:
-                if hasattr(adapter, 'cancel_orders_by_ids'):
-                    adapter.cancel_orders_by_ids(order_id_list=stale_order_ids)
+                results = adapter.cancel_orders(stale_order_ids, symbol=symbol)
             except:
-                pass
+                return
+            if order_cache is not None:
+                for order_id, result in zip(stale_order_ids, results):
+                    if result.success:
+                        order_cache.discard(order_id)
     except Exception:
         pass
 
 
-def cancel_orders_by_prices(cancel_long, cancel_short, long_price_to_ids, short_price_to_ids, adapter):
-    """根据价格列表撤单
-    
-    Args:
-        cancel_long: 需要撤单的做多价格列表
-        cancel_short: 需要撤单的做空价格列表
-        long_price_to_ids: 做多价格到订单ID列表的字典映射
-        short_price_to_ids: 做空价格到订单ID列表的字典映射
-        adapter: 适配器实例
-    """
-    if not cancel_long and not cancel_short:
-        return
-    
-    # 根据价格映射获取订单ID
-    all_order_ids = []
-    for price in cancel_long:
-        if price in long_price_to_ids:
-            all_order_ids.extend(long_price_to_ids[price])
-    for price in cancel_short:
-        if price in short_price_to_ids:
-            all_order_ids.extend(short_price_to_ids[price])
-    
-    if not all_order_ids:
-        return
-    
-    # 批量撤单
-    try:
-        if hasattr(adapter, 'cancel_orders_by_ids'):
-            adapter.cancel_orders_by_ids(order_id_list=all_order_ids)
-        else:
-            # 如果适配器没有批量撤单方法，逐个撤单
-            for order_id in all_order_ids:
-                try:
-                    adapter.cancel_order(order_id=str(order_id))
-                except:
-                    pass
-    except:
-        pass
-
-
-def place_orders_by_prices(place_long, place_short, adapter, symbol, quantity):
-    """根据价格列表下单
+def build_order_requests(place_long, place_short, symbol, quantity, tick_size=None):
+    """根据价格列表生成下单请求（做多：buy，做空：sell）
     
     Args:
-        place_long: 需要下单的做多价格列表
-        place_short: 需要下单的做空价格列表
-        adapter: 适配器实例
-        symbol: 交易对符号
-        quantity: 订单数量
-    """
-    if not place_long and not place_short:
-        return
-    
-    quantity_decimal = Decimal(str(quantity))
-    
-    # 做多订单：buy
-    for price in place_long:
-        try:
-            order = adapter.place_order(
-                symbol=symbol,
-                side="buy",
-                order_type="limit",
-                quantity=quantity_decimal,
-                price=Decimal(str(price)),
-                time_in_force="gtc",
-                reduce_only=False
-            )
-            print(f"[下单成功][多单] 价格={price}, 数量={quantity_decimal}, 订单ID={getattr(order, 'order_id', None)}")
-        except Exception as e:
-            print(f"[下单失败][多单] 价格={price}, 数量={quantity_decimal}, 错误={e}")
-    
-    # 做空订单：sell
-    for price in place_short:
-        try:
-            order = adapter.place_order(
-                symbol=symbol,
-                side="sell",
-                order_type="limit",
-                quantity=quantity_decimal,
-                price=Decimal(str(price)),
-                time_in_force="gtc",
-                reduce_only=False
-            )
-            print(f"[下单成功][空单] 价格={price}, 数量={quantity_decimal}, 订单ID={getattr(order, 'order_id', None)}")
-        except Exception as e:
-            print(f"[下单失败][空单] 价格={price}, 数量={quantity_decimal}, 错误={e}")
-
-
-def calculate_cancel_orders(target_long, target_short, current_long, current_short):
-    """计算需要撤单的多空数组
-    
-    Args:
-        target_long: 目标做多数组（应该存在的订单价格）
-        target_short: 目标做空数组（应该存在的订单价格）
-        current_long: 当前做多数组（实际存在的订单价格）
-        current_short: 当前做空数组（实际存在的订单价格）
+        tick_size: 价位为 tick 数时传入价格最小变动单位；为 None 时价位即价格
     
     Returns:
-        (cancel_long, cancel_short): 需要撤单的做多数组和做空数组
+        List[OrderRequest]: 下单请求列表（做多在前，做空在后）
     """
-    # 将目标数组转换为集合，便于查找
-    target_long_set = set(target_long)
-    target_short_set = set(target_short)
-    
-    # 撤单做多数组：在当前做多数组中，但不在目标做多数组中的价格
-    cancel_long = [price for price in current_long if price not in target_long_set]
-    
-    # 撤单做空数组：在当前做空数组中，但不在目标做空数组中的价格
-    cancel_short = [price for price in current_short if price not in target_short_set]
-    
-    return sorted(cancel_long), sorted(cancel_short)
-
-
-def calculate_place_orders(target_long, target_short, current_long, current_short):
-    """计算需要下单的多空数组
-    
-    Args:
-        target_long: 目标做多数组（应该存在的订单价格）
-        target_short: 目标做空数组（应该存在的订单价格）
-        current_long: 当前做多数组（实际存在的订单价格）
-        current_short: 当前做空数组（实际存在的订单价格）
-    
-    Returns:
-        (place_long, place_short): 需要下单的做多数组和做空数组
-    """
-    # 将当前数组转换为集合，便于查找
-    current_long_set = set(current_long)
-    current_short_set = set(current_short)
-    
-    # 下单做多数组：在目标做多数组中，但不在当前做多数组中的价格
-    place_long = [price for price in target_long if price not in current_long_set]
-    
-    # 下单做空数组：在目标做空数组中，但不在当前做空数组中的价格
-    place_short = [price for price in target_short if price not in current_short_set]
-    
-    return sorted(place_long), sorted(place_short)
+    quantity_decimal = Decimal(str(quantity))
+    tick = Decimal(str(tick_size)) if tick_size is not None else None
+    return [
+        OrderRequest(
+            symbol=symbol,
+            side=side,
+            order_type="limit",
+            quantity=quantity_decimal,
+            price=price * tick if tick is not None else Decimal(str(price)),
+            time_in_force="gtc",
+            reduce_only=False,
+        )
+        for side, prices in (("buy", place_long), ("sell", place_short))
+        for price in prices
+    ]
+
+
+def print_place_results(results):
+    """打印下单结果"""
+    for result in results:
+        request = result.request
+        label = "多单" if request.side == "buy" else "空单"
+        if result.success:
+            print(f"[下单成功][{label}] 价格={request.price}, 数量={request.quantity}, 订单ID={getattr(result.result, 'order_id', None)}")
+        else:
+            print(f"[下单失败][{label}] 价格={request.price}, 数量={request.quantity}, 错误={result.error}")
 
 
 def close_position_if_exists(adapter, symbol):
@@ -439,7 +417,7 @@ def close_position_if_exists(adapter, symbol):
         pass
 
 
-def calculate_dynamic_price_spread(adx, current_price, default_spread, adx_threshold, adx_max=60):
+def calculate_dynamic_price_spread(adx, current_price, default_spread, adx_threshold, adx_max=60, tick_size=1):
     """根据 ADX 值动态计算 price_spread
     
     Args:
@@ -448,99 +426,256 @@ def calculate_dynamic_price_spread(adx, current_price, default_spread, adx_thres
         default_spread: 默认 price_spread
         adx_threshold: ADX 阈值，低于此值使用默认值（通常为25）
         adx_max: ADX 最大值，超过此值按此值处理（默认60）
+        tick_size: 价格最小变动单位，动态值向下对齐到 tick 的整数倍
     
     Returns:
-        int: 计算后的 price_spread
+        Decimal: 计算后的 price_spread
     """
-    max_spread = current_price * 0.01  # 最大为价格的1%
+    default = Decimal(str(default_spread))
+    tick = Decimal(str(tick_size))
+    max_spread = Decimal(str(current_price)) * Decimal("0.01")  # 最大为价格的1%
     
     if adx is not None:
         print(f"ADX(5m): {adx:.2f}")
         # ADX <= threshold 时使用默认值
         if adx <= adx_threshold:
-            price_spread = default_spread
+            price_spread = default
         else:
             # 超过 60 按 60 处理
             effective_adx = min(adx, adx_max)
             # ADX 在 [threshold, 60] 范围内映射到 [默认值, 最大值]
-            ratio = (effective_adx - adx_threshold) / (adx_max - adx_threshold)  # ADX 25-60 映射到 0-1
-            dynamic_spread = default_spread + ratio * (max_spread - default_spread)
-            price_spread = int(min(dynamic_spread, max_spread))
-        print(f"动态 price_spread: {price_spread} (默认: {default_spread}, 最大: {int(max_spread)})")
+            ratio = Decimal(str((effective_adx - adx_threshold) / (adx_max - adx_threshold)))  # ADX 25-60 映射到 0-1
+            dynamic_spread = min(default + ratio * (max_spread - default), max_spread)
+            # 对齐到 tick，且不小于默认值
+            price_spread = max(default, (dynamic_spread / tick).to_integral_value(ROUND_FLOOR) * tick)
+        print(f"动态 price_spread: {price_spread} (默认: {default_spread}, 最大: {max_spread})")
         return price_spread
     else:
         print(f"ADX(5m): 获取失败，使用默认 price_spread: {default_spread}")
-        return default_spread
+        return default
 
 
-def run_strategy_cycle(adapter):
-    """执行一次策略循环
+def compute_price_spread(last_price, market=None):
+    """根据风险配置计算当前 price_spread（启用 ADX 时动态调整）
+    
+    Args:
+        last_price: 当前价格
+        market: 网格市场，默认为当前市场
+    
+    Returns:
+        price_spread
+    """
+    market = market or MARKET
+    default_spread = market.grid_config['price_spread']
+    risk_config = market.risk_config
+    
+    if risk_config.get('enable', False):
+        adx_symbol = convert_symbol_for_adx(market.symbol)
+        adx = INDICATOR_TOOL.get_adx(adx_symbol, "5m", period=14)
+        adx_threshold = risk_config.get('adx_threshold', 25)
+        adx_max = risk_config.get('adx_max', 60)
+        return calculate_dynamic_price_spread(
+            adx, last_price, default_spread, adx_threshold, adx_max, market.tick_size
+        )
+    return default_spread
+
+
+def apply_grid_diff(adapter, diff, order_cache, market=None):
+    """执行网格编辑脚本：先改单，再把撤单和下单合并为一次批量操作
     
     Args:
         adapter: 适配器实例
+        diff: GridReconciler 生成的 GridDiff
+        order_cache: 订单缓存，改单/下单成功的订单会写入缓存
+        market: 网格市场，默认为当前市场
     """
-    price_info = adapter.get_ticker(SYMBOL)
-    last_price = price_info.get('last_price') or price_info.get('mid_price') or price_info.get('mark_price')
-    print(f"{SYMBOL} 价格: {last_price:.2f}")
+    market = market or MARKET
+    symbol = market.symbol
+    quantity = market.grid_config.get('order_quantity', 0.001)
+    cancel_ids = diff.long.cancel + diff.short.cancel
+    place_long = list(diff.long.place)
+    place_short = list(diff.short.place)
+    
+    # 先改单，改单失败的价位退回撤单+下单
+    amends = [("buy", amend) for amend in diff.long.amend] + [("sell", amend) for amend in diff.short.amend]
+    if amends:
+        amend_requests = [
+            AmendRequest(
+                order_id=str(order_id),
+                symbol=symbol,
+                price=market.to_price(new_price),
+                quantity=Decimal(str(quantity)),
+                side=side,
+            )
+            for side, (order_id, _, new_price) in amends
+        ]
+        for (side, (order_id, old_price, new_price)), result in zip(amends, adapter.amend_orders(amend_requests)):
+            if result.success:
+                print(f"[改单成功][{'多单' if side == 'buy' else '空单'}] {market.to_price(old_price)} -> {market.to_price(new_price)}, 订单ID={order_id}")
+                if result.result is not None:
+                    order_cache.apply(result.result)
+                continue
+            print(f"[改单失败] 订单ID={order_id}, 错误={result.error}，改为撤单+下单")
+            cancel_ids.append(order_id)
+            (place_long if side == "buy" else place_short).append(new_price)
+    
+    # 撤单和下单合并为一次批量操作，成功的订单先记入缓存占住价位
+    new_orders = build_order_requests(sorted(place_long), sorted(place_short), symbol, quantity, market.tick_size)
+    try:
+        _, results = adapter.replace_orders(cancel_ids, new_orders, symbol=symbol)
+    except Exception as e:
+        print(f"批量撤单/下单失败: {e}")
+        results = []
+    print_place_results(results)
+    for result in results:
+        if result.success and result.result is not None:
+            order_cache.track_placed(result.result)
 
-    # 获取 ADX 指标并动态调整 price_spread
-    default_spread = GRID_CONFIG['price_spread']
-    
-    if RISK_CONFIG.get('enable', False):
-        indicator_tool = IndicatorTool()
-        adx_symbol = convert_symbol_for_adx(SYMBOL)
-        adx = indicator_tool.get_adx(adx_symbol, "5m", period=14)
-        adx_threshold = RISK_CONFIG.get('adx_threshold', 25)
-        adx_max = RISK_CONFIG.get('adx_max', 60)
-        price_spread = calculate_dynamic_price_spread(adx, last_price, default_spread, adx_threshold, adx_max)
+
+def sync_orders_to_grid(adapter, long_grid, short_grid, order_cache=None, market=None):
+    """将账户未成交订单同步到目标网格：撤掉多余订单、补齐缺失订单、检查持仓
+    
+    Args:
+        adapter: 适配器实例
+        long_grid: 目标做多数组
+        short_grid: 目标做空数组
+        order_cache: 由订单推送维护的订单缓存；为 None 时本轮从 REST 拉取一次快照
+        market: 网格市场，默认为当前市场
+    """
+    market = market or MARKET
+    symbol = market.symbol
+    if order_cache is None:
+        # 每轮只拉一次 REST 快照，网格比对和超时撤单共用
+        order_cache = OrderStateCache(adapter, symbol)
+        try:
+            order_cache.seed()
+        except NotImplementedError:
+            pass
+        except Exception as e:
+            print(f"获取未成交订单失败: {e}")
     else:
-        price_spread = default_spread
+        try:
+            order_cache.reconcile_if_due()
+        except Exception as e:
+            print(f"订单缓存对账失败: {e}")
     
-    long_grid, short_grid = generate_grid_arrays(
-        last_price, 
-        GRID_CONFIG['price_step'], 
-        GRID_CONFIG['grid_count'],
-        price_spread
-    )
-    print(f"做多数组: {long_grid}")
-    print(f"做空数组: {short_grid}")
+    # 随机取消未成交时间过长的订单（在网格比对之前，撤掉的价位本轮即补挂）
+    cancel_stale_config = market.cancel_stale_config
+    if cancel_stale_config.get('enable', False):
+        stale_seconds = cancel_stale_config.get('stale_seconds', 5)
+        cancel_probability = cancel_stale_config.get('cancel_probability', 0.5)
+        cancel_stale_order_ids(adapter, symbol, stale_seconds, cancel_probability, order_cache)
     
     # 获取未成交订单数组和价格到订单ID的映射
-    long_pending, short_pending, long_price_to_ids, short_price_to_ids = get_pending_orders_arrays(adapter, SYMBOL)
-    print(f"当前做多数组: {long_pending}")
-    print(f"当前做空数组: {short_pending}")
+    long_pending, short_pending, long_price_to_ids, short_price_to_ids = get_pending_orders_arrays(
+        adapter, symbol, order_cache, market.tick_size
+    )
+    print(f"当前做多数组: {market.format_prices(long_pending)}")
+    print(f"当前做空数组: {market.format_prices(short_pending)}")
     
-    # 计算需要撤单的数组
-    cancel_long, cancel_short = calculate_cancel_orders(
-        long_grid, short_grid, long_pending, short_pending
+    # 增量比对：保留不需要移动的价位，移出网格的订单在交易所支持时直接改价
+    supports_amend = getattr(adapter, 'supports_amend', False)
+    diff = market.reconciler.diff(
+        long_grid, short_grid, long_price_to_ids, short_price_to_ids, allow_amend=supports_amend
     )
-    print(f"撤单做多数组: {cancel_long}")
-    print(f"撤单做空数组: {cancel_short}")
+    print(f"撤单做多订单: {diff.long.cancel}, 撤单做空订单: {diff.short.cancel}")
+    print(f"改价做多: {len(diff.long.amend)} 个, 改价做空: {len(diff.short.amend)} 个")
+    
+    print(f"下单做多数组: {market.format_prices(diff.long.place)}")
+    print(f"下单做空数组: {market.format_prices(diff.short.place)}")
     
-    # 执行撤单
-    cancel_orders_by_prices(
-        cancel_long, cancel_short, long_price_to_ids, short_price_to_ids, adapter
+    if not diff.is_empty:
+        apply_grid_diff(adapter, diff, order_cache, market)
+    # 检查持仓，如果有持仓则市价平仓
+    close_position_if_exists(adapter, symbol)
+
+
+def build_grid(last_price, price_spread, market=None):
+    """按网格配置生成做多/做空价位（以交易对 tick 为单位）"""
+    market = market or MARKET
+    grid_config = market.grid_config
+    return generate_grid_arrays(
+        last_price, 
+        grid_config['price_step'], 
+        grid_config['grid_count'],
+        price_spread,
+        market.tick_size,
     )
 
-    # 随机取消未成交时间过长的订单
-    if CANCEL_STALE_ORDERS_CONFIG.get('enable', False):
-        stale_seconds = CANCEL_STALE_ORDERS_CONFIG.get('stale_seconds', 5)
-        cancel_probability = CANCEL_STALE_ORDERS_CONFIG.get('cancel_probability', 0.5)
-        cancel_stale_order_ids(adapter, SYMBOL, stale_seconds, cancel_probability)
+
+def run_strategy_cycle(adapter, market=None):
+    """执行一次策略循环
     
-    # 计算需要下单的数组
-    place_long, place_short = calculate_place_orders(
-        long_grid, short_grid, long_pending, short_pending
-    )
-    print(f"下单做多数组: {place_long}")
-    print(f"下单做空数组: {place_short}")
+    Args:
+        adapter: 适配器实例
+        market: 网格市场，默认为当前市场
+    """
+    market = market or MARKET
+    price_info = adapter.get_ticker(market.symbol)
+    last_price = price_info.get('last_price') or price_info.get('mid_price') or price_info.get('mark_price')
+    print(f"{market.symbol} 价格: {last_price:.2f}")
+    resolve_instrument(adapter, market)
+
+    # 获取 ADX 指标并动态调整 price_spread
+    price_spread = compute_price_spread(last_price, market)
     
-    # 执行下单
-    place_orders_by_prices(
-        place_long, place_short, adapter, SYMBOL, GRID_CONFIG.get('order_quantity', 0.001)
-    )
-    # 检查持仓，如果有持仓则市价平仓
-    close_position_if_exists(adapter, SYMBOL)
+    long_grid, short_grid = build_grid(last_price, price_spread, market)
+    print(f"做多数组: {market.format_prices(long_grid)}")
+    print(f"做空数组: {market.format_prices(short_grid)}")
+    
+    sync_orders_to_grid(adapter, long_grid, short_grid, market=market)
+
+
+async def run_event_engine(adapter, market=None):
+    """以事件驱动方式运行策略：价格/订单推送触发重新挂单
+    
+    Args:
+        adapter: 适配器实例
+        market: 网格市场，默认为当前市场
+    """
+    market = market or MARKET
+    symbol = market.symbol
+    grid_config = market.grid_config
+    # price_spread 在挂单线程中按 ADX 刷新，价格推送回调只读取缓存值做纯计算
+    state = {"price_spread": grid_config['price_spread']}
+
+    def on_price(last_price):
+        return build_grid(last_price, state["price_spread"], market)
+
+    def requote(last_price, long_grid, short_grid):
+        print(f"{symbol} 价格: {last_price:.2f}")
+        tick_size = market.tick_size
+        resolve_instrument(adapter, market)
+        price_spread = compute_price_spread(last_price, market)
+        if price_spread != state["price_spread"] or market.tick_size != tick_size:
+            state["price_spread"] = price_spread
+            long_grid, short_grid = on_price(last_price)
+        print(f"做多数组: {market.format_prices(long_grid)}")
+        print(f"做空数组: {market.format_prices(short_grid)}")
+        sync_orders_to_grid(adapter, long_grid, short_grid, order_cache, market)
+
+    resync_interval = grid_config.get('resync_interval', 30)
+    # 价格推送回调按 tick 计算网格，启动前先加载精度信息
+    await asyncio.to_thread(resolve_instrument, adapter, market)
+    # 订单缓存由订单推送维护，按 resync_interval 与 REST 对账；交易所不支持推送时每轮拉取快照
+    order_cache = OrderStateCache(adapter, symbol, reconcile_interval=resync_interval)
+    try:
+        if not await order_cache.start():
+            order_cache = None
+
+        engine = EventGridEngine(
+            adapter,
+            symbol,
+            build_grid=on_price,
+            requote=requote,
+            resync_interval=resync_interval,
+            order_cache=order_cache,
+        )
+        await engine.run()
+    finally:
+        # 引擎退出后由 multi_runner 重启，先取消本次注册的订单回调
+        if order_cache is not None:
+            order_cache.stop()
 
 
 def main():
@@ -558,6 +693,13 @@ def main():
         required=True,
         help='指定要使用的交易所名称（必需），例如: standx 或 grvt'
     )
+    parser.add_argument(
+        '--engine',
+        type=str,
+        choices=['poll', 'event'],
+        default=None,
+        help='运行模式: poll（定时轮询）或 event（价格/订单推送驱动），默认读取 grid.engine，未配置时为 poll'
+    )
     args = parser.parse_args()
     
     # 加载配置文件
@@ -576,6 +718,15 @@ def main():
         adapter = create_adapter(EXCHANGE_CONFIG)
         adapter.connect()
         
+        engine_mode = args.engine or GRID_CONFIG.get('engine', 'poll')
+        if engine_mode == 'event':
+            print("策略开始运行（事件驱动模式），按 Ctrl+C 停止...\n")
+            try:
+                asyncio.run(run_event_engine(adapter))
+            except KeyboardInterrupt:
+                print("\n\n策略已停止")
+            return
+        
         sleep_interval = GRID_CONFIG.get('sleep_interval', 60)
         
         print("策略开始运行，按 Ctrl+C 停止...")
@@ -0,0 +1,76 @@
+import contextlib
+import io
+import unittest
+from decimal import Decimal
+
+from strategys.strategy_common.notrade_mm import (
+    _grid_ladder,
+    calculate_dynamic_price_spread,
+    generate_grid_arrays,
+)
+
+
+def dynamic_spread(*args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return calculate_dynamic_price_spread(*args, **kwargs)
+
+
+class TestGridLadder(unittest.TestCase):
+    """_grid_ladder unit tests"""
+
+    def testLaddersAscendFromBases(self):
+        self.assertEqual(_grid_ladder(100, 110, 5, 3, 2), ((90, 95, 100), (110, 115)))
+        self.assertEqual(_grid_ladder(100, 110, 5, 0, 0), ((), ()))
+
+
+class TestGenerateGridArrays(unittest.TestCase):
+    """generate_grid_arrays unit tests"""
+
+    def testWholeDollarTick(self):
+        self.assertEqual(
+            generate_grid_arrays(100000, 50, 3, 120, 1),
+            ((99750, 99800, 99850), (100150, 100200, 100250)),
+        )
+
+    def testSubDollarTick(self):
+        long_grid, short_grid = generate_grid_arrays(0.5, 0.001, 3, Decimal("0.0032"), Decimal("0.0001"))
+        self.assertEqual((long_grid, short_grid), ((4950, 4960), (5040, 5050)))
+        self.assertLess(long_grid[-1], short_grid[0])
+
+    def testZeroSpreadDoesNotCross(self):
+        long_grid, short_grid = generate_grid_arrays(0.5, 0.001, 3, 0, Decimal("0.0001"))
+        self.assertEqual((long_grid, short_grid), ((4980, 4990, 5000), (5010, 5020, 5030)))
+
+    def testLevelsBeyondOnePercentAreDropped(self):
+        long_grid, short_grid = generate_grid_arrays(100, 0.4, 5, 0.5, 0.1)
+        self.assertEqual((long_grid, short_grid), ((992,), (1008,)))
+
+    def testInvalidArguments(self):
+        with self.assertRaises(ValueError):
+            generate_grid_arrays(100, 0, 3, 1)
+        with self.assertRaises(ValueError):
+            generate_grid_arrays(100, 1, -1, 1)
+        with self.assertRaises(ValueError):
+            generate_grid_arrays(100, 1, 3, -1)
+
+
+class TestDynamicPriceSpread(unittest.TestCase):
+    """calculate_dynamic_price_spread unit tests"""
+
+    def testSubDollarSpreadIsSnappedToTick(self):
+        spread = dynamic_spread(40, 0.5, 0.002, 25, 60, Decimal("0.0001"))
+        self.assertEqual(spread, Decimal("0.0032"))
+
+    def testDefaultAndCap(self):
+        self.assertEqual(dynamic_spread(20, 100000, 120, 25, 60), Decimal("120"))
+        self.assertEqual(dynamic_spread(None, 100000, 120, 25, 60), Decimal("120"))
+        self.assertEqual(dynamic_spread(80, 100000, 120, 25, 60), Decimal("1000"))
+        self.assertEqual(dynamic_spread(40, 100000, 120, 25, 60), Decimal("497"))
+
+    def testNeverBelowDefault(self):
+        spread = dynamic_spread(25.1, 0.5, Decimal("0.00205"), 25, 60, Decimal("0.0001"))
+        self.assertEqual(spread, Decimal("0.00205"))
+
+
+if __name__ == "__main__":
+    unittest.main()
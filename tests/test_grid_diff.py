@@ -0,0 +1,149 @@
+import contextlib
+import io
+import unittest
+from decimal import Decimal
+
+from adapters.batch_executor import OrderResult
+from strategys.strategy_common.grid_diff import GridReconciler, diff_side
+from strategys.strategy_common.notrade_mm import GridMarket, apply_grid_diff
+
+
+def script(side):
+    return side.keep, side.amend, side.cancel, side.place
+
+
+class TestDiffSide(unittest.TestCase):
+    """diff_side unit tests"""
+
+    def testGridShiftCancelsAndPlaces(self):
+        side = diff_side((98, 99, 100), {97: ["a"], 98: ["b"], 99: ["c"]})
+        self.assertEqual(script(side), ([98, 99], [], ["a"], [100]))
+        self.assertEqual(side.message_count, 2)
+
+    def testGridShiftAmends(self):
+        side = diff_side((98, 99, 100), {97: ["a"], 98: ["b"], 99: ["c"]}, allow_amend=True)
+        self.assertEqual(script(side), ([98, 99], [("a", 97, 100)], [], []))
+        self.assertEqual(side.message_count, 1)
+
+    def testMovableOrdersPairWithPlacesInPriceOrder(self):
+        side = diff_side((103, 104), {102: ["c"], 100: ["a"], 101: ["b"]}, allow_amend=True)
+        self.assertEqual(script(side), ([], [("a", 100, 103), ("b", 101, 104)], ["c"], []))
+
+    def testMorePlacesThanMovableOrders(self):
+        side = diff_side((101, 102, 103), {100: ["a"]}, allow_amend=True)
+        self.assertEqual(script(side), ([], [("a", 100, 101)], [], [102, 103]))
+
+    def testDuplicateOrdersAtOneLevel(self):
+        current = {98: ["a", "a2"], 99: ["b", "b2", "b3"]}
+        side = diff_side((99, 100), current, allow_amend=True)
+        self.assertEqual(script(side), ([99], [("a", 98, 100)], ["a2", "b2", "b3"], []))
+        side = diff_side((99, 100), current)
+        self.assertEqual(script(side), ([99], [], ["a2", "b2", "b3", "a"], [100]))
+
+    def testEmptySides(self):
+        self.assertEqual(script(diff_side((), {})), ([], [], [], []))
+        self.assertEqual(script(diff_side((1, 2), {}, allow_amend=True)), ([], [], [], [1, 2]))
+        self.assertEqual(script(diff_side((), {1: ["a"], 2: ["b"]}, allow_amend=True)), ([], [], ["a", "b"], []))
+
+    def testMoreOrdersThanTargetLevels(self):
+        current = {96: ["a"], 97: ["b"], 98: ["c"], 99: ["d"]}
+        side = diff_side((99, 100), current, allow_amend=True)
+        self.assertEqual(script(side), ([99], [("a", 96, 100)], ["b", "c"], []))
+
+
+class TestGridReconciler(unittest.TestCase):
+    """GridReconciler unit tests"""
+
+    def setUp(self):
+        self.reconciler = GridReconciler()
+        self.long = {98: ["a"], 99: ["b"]}
+        self.short = {101: ["c"]}
+
+    def testUnchangedCoveredGridIsEmpty(self):
+        first = self.reconciler.diff((98, 99), (101,), self.long, self.short)
+        self.assertTrue(first.is_empty)
+        second = self.reconciler.diff((98, 99), (101,), self.long, self.short)
+        self.assertTrue(second.is_empty)
+        self.assertEqual((second.long.keep, second.short.keep), ([98, 99], [101]))
+
+    def testFastPathChecksCurrentOrders(self):
+        self.reconciler.diff((98, 99), (101,), self.long, self.short)
+        # same target, but an order was filled and another level got a duplicate
+        diff = self.reconciler.diff((98, 99), (101,), {98: ["a", "a2"]}, self.short)
+        self.assertEqual(script(diff.long), ([98], [], ["a2"], [99]))
+        self.assertEqual(diff.message_count, 2)
+
+    def testChangedTargetIsDiffed(self):
+        self.reconciler.diff((98, 99), (101,), self.long, self.short)
+        diff = self.reconciler.diff((99, 100), (102,), self.long, self.short, allow_amend=True)
+        self.assertEqual(script(diff.long), ([99], [("a", 98, 100)], [], []))
+        self.assertEqual(script(diff.short), ([], [("c", 101, 102)], [], []))
+
+    def testResetForgetsTarget(self):
+        self.reconciler.diff((98, 99), (101,), self.long, self.short)
+        self.reconciler.reset()
+        self.assertIsNone(self.reconciler._last_target)
+
+
+class StubAdapter:
+    """记录改单和撤单/下单请求；failed_amends 中的订单ID改单失败"""
+
+    def __init__(self, failed_amends=()):
+        self.failed_amends = set(failed_amends)
+        self.amends = []
+        self.replaced = None
+
+    def amend_orders(self, requests):
+        self.amends.extend(requests)
+        return [
+            OrderResult(request, False, error=Exception("order not found"))
+            if request.order_id in self.failed_amends
+            else OrderResult(request, True, result=None)
+            for request in requests
+        ]
+
+    def replace_orders(self, cancel_ids, new_orders, symbol=None):
+        self.replaced = (cancel_ids, [(order.side, order.price) for order in new_orders])
+        return [], [OrderResult(order, True, result=None) for order in new_orders]
+
+
+class StubOrderCache:
+    def apply(self, order):
+        pass
+
+    def track_placed(self, order):
+        pass
+
+
+class TestApplyGridDiff(unittest.TestCase):
+    """apply_grid_diff unit tests"""
+
+    def setUp(self):
+        self.market = GridMarket("test", "BTC-USD", {"order_quantity": 0.01, "tick_size": "0.5"})
+
+    def apply(self, adapter, diff):
+        with contextlib.redirect_stdout(io.StringIO()):
+            apply_grid_diff(adapter, diff, StubOrderCache(), self.market)
+
+    def testFailedAmendFallsBackToCancelAndPlace(self):
+        diff = GridReconciler().diff(
+            (99, 100), (102, 103), {98: ["a"], 99: ["b"]}, {101: ["c"], 102: ["d"]}, allow_amend=True
+        )
+        adapter = StubAdapter(failed_amends={"c"})
+        self.apply(adapter, diff)
+        self.assertEqual(
+            [(request.order_id, request.side, request.price) for request in adapter.amends],
+            [("a", "buy", Decimal("50.0")), ("c", "sell", Decimal("51.5"))],
+        )
+        self.assertEqual(adapter.replaced, (["c"], [("sell", Decimal("51.5"))]))
+
+    def testCancelsAndPlacesGoInOneBatch(self):
+        diff = GridReconciler().diff((99, 100), (), {97: ["a"], 99: ["b", "b2"]}, {101: ["c"]})
+        adapter = StubAdapter()
+        self.apply(adapter, diff)
+        self.assertEqual(adapter.amends, [])
+        self.assertEqual(adapter.replaced, (["b2", "a", "c"], [("buy", Decimal("50.0"))]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import math
+import random
+import statistics
+import unittest
+
+from risk.indicators import INDICATOR_COLUMNS, IndicatorEngine
+
+INTERVAL_MS = 60_000
+
+
+def make_bars(count, seed):
+    """随机游走的 (open_time, open, high, low, close) K 线"""
+    rng = random.Random(seed)
+    bars, close = [], 100.0
+    for i in range(count):
+        open_ = close
+        close = open_ * math.exp(rng.gauss(0, 0.01))
+        high = max(open_, close) * (1 + rng.random() * 0.005)
+        low = min(open_, close) * (1 - rng.random() * 0.005)
+        bars.append((i * INTERVAL_MS, open_, high, low, close))
+    return bars
+
+
+def wilder(values, period):
+    """Wilder 平滑的逐根递推参考实现：前 period 个取平均作为初值"""
+    average = sum(values[:period]) / period
+    for value in values[period:]:
+        average = (average * (period - 1) + value) / period
+    return average
+
+
+def reference(bars, atr_period=14, rsi_period=14, vol_window=30, bb_period=20, bb_std=2.0):
+    highs = [bar[2] for bar in bars]
+    lows = [bar[3] for bar in bars]
+    closes = [bar[4] for bar in bars]
+    true_ranges = [
+        max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+        for i in range(1, len(bars))
+    ]
+    atr = wilder(true_ranges, atr_period)
+
+    changes = [closes[i] - closes[i - 1] for i in range(1, len(bars))]
+    avg_gain = wilder([max(c, 0.0) for c in changes], rsi_period)
+    avg_loss = wilder([max(-c, 0.0) for c in changes], rsi_period)
+    rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    returns = [math.log(closes[i] / closes[i - 1]) for i in range(len(closes) - vol_window, len(closes))]
+    realized_vol = statistics.stdev(returns) * math.sqrt(365 * 86400 / 60)
+
+    window = closes[-bb_period:]
+    bb_width = 2.0 * bb_std * statistics.pstdev(window) / statistics.fmean(window)
+    return {
+        "close": closes[-1],
+        "atr": atr,
+        "atr_pct": atr / closes[-1],
+        "realized_vol": realized_vol,
+        "bb_width": bb_width,
+        "rsi": rsi,
+    }
+
+
+def load(engine, symbol, bars):
+    for open_time, open_, high, low, close in bars:
+        engine.update(symbol, "1m", open_time, open_, high, low, close)
+
+
+class TestIndicatorEngine(unittest.TestCase):
+    """IndicatorEngine unit tests"""
+
+    def testPanelMatchesReferenceComputation(self):
+        engine = IndicatorEngine(capacity=256, max_rows=4)
+        bars = {"BTC": make_bars(400, seed=1), "ETH": make_bars(300, seed=2)}
+        for symbol, symbol_bars in bars.items():
+            load(engine, symbol, symbol_bars)
+        panel = engine.compute()
+        self.assertEqual(panel.shape, (2, len(INDICATOR_COLUMNS)))
+
+        for symbol, symbol_bars in bars.items():
+            expected = reference(symbol_bars)
+            for name in INDICATOR_COLUMNS:
+                with self.subTest(symbol=symbol, indicator=name):
+                    self.assertAlmostEqual(engine.get(symbol, "1m", name) / expected[name], 1.0, places=6)
+
+    def testShortHistoryIsNaN(self):
+        engine = IndicatorEngine(capacity=64)
+        load(engine, "BTC", make_bars(10, seed=3))
+        engine.compute()
+        self.assertIsNone(engine.get("BTC", "1m", "atr"))
+        self.assertIsNone(engine.get("BTC", "1m", "rsi"))
+        self.assertIsNotNone(engine.get("BTC", "1m", "close"))
+
+    def testSameOpenTimeOverwritesLatestBar(self):
+        engine = IndicatorEngine(capacity=64)
+        bars = make_bars(40, seed=4)
+        load(engine, "BTC", bars)
+        open_time, open_, high, low, _ = bars[-1]
+        engine.update("BTC", "1m", open_time, open_, high, low, 123.0)
+        engine.update("BTC", "1m", open_time - INTERVAL_MS, open_, high, low, 1.0)
+        engine.compute()
+        self.assertEqual(engine.get("BTC", "1m", "close"), 123.0)
+
+    def testViewsStayValidAfterNewRowsAndAppends(self):
+        engine = IndicatorEngine(capacity=64, max_rows=3)
+        btc = make_bars(100, seed=5)
+        load(engine, "BTC", btc[:80])
+        panel = engine.compute()
+        btc_row = engine.row("BTC", "1m")
+        self.assertFalse(btc_row.flags.writeable)
+
+        # 新增交易对和追加 K 线后，之前交出去的视图仍指向同一块内存
+        load(engine, "ETH", make_bars(80, seed=6))
+        load(engine, "BTC", btc[80:])
+        engine.compute()
+        self.assertEqual(btc_row[0], btc[-1][4])
+        self.assertEqual(panel[0, 0], btc[-1][4])
+        self.assertEqual(engine.row("ETH", "1m")[0], engine.get("ETH", "1m", "close"))
+        self.assertEqual(engine.panel.shape[0], 2)
+        self.assertEqual(engine.keys(), [("BTC", "1m"), ("ETH", "1m")])
+
+    def testRowCapacityIsEnforced(self):
+        engine = IndicatorEngine(capacity=64, max_rows=1)
+        engine.update("BTC", "1m", 0, 1.0, 1.0, 1.0, 1.0)
+        with self.assertRaises(ValueError):
+            engine.update("ETH", "1m", 0, 1.0, 1.0, 1.0, 1.0)
+        self.assertEqual(engine.keys(), [("BTC", "1m")])
+
+
+if __name__ == "__main__":
+    unittest.main()
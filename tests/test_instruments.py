@@ -0,0 +1,103 @@
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from adapters import instruments
+from adapters.instruments import Instrument, InstrumentCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInstrument(unittest.TestCase):
+    """Instrument unit tests"""
+
+    def testTickAndLotConversions(self):
+        instrument = Instrument.from_decimals("BTC", 1, 3)
+        self.assertEqual((instrument.tick_size, instrument.lot_size), (Decimal("0.1"), Decimal("0.001")))
+        self.assertEqual(instrument.floor_ticks("100.05"), 1000)
+        self.assertEqual(instrument.ceil_ticks("100.01"), 1001)
+        self.assertEqual(instrument.ticks_to_price(1001), Decimal("100.1"))
+        self.assertEqual(instrument.quantize_quantity("0.0129"), Decimal("0.012"))
+
+    def testRejectsNonPositiveTick(self):
+        with self.assertRaises(ValueError):
+            Instrument("BTC", 0, 1)
+
+
+class TestInstrumentCache(unittest.TestCase):
+    """InstrumentCache unit tests"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(instruments.time, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = 0
+        self.result = {"BTC": Instrument("BTC", "0.1", "0.001")}
+
+    def loader(self):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    def testLoadsOnceAndRefreshesAfterInterval(self):
+        cache = InstrumentCache(self.loader, refresh_interval=100)
+        self.assertEqual(cache.get("BTC").tick_size, Decimal("0.1"))
+        self.clock.now += 99
+        cache.get("BTC")
+        self.assertEqual(self.calls, 1)
+        self.clock.now += 1
+        cache.get("BTC")
+        self.assertEqual(self.calls, 2)
+
+    def testUnknownSymbolReloadIsRateLimited(self):
+        cache = InstrumentCache(self.loader)
+        self.assertIsNone(cache.get("ETH"))
+        self.assertIsNone(cache.get("ETH"))
+        self.assertEqual(self.calls, 1)
+        self.clock.now += instruments.UNKNOWN_SYMBOL_RELOAD_INTERVAL
+        self.assertIsNone(cache.get("ETH"))
+        self.assertEqual(self.calls, 2)
+
+    def testFirstLoadFailureBacksOff(self):
+        cache = InstrumentCache(self.loader)
+        self.result = RuntimeError("timeout")
+        with self.assertRaises(Exception):
+            cache.get("BTC")
+        self.assertIsNone(cache.get("BTC"))
+        self.clock.now += instruments.LOAD_RETRY_INTERVAL - 1
+        self.assertIsNone(cache.get("BTC"))
+        self.assertEqual(self.calls, 1)
+
+        self.clock.now += 1
+        self.result = {"BTC": Instrument("BTC", "0.1", "0.001")}
+        self.assertIsNotNone(cache.get("BTC"))
+        self.assertEqual(self.calls, 2)
+
+    def testRefreshFailureKeepsCache(self):
+        cache = InstrumentCache(self.loader, refresh_interval=100)
+        cache.get("BTC")
+        self.result = RuntimeError("timeout")
+        self.clock.now += 100
+        self.assertIsNotNone(cache.get("BTC"))
+        self.assertIsNotNone(cache.get("BTC"))
+        self.assertEqual(self.calls, 2)
+
+    def testUnsupportedExchangeReturnsNone(self):
+        self.result = NotImplementedError()
+        cache = InstrumentCache(self.loader)
+        self.assertIsNone(cache.get("BTC"))
+        self.assertIsNone(cache.get("BTC"))
+        self.assertFalse(cache.supported)
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
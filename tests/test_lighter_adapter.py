@@ -0,0 +1,300 @@
+import asyncio
+import json
+import time
+import unittest
+from decimal import Decimal
+from types import SimpleNamespace
+
+from adapters.base_adapter import OrderRequest
+from adapters.instruments import Instrument
+from adapters.lighter_adapter import MAX_BATCH_SIZE, LighterAdapter
+from lighter import WsClient
+from lighter.nonce_manager import AsyncNonceManager
+
+API_KEY = 2
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+class StubNonceApi:
+    """nextNonce 接口：返回服务端当前的下一个 nonce"""
+
+    def __init__(self, nonce):
+        self.nonce = nonce
+        self.calls = 0
+
+    async def next_nonce(self, account_index, api_key_index):
+        self.calls += 1
+        return SimpleNamespace(code=200, nonce=self.nonce)
+
+
+class StubSigner:
+    """代替 SignerClient：签名结果带上参数，price 在 fail_prices 中时签名失败"""
+
+    def __init__(self, nonce_manager):
+        self.nonce_manager = nonce_manager
+        self.fail_prices = set()
+
+    def _sign(self, tx_type, args):
+        if args[3] in self.fail_prices:
+            return None, None, None, "bad price"
+        return tx_type, json.dumps({"args": args, "nonce": args[-2], "api_key": args[-1]}), "0x1", None
+
+    def sign_create_order(self, *args):
+        return self._sign(14, args)
+
+    def sign_cancel_order(self, *args):
+        return self._sign(15, args)
+
+    async def close(self):
+        pass
+
+
+class TestLighterAdapterBatches(unittest.TestCase):
+    """LighterAdapter._execute_batch nonce handling unit tests"""
+
+    def setUp(self):
+        self.adapter = LighterAdapter({"exchange_name": "lighter", "account_index": 1})
+        self.addCleanup(self.adapter.close)
+        loop = self.adapter._ensure_loop()
+
+        nonce_manager = AsyncNonceManager(
+            account_index=1, api_client=SimpleNamespace(), api_keys_list=[API_KEY], settle_timeout=0.05
+        )
+        self.nonce_api = nonce_manager.tx_api = StubNonceApi(10)
+        asyncio.run_coroutine_threadsafe(nonce_manager.start(), loop).result(2)
+        self.nonce_manager = nonce_manager
+        self.adapter.signer = StubSigner(nonce_manager)
+
+        def load_instruments():
+            self.adapter._market_ids = {"ETH": 0}
+            self.adapter._symbols = {0: "ETH"}
+            return {"ETH": Instrument.from_decimals("ETH", 2, 4)}
+
+        self.adapter.instruments.loader = load_instruments
+        self.batches = []
+        self.send_error = None
+        self.adapter._send_batch = self.send_batch
+
+    def send_batch(self, tx_types, tx_infos):
+        self.batches.append([json.loads(info)["nonce"] for info in tx_infos])
+        if self.send_error is not None:
+            raise self.send_error
+
+    def place(self, *prices):
+        return self.adapter.place_orders([
+            OrderRequest("ETH", "buy", "limit", Decimal("0.01"), Decimal(price)) for price in prices
+        ])
+
+    def testBatchUsesContiguousNoncesOfOneKey(self):
+        results = self.place("100", "101", "102")
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(self.batches, [[10, 11, 12]])
+        self.assertEqual(results[0].result.price, Decimal("100.00"))
+        self.assertEqual(self.nonce_manager.in_flight[API_KEY], set())
+        self.assertEqual(self.nonce_manager.next_nonce(API_KEY), (API_KEY, 13))
+
+    def testMidBatchSigningFailureKeepsNoncesContiguous(self):
+        self.adapter.signer.fail_prices.add(10100)
+        results = self.place("100", "101", "102", "103")
+        self.assertEqual([result.success for result in results], [True, False, True, True])
+        self.assertIn("签名失败", str(results[1].error))
+        # the failed nonce is handed to the next order instead of leaving a gap
+        self.assertEqual(self.batches, [[10, 11, 12]])
+        self.assertFalse(self.nonce_manager.resyncing)
+        self.assertEqual(self.nonce_manager.next_nonce(API_KEY), (API_KEY, 13))
+
+    def testRejectedBatchRollsNoncesBack(self):
+        self.send_error = Exception("Lighter 批量交易被拒绝: margin")
+        results = self.place("100", "101", "102")
+        self.assertFalse(any(result.success for result in results))
+        self.assertEqual(self.nonce_manager.in_flight[API_KEY], set())
+        self.assertFalse(self.nonce_manager.resyncing)
+
+        self.send_error = None
+        self.place("100")
+        self.assertEqual(self.batches, [[10, 11, 12], [10]])
+        self.assertEqual(self.nonce_api.calls, 1)
+
+    def testRejectedNonceRollsBackAndResyncs(self):
+        self.send_error = Exception("Lighter 批量交易被拒绝: invalid nonce")
+        self.place("100", "101")
+        self.nonce_api.nonce = 15
+        self.send_error = None
+        wait_until(lambda: not self.nonce_manager.resyncing)
+        self.place("100")
+        self.assertEqual(self.batches, [[10, 11], [15]])
+
+    def testTimeoutResyncsKeyWithoutRollback(self):
+        self.send_error = TimeoutError()
+        results = self.place("100", "101")
+        self.assertFalse(any(result.success for result in results))
+        # the batch may still execute: the nonces stay in flight until the resync refetches them
+        self.assertIn(API_KEY, self.nonce_manager.resyncing)
+        self.assertEqual(self.nonce_manager.nonce[API_KEY], 11)
+
+        self.nonce_api.nonce = 12
+        self.send_error = None
+        wait_until(lambda: not self.nonce_manager.resyncing)
+        self.place("100")
+        self.assertEqual(self.batches, [[10, 11], [12]])
+
+    def testLargeRequestIsSplitIntoBatches(self):
+        results = self.place(*(str(100 + i) for i in range(MAX_BATCH_SIZE + 5)))
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual([len(batch) for batch in self.batches], [MAX_BATCH_SIZE, 5])
+        self.assertEqual(self.batches[1][0], self.batches[0][-1] + 1)
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+def orders_message(orders):
+    return {"type": "update/account_all_orders", "channel": "account_all_orders:1", "orders": orders}
+
+
+class TestLighterOrderStream(unittest.IsolatedAsyncioTestCase):
+    """LighterAdapter.subscribe_orders unit tests"""
+
+    async def asyncSetUp(self):
+        adapter = LighterAdapter({"exchange_name": "lighter", "account_index": 1})
+        self.adapter = adapter
+        adapter._market_ids = {"ETH": 0, "BTC": 1}
+        adapter._symbols = {0: "ETH", 1: "BTC"}
+        adapter.instruments.loader = lambda: {
+            "ETH": Instrument.from_decimals("ETH", 2, 4), "BTC": Instrument.from_decimals("BTC", 1, 5),
+        }
+        adapter.signer = SimpleNamespace(create_auth_token_with_expiry=lambda: ("token", None))
+        adapter._ensure_loop()
+        # 预先放入未连接网络的 WsClient，_ensure_stream 直接复用
+        adapter.ws_client = WsClient(
+            host="example.com",
+            account_ids=[1],
+            on_account_update=adapter._on_account,
+            on_account_orders_update=adapter._on_account_orders,
+            auth_token_provider=adapter._auth,
+        )
+        adapter.ws_client.ws = RecordingConnection()
+        adapter.ws_client.connected = True
+        self.eth, self.btc = [], []
+
+    async def asyncTearDown(self):
+        self.adapter.ws_client = self.adapter.signer = None
+        await asyncio.to_thread(self.adapter.close)
+
+    async def deliver(self, orders):
+        self.adapter.ws_client.on_message(None, orders_message(orders))
+        await asyncio.sleep(0)
+
+    async def testSubscribesOnceWithAuthToken(self):
+        await self.adapter.subscribe_orders("ETH", self.eth.append)
+        await self.adapter.subscribe_orders("BTC", self.btc.append)
+        self.assertEqual(self.adapter.ws_client.ws.sent, [
+            {"type": "subscribe", "channel": "account_all_orders/1", "auth": "token"},
+        ])
+
+    async def testOrdersAreRoutedByMarket(self):
+        await self.adapter.subscribe_orders("ETH", self.eth.append)
+        await self.adapter.subscribe_orders("ETH", self.eth.append)
+        await self.adapter.subscribe_orders("BTC", self.btc.append)
+        await self.deliver({
+            "0": [{"client_order_index": 7, "initial_base_amount": "0.02", "price": "2410.50",
+                   "is_ask": True, "status": "canceled-post-only"}],
+            "1": [{"market_index": 1, "order_index": 99, "initial_base_amount": "0.001",
+                   "filled_base_amount": "0.0005", "price": "60000.0", "status": "open"}],
+        })
+        self.assertEqual([(o.order_id, o.symbol, o.side, o.status) for o in self.eth], [
+            ("7", "ETH", "sell", "cancelled"),
+        ])
+        self.assertEqual([(o.order_id, o.symbol, o.status) for o in self.btc], [
+            ("99", "BTC", "partially_filled"),
+        ])
+
+    async def testUnsubscribeAndFailingCallback(self):
+        def broken(order):
+            raise ValueError("boom")
+
+        unsubscribe = await self.adapter.subscribe_orders("ETH", self.eth.append)
+        await self.adapter.subscribe_orders("ETH", broken)
+        await self.deliver({"0": [{"client_order_index": 7, "status": "open"}]})
+        self.assertEqual(len(self.eth), 1)
+
+        unsubscribe()
+        unsubscribe()
+        await self.deliver({"0": [{"client_order_index": 8, "status": "open"}]})
+        self.assertEqual(len(self.eth), 1)
+
+    async def testRequiresSigner(self):
+        self.adapter.signer = None
+        with self.assertRaises(Exception):
+            await self.adapter.subscribe_orders("ETH", self.eth.append)
+        self.assertEqual(self.adapter._order_callbacks, {})
+
+
+class TestLighterOrderMapping(unittest.TestCase):
+    """LighterAdapter._order_from_data unit tests"""
+
+    def setUp(self):
+        self.adapter = LighterAdapter({"exchange_name": "lighter"})
+        self.adapter._symbols = {0: "ETH"}
+
+    def order(self, **fields):
+        data = {
+            "market_index": 0,
+            "client_order_index": 7,
+            "order_index": 99,
+            "initial_base_amount": "0.02",
+            "filled_base_amount": "0",
+            "price": "2410.50",
+            "is_ask": True,
+            "type": "limit",
+            "time_in_force": "post-only",
+            "status": "open",
+            "created_at": 1700000000,
+            "updated_at": 1700000000123,
+        }
+        data.update(fields)
+        return self.adapter._order_from_data(data)
+
+    def testStatusMapping(self):
+        cases = {
+            "open": "open",
+            "in-progress": "pending",
+            "pending": "pending",
+            "filled": "filled",
+            "canceled": "cancelled",
+            "canceled-post-only": "cancelled",
+            "canceled-margin-not-allowed": "cancelled",
+            "unknown": "rejected",
+        }
+        for lighter_status, status in cases.items():
+            with self.subTest(status=lighter_status):
+                self.assertEqual(self.order(status=lighter_status).status, status)
+        self.assertEqual(self.order(filled_base_amount="0.01").status, "partially_filled")
+
+    def testFields(self):
+        order = self.order()
+        self.assertEqual((order.order_id, order.client_order_id, order.symbol), ("7", "7", "ETH"))
+        self.assertEqual((order.side, order.order_type, order.time_in_force), ("sell", "limit", "post_only"))
+        self.assertEqual((order.quantity, order.price), (Decimal("0.02"), Decimal("2410.50")))
+        self.assertEqual((order.created_at, order.updated_at), (1700000000000, 1700000000123))
+
+    def testOrderIndexWithoutClientIndex(self):
+        order = self.order(client_order_index=0, is_ask=False, type="market", price="")
+        self.assertEqual((order.order_id, order.client_order_id), ("99", None))
+        self.assertEqual((order.side, order.order_type, order.price), ("buy", "market", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+from adapters.orderbook import LocalOrderBook, OrderBookService, OrderBookSnapshot, parse_levels
+
+
+class TestParseLevels(unittest.TestCase):
+    """parse_levels unit tests"""
+
+    def testListAndDictFormats(self):
+        self.assertEqual(parse_levels([["100.5", "2"], [99, 1]]), [(100.5, 2.0), (99.0, 1.0)])
+        self.assertEqual(parse_levels([{"price": "100.5", "size": "2"}]), [(100.5, 2.0)])
+        self.assertEqual(parse_levels(None), [])
+
+
+class TestLocalOrderBook(unittest.TestCase):
+    """LocalOrderBook snapshot/delta unit tests"""
+
+    def setUp(self):
+        self.book = LocalOrderBook("BTC", publish_depth=3)
+        self.book.apply_snapshot(
+            [(99.0, 1.0), (100.0, 2.0), (98.0, 0.0)],
+            [(102.0, 1.0), (101.0, 3.0)],
+            sequence=10,
+        )
+
+    def testSnapshotPublishesSortedLevels(self):
+        snapshot = self.book.snapshot
+        self.assertTrue(self.book.synced)
+        self.assertEqual(snapshot.bids, ((100.0, 2.0), (99.0, 1.0)))
+        self.assertEqual(snapshot.asks, ((101.0, 3.0), (102.0, 1.0)))
+        self.assertEqual(snapshot.sequence, 10)
+        self.assertEqual(snapshot.best_bid(), (100.0, 2.0))
+
+    def testDeltaInsertsUpdatesAndDeletes(self):
+        self.assertTrue(self.book.apply_delta(
+            [(100.5, 1.0), (99.0, 4.0), (100.0, 0.0)], [(101.0, 0.0), (103.0, 2.0)], sequence=11
+        ))
+        snapshot = self.book.snapshot
+        self.assertEqual(snapshot.bids, ((100.5, 1.0), (99.0, 4.0)))
+        self.assertEqual(snapshot.asks, ((102.0, 1.0), (103.0, 2.0)))
+        self.assertEqual(snapshot.sequence, 11)
+
+    def testPublishDepthLimitsLevels(self):
+        self.book.apply_delta([(97.0, 1.0), (96.0, 1.0)], [], sequence=11)
+        self.assertEqual([price for price, _ in self.book.snapshot.bids], [100.0, 99.0, 97.0])
+
+    def testPublishedSnapshotIsNotMutated(self):
+        before = self.book.snapshot
+        self.book.apply_delta([(100.0, 5.0)], [], sequence=11)
+        self.assertEqual(before.bids[0], (100.0, 2.0))
+        self.assertIsNot(self.book.snapshot, before)
+
+    def testStaleSequenceIsIgnored(self):
+        self.assertTrue(self.book.apply_delta([(100.0, 9.0)], [], sequence=10))
+        self.assertTrue(self.book.apply_delta([(100.0, 9.0)], [], sequence=9))
+        self.assertEqual(self.book.snapshot.bids[0], (100.0, 2.0))
+        self.assertTrue(self.book.synced)
+
+    def testPrevSequenceGapInvalidates(self):
+        self.assertTrue(self.book.apply_delta([(100.0, 3.0)], [], sequence=11, prev_sequence=10))
+        self.assertFalse(self.book.apply_delta([(100.0, 4.0)], [], sequence=13, prev_sequence=12))
+        self.assertFalse(self.book.synced)
+        self.assertIsNone(self.book.snapshot)
+        self.assertEqual(self.book.gap_count, 1)
+
+    def testCrossedDeltaInvalidates(self):
+        self.assertFalse(self.book.apply_delta([(101.0, 1.0)], [], sequence=11))
+        self.assertTrue(self.book.crossed)
+        self.assertFalse(self.book.synced)
+        self.assertIsNone(self.book.snapshot)
+
+    def testDeltasRejectedUntilResyncSnapshot(self):
+        self.book.invalidate()
+        self.book.invalidate()
+        self.assertEqual(self.book.gap_count, 1)
+        self.assertFalse(self.book.apply_delta([(100.0, 1.0)], [], sequence=11))
+        self.assertIsNone(self.book.snapshot)
+
+        self.book.apply_snapshot([(90.0, 1.0)], [(91.0, 1.0)], sequence=20)
+        self.assertTrue(self.book.synced)
+        self.assertFalse(self.book.crossed)
+        self.assertTrue(self.book.apply_delta([(90.5, 1.0)], [], sequence=21))
+        self.assertEqual(self.book.snapshot.bids, ((90.5, 1.0), (90.0, 1.0)))
+
+
+class TestOrderBookService(unittest.TestCase):
+    """OrderBookService unit tests"""
+
+    def testGetReturnsPublishedBook(self):
+        service = OrderBookService(publish_depth=5)
+        self.assertIsNone(service.get("BTC"))
+        book = service.book("BTC")
+        self.assertIs(service.book("BTC"), book)
+        self.assertIn("BTC", service)
+        self.assertIsNone(service.get("BTC"))
+
+        book.apply_snapshot([(100.0, 1.0), (99.0, 2.0)], [(101.0, 1.0)], sequence=1, timestamp=5)
+        self.assertEqual(service.get("BTC", depth=1), {
+            "symbol": "BTC",
+            "bids": [[100.0, 1.0]],
+            "asks": [[101.0, 1.0]],
+            "sequence": 1,
+            "timestamp": 5,
+        })
+
+    def testFromLevelsSortsAndDropsEmptyLevels(self):
+        snapshot = OrderBookSnapshot.from_levels("BTC", [(99.0, 1.0), (100.0, 1.0)], [(102.0, 0.0), (101.0, 1.0)])
+        self.assertEqual(snapshot.bids, ((100.0, 1.0), (99.0, 1.0)))
+        self.assertEqual(snapshot.asks, ((101.0, 1.0),))
+
+
+if __name__ == "__main__":
+    unittest.main()